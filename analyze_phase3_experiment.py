@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import List, Dict, Any
 from collections import defaultdict
 
+from evolution.storage import RunReader
+
 def load_evaluation(eval_path: Path) -> Dict[str, Any]:
     """Load a strategy evaluation from JSON."""
     with open(eval_path, 'r') as f:
@@ -157,10 +159,8 @@ def generate_report(run_dir: Path) -> str:
     report_lines.append("")
 
     # Load all evaluations
-    evals_dir = run_dir / "evals"
-    all_evals = []
-    for eval_file in evals_dir.glob("*.json"):
-        all_evals.append(load_evaluation(eval_file))
+    reader = RunReader(run_dir)
+    all_evals = [reader.load_evaluation(graph_id) for graph_id in reader.evaluation_metadata()]
 
     report_lines.append(f"## OVERVIEW")
     report_lines.append(f"Total strategies evaluated: {len(all_evals)}")
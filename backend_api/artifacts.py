@@ -0,0 +1,146 @@
+"""Bulk artifact export for the run viewer.
+
+One request returns any of a run's per-graph artifacts (graphs, evals,
+Phase 3 reports, Blue Memos, Red Verdicts) for many graphs at once, as one
+record per graph:
+
+    {"graph_id": "...", "graph": {...}, "eval": {...}, ...}
+
+Artifacts can be projected to dotted field paths prefixed with their kind
+(e.g. "eval.fitness", "eval.validation_report.holdout_metrics.sharpe");
+kinds without listed paths are returned whole. Records are streamed as
+NDJSON (gzip-compressed when the client accepts it) or as a sequence of
+msgpack objects.
+"""
+
+import json
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from evolution.storage import RunReader
+
+try:
+    import msgpack
+except ImportError:  # optional: only needed for msgpack responses
+    msgpack = None
+
+
+ARTIFACT_KINDS = ("graph", "eval", "phase3", "memo", "verdict")
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+
+def parse_fields(paths: Iterable[str]) -> Dict[str, List[List[str]]]:
+    """Group "kind.dotted.path" strings by artifact kind.
+
+    Raises:
+        ValueError: If a path names an unknown kind or has no field part
+    """
+    fields: Dict[str, List[List[str]]] = {}
+    for path in paths:
+        kind, _, rest = path.partition(".")
+        if kind not in ARTIFACT_KINDS or not rest:
+            raise ValueError(f"Invalid field path {path!r} (expected <kind>.<field>[.<field>...])")
+        fields.setdefault(kind, []).append(rest.split("."))
+    return fields
+
+
+def invalid_graph_ids(graph_ids: Iterable[str]) -> List[str]:
+    """Graph IDs that cannot name an artifact file (empty, ".", "..", or containing a path separator).
+
+    Graph IDs become file names (graphs/<id>.json, memos/<id>.json, ...), so
+    these would read files outside the run's artifact directories.
+    """
+    return [
+        graph_id for graph_id in graph_ids
+        if graph_id in ("", ".", "..") or any(char in graph_id for char in ("/", "\\", "\0"))
+    ]
+
+
+def project(value: Any, paths: List[List[str]]) -> Any:
+    """Keep only the given field paths of a nested dict (missing paths are skipped)."""
+    if not paths or not isinstance(value, dict):
+        return value
+    result: Dict[str, Any] = {}
+    for path in paths:
+        source, target = value, result
+        for i, key in enumerate(path):
+            if not isinstance(source, dict) or key not in source:
+                break
+            if i == len(path) - 1:
+                target[key] = source[key]
+            else:
+                source = source[key]
+                target = target.setdefault(key, {})
+    return result
+
+
+def iter_artifacts(
+    run_dir: Path,
+    run_id: str,
+    graph_ids: Optional[List[str]],
+    kinds: List[str],
+    fields: Dict[str, List[List[str]]],
+) -> Iterator[Dict[str, Any]]:
+    """One record per graph with the requested artifacts (None where missing).
+
+    Args:
+        run_dir: Run directory
+        run_id: Run identifier (for the research artifacts)
+        graph_ids: Graphs to include (None for every graph in the run)
+        kinds: Artifact kinds to include
+        fields: parse_fields() result
+
+    Raises:
+        ValueError: If graph_ids has IDs that invalid_graph_ids() rejects
+    """
+    invalid = invalid_graph_ids(graph_ids or [])
+    if invalid:
+        raise ValueError(f"Invalid graph IDs: {invalid}")
+    reader = RunReader(run_dir)
+    loaders: Dict[str, Callable[[str], Any]] = {
+        "graph": reader.load_graph,
+        "eval": reader.load_evaluation,
+        "phase3": reader.load_phase3_report,
+    }
+    if "memo" in kinds or "verdict" in kinds:
+        from research.storage import ResearchStorage
+
+        research = ResearchStorage(run_id=run_id)
+        loaders["memo"] = lambda graph_id: _model_dump(research.load_blue_memo(graph_id))
+        loaders["verdict"] = lambda graph_id: _model_dump(research.load_red_verdict(graph_id))
+
+    for graph_id in reader.graph_ids() if graph_ids is None else graph_ids:
+        record = {"graph_id": graph_id}
+        for kind in kinds:
+            value = loaders[kind](graph_id)
+            record[kind] = project(value, fields.get(kind, [])) if value is not None else None
+        yield record
+
+
+def _model_dump(model) -> Optional[Dict[str, Any]]:
+    return model.model_dump(mode="json") if model is not None else None
+
+
+def ndjson_chunks(records: Iterable[Dict[str, Any]], compress: bool = True) -> Iterator[bytes]:
+    """Encode records as compact NDJSON, gzip-compressed as a single stream if compress."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None  # wbits=31: gzip framing
+    for record in records:
+        line = (json.dumps(record, separators=(",", ":"), default=str) + "\n").encode()
+        if compressor is None:
+            yield line
+            continue
+        chunk = compressor.compress(line)
+        if chunk:
+            yield chunk
+    if compressor is not None:
+        yield compressor.flush()
+
+
+def msgpack_chunks(records: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode records as a stream of msgpack objects (requires msgpack; read with msgpack.Unpacker)."""
+    packer = msgpack.Packer(default=str)
+    for record in records:
+        yield packer.pack(record)
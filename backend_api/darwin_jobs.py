@@ -0,0 +1,346 @@
+"""Darwin run jobs, executed in JobRunner worker processes (see backend_api/jobs.py).
+
+Each job receives a JobChannel as its first argument and reports through it:
+events ("log", "run_started", "run_finished", "error") feed the run's SSE
+stream, and progress fields (phase, evals_completed, best_fitness, ...) feed
+its status. Runs stop at their next checkpoint when channel.token is
+cancelled (a graceful JobRunner.cancel). Market data is shared between the runs a worker executes
+through a per-process dataset registry.
+
+Batch evaluation jobs (POST /api/evaluate/batch) run here too, emitting one
+"evaluation" event per strategy.
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import config
+from backend_api.jobs import JobChannel
+from cancellation import Cancelled
+from backend_api.state import get_state_store
+from data.polygon_client import PolygonClient
+from data.registry import DatasetRegistry
+from data.synthetic import SyntheticClient
+from evolution.darwin import run_darwin
+from graph.schema import StrategyGraph, UniverseSpec, TimeConfig, DateRange
+from llm.cache import get_budget, reset_budget
+from validation.evaluation import Phase3Config, iter_evaluations
+
+
+logger = logging.getLogger(__name__)
+
+_polygon_client: Optional[PolygonClient] = None
+
+
+def _load_bars(symbol: str, timeframe: str, start: str, end: str):
+    """Dataset registry loader: bars via one shared (pooled) market data client.
+
+    MARKET_DATA_PROVIDER=synthetic swaps Polygon for the offline generator.
+    """
+    global _polygon_client
+    if _polygon_client is None:
+        if config.MARKET_DATA_PROVIDER == "synthetic":
+            _polygon_client = SyntheticClient(seed=config.SYNTHETIC_SEED, compact=config.COMPACT_MARKET_DATA)
+        else:
+            _polygon_client = PolygonClient()
+    return _polygon_client.get_bars(symbol=symbol, timeframe=timeframe, start=start, end=end)
+
+
+# Shared market data for all runs in this worker process (LRU under a byte budget)
+dataset_registry = DatasetRegistry(loader=_load_bars, max_bytes=config.DATASET_REGISTRY_MAX_BYTES)
+
+
+def _get_run_dir(run_id: str) -> Path:
+    run_dir = config.RESULTS_DIR / "runs" / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    return run_dir
+
+
+def persist_budget_snapshot(run_id: str, run_dir: Path = None):
+    """Write the current LLMBudget to the state store and results/runs/<run_id>/budget.json."""
+    try:
+        if run_dir is None:
+            run_dir = _get_run_dir(run_id)
+        budget = get_budget().to_dict()
+        get_state_store().save_budget(run_id, budget)
+        budget_path = run_dir / "budget.json"
+        with open(budget_path, "w") as f:
+            json.dump(budget, f, indent=2)
+    except Exception as err:
+        logger.warning(f"[{run_id}] Failed to persist budget: {err}")
+
+
+def _report_generation(channel: JobChannel, stats: Dict[str, Any]):
+    """run_darwin on_generation callback: forward progress to the server."""
+    channel.progress(
+        current_generation=stats["generation"],
+        evals_completed=stats["evals_completed"],
+        best_fitness=stats["best_fitness"],
+    )
+    channel.emit("log", {
+        "message": f"Generation {stats['generation']}/{stats['depth']}: "
+                   f"{stats['survivors']}/{stats['total']} survived, best fitness {stats['best_fitness']:.3f}"
+    })
+    persist_budget_snapshot(channel.job_id)
+
+
+def run_darwin_job(channel: JobChannel, request: Dict[str, Any]) -> Dict[str, Any]:
+    """POST /api/run job: fetch market data, then run Darwin with structured events.
+
+    Args:
+        channel: Job channel
+        request: RunRequest fields
+
+    Returns:
+        {"best_fitness", "total_evaluations", "budget"}
+    """
+    run_id = channel.job_id
+    logger.info(f"Starting Darwin job {run_id}")
+    logger.info(f"Request params: symbols={request['universe_symbols']}, timeframe={request['timeframe']}, "
+                f"depth={request['depth']}")
+    run_dir = _get_run_dir(run_id)
+    reset_budget()
+    persist_budget_snapshot(run_id, run_dir)
+
+    try:
+        channel.progress(phase="fetching_data")
+        channel.emit("run_started", {
+            "depth": request["depth"],
+            "branching": request["branching"],
+            "max_total_evals": request["max_total_evals"],
+            "symbols": request["universe_symbols"],
+        })
+
+        # Fetch data
+        fetch_errors = {}
+
+        def on_symbol_fetched(symbol, frame, fetch_error):
+            if fetch_error is not None:
+                logger.error(f"[{run_id}] Failed to fetch data for {symbol}: {fetch_error}")
+                fetch_errors[symbol] = fetch_error
+                return
+            logger.info(f"[{run_id}] Successfully fetched {len(frame.df)} bars for {symbol}")
+            channel.emit("log", {"message": f"Fetched {len(frame.df)} bars for {symbol}"})
+
+        channel.emit("log", {"message": f"Fetching {', '.join(request['universe_symbols'])} data..."})
+        frames = dataset_registry.get_many(
+            request["universe_symbols"],
+            timeframe=request["timeframe"],
+            start=request["start_date"],
+            end=request["end_date"],
+            max_workers=config.POLYGON_MAX_WORKERS,
+            on_symbol=on_symbol_fetched,
+        )
+        channel.worker_info(datasets=dataset_registry.stats())
+        if fetch_errors:
+            raise next(iter(fetch_errors.values()))
+
+        # Use first symbol's data
+        data = frames[request["universe_symbols"][0]].df
+        logger.info(f"[{run_id}] Using {request['universe_symbols'][0]} data for evolution")
+
+        channel.progress(
+            phase="evolving",
+            evals_completed=0,
+            max_total_evals=request["max_total_evals"],
+            current_generation=0,
+            best_fitness=None,
+            kill_stats={},
+        )
+
+        # Create locked params
+        universe = UniverseSpec(type="explicit", symbols=request["universe_symbols"])
+        time_config = TimeConfig(
+            timeframe=request["timeframe"],
+            date_range=DateRange(start=request["start_date"], end=request["end_date"])
+        )
+
+        # Configure Phase 3 robust evaluation
+        phase3_config = None
+        if request["robust_mode"]:
+            logger.info(f"[{run_id}] Enabling Phase 3 multi-episode evaluation")
+            phase3_config = Phase3Config(
+                enabled=True,
+                mode="episodes",
+                n_episodes=8,  # Test on 8 different time windows
+                min_months=6,
+                max_months=12,
+                min_bars=120,
+                sampling_mode="uniform_random",  # Better temporal coverage
+                min_trades_per_episode=3,
+                regime_penalty_weight=0.3,
+                abort_on_all_episode_failures=True,
+            )
+            channel.emit("log", {"message": "Phase 3 enabled: 8 episodes, 6-12 months each, uniform sampling"})
+        else:
+            logger.info(f"[{run_id}] Using Phase 2 train/holdout validation")
+            channel.emit("log", {"message": "Using standard train/holdout validation"})
+
+        channel.emit("log", {"message": "Compiling initial strategy from natural language..."})
+        summary = run_darwin(
+            data=data,
+            universe=universe,
+            time_config=time_config,
+            nl_text=request["nl_text"],
+            depth=request["depth"],
+            branching=request["branching"],
+            survivors_per_layer=request["survivors_per_layer"],
+            max_total_evals=request["max_total_evals"],
+            run_id=run_id,
+            phase3_config=phase3_config,
+            on_generation=lambda stats: _report_generation(channel, stats),
+            token=channel.token,
+        )
+        logger.info(f"[{run_id}] Darwin evolution completed. Total evals: {summary.total_evaluations}")
+        channel.emit("log", {"message": f"Evolution complete: {summary.total_evaluations} evaluations"})
+
+        budget = get_budget()
+        result = {
+            "best_fitness": summary.best_strategy.fitness,
+            "total_evaluations": summary.total_evaluations,
+            "budget": budget.to_dict(),
+        }
+        channel.emit("run_finished", result)
+        persist_budget_snapshot(run_id, run_dir)
+        return result
+
+    except Cancelled:
+        logger.info(f"[{run_id}] Run cancelled")
+        channel.emit("log", {"message": "Run cancelled; partial results saved"})
+        persist_budget_snapshot(run_id, run_dir)
+        raise
+    except Exception as e:
+        logger.error(f"[{run_id}] Job failed with error: {e}", exc_info=True)
+        channel.emit("error", {"message": str(e)})
+        persist_budget_snapshot(run_id, run_dir)
+        raise
+
+
+def run_darwin_task(
+    channel: JobChannel,
+    seed_prompt: str,
+    universe: Dict[str, Any],
+    time_config: Dict[str, Any],
+    depth: int,
+    branching: int,
+    survivors_per_layer: int,
+    phase3_config: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """POST /api/runs job: fetch market data, then run Darwin.
+
+    Args:
+        channel: Job channel (job_id is the run_id)
+        seed_prompt: Natural-language strategy
+        universe: UniverseSpec fields
+        time_config: TimeConfig fields
+        depth: Generations
+        branching: Children per survivor
+        survivors_per_layer: Survivors kept per generation
+        phase3_config: Phase3Config fields (None for train/holdout validation)
+
+    Returns:
+        {"best_fitness", "total_evaluations"}
+    """
+    run_id = channel.job_id
+    universe = UniverseSpec(**universe)
+    time_config = TimeConfig(**time_config)
+
+    t0 = time.monotonic()
+    channel.progress(phase="fetching_data")
+    logger.info(f"[{run_id}] Fetching market data...")
+    dr = time_config.date_range
+
+    # Fetch data for first successful symbol (break early for speed)
+    data = None
+    for sym in universe.resolve_symbols():
+        try:
+            df = dataset_registry.get(sym, time_config.timeframe, dr.start, dr.end).df
+            if df is not None and not df.empty:
+                logger.info(f"[{run_id}] Fetched {len(df)} bars for {sym}, using it as primary data source")
+                data = df
+                break  # Use first successful symbol, skip rest
+        except Exception as e:
+            logger.warning(f"[{run_id}] Failed to fetch {sym}: {e}")
+    channel.worker_info(datasets=dataset_registry.stats())
+
+    t_data = time.monotonic()
+    logger.info(f"[{run_id}] Data fetch took {t_data - t0:.1f}s")
+    if data is None:
+        raise ValueError("No data fetched for any symbol")
+
+    channel.progress(phase="evolving", evals_completed=0, current_generation=0, best_fitness=None)
+    logger.info(f"[{run_id}] Starting Darwin evolution with {len(data)} bars...")
+    summary = run_darwin(
+        data=data,
+        universe=universe,
+        time_config=time_config,
+        nl_text=seed_prompt,
+        depth=depth,
+        branching=branching,
+        survivors_per_layer=survivors_per_layer,
+        phase3_config=Phase3Config(**phase3_config) if phase3_config else None,
+        run_id=run_id,
+        rescue_mode=True,
+        on_generation=lambda stats: _report_generation(channel, stats),
+        token=channel.token,
+    )
+    t_done = time.monotonic()
+    logger.info(f"[{run_id}] Darwin run complete! Total: {t_done - t0:.1f}s "
+                f"(data: {t_data - t0:.1f}s, evolution: {t_done - t_data:.1f}s)")
+    return {
+        "best_fitness": summary.best_strategy.fitness,
+        "total_evaluations": summary.total_evaluations,
+    }
+
+
+def run_evaluation_batch(
+    channel: JobChannel,
+    graphs: List[Dict[str, Any]],
+    data: Dict[str, Any],
+    evaluation: Dict[str, Any],
+) -> Dict[str, Any]:
+    """POST /api/evaluate/batch job: score strategy graphs against one dataset.
+
+    Strategies are evaluated on a process pool of config.EVAL_BATCH_WORKERS
+    workers; each result is emitted as an "evaluation" event as soon as it
+    completes.
+
+    Args:
+        channel: Job channel
+        graphs: StrategyGraph fields, one dict per strategy
+        data: {"symbol", "timeframe", "start_date", "end_date"}
+        evaluation: evaluate_strategy() keyword arguments
+
+    Returns:
+        {"evaluated", "survivors", "seconds"}
+    """
+    batch_id = channel.job_id
+    strategies = [StrategyGraph.model_validate(graph) for graph in graphs]
+
+    t0 = time.monotonic()
+    channel.progress(phase="fetching_data", total=len(strategies), completed=0)
+    bars = dataset_registry.get(data["symbol"], data["timeframe"], data["start_date"], data["end_date"]).df
+    channel.worker_info(datasets=dataset_registry.stats())
+    if bars is None or bars.empty:
+        raise ValueError(f"No bars for {data['symbol']} {data['timeframe']} {data['start_date']}..{data['end_date']}")
+    logger.info(f"[{batch_id}] Evaluating {len(strategies)} strategies on {len(bars)} {data['symbol']} bars")
+
+    channel.progress(phase="evaluating")
+    completed = survivors = 0
+    for index, result, seconds in iter_evaluations(
+        strategies, bars, n_workers=config.EVAL_BATCH_WORKERS, token=channel.token, **evaluation
+    ):
+        completed += 1
+        survivors += result.decision == "survive"
+        channel.emit("evaluation", {
+            "index": index,
+            "graph_id": result.graph_id,
+            "seconds": round(seconds, 3),
+            "result": result.to_dict(),
+        })
+        channel.progress(completed=completed, survivors=survivors)
+
+    return {"evaluated": completed, "survivors": survivors, "seconds": round(time.monotonic() - t0, 3)}
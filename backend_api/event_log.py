@@ -0,0 +1,141 @@
+"""Bounded, persisted, resumable per-run event log.
+
+Every event a run emits gets the next event ID (1, 2, 3, ...) and is
+appended to results/runs/<run_id>/events.jsonl as {"id": ..., "event": ...}.
+Only the most recent events (the hot tail) are kept in memory, in a ring
+buffer, so chatty runs do not grow the server.
+
+since(last_id) replays what a client missed: from the ring when it still
+covers last_id, otherwise by streaming the file. The SSE endpoint uses this
+to resume from a reconnecting client's Last-Event-ID. A log reopened after a
+restart continues numbering where the file left off.
+
+Only the process running the job appends to a run's log. Other API
+processes open the same file and call refresh() to pick up new events.
+"""
+
+import json
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+import config
+
+
+EVENT_LOG_NAME = "events.jsonl"
+
+LoggedEvent = Tuple[int, Dict[str, Any]]
+
+
+class RunEventLog:
+    """Append-only event log for one run.
+
+    Args:
+        path: JSONL file (created on first append)
+        ring_size: Recent events kept in memory
+    """
+
+    def __init__(self, path: Path, ring_size: int = config.EVENT_RING_SIZE):
+        self.path = Path(path)
+        self._ring: Deque[LoggedEvent] = deque(maxlen=max(1, ring_size))
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self.last_id = 0
+        self.refresh()
+
+    def append(self, event: Dict[str, Any]) -> int:
+        """Log an event.
+
+        Args:
+            event: JSON-serializable event
+
+        Returns:
+            The event's ID
+        """
+        with self._lock:
+            event_id = self.last_id + 1
+            line = (json.dumps({"id": event_id, "event": event}, default=str) + "\n").encode()
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "ab")
+            self._file.write(line)
+            self._file.flush()
+            self._size += len(line)
+            self._ring.append((event_id, event))
+            self.last_id = event_id
+        return event_id
+
+    def since(self, last_id: int = 0) -> Iterator[LoggedEvent]:
+        """Events with an ID greater than last_id, oldest first.
+
+        Served from memory when the ring still holds last_id + 1; otherwise
+        streamed from disk (memory use stays bounded either way). Events
+        appended while iterating may or may not be included.
+        """
+        with self._lock:
+            if not self._ring or last_id + 1 >= self._ring[0][0]:
+                tail = [(event_id, event) for event_id, event in self._ring if event_id > last_id]
+                size = None
+            else:
+                size = self._size
+        if size is None:
+            yield from tail
+            return
+        for event_id, event in self._read(size):
+            if event_id > last_id:
+                yield event_id, event
+
+    def refresh(self) -> int:
+        """Load events appended to the file by another process.
+
+        Returns:
+            Number of new events
+        """
+        with self._lock:
+            try:
+                if self.path.stat().st_size <= self._size:
+                    return 0
+            except FileNotFoundError:
+                return 0
+            count = 0
+            with open(self.path, "rb") as f:
+                f.seek(self._size)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # partially written line
+                    self._size += len(line)
+                    record = json.loads(line)
+                    self._ring.append((record["id"], record["event"]))
+                    self.last_id = record["id"]
+                    count += 1
+            return count
+
+    def close(self):
+        """Close the file (a later append reopens it)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _read(self, size: int) -> Iterator[LoggedEvent]:
+        """Stream logged events from the first size bytes of the file."""
+        with open(self.path, "rb") as f:
+            remaining = size
+            for line in f:
+                if remaining <= 0:
+                    break
+                remaining -= len(line)
+                if not line.endswith(b"\n"):
+                    break  # partially written line
+                record = json.loads(line)
+                yield record["id"], record["event"]
+
+
+def parse_last_event_id(value: Optional[str]) -> int:
+    """Last-Event-ID header/query value as an event ID (0 when absent or invalid)."""
+    try:
+        return max(0, int(value)) if value else 0
+    except ValueError:
+        return 0
@@ -0,0 +1,113 @@
+"""In-process pub/sub for run events, feeding the SSE streams.
+
+Publishers (the job runner's monitor thread, or request handlers on the
+event loop) call EventBus.publish(); every subscriber to that run gets the
+event pushed onto its own asyncio.Queue on the subscriber's event loop. An
+SSE stream therefore wakes only when something happened, instead of polling
+on a timer.
+
+Each published item is (seq, event). seq is the event's position in the
+run's event log, used by subscribers to skip events already sent from the
+backlog. It is None for transient events (status snapshots) that are not
+logged.
+
+A subscriber that falls more than max_queue events behind is dropped, and
+its get() returns None so the stream can close and the client reconnect.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+Published = Tuple[Optional[int], Dict[str, Any]]
+
+_OVERFLOW = object()
+
+
+class Subscription:
+    """One subscriber's queue of published events for a run."""
+
+    def __init__(self, run_id: str, max_queue: int):
+        self.run_id = run_id
+        self.loop = asyncio.get_running_loop()
+        self._queue: "asyncio.Queue" = asyncio.Queue(maxsize=max_queue)
+        self.dropped = False
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Published]:
+        """Next (seq, event), or None once the subscriber has been dropped.
+
+        Raises:
+            asyncio.TimeoutError: If nothing arrives within timeout seconds
+        """
+        item = await asyncio.wait_for(self._queue.get(), timeout)
+        return None if item is _OVERFLOW else item
+
+    def _push(self, item):
+        # Runs on the subscriber's loop
+        if self.dropped:
+            return
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped = True
+            self._queue.get_nowait()
+            self._queue.put_nowait(_OVERFLOW)
+
+
+class EventBus:
+    """Per-run fan-out of events to asyncio subscribers.
+
+    Args:
+        max_queue: Events a subscriber may fall behind before it is dropped
+    """
+
+    def __init__(self, max_queue: int = 1000):
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[Subscription]] = defaultdict(set)
+
+    @contextmanager
+    def subscribe(self, run_id: str) -> Iterator[Subscription]:
+        """Subscribe to a run's events for the duration of the block (call on an event loop)."""
+        subscription = Subscription(run_id, self.max_queue)
+        with self._lock:
+            self._subscribers[run_id].add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(run_id)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[run_id]
+
+    def publish(self, run_id: str, event: Dict[str, Any], seq: Optional[int] = None):
+        """Push an event to every subscriber of run_id (safe from any thread).
+
+        Args:
+            run_id: Run identifier
+            event: Event payload
+            seq: Position of the event in the run's log (None if not logged)
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(run_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._push, (seq, event))
+            except RuntimeError:
+                # The subscriber's loop has closed; its stream is gone
+                with self._lock:
+                    self._subscribers.get(run_id, set()).discard(subscription)
+
+    def subscriber_count(self, run_id: Optional[str] = None) -> int:
+        """Subscribers to one run (or to all runs)."""
+        with self._lock:
+            if run_id is not None:
+                return len(self._subscribers.get(run_id, ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
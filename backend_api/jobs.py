@@ -0,0 +1,597 @@
+"""Process-pool job runner for the API server.
+
+Darwin runs are synchronous and CPU-heavy, so the server must not execute
+them on its event loop. JobRunner queues them (up to max_queued) and runs
+them on a fixed pool of long-lived worker processes, one job per worker at
+a time: the pool size is also the maximum number of concurrent runs.
+
+Each worker talks to the server over its own pipe. The server sends jobs
+down it; the job reports events, progress and its result back through a
+JobChannel. A monitor thread in the server reads those messages, hands
+queued jobs to idle workers and replaces workers that die.
+
+Jobs move through queued -> running -> completed | failed | cancelled.
+Cancelling a queued job drops it; cancelling a running job terminates its
+worker process (and its process group, so processes the job started go
+with it), which is then replaced. A graceful cancel (cancel(job_id,
+grace=...)) instead sets the worker's cancel flag, which the job sees as
+channel.token (see cancellation.py): the job stops at its next checkpoint,
+saves what it has and raises Cancelled. Only a job still running after
+the grace period is terminated.
+
+Job targets are "module:function" strings, imported in the worker and
+called as function(channel, **kwargs). Arguments and return values cross a
+process boundary, so they must be picklable.
+
+Workers also push their metrics registry (see telemetry.py) while jobs
+report and when a job ends; metrics() sums the pool's latest snapshots.
+"""
+
+import atexit
+import importlib
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import config
+import telemetry
+from cancellation import CancelToken, Cancelled
+
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+
+class QueueFull(RuntimeError):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+@dataclass
+class Job:
+    """A submitted job and its lifecycle state."""
+    job_id: str
+    target: str
+    kwargs: Dict[str, Any]
+    status: str = QUEUED
+    submitted_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    worker_pid: Optional[int] = None
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly view of the job (without its arguments)."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "worker_pid": self.worker_pid,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobChannel:
+    """Worker-side handle a running job uses to report back to the server."""
+
+    def __init__(self, job_id: str, conn: Connection, lock: threading.Lock, token: Optional[CancelToken] = None):
+        self.job_id = job_id
+        self._conn = conn
+        self._lock = lock
+        self._metrics_sent = time.monotonic()
+        # Cancelled by a graceful JobRunner.cancel(); pass it down to long-running work
+        self.token = token if token is not None else CancelToken()
+
+    def emit(self, event_type: str, data: Optional[Dict[str, Any]] = None):
+        """Send a structured event (delivered to the runner's on_event callback).
+
+        Args:
+            event_type: Event type (e.g. "log", "run_finished")
+            data: Extra event fields
+        """
+        self._send("event", {"type": event_type, "timestamp": datetime.now().isoformat(), **(data or {})})
+        self._publish_metrics()
+
+    def progress(self, **fields):
+        """Merge fields into the job's progress dict."""
+        self._send("progress", fields)
+        self._publish_metrics()
+
+    def worker_info(self, **fields):
+        """Publish worker-level state (e.g. cache stats) that outlives the job."""
+        self._send("worker_info", fields)
+
+    def _publish_metrics(self, force: bool = False):
+        """Send this process's metrics snapshot, at most every config.METRICS_PUBLISH_SECONDS."""
+        now = time.monotonic()
+        if force or now - self._metrics_sent >= config.METRICS_PUBLISH_SECONDS:
+            self._metrics_sent = now
+            self._send("metrics", telemetry.snapshot())
+
+    def _send(self, kind: str, payload: Any):
+        # Jobs may report from several threads; one message at a time on the pipe
+        with self._lock:
+            self._conn.send((kind, self.job_id, payload))
+
+
+def _resolve(target: str) -> Callable[..., Any]:
+    module_name, _, function_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def _worker_main(conn: Connection, cancel_flag):
+    """Worker process loop: run jobs sent by the server until told to stop.
+
+    cancel_flag is the worker's multiprocessing.Event: the server clears it
+    before sending a job and sets it to cancel that job gracefully.
+    """
+    # Ctrl-C reaches the whole process group; the server decides when workers stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Lead a process group of our own, so that kill() also stops the
+    # processes a job starts (e.g. an evaluation pool) instead of orphaning them
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    lock = threading.Lock()
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+
+        job_id, target, kwargs = message
+        channel = JobChannel(job_id, conn, lock, CancelToken(flag=cancel_flag))
+        channel._send("started", os.getpid())
+        try:
+            result = _resolve(target)(channel, **kwargs)
+        except Cancelled as e:
+            channel._publish_metrics(force=True)
+            channel._send("cancelled", {"error": str(e) or "cancelled"})
+        except Exception as e:
+            channel._publish_metrics(force=True)
+            channel._send("failed", {"error": str(e) or type(e).__name__, "traceback": traceback.format_exc()})
+        else:
+            channel._publish_metrics(force=True)
+            channel._send("finished", result)
+
+
+class _Worker:
+    """A worker process and the server's end of its pipe."""
+
+    def __init__(self, ctx, index: int):
+        self.index = index
+        self.conn, child_conn = ctx.Pipe()
+        self.cancel_flag = ctx.Event()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child_conn, self.cancel_flag), name=f"job-worker-{index}"
+        )
+        self.process.start()
+        child_conn.close()
+        self.job_id: Optional[str] = None
+        self.kill_at: Optional[float] = None  # monotonic deadline of a graceful cancel
+        self.jobs_run = 0
+        self.info: Dict[str, Any] = {}
+        self.metrics: telemetry.Snapshot = {}
+
+    def stop(self, timeout: float):
+        """Ask the worker to exit after its current job; terminate it after timeout."""
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        self.kill()
+
+    def kill(self):
+        """Terminate the worker process, and any processes its job started, immediately."""
+        if self.process.is_alive():
+            try:
+                os.killpg(self.process.pid, signal.SIGTERM)
+            except (AttributeError, OSError):
+                # No process groups (Windows), or the worker has not set up its group yet
+                self.process.terminate()
+            self.process.join(5)
+        self.conn.close()
+
+
+Notification = Tuple[Job, Optional[Dict[str, Any]]]
+
+
+class JobRunner:
+    """Bounded job queue in front of a pool of worker processes.
+
+    Worker processes are started on first submit.
+
+    Args:
+        max_workers: Worker processes (= maximum concurrent jobs)
+        max_queued: Jobs allowed to wait for a worker; submit raises QueueFull beyond that
+        on_event: Called as on_event(job, event) for every event a job emits and
+            with event=None on every lifecycle or progress change. Runs on the
+            runner's monitor thread.
+        start_method: multiprocessing start method for workers
+        max_finished: Finished jobs kept for get() and wait(); the oldest are
+            dropped beyond that (their records live on in the state store)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = config.JOB_WORKERS,
+        max_queued: int = config.JOB_QUEUE_SIZE,
+        on_event: Optional[Callable[[Job, Optional[Dict[str, Any]]], None]] = None,
+        start_method: str = config.JOB_START_METHOD,
+        max_finished: int = config.JOB_HISTORY_SIZE,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_queued = max(0, max_queued)
+        self.on_event = on_event
+        self.start_method = start_method
+        self.max_finished = max(0, max_finished)
+
+        self._jobs: Dict[str, Job] = {}
+        self._pending: Deque[Job] = deque()
+        self._finished: Deque[Job] = deque()  # in finishing order, for eviction
+        self._workers: List[_Worker] = []
+        self._retired_metrics: telemetry.Snapshot = {}  # last snapshots of replaced workers
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+        self._ctx = None
+        self._wake_r = self._wake_w = None
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def start(self):
+        """Start the worker processes and the monitor thread (idempotent)."""
+        with self._lock:
+            if self._monitor_thread is not None:
+                return
+            if self._stopping:
+                raise RuntimeError("JobRunner has been shut down")
+            self._ctx = multiprocessing.get_context(self.start_method)
+            self._wake_r, self._wake_w = self._ctx.Pipe(duplex=False)
+            self._workers = [_Worker(self._ctx, i) for i in range(self.max_workers)]
+            self._monitor_thread = threading.Thread(target=self._monitor, name="job-runner", daemon=True)
+            self._monitor_thread.start()
+            atexit.register(self.shutdown)
+
+    def submit(self, job_id: str, target: str, **kwargs) -> Job:
+        """Queue a job.
+
+        Args:
+            job_id: Unique job identifier
+            target: "module:function" called in a worker as function(channel, **kwargs)
+            **kwargs: Picklable job arguments
+
+        Returns:
+            The Job (already running if a worker was idle)
+
+        Raises:
+            QueueFull: If max_queued jobs are already waiting
+            ValueError: If a job with this id is queued or running
+        """
+        self.start()
+        with self._lock:
+            existing = self._jobs.get(job_id)
+            if existing is not None and not existing.finished:
+                raise ValueError(f"Job {job_id} is already {existing.status}")
+            if len(self._pending) >= self.max_queued and not self._idle_workers():
+                raise QueueFull(
+                    f"{len(self._pending)} job(s) already queued and all {self.max_workers} worker(s) busy"
+                )
+            job = Job(job_id=job_id, target=target, kwargs=kwargs)
+            self._jobs[job_id] = job
+            self._pending.append(job)
+            notifications = [(job, None)] + self._dispatch()
+            self._changed.notify_all()
+        self._notify(notifications)
+        return job
+
+    def cancel(self, job_id: str, grace: Optional[float] = None) -> Job:
+        """Cancel a queued or running job (finished jobs are returned unchanged).
+
+        Args:
+            job_id: Job to cancel
+            grace: None terminates a running job's worker right away. Otherwise
+                the job's token is cancelled and the job stays running until it
+                stops by itself; its worker is terminated if it is still
+                running after grace seconds. Queued jobs are always dropped.
+
+        Raises:
+            KeyError: If the job is unknown
+        """
+        with self._lock:
+            job = self._jobs[job_id]
+            if job.finished:
+                return job
+            worker = next((w for w in self._workers if w.job_id == job_id), None)
+            if job.status == QUEUED:
+                self._pending.remove(job)
+            elif worker is not None and grace is not None:
+                worker.cancel_flag.set()
+                if worker.kill_at is None:
+                    worker.kill_at = time.monotonic() + grace
+                self._wake()
+                return job
+            elif worker is not None:
+                self._replace_worker(worker)
+            self._finish(job, CANCELLED)
+            notifications = [(job, None)] + self._dispatch()
+            self._changed.notify_all()
+        self._wake()
+        self._notify(notifications)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """The job with this id, or None."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[Job]:
+        """All known jobs, oldest first."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        """0-based position of a queued job (None if it is not queued)."""
+        with self._lock:
+            for position, job in enumerate(self._pending):
+                if job.job_id == job_id:
+                    return position
+        return None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Job:
+        """Block until a job has finished (or timeout expires); returns the job."""
+        with self._changed:
+            job = self._jobs[job_id]
+            self._changed.wait_for(lambda: job.finished, timeout=timeout)
+            return job
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool and queue occupancy, plus per-worker info."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queued": self.max_queued,
+                "running": sum(1 for w in self._workers if w.job_id is not None),
+                "queued": len(self._pending),
+                "workers": [
+                    {
+                        "index": w.index,
+                        "pid": w.process.pid,
+                        "job_id": w.job_id,
+                        "jobs_run": w.jobs_run,
+                        **w.info,
+                    }
+                    for w in self._workers
+                ],
+            }
+
+    def metrics(self) -> telemetry.Snapshot:
+        """Metrics recorded by this runner's worker processes, including replaced ones."""
+        with self._lock:
+            return telemetry.combine([self._retired_metrics, *(w.metrics for w in self._workers)])
+
+    def shutdown(self, timeout: float = 5.0):
+        """Cancel queued jobs and stop the workers (running jobs get timeout seconds)."""
+        with self._lock:
+            if self._stopping:
+                return
+            self._stopping = True
+            notifications = []
+            while self._pending:
+                job = self._pending.popleft()
+                self._finish(job, CANCELLED)
+                notifications.append((job, None))
+            workers = list(self._workers)
+
+        for worker in workers:
+            worker.stop(timeout)
+
+        with self._lock:
+            for worker in workers:
+                job = self._jobs.get(worker.job_id) if worker.job_id else None
+                if job is not None and not job.finished:
+                    self._finish(job, CANCELLED, error="Job runner shut down")
+                    notifications.append((job, None))
+                worker.job_id = None
+            self._changed.notify_all()
+        self._wake()
+        if self._monitor_thread is not None:
+            self._monitor_thread.join(timeout)
+            atexit.unregister(self.shutdown)
+        self._notify(notifications)
+
+    def _monitor(self):
+        while True:
+            with self._lock:
+                if self._stopping:
+                    return
+                by_handle = {}
+                for worker in self._workers:
+                    by_handle[worker.conn] = worker
+                    by_handle[worker.process.sentinel] = worker
+                kill_ats = [w.kill_at for w in self._workers if w.kill_at is not None]
+            timeout = 1.0
+            if kill_ats:
+                timeout = min(timeout, max(0.0, min(kill_ats) - time.monotonic()))
+
+            try:
+                ready = wait(list(by_handle) + [self._wake_r], timeout=timeout)
+            except OSError:
+                continue  # a worker was replaced (its pipe closed) before we waited on it
+
+            notifications: List[Notification] = []
+            with self._lock:
+                if self._stopping:
+                    return
+                if self._wake_r in ready:
+                    while self._wake_r.poll():
+                        self._wake_r.recv_bytes()
+                for worker in {by_handle[handle] for handle in ready if handle in by_handle}:
+                    if worker not in self._workers:
+                        continue  # replaced (cancelled) since we started waiting
+                    notifications.extend(self._drain(worker))
+                    if not worker.process.is_alive():
+                        notifications.extend(self._worker_died(worker))
+                notifications.extend(self._kill_overdue())
+                notifications.extend(self._dispatch())
+                if notifications:
+                    self._changed.notify_all()
+            self._notify(notifications)
+
+    def _drain(self, worker: _Worker) -> List[Notification]:
+        """Handle every message the worker has sent so far."""
+        notifications = []
+        try:
+            while worker.conn.poll():
+                notifications.extend(self._handle(worker, *worker.conn.recv()))
+        except (EOFError, OSError):
+            pass
+        return notifications
+
+    def _handle(self, worker: _Worker, kind: str, job_id: str, payload: Any) -> List[Notification]:
+        if kind == "metrics":
+            worker.metrics = payload  # per worker, so kept even for a cancelled job
+            return []
+        job = self._jobs.get(job_id)
+        if job is None or job.finished or worker.job_id != job_id:
+            return []  # late message from a cancelled job
+
+        if kind == "started":
+            job.worker_pid = payload
+            return [(job, None)]
+        if kind == "event":
+            return [(job, payload)]
+        if kind == "progress":
+            job.progress.update(payload)
+            return [(job, None)]
+        if kind == "worker_info":
+            worker.info.update(payload)
+            return []
+
+        worker.job_id = None
+        worker.kill_at = None
+        worker.jobs_run += 1
+        if kind == "finished":
+            job.result = payload
+            self._finish(job, COMPLETED)
+        elif kind == "cancelled":
+            self._finish(job, CANCELLED, error=payload["error"])
+        else:
+            logger.error(f"[{job_id}] Job failed: {payload['error']}\n{payload['traceback']}")
+            self._finish(job, FAILED, error=payload["error"])
+        return [(job, None)]
+
+    def _worker_died(self, worker: _Worker) -> List[Notification]:
+        exitcode = worker.process.exitcode
+        logger.warning(f"Job worker {worker.index} (pid {worker.process.pid}) exited with code {exitcode}")
+        notifications = []
+        job = self._jobs.get(worker.job_id) if worker.job_id else None
+        if job is not None and not job.finished:
+            self._finish(job, FAILED, error=f"Worker process exited unexpectedly (exit code {exitcode})")
+            notifications.append((job, None))
+        self._replace_worker(worker)
+        return notifications
+
+    def _kill_overdue(self) -> List[Notification]:
+        """Terminate workers whose job outlived its graceful cancel."""
+        notifications = []
+        now = time.monotonic()
+        for worker in list(self._workers):
+            if worker.kill_at is None or worker.kill_at > now:
+                continue
+            job = self._jobs.get(worker.job_id) if worker.job_id else None
+            self._replace_worker(worker)
+            if job is not None and not job.finished:
+                logger.warning(f"[{job.job_id}] Job did not stop within its cancel grace period; worker terminated")
+                self._finish(job, CANCELLED, error="Terminated after cancel grace period")
+                notifications.append((job, None))
+        return notifications
+
+    def _replace_worker(self, worker: _Worker):
+        worker.kill()
+        worker.job_id = None
+        # Gauges of a dead worker (e.g. its storage queue depth) no longer hold
+        self._retired_metrics = telemetry.combine(
+            [self._retired_metrics, telemetry.without_gauges(worker.metrics)]
+        )
+        self._workers[self._workers.index(worker)] = _Worker(self._ctx, worker.index)
+
+    def _idle_workers(self) -> List[_Worker]:
+        return [w for w in self._workers if w.job_id is None and w.process.is_alive()]
+
+    def _dispatch(self) -> List[Notification]:
+        """Hand queued jobs to idle workers."""
+        notifications = []
+        for worker in self._idle_workers():
+            if not self._pending:
+                break
+            job = self._pending.popleft()
+            worker.cancel_flag.clear()  # a late graceful cancel of the previous job
+            try:
+                worker.conn.send((job.job_id, job.target, job.kwargs))
+            except (BrokenPipeError, EOFError, ConnectionError):
+                self._pending.appendleft(job)  # the monitor replaces the dead worker
+                continue
+            except Exception as e:
+                self._finish(job, FAILED, error=f"Could not send job to worker: {e}")
+                notifications.append((job, None))
+                continue
+            worker.job_id = job.job_id
+            job.status = RUNNING
+            job.started_at = datetime.now().isoformat()
+            job.worker_pid = worker.process.pid
+            notifications.append((job, None))
+        return notifications
+
+    def _finish(self, job: Job, status: str, error: Optional[str] = None):
+        job.status = status
+        job.finished_at = datetime.now().isoformat()
+        if error is not None:
+            job.error = error
+        self._finished.append(job)
+        while len(self._finished) > self.max_finished:
+            evicted = self._finished.popleft()
+            if self._jobs.get(evicted.job_id) is evicted:  # not resubmitted since
+                del self._jobs[evicted.job_id]
+
+    def _wake(self):
+        if self._wake_w is not None:
+            try:
+                self._wake_w.send_bytes(b"")
+            except OSError:
+                pass
+
+    def _notify(self, notifications: List[Notification]):
+        if self.on_event is None:
+            return
+        for job, event in notifications:
+            try:
+                self.on_event(job, event)
+            except Exception as e:
+                logger.error(f"[{job.job_id}] Job event handler failed: {e}", exc_info=True)
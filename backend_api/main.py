@@ -1,31 +1,39 @@
 """FastAPI backend for Darwin evolution viewer."""
 
-from collections import deque, Counter
+from collections import deque, Counter, OrderedDict
 import time
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, status
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import List, Deque, Dict, Any, Literal, Optional, Tuple, Union
 import json
 import asyncio
 from pathlib import Path
 from datetime import datetime
 import logging
 import traceback
+import uuid
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import config
-from graph.schema import UniverseSpec, TimeConfig, DateRange
-from data.polygon_client import PolygonClient
-from evolution.darwin import run_darwin
+import telemetry
+from graph.schema import StrategyGraph, UniverseSpec, TimeConfig, DateRange
+from backend_api.jobs import CANCELLED, COMPLETED, FINISHED_STATES, Job, JobRunner, QueueFull
+from backend_api.event_log import EVENT_LOG_NAME, RunEventLog, parse_last_event_id
+from backend_api.events import EventBus
+from backend_api.state import fail_orphaned_jobs, get_state_store
+from backend_api import artifacts
+from evolution.storage import RunReader
+from evolution.playback import assemble_playback
+from evolution.catalog import DEFAULT_PAGE_SIZE, InvalidCursor, RunCatalog
 from validation.evaluation import Phase3Config
 from graph.gene_pool import get_registry
 from graph.gene_pool import get_registry
-from llm.cache import get_budget, reset_budget, get_global_budget, LLMBudget
+from llm.cache import get_global_budget, LLMBudget
 from llm.transcripts import list_transcripts as list_llm_transcripts, read_transcript as read_llm_transcript
 import hashlib
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -44,13 +52,27 @@ logger = logging.getLogger(__name__)
 
 REQUEST_LOG_SIZE = 250
 ERROR_LOG_SIZE = 50
-request_history = deque(maxlen=REQUEST_LOG_SIZE)
-error_history = deque(maxlen=ERROR_LOG_SIZE)
+
+
+# Request and error history entries wait here until _flush_history() writes
+# them to the state store off the event loop (oldest dropped if it falls behind)
+_pending_history: Deque[Tuple[str, Dict[str, Any], int]] = deque(maxlen=REQUEST_LOG_SIZE + ERROR_LOG_SIZE)
 
 
 def _record_error(entry: Dict[str, Any]):
-    """Keep a bounded history of recent backend errors."""
-    error_history.append(entry)
+    """Keep a bounded history of recent backend errors (shared by all API processes)."""
+    _pending_history.append(("errors", entry, ERROR_LOG_SIZE))
+
+
+def _flush_history():
+    """Write buffered request/error entries to the state store (blocking)."""
+    store = get_state_store()
+    while True:
+        try:
+            log, entry, keep = _pending_history.popleft()
+        except IndexError:  # drained (possibly by a concurrent flush)
+            return
+        store.record(log, entry, keep=keep)
 
 
 app = FastAPI(title="Darwin Evolution API", version="1.0.0")
@@ -98,16 +120,20 @@ async def log_request_details(request: Request, call_next):
             "client": client_host,
             "user_agent": request.headers.get("user-agent"),
         }
-        request_history.append(record)
+        _pending_history.append(("requests", record, REQUEST_LOG_SIZE))
         if status_code >= 400:
             logger.info(
                 f"HTTP {status_code} {request.method} {request.url.path}{query_string} "
                 f"from {client_host} (UA={record['user_agent']}) in {duration:.3f}s"
             )
 
-# Track running jobs with event queues
+# Event logs of the jobs this process runs. Job state lives in the shared
+# state store (backend_api/state.py) so any API process can serve any run.
 running_jobs: Dict[str, Dict[str, Any]] = {}
 
+# Pushes run events to SSE subscribers as they happen (see backend_api/events.py)
+event_bus = EventBus()
+
 
 def _get_run_dir(run_id: str) -> Path:
     run_dir = config.RESULTS_DIR / "runs" / run_id
@@ -116,18 +142,143 @@ def _get_run_dir(run_id: str) -> Path:
 
 FINGERPRINT_NODE_DIMENSIONS = sorted(get_registry().get_all_types())[:18]
 
+def _run_event_log(run_id: str) -> RunEventLog:
+    return RunEventLog(_get_run_dir(run_id) / EVENT_LOG_NAME)
 
-def emit_event(run_id: str, event_type: str, data: Dict[str, Any] = None):
-    """Emit a structured event for a run."""
-    if run_id not in running_jobs:
-        return
 
-    event = {
-        "type": event_type,
+def _append_event(run_id: str, event: Dict[str, Any]):
+    """Log an event for a run and push it to the run's SSE subscribers."""
+    event_id = running_jobs[run_id]["events"].append(event)
+    event_bus.publish(run_id, event, seq=event_id)
+
+
+def _status_event(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "type": "status",
+        "status": job["status"],
         "timestamp": datetime.now().isoformat(),
-        **(data or {})
+        "progress": job.get("progress", {}),
     }
-    running_jobs[run_id]["events"].append(event)
+
+
+def _on_job_update(job: Job, event: Optional[Dict[str, Any]]):
+    """JobRunner callback: log a job's events and publish its state to the state store."""
+    entry = running_jobs.get(job.job_id)
+    if entry is None:
+        entry = running_jobs[job.job_id] = {"events": _run_event_log(job.job_id), "status": None}
+    if job.status == CANCELLED and entry["status"] != CANCELLED:
+        _append_event(job.job_id, {"type": "run_cancelled", "timestamp": job.finished_at, "message": "Run cancelled"})
+    if event is not None:
+        _append_event(job.job_id, event)
+        return
+
+    entry["status"] = job.status
+    view = job.to_dict()
+    get_state_store().save_job(view)
+    if job.finished:
+        entry["events"].close()
+    event_bus.publish(job.job_id, _status_event(view))
+
+
+# Darwin runs execute in worker processes, off the event loop (see backend_api/jobs.py)
+job_runner = JobRunner(on_event=_on_job_update)
+app.router.add_event_handler("shutdown", job_runner.shutdown)
+
+
+async def _apply_cancel_requests():
+    """Cancel this process's jobs when a cancel request reached another API process.
+
+    Requests stay pending until the job finishes, so these cancels are
+    graceful (repeating one keeps its original grace deadline).
+    """
+    while True:
+        await asyncio.sleep(config.API_STATE_POLL_SECONDS)
+        try:
+            for job_id in get_state_store().cancel_requests():
+                if job_runner.get(job_id) is not None:
+                    job_runner.cancel(job_id, grace=config.JOB_CANCEL_GRACE_SECONDS)
+        except Exception as e:
+            logger.warning(f"Failed to apply cancel requests: {e}")
+
+
+def _start_cancel_watcher():
+    orphaned = fail_orphaned_jobs(get_state_store())
+    if orphaned:
+        logger.warning(f"Marked {len(orphaned)} job(s) of exited API processes as failed: {orphaned}")
+    app.state.cancel_watcher = asyncio.get_running_loop().create_task(_apply_cancel_requests())
+
+
+def _stop_cancel_watcher():
+    watcher = getattr(app.state, "cancel_watcher", None)
+    if watcher is not None:
+        watcher.cancel()
+
+
+app.router.add_event_handler("startup", _start_cancel_watcher)
+app.router.add_event_handler("shutdown", _stop_cancel_watcher)
+
+
+def _publish_metrics():
+    """Save this process's metrics, including its job workers', to the state store."""
+    get_state_store().save_metrics(telemetry.combine([telemetry.snapshot(), job_runner.metrics()]))
+
+
+async def _publish_metrics_periodically():
+    while True:
+        await asyncio.sleep(config.METRICS_PUBLISH_SECONDS)
+        try:
+            _publish_metrics()
+        except Exception as e:
+            logger.warning(f"Failed to publish metrics: {e}")
+
+
+def _start_metrics_publisher():
+    app.state.metrics_publisher = asyncio.get_running_loop().create_task(_publish_metrics_periodically())
+
+
+def _stop_metrics_publisher():
+    publisher = getattr(app.state, "metrics_publisher", None)
+    if publisher is not None:
+        publisher.cancel()
+
+
+app.router.add_event_handler("startup", _start_metrics_publisher)
+app.router.add_event_handler("shutdown", _stop_metrics_publisher)
+
+
+async def _flush_history_periodically():
+    while True:
+        await asyncio.sleep(config.API_STATE_POLL_SECONDS)
+        try:
+            await asyncio.to_thread(_flush_history)
+        except Exception as e:
+            logger.warning(f"Failed to save request history: {e}")
+
+
+def _start_history_writer():
+    app.state.history_writer = asyncio.get_running_loop().create_task(_flush_history_periodically())
+
+
+def _stop_history_writer():
+    writer = getattr(app.state, "history_writer", None)
+    if writer is not None:
+        writer.cancel()
+    try:
+        _flush_history()
+    except Exception as e:
+        logger.warning(f"Failed to save request history: {e}")
+
+
+app.router.add_event_handler("startup", _start_history_writer)
+app.router.add_event_handler("shutdown", _stop_history_writer)
+
+
+def _submit_job(run_id: str, target: str, **kwargs) -> Job:
+    """Queue a run on the job runner (503 when the queue is full)."""
+    try:
+        return job_runner.submit(run_id, target, **kwargs)
+    except QueueFull as e:
+        raise HTTPException(status_code=503, detail=f"Run queue is full: {e}")
 
 
 class RunRequest(BaseModel):
@@ -144,27 +295,48 @@ class RunRequest(BaseModel):
     robust_mode: bool = False
 
 
-@app.get("/api/runs")
-async def list_runs():
-    """List all run IDs and their summaries."""
-    runs_dir = config.RESULTS_DIR / "runs"
+_run_catalog_instance: Optional[RunCatalog] = None
 
-    if not runs_dir.exists():
-        return {"runs": []}
 
-    runs = []
-    for run_dir in sorted(runs_dir.iterdir(), reverse=True):
-        if run_dir.is_dir():
-            summary_file = run_dir / "summary.json"
-            if summary_file.exists():
-                with open(summary_file) as f:
-                    summary = json.load(f)
-                runs.append({
-                    "run_id": run_dir.name,
-                    "summary": summary
-                })
+def _run_catalog() -> RunCatalog:
+    """Process-wide run catalog (legacy run directories are indexed once on first use)."""
+    global _run_catalog_instance
+    if _run_catalog_instance is None or _run_catalog_instance.db_path.parent != config.RESULTS_DIR:
+        catalog = RunCatalog()
+        catalog.backfill(config.RESULTS_DIR / "runs")
+        _run_catalog_instance = catalog
+    return _run_catalog_instance
 
-    return {"runs": runs}
+
+@app.get("/api/runs")
+async def list_runs(
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    min_fitness: Optional[float] = None,
+    max_fitness: Optional[float] = None,
+    fields: Optional[str] = None,
+):
+    """List runs with their summaries, newest first.
+
+    Query params:
+        limit: Page size (max 500)
+        cursor: next_cursor from the previous page
+        status: Filter by run status (e.g. "completed", "failed_compile")
+        min_fitness / max_fitness: Filter by best fitness
+        fields: Comma-separated summary keys to return (default: all)
+    """
+    try:
+        return _run_catalog().list(
+            limit=limit,
+            cursor=cursor or None,
+            status=status,
+            min_fitness=min_fitness,
+            max_fitness=max_fitness,
+            fields=[f.strip() for f in fields.split(",") if f.strip()] if fields else None,
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 class CreateRunRequest(BaseModel):
@@ -178,75 +350,9 @@ class CreateRunRequest(BaseModel):
     demo_mode: bool = False
 
 
-def _run_darwin_task(
-    seed_prompt: str,
-    universe: UniverseSpec,
-    time_config: TimeConfig,
-    depth: int,
-    branching: int,
-    survivors_per_layer: int,
-    phase3_config: Optional[Phase3Config],
-    run_id: str,
-):
-    """Background task: fetch market data, then run Darwin."""
-    import time as _time
-    try:
-        t0 = _time.monotonic()
-        logger.info(f"[{run_id}] Fetching market data...")
-        client = PolygonClient()
-        symbols = universe.resolve_symbols()
-        dr = time_config.date_range
-
-        # Fetch data for first successful symbol (break early for speed)
-        data = None
-        for sym in symbols:
-            try:
-                df = client.get_bars(
-                    symbol=sym,
-                    timeframe=time_config.timeframe,
-                    start=dr.start,
-                    end=dr.end,
-                )
-                if df is not None and not df.empty:
-                    logger.info(f"[{run_id}] Fetched {len(df)} bars for {sym}")
-                    data = df
-                    logger.info(f"[{run_id}] Using {sym} as primary data source")
-                    break  # Use first successful symbol, skip rest
-            except Exception as e:
-                logger.warning(f"[{run_id}] Failed to fetch {sym}: {e}")
-
-        t_data = _time.monotonic()
-        logger.info(f"[{run_id}] Data fetch took {t_data - t0:.1f}s")
-
-        if data is None:
-            logger.error(f"[{run_id}] No data fetched for any symbol!")
-            return
-
-        logger.info(f"[{run_id}] Starting Darwin evolution with {len(data)} bars...")
-        summary = run_darwin(
-            data=data,
-            universe=universe,
-            time_config=time_config,
-            nl_text=seed_prompt,
-            depth=depth,
-            branching=branching,
-            survivors_per_layer=survivors_per_layer,
-            phase3_config=phase3_config,
-            run_id=run_id,
-            rescue_mode=True,
-        )
-        t_done = _time.monotonic()
-        logger.info(f"[{run_id}] Darwin run complete! Total: {t_done - t0:.1f}s (data: {t_data - t0:.1f}s, evolution: {t_done - t_data:.1f}s)")
-
-    except Exception as e:
-        logger.error(f"[{run_id}] Darwin run failed: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-
-
 @app.post("/api/runs")
-async def create_run(request: CreateRunRequest, background_tasks: BackgroundTasks):
-    """Create a new Darwin evolution run in the background."""
+async def create_run(request: CreateRunRequest):
+    """Queue a new Darwin evolution run on the job runner."""
     # Demo mode: return pre-baked Gap & Go results instantly
     if request.demo_mode:
         demo_dir = config.RESULTS_DIR / "runs" / "demo_gap_and_go"
@@ -279,32 +385,31 @@ async def create_run(request: CreateRunRequest, background_tasks: BackgroundTask
             phase3_config = Phase3Config(**request.phase3_config)
 
         # Generate run ID
-        import uuid
         run_id = f"run_{uuid.uuid4().hex[:8]}"
 
-        # Start Darwin in background (maps frontend names to run_darwin params)
-        background_tasks.add_task(
-            _run_darwin_task,
-            seed_prompt=request.seed_prompt,
-            universe=universe,
-            time_config=time_config,
-            depth=request.generations,
-            branching=request.children_per_survivor,
-            survivors_per_layer=request.survivors_per_gen,
-            phase3_config=phase3_config,
-            run_id=run_id,
-        )
-
-        return {
-            "run_id": run_id,
-            "status": "started",
-            "message": f"Darwin run {run_id} started in background. Check /api/runs/{run_id} for progress."
-        }
-
     except Exception as e:
         logger.error(f"Failed to create run: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
+    # Queue Darwin on the job runner (maps frontend names to run_darwin params)
+    job = _submit_job(
+        run_id,
+        "backend_api.darwin_jobs:run_darwin_task",
+        seed_prompt=request.seed_prompt,
+        universe=universe.model_dump(),
+        time_config=time_config.model_dump(),
+        depth=request.generations,
+        branching=request.children_per_survivor,
+        survivors_per_layer=request.survivors_per_gen,
+        phase3_config=phase3_config.model_dump() if phase3_config else None,
+    )
+
+    return {
+        "run_id": run_id,
+        "status": job.status,
+        "message": f"Darwin run {run_id} {job.status}. Check /api/jobs/{run_id} for progress."
+    }
+
 
 @app.get("/api/runs/{run_id}")
 async def get_run(run_id: str):
@@ -330,141 +435,89 @@ async def get_run(run_id: str):
     return result
 
 
+PLAYBACK_CACHE_SIZE = 8
+_playback_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _playback_state(run_dir: Path):
+    """(reader, version, cache key, ETag) for a run's playback document.
+
+    The ETag changes whenever a playback entry is written (version), the
+    summary is rewritten (best_fitness) or the run's store is replaced.
+    """
+    reader = RunReader(run_dir)
+    version = reader.playback_version()
+    summary_file = run_dir / "summary.json"
+    summary_mtime = summary_file.stat().st_mtime_ns if summary_file.exists() else 0
+    db_file = run_dir / "run.db"
+    db_ino = db_file.stat().st_ino if db_file.exists() else 0
+    return reader, version, f"{run_dir}:{db_ino}", f'"{db_ino}-{version}-{summary_mtime}"'
+
+
 @app.get("/api/runs/{run_id}/playback")
-async def get_run_playback(run_id: str):
+async def get_run_playback(run_id: str, request: Request):
     """Return run data in the frontend playback format.
 
-    Reconstructs the {generations, lineage} structure the frontend
-    useEvolutionPlayback hook expects from stored graphs + evals.
+    Assembled from the playback entries RunStorage materializes as
+    evaluations land. Responses carry an ETag; a matching If-None-Match gets
+    304. Recently served runs are cached in memory and brought up to date
+    with only the entries written since.
     """
     run_dir = config.RESULTS_DIR / "runs" / run_id
     if not run_dir.exists():
         raise HTTPException(status_code=404, detail="Run not found")
 
-    graphs_dir = run_dir / "graphs"
-    evals_dir = run_dir / "evals"
-    summary_file = run_dir / "summary.json"
+    reader, version, cache_key, etag = _playback_state(run_dir)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    cached = _playback_cache.get(cache_key)
+    if cached is None or cached["etag"] != etag:
+        if cached is None or cached["version"] > version:
+            cached = {"entries": {}, "version": 0}
+        entries = dict(cached["entries"])
+        for _, entry in reader.playback_entries(after=cached["version"]):
+            entries[entry["id"]] = entry
+
+        summary_file = run_dir / "summary.json"
+        summary = json.loads(summary_file.read_text()) if summary_file.exists() else {}
+        cached = {
+            "entries": entries,
+            "version": version,
+            "etag": etag,
+            "document": assemble_playback(run_id, list(entries.values()), summary),
+        }
+    _playback_cache[cache_key] = cached
+    _playback_cache.move_to_end(cache_key)
+    while len(_playback_cache) > PLAYBACK_CACHE_SIZE:
+        _playback_cache.popitem(last=False)
 
-    # Load all graphs and evals
-    strategies = []
-    if graphs_dir.exists():
-        for gf in sorted(graphs_dir.glob("*.json")):
-            graph_id = gf.stem
-            graph = json.loads(gf.read_text())
-
-            # Load matching eval
-            eval_file = evals_dir / f"{graph_id}.json"
-            eval_data = json.loads(eval_file.read_text()) if eval_file.exists() else {}
-
-            # Determine state from eval decision
-            decision = eval_data.get("decision", "survive")
-            if decision == "survive":
-                state = "alive"
-            elif decision == "kill":
-                state = "dead"
-            else:
-                state = "alive"
-
-            # Build results in mock-compatible format
-            val_report = eval_data.get("validation_report", {})
-            fitness = eval_data.get("fitness", val_report.get("fitness", 0))
-            train = val_report.get("train_metrics", {})
-            holdout = val_report.get("holdout_metrics", {})
-            penalties = val_report.get("penalties", {})
-            failures = val_report.get("failure_labels", [])
-
-            results = {
-                "phase3": {
-                    "aggregated_fitness": fitness,
-                    "median_fitness": fitness,
-                    "penalties": penalties,
-                    "regime_coverage": {
-                        "unique_regimes": 1,
-                        "years_covered": 0.33,
-                        "per_regime_fitness": {},
-                    },
-                    "episodes": [
-                        {
-                            "label": "full_period",
-                            "start_ts": graph.get("time", {}).get("date_range", {}).get("start", "2024-10-01"),
-                            "fitness": fitness,
-                            "tags": {
-                                "trend": "bull" if holdout.get("return_pct", 0) > 0 else "bear",
-                                "vol_bucket": "medium",
-                                "chop_bucket": "medium",
-                                "drawdown_state": "normal",
-                            },
-                            "difficulty": 0.5,
-                            "debug_stats": {
-                                "return_pct": holdout.get("return_pct", 0),
-                                "sharpe": holdout.get("sharpe", 0),
-                                "max_dd_pct": holdout.get("max_dd_pct", 0),
-                                "trades": holdout.get("trades", 0),
-                                "win_rate": holdout.get("win_rate", 0),
-                            },
-                        }
-                    ],
-                },
-                "red_verdict": {
-                    "verdict": "SURVIVE" if decision == "survive" else "KILL",
-                    "failures": failures,
-                    "next_action": "breed" if decision == "survive" else "discard",
-                },
-                "fitness": fitness,
-            }
+    return JSONResponse(cached["document"], headers={"ETag": etag})
 
-            # Ensure graph has metadata.generation
-            if "metadata" not in graph:
-                graph["metadata"] = {}
-            if "generation" not in graph["metadata"]:
-                graph["metadata"]["generation"] = 0
-
-            strategies.append({
-                "id": graph.get("graph_id", graph_id),
-                "graph": graph,
-                "results": results,
-                "state": state,
-            })
-
-    # Mark top strategy as elite
-    if strategies:
-        strategies.sort(key=lambda s: s["results"].get("fitness", 0), reverse=True)
-        strategies[0]["state"] = "elite"
-
-    # Build generations array (group by metadata.generation)
-    gen_map = {}
-    for s in strategies:
-        gen = s["graph"].get("metadata", {}).get("generation", 0)
-        gen_map.setdefault(gen, []).append(s)
-
-    max_gen = max(gen_map.keys()) if gen_map else 0
-    generations = [gen_map.get(g, []) for g in range(max_gen + 1)]
-
-    # Build lineage
-    lineage = {"roots": [], "edges": []}
-    for s in strategies:
-        parent = s["graph"].get("metadata", {}).get("parent_graph")
-        if parent:
-            lineage["edges"].append({"parent": parent, "child": s["id"]})
-        else:
-            lineage["roots"].append(s["id"])
 
-    # Load summary for stats
-    summary = {}
-    if summary_file.exists():
-        summary = json.loads(summary_file.read_text())
+@app.get("/api/runs/{run_id}/playback/delta")
+async def get_run_playback_delta(run_id: str, cursor: int = 0):
+    """Playback entries written since a cursor.
+
+    Query params:
+        cursor: cursor from the previous delta response (0 for everything)
+
+    Returns:
+        {"run_id", "cursor", "strategies", "champion_id"}.
+        strategies holds new entries and entries whose evaluation changed;
+        pass the returned cursor on the next call.
+    """
+    run_dir = config.RESULTS_DIR / "runs" / run_id
+    if not run_dir.exists():
+        raise HTTPException(status_code=404, detail="Run not found")
 
+    reader = RunReader(run_dir)
+    written = reader.playback_entries(after=max(0, cursor))
     return {
         "run_id": run_id,
-        "generations": generations,
-        "lineage": lineage,
-        "champion": strategies[0] if strategies else None,
-        "stats": {
-            "total_strategies": len(strategies),
-            "total_survivors": sum(1 for s in strategies if s["state"] in ("alive", "elite")),
-            "survival_rate": sum(1 for s in strategies if s["state"] in ("alive", "elite")) / max(len(strategies), 1),
-            "best_fitness": summary.get("best_fitness", 0),
-        },
+        "cursor": written[-1][0] if written else max(0, cursor),
+        "strategies": [entry for _, entry in written],
+        "champion_id": reader.champion_id(),
     }
 
 
@@ -472,18 +525,10 @@ async def get_run_playback(run_id: str):
 async def get_lineage(run_id: str):
     """Get lineage for a run."""
     run_dir = config.RESULTS_DIR / "runs" / run_id
-    lineage_file = run_dir / "lineage.jsonl"
-
-    if not lineage_file.exists():
+    if not run_dir.exists():
         return {"lineage": []}
 
-    lineage = []
-    with open(lineage_file) as f:
-        for line in f:
-            if line.strip():
-                lineage.append(json.loads(line))
-
-    return {"lineage": lineage}
+    return {"lineage": RunReader(run_dir).lineage()}
 
 
 @app.get("/api/runs/{run_id}/lineage_graph")
@@ -497,110 +542,10 @@ async def get_lineage_graph(run_id: str):
     return result
 
 
-def _load_eval_metadata(run_dir: Path, graph_id: str):
-    eval_file = run_dir / "evals" / f"{graph_id}.json"
-    if not eval_file.exists():
-        return {}
-
-    try:
-        with open(eval_file) as f:
-            data = json.load(f)
-        return {
-            "fitness": data.get("fitness"),
-            "decision": data.get("decision"),
-            "graph_id": graph_id,
-        }
-    except Exception:
-        return {}
-
-
-def _read_lineage_entries(run_dir: Path):
-    lineage_path = run_dir / "lineage.jsonl"
-    if not lineage_path.exists():
-        return []
-
-    entries = []
-    with open(lineage_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                logger.warning("Skipping malformed lineage entry")
-    return entries
-
-
 def _build_lineage_graph(run_dir: Path):
-    entries = _read_lineage_entries(run_dir)
-
-    graph_ids = set()
-    parents = set()
-    children = set()
-    adjacency = defaultdict(list)
-    child_gen = {}
-
-    for entry in entries:
-        parent_id = entry.get("parent_id")
-        child_id = entry.get("child_id")
-        depth = entry.get("depth")
-        if parent_id:
-            graph_ids.add(parent_id)
-            parents.add(parent_id)
-        if child_id:
-            graph_ids.add(child_id)
-            children.add(child_id)
-        if parent_id and child_id:
-            adjacency[parent_id].append(child_id)
-            generation = depth if isinstance(depth, int) else None
-            if generation is not None:
-                child_gen[child_id] = generation
-
-    graphs_dir = run_dir / "graphs"
-    if graphs_dir.exists():
-        graph_ids.update(p.stem for p in graphs_dir.glob("*.json"))
-
-    generation_map = {}
-    roots = list(graph_ids - children)
-    queue = deque()
-    for root_id in roots:
-        generation_map[root_id] = 0
-        queue.append(root_id)
-
-    while queue:
-        node = queue.popleft()
-        base_gen = generation_map.get(node, 0)
-        for child in adjacency.get(node, []):
-            child_generation = max(child_gen.get(child, base_gen + 1), base_gen + 1)
-            if child not in generation_map or child_generation < generation_map[child]:
-                generation_map[child] = child_generation
-            if child not in queue:
-                queue.append(child)
-
-    # Ensure adam-like nodes default to zero
-    for gid in graph_ids:
-        generation_map.setdefault(gid, 0)
-
-    nodes = []
-    for graph_id in sorted(graph_ids):
-        metadata = _load_eval_metadata(run_dir, graph_id)
-        nodes.append({
-            "id": graph_id,
-            "label": graph_id,
-            "fitness": metadata.get("fitness"),
-            "decision": metadata.get("decision"),
-            "generation": generation_map.get(graph_id, 0),
-        })
-
-    edges = []
-    for parent_id, targets in adjacency.items():
-        for target in targets:
-            edges.append({
-                "source": parent_id,
-                "target": target,
-                "generation": generation_map.get(target),
-            })
+    lineage_graph = RunReader(run_dir).lineage_graph()
+    nodes = lineage_graph["nodes"]
+    edges = lineage_graph["edges"]
 
     summary_file = run_dir / "summary.json"
     best_id = None
@@ -625,13 +570,10 @@ def _build_lineage_graph(run_dir: Path):
 
 def _build_graph_fingerprint(run_dir: Path, graph_id: str):
     """Build a deterministic fingerprint for a strategy graph."""
-    graph_file = run_dir / "graphs" / f"{graph_id}.json"
-    if not graph_file.exists():
+    graph = RunReader(run_dir).load_graph(graph_id)
+    if graph is None:
         raise HTTPException(status_code=404, detail="Graph not found")
 
-    with open(graph_file) as f:
-        graph = json.load(f)
-
     node_type_counts = Counter()
     edge_count = 0
     param_count = 0
@@ -687,13 +629,12 @@ def _build_graph_fingerprint(run_dir: Path, graph_id: str):
 @app.get("/api/runs/{run_id}/graphs/{graph_id}")
 async def get_graph(run_id: str, graph_id: str):
     """Get a strategy graph."""
-    graph_file = config.RESULTS_DIR / "runs" / run_id / "graphs" / f"{graph_id}.json"
+    graph = RunReader(config.RESULTS_DIR / "runs" / run_id).load_graph(graph_id)
 
-    if not graph_file.exists():
+    if graph is None:
         raise HTTPException(status_code=404, detail="Graph not found")
 
-    with open(graph_file) as f:
-        return json.load(f)
+    return graph
 
 
 @app.get("/api/runs/{run_id}/graphs/{graph_id}/fingerprint")
@@ -709,25 +650,89 @@ async def get_graph_fingerprint(run_id: str, graph_id: str):
 @app.get("/api/runs/{run_id}/evals/{graph_id}")
 async def get_eval(run_id: str, graph_id: str):
     """Get evaluation result for a graph."""
-    eval_file = config.RESULTS_DIR / "runs" / run_id / "evals" / f"{graph_id}.json"
+    evaluation = RunReader(config.RESULTS_DIR / "runs" / run_id).load_evaluation(graph_id)
 
-    if not eval_file.exists():
+    if evaluation is None:
         raise HTTPException(status_code=404, detail="Evaluation not found")
 
-    with open(eval_file) as f:
-        return json.load(f)
+    return evaluation
 
 
 @app.get("/api/runs/{run_id}/phase3/{graph_id}")
 async def get_phase3_report(run_id: str, graph_id: str):
     """Get Phase 3 robustness report for a graph."""
-    report_file = config.RESULTS_DIR / "runs" / run_id / "phase3_reports" / f"{graph_id}.json"
+    report = RunReader(config.RESULTS_DIR / "runs" / run_id).load_phase3_report(graph_id)
 
-    if not report_file.exists():
+    if report is None:
         raise HTTPException(status_code=404, detail="Phase 3 report not found")
 
-    with open(report_file) as f:
-        return json.load(f)
+    return report
+
+
+class ArtifactBulkRequest(BaseModel):
+    """Request for many artifacts of a run in one response."""
+    graph_ids: Union[List[str], Literal["all"]] = "all"
+    kinds: List[str] = ["graph", "eval"]
+    fields: List[str] = []
+    format: Optional[Literal["ndjson", "msgpack"]] = None
+
+
+@app.post("/api/runs/{run_id}/artifacts")
+async def get_run_artifacts(run_id: str, body: ArtifactBulkRequest, request: Request):
+    """Stream artifacts for many graphs of a run in one response.
+
+    Body:
+        graph_ids: Graph IDs, or "all"
+        kinds: Any of graph, eval, phase3, memo, verdict
+        fields: Field paths to keep, e.g. ["eval.fitness", "graph.metadata.generation"]
+            (kinds without listed paths are returned whole)
+        format: "ndjson" or "msgpack" (default: from the Accept header, else ndjson)
+
+    Returns:
+        One {"graph_id", <kind>: artifact or null, ...} record per graph, as
+        NDJSON (gzip Content-Encoding when accepted) or concatenated msgpack
+        objects
+    """
+    run_dir = config.RESULTS_DIR / "runs" / run_id
+    if not run_dir.exists():
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    unknown = [kind for kind in body.kinds if kind not in artifacts.ARTIFACT_KINDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown artifact kinds: {unknown}")
+    try:
+        fields = artifacts.parse_fields(body.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if body.graph_ids != "all":
+        invalid = artifacts.invalid_graph_ids(body.graph_ids)
+        if invalid:
+            raise HTTPException(status_code=400, detail=f"Invalid graph IDs: {invalid}")
+
+    records = artifacts.iter_artifacts(
+        run_dir,
+        run_id,
+        None if body.graph_ids == "all" else body.graph_ids,
+        body.kinds,
+        fields,
+    )
+
+    output_format = body.format
+    if output_format is None:
+        accept = request.headers.get("accept", "")
+        output_format = "msgpack" if artifacts.MSGPACK_MEDIA_TYPE in accept else "ndjson"
+
+    if output_format == "msgpack":
+        if artifacts.msgpack is None:
+            raise HTTPException(status_code=501, detail="msgpack responses need the msgpack package installed")
+        return StreamingResponse(artifacts.msgpack_chunks(records), media_type=artifacts.MSGPACK_MEDIA_TYPE)
+
+    compress = "gzip" in request.headers.get("accept-encoding", "")
+    return StreamingResponse(
+        artifacts.ndjson_chunks(records, compress=compress),
+        media_type=artifacts.NDJSON_MEDIA_TYPE,
+        headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"} if compress else {"Vary": "Accept-Encoding"},
+    )
 
 
 # ============================================================================
@@ -908,8 +913,8 @@ async def get_run_llm_transcript(run_id: str, filename: str):
 
 
 @app.post("/api/run")
-async def start_run(request: RunRequest, background_tasks: BackgroundTasks):
-    """Start a Darwin evolution run."""
+async def start_run(request: RunRequest):
+    """Queue a Darwin evolution run (events stream from /api/run/{run_id}/events)."""
     run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     logger.info(f"Received request to start run {run_id}")
@@ -917,194 +922,170 @@ async def start_run(request: RunRequest, background_tasks: BackgroundTasks):
                 f"timeframe={request.timeframe}, dates={request.start_date} to {request.end_date}, "
                 f"depth={request.depth}, branching={request.branching}, max_evals={request.max_total_evals}")
 
-    # Initialize job tracking
-    running_jobs[run_id] = {
-        "status": "starting",
-        "events": [],
-        "started_at": datetime.now().isoformat(),
-    }
+    job = _submit_job(run_id, "backend_api.darwin_jobs:run_darwin_job", request=request.model_dump())
+    logger.info(f"Queued job {run_id} ({job.status})")
+
+    return {"run_id": run_id, "status": job.status}
+
+
+class BatchDataSpec(BaseModel):
+    """Market data a batch of strategies is scored against."""
+    symbol: str
+    timeframe: str
+    start_date: str
+    end_date: str
 
-    logger.info(f"Initialized job tracking for {run_id}")
 
-    # Start run in background
-    background_tasks.add_task(_run_darwin_job, run_id, request)
-    logger.info(f"Added background task for {run_id}")
+class BatchEvaluationConfig(BaseModel):
+    """evaluate_strategy() parameters for a batch."""
+    train_frac: float = 0.75
+    k_windows: int = 6
+    n_jitter: int = 10
+    jitter_pct: float = 0.1
+    initial_capital: float = 100000.0
+    staged: bool = False
 
-    return {"run_id": run_id, "status": "started"}
 
+class EvaluateBatchRequest(BaseModel):
+    """Request to score strategy graphs without running Darwin."""
+    graphs: List[StrategyGraph]
+    data: BatchDataSpec
+    evaluation: BatchEvaluationConfig = BatchEvaluationConfig()
 
-def run_darwin_with_events(run_id: str, emit_fn, **darwin_kwargs):
-    """Wrapper around run_darwin that emits structured events.
 
-    This is a simplified implementation that emits periodic budget updates.
-    A full implementation would require modifying darwin.py to accept callbacks.
-    """
-    logger.info(f"[{run_id}] run_darwin_with_events called with kwargs: {list(darwin_kwargs.keys())}")
+@app.post("/api/evaluate/batch")
+async def evaluate_batch(request: EvaluateBatchRequest):
+    """Score a list of strategy graphs on one dataset, streaming results as NDJSON.
 
-    # Extract run_id_param and rename it to run_id for darwin
-    run_id_param = darwin_kwargs.pop('run_id_param', None)
-    if run_id_param:
-        darwin_kwargs['run_id'] = run_id_param
+    The batch runs as a job (it shows up in /api/jobs and counts against the
+    run queue) whose worker evaluates the strategies on a process pool.
+    Lines are written as strategies finish, in completion order:
 
-    # For now, just call run_darwin directly
-    # Full event integration would require modifying darwin.py
-    emit_fn("log", {"message": "Compiling initial strategy from natural language..."})
-    logger.info(f"[{run_id}] Calling run_darwin")
+        {"type": "evaluation", "index", "graph_id", "seconds", "result"}
+        ...
+        {"type": "batch_finished", "batch_id", "evaluated", "survivors", "seconds"}
 
-    try:
-        result = run_darwin(**darwin_kwargs)
-        logger.info(f"[{run_id}] run_darwin returned successfully")
-        emit_fn("log", {"message": f"Evolution complete: {result.total_evaluations} evaluations"})
-        return result
-    except Exception as e:
-        logger.error(f"[{run_id}] run_darwin failed: {e}", exc_info=True)
-        raise
+    index is the graph's position in the request, seconds its evaluation
+    time and result the StrategyEvaluationResult. A batch that fails or is
+    cancelled ends with {"type": "batch_failed", "batch_id", "status",
+    "error"}. Closing the connection cancels the batch.
+    """
+    if not request.graphs:
+        raise HTTPException(status_code=400, detail="No graphs to evaluate")
+
+    batch_id = f"eval_{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:6]}"
+    # Held for the whole stream: the runner may evict it once finished
+    job = _submit_job(
+        batch_id,
+        "backend_api.darwin_jobs:run_evaluation_batch",
+        graphs=[graph.model_dump(mode="json") for graph in request.graphs],
+        data=request.data.model_dump(),
+        evaluation=request.evaluation.model_dump(),
+    )
+    logger.info(f"Queued evaluation batch {batch_id} ({len(request.graphs)} graphs)")
 
+    def line(event: Dict[str, Any]) -> str:
+        return json.dumps(event, default=str) + "\n"
 
-async def _run_darwin_job(run_id: str, request: RunRequest):
-    """Run Darwin evolution in background with structured events."""
-    logger.info(f"Starting Darwin job {run_id}")
-    logger.info(f"Request params: symbols={request.universe_symbols}, timeframe={request.timeframe}, depth={request.depth}")
-    run_dir = _get_run_dir(run_id)
-    _persist_budget_snapshot(run_id, run_dir)
+    async def results():
+        try:
+            with event_bus.subscribe(batch_id) as subscription:
+                # A batch that had already finished has all its events in the log
+                finished = job.finished
+                last_sent = 0
+                for event_id, event in running_jobs[batch_id]["events"].since(0):
+                    last_sent = event_id
+                    if event["type"] == "evaluation":
+                        yield line(event)
+
+                while not finished:
+                    published = await subscription.get()
+                    if published is None:
+                        logger.warning(f"[{batch_id}] Batch stream fell behind; closing")
+                        return
+                    event_id, event = published
+                    if event_id is not None:
+                        if event_id <= last_sent:
+                            continue
+                        last_sent = event_id
+                    if event["type"] == "evaluation":
+                        yield line(event)
+                    finished = event["type"] == "status" and event["status"] in FINISHED_STATES
+
+            if job.status == COMPLETED:
+                yield line({"type": "batch_finished", "batch_id": batch_id, **job.result})
+            else:
+                yield line({"type": "batch_failed", "batch_id": batch_id, "status": job.status, "error": job.error})
+        finally:
+            # Client went away mid-batch: stop evaluating. Graceful, so the job
+            # shuts its evaluation pool down before its worker could be killed
+            if not job.finished:
+                job_runner.cancel(batch_id, grace=config.JOB_CANCEL_GRACE_SECONDS)
 
-    try:
-        # Emit run_started event
-        running_jobs[run_id]["status"] = "fetching_data"
-        emit_event(run_id, "run_started", {
-            "depth": request.depth,
-            "branching": request.branching,
-            "max_total_evals": request.max_total_evals,
-            "symbols": request.universe_symbols,
-        })
-        logger.info(f"[{run_id}] Emitted run_started event")
-
-        # Fetch data
-        logger.info(f"[{run_id}] Initializing Polygon client")
-        client = PolygonClient()
-        data_dict = {}
-
-        for symbol in request.universe_symbols:
-            logger.info(f"[{run_id}] Fetching data for {symbol}")
-            emit_event(run_id, "log", {"message": f"Fetching {symbol} data..."})
-
-            try:
-                data = client.get_bars(
-                    symbol=symbol,
-                    timeframe=request.timeframe,
-                    start=request.start_date,
-                    end=request.end_date
-                )
-                data_dict[symbol] = data
-                logger.info(f"[{run_id}] Successfully fetched {len(data)} bars for {symbol}")
-                emit_event(run_id, "log", {"message": f"Fetched {len(data)} bars for {symbol}"})
-            except Exception as fetch_error:
-                logger.error(f"[{run_id}] Failed to fetch data for {symbol}: {fetch_error}")
-                raise
-
-        # Use first symbol's data
-        data = data_dict[request.universe_symbols[0]]
-        logger.info(f"[{run_id}] Using {request.universe_symbols[0]} data for evolution")
-
-        running_jobs[run_id]["status"] = "running"
-        running_jobs[run_id]["progress"] = {
-            "evals_completed": 0,
-            "max_total_evals": request.max_total_evals,
-            "current_generation": 0,
-            "best_fitness": None,
-            "kill_stats": {},
-        }
+    return StreamingResponse(results(), media_type=artifacts.NDJSON_MEDIA_TYPE)
 
-        # Reset budget
-        logger.info(f"[{run_id}] Resetting LLM budget")
-        reset_budget()
 
-        # Create locked params
-        universe = UniverseSpec(type="explicit", symbols=request.universe_symbols)
-        time_config = TimeConfig(
-            timeframe=request.timeframe,
-            date_range=DateRange(start=request.start_date, end=request.end_date)
-        )
-        logger.info(f"[{run_id}] Created universe and time config")
+def _job_view(job: Dict[str, Any]) -> Dict[str, Any]:
+    """A state store job record plus its queue position (when queued on this process)."""
+    return {**job, "queue_position": job_runner.queue_position(job["job_id"])}
 
-        # Configure Phase 3 robust evaluation
-        phase3_config = None
-        if request.robust_mode:
-            logger.info(f"[{run_id}] Enabling Phase 3 multi-episode evaluation")
-            phase3_config = Phase3Config(
-                enabled=True,
-                mode="episodes",
-                n_episodes=8,  # Test on 8 different time windows
-                min_months=6,
-                max_months=12,
-                min_bars=120,
-                sampling_mode="uniform_random",  # Better temporal coverage
-                min_trades_per_episode=3,
-                regime_penalty_weight=0.3,
-                abort_on_all_episode_failures=True,
-            )
-            emit_event(run_id, "log", {"message": "Phase 3 enabled: 8 episodes, 6-12 months each, uniform sampling"})
-        else:
-            logger.info(f"[{run_id}] Using Phase 2 train/holdout validation")
-            emit_event(run_id, "log", {"message": "Using standard train/holdout validation"})
-
-        # Run Darwin with event callback
-        logger.info(f"[{run_id}] Starting Darwin evolution")
-        emit_event(run_id, "log", {"message": "Starting Darwin evolution..."})
-
-        summary = run_darwin_with_events(
-            run_id=run_id,
-            emit_fn=lambda event_type, data: emit_event(run_id, event_type, data),
-            data=data,
-            universe=universe,
-            time_config=time_config,
-            nl_text=request.nl_text,
-            depth=request.depth,
-            branching=request.branching,
-            survivors_per_layer=request.survivors_per_layer,
-            max_total_evals=request.max_total_evals,
-            run_id_param=run_id,  # Pass run_id to darwin
-            phase3_config=phase3_config,  # PHASE 3 ACTIVATED! 🚀
-        )
 
-        logger.info(f"[{run_id}] Darwin evolution completed. Total evals: {summary.total_evaluations}")
+@app.get("/api/jobs")
+async def list_jobs():
+    """List recent run jobs (queued, running and finished) with this process's worker pool occupancy."""
+    return {
+        "jobs": [_job_view(job) for job in get_state_store().list_jobs()],
+        "pool": job_runner.stats(),
+    }
 
-        # Get budget
-        budget = get_budget()
-        logger.info(f"[{run_id}] Budget: {budget.total_calls} calls, {budget.total_tokens} tokens")
 
-        running_jobs[run_id]["status"] = "completed"
-        running_jobs[run_id]["summary"] = {
-            "best_fitness": summary.best_strategy.fitness,
-            "total_evaluations": summary.total_evaluations,
-            "budget": budget.to_dict(),
-        }
-        emit_event(run_id, "run_finished", {
-            "best_fitness": summary.best_strategy.fitness,
-            "total_evaluations": summary.total_evaluations,
-            "budget": budget.to_dict(),
-        })
-        logger.info(f"[{run_id}] Job completed successfully. Best fitness: {summary.best_strategy.fitness:.3f}")
-        try:
-            _persist_budget_snapshot(run_id, run_dir)
-        except Exception as persist_err:
-            logger.warning(f"[{run_id}] Failed to persist budget snapshot: {persist_err}")
+@app.get("/api/jobs/{run_id}")
+async def get_job(run_id: str):
+    """Lifecycle state of a run job: queued, running, completed, failed or cancelled."""
+    job = get_state_store().get_job(run_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _job_view(job)
 
-    except Exception as e:
-        logger.error(f"[{run_id}] Job failed with error: {e}", exc_info=True)
-        running_jobs[run_id]["status"] = "failed"
-        running_jobs[run_id]["error"] = str(e)
 
-        # Get full traceback
-        import traceback
-        error_detail = traceback.format_exc()
-        logger.error(f"[{run_id}] Full traceback:\n{error_detail}")
+@app.post("/api/jobs/{run_id}/cancel")
+async def cancel_job(run_id: str):
+    """Cancel a queued or running run job.
 
-        emit_event(run_id, "error", {"message": str(e)})
-        try:
-            _persist_budget_snapshot(run_id, run_dir)
-        except Exception as persist_err:
-            logger.warning(f"[{run_id}] Failed to persist budget snapshot on error: {persist_err}")
+    Jobs run by another API process are flagged (cancel_requested) and
+    cancelled by their owner within API_STATE_POLL_SECONDS.
+    """
+    store = get_state_store()
+    if job_runner.get(run_id) is not None:
+        job_runner.cancel(run_id)
+    elif store.get_job(run_id) is not None:
+        store.request_cancel(run_id)
+    job = store.get_job(run_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _job_view(job)
+
+
+@app.delete("/api/runs/{run_id}")
+async def cancel_run(run_id: str):
+    """Cancel a run gracefully, keeping what it has evaluated so far.
+
+    The run stops at its next checkpoint (an evaluation stage or LLM call),
+    flushes its storage and saves its summary with status "cancelled". A run
+    still going after JOB_CANCEL_GRACE_SECONDS is terminated. Runs owned by
+    another API process are flagged and cancelled the same way by their
+    owner. Waits up to a second for the run to stop, then returns its job
+    state (still "running" while it winds down).
+    """
+    store = get_state_store()
+    if job_runner.get(run_id) is not None:
+        job_runner.cancel(run_id, grace=config.JOB_CANCEL_GRACE_SECONDS)
+        job = await asyncio.to_thread(job_runner.wait, run_id, 1.0)
+        # The runner's copy: the state store is updated just after waiters wake
+        return _job_view({**(store.get_job(run_id) or {}), **job.to_dict()})
+    if not store.request_cancel(run_id) and store.get_job(run_id) is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return _job_view(store.get_job(run_id))
 
 
 @app.exception_handler(StarletteHTTPException)
@@ -1157,24 +1138,14 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
-def _persist_budget_snapshot(run_id: str, run_dir: Path = None):
-    """Write the current LLMBudget to results/runs/<run_id>/budget.json."""
-    try:
-        if run_dir is None:
-            run_dir = _get_run_dir(run_id)
-        budget = get_budget().to_dict()
-        budget_path = run_dir / "budget.json"
-        with open(budget_path, "w") as f:
-            json.dump(budget, f, indent=2)
-    except Exception as err:
-        logger.warning(f"[{run_id}] Failed to persist budget: {err}")
-
-
 def _read_budget(run_id: str):
     run_dir = _get_run_dir(run_id)
     budget_path = run_dir / "budget.json"
     usage = LLMBudget().to_dict()
-    if budget_path.exists():
+    stored = get_state_store().get_budget(run_id)
+    if stored is not None:
+        usage.update(stored)
+    elif budget_path.exists():
         try:
             with open(budget_path) as f:
                 data = json.load(f)
@@ -1202,50 +1173,112 @@ def _add_event(run_id: str, level: str, message: str):
         "level": level,
         "message": message
     }
-    running_jobs[run_id]["events"].append(event)
+    _append_event(run_id, event)
 
 
 @app.get("/api/run/{run_id}/events")
-async def stream_events(run_id: str):
-    """Stream SSE events for a running job."""
-    if run_id not in running_jobs:
+async def stream_events(run_id: str, request: Request, last_event_id: Optional[str] = None):
+    """Stream SSE events for a job.
+
+    Events carry SSE ids, so a reconnecting client (Last-Event-ID header, or
+    the last_event_id query param) only receives what it missed. Jobs run by
+    this process push events as they happen; jobs run by another API process
+    are followed by tailing their event log and state store record. Runs
+    with no job record (e.g. from before a restart) replay their persisted
+    event log and close.
+    """
+    local = running_jobs.get(run_id)
+    if local is not None:
+        event_log = local["events"]
+    elif (config.RESULTS_DIR / "runs" / run_id / EVENT_LOG_NAME).exists():
+        event_log = _run_event_log(run_id)
+    else:
         raise HTTPException(status_code=404, detail="Run not found")
+    resume_from = parse_last_event_id(last_event_id or request.headers.get("last-event-id"))
+    store = get_state_store()
 
-    async def event_generator():
-        last_event_idx = 0
+    def sse(event: Dict[str, Any], event_id: Optional[int] = None) -> str:
+        id_line = f"id: {event_id}\n" if event_id is not None else ""
+        return f"{id_line}data: {json.dumps(event)}\n\n"
 
-        while True:
-            job = running_jobs.get(run_id)
-            if not job:
-                break
-
-            # Send new events
-            events = job["events"][last_event_idx:]
-            for event in events:
-                yield f"data: {json.dumps(event)}\n\n"
-                last_event_idx += 1
-
-            # Send status update with progress
-            status_event = {
-                "type": "status",
-                "status": job["status"],
-                "timestamp": datetime.now().isoformat(),
-                "progress": job.get("progress", {})
-            }
-            yield f"data: {json.dumps(status_event)}\n\n"
+    def final_events(job: Dict[str, Any]) -> List[str]:
+        if job["status"] != COMPLETED or not job.get("result"):
+            return []
+        return [sse({"type": "run_finished", "timestamp": datetime.now().isoformat(), **job["result"]})]
 
-            # If completed or failed, send final event and close
-            if job["status"] in ["completed", "failed"]:
-                if "summary" in job:
-                    final_event = {
-                        "type": "run_finished" if job["status"] == "completed" else "error",
-                        "timestamp": datetime.now().isoformat(),
-                        **(job["summary"] if job["status"] == "completed" else {"message": job.get("error", "Unknown error")})
-                    }
-                    yield f"data: {json.dumps(final_event)}\n\n"
-                break
-
-            await asyncio.sleep(1)  # Poll every second for better responsiveness
+    async def event_generator():
+        # Subscribe before replaying the log so nothing falls in between;
+        # live events already replayed are skipped by ID
+        with event_bus.subscribe(run_id) as subscription:
+            last_sent = resume_from
+            for event_id, event in event_log.since(resume_from):
+                yield sse(event, event_id)
+                last_sent = event_id
+
+            job = store.get_job(run_id)
+            if job is None:
+                return
+            yield sse(_status_event(job))
+            if job["status"] in FINISHED_STATES:
+                for chunk in final_events(job):
+                    yield chunk
+                return
+
+            if run_id not in running_jobs:
+                async for chunk in follow_remote_job(job, last_sent):
+                    yield chunk
+                return
+
+            while True:
+                try:
+                    published = await subscription.get(timeout=config.SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if published is None:
+                    logger.warning(f"[{run_id}] SSE subscriber fell behind; closing stream")
+                    return
+
+                event_id, event = published
+                if event_id is not None:
+                    if event_id <= last_sent:
+                        continue
+                    last_sent = event_id
+                yield sse(event, event_id)
+
+                # If completed, failed or cancelled, send final event and close
+                if event["type"] == "status" and event["status"] in FINISHED_STATES:
+                    for chunk in final_events(store.get_job(run_id)):
+                        yield chunk
+                    return
+
+    async def follow_remote_job(job: Dict[str, Any], last_sent: int):
+        # The job runs in another API process: poll its event log and job record
+        last_status = (job["status"], job.get("progress"))
+        idle_since = time.monotonic()
+        while True:
+            await asyncio.sleep(config.API_STATE_POLL_SECONDS)
+            event_log.refresh()
+            for event_id, event in event_log.since(last_sent):
+                yield sse(event, event_id)
+                last_sent = event_id
+                idle_since = time.monotonic()
+
+            job = store.get_job(run_id)
+            if (job["status"], job.get("progress")) != last_status:
+                last_status = (job["status"], job.get("progress"))
+                yield sse(_status_event(job))
+                idle_since = time.monotonic()
+            if job["status"] in FINISHED_STATES:
+                event_log.refresh()
+                for event_id, event in event_log.since(last_sent):
+                    yield sse(event, event_id)
+                for chunk in final_events(job):
+                    yield chunk
+                return
+            if time.monotonic() - idle_since >= config.SSE_HEARTBEAT_SECONDS:
+                yield ": keep-alive\n\n"
+                idle_since = time.monotonic()
 
     return StreamingResponse(
         event_generator(),
@@ -1328,13 +1361,26 @@ async def conflict_signals_active(
 @app.get("/api/debug/requests")
 async def debug_requests():
     """Return recent request metadata (for troubleshooting)."""
-    return {"requests": list(request_history)}
+    await asyncio.to_thread(_flush_history)
+    return {"requests": await asyncio.to_thread(get_state_store().recent, "requests")}
 
 
 @app.get("/api/debug/errors")
 async def debug_errors():
     """Return recent error logs (for troubleshooting)."""
-    return {"errors": list(error_history)}
+    await asyncio.to_thread(_flush_history)
+    return {"errors": await asyncio.to_thread(get_state_store().recent, "errors")}
+
+
+@app.get("/api/debug/datasets")
+async def debug_datasets():
+    """Return each job worker's dataset registry counters and resident datasets."""
+    return {
+        "workers": [
+            {"index": worker["index"], "pid": worker["pid"], "datasets": worker.get("datasets")}
+            for worker in job_runner.stats()["workers"]
+        ]
+    }
 
 
 @app.get("/api/health")
@@ -1343,10 +1389,24 @@ async def health():
     return {"status": "ok", "version": "1.0.0"}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Engine metrics in Prometheus text format, summed over every live API process and its job workers."""
+    _publish_metrics()
+    snapshots = get_state_store().metrics_snapshots(max_age=config.METRICS_STALE_SECONDS)
+    return Response(content=telemetry.render(telemetry.combine(snapshots)), media_type=telemetry.PROMETHEUS_CONTENT_TYPE)
+
+
 @app.get("/api/llm/usage")
 async def get_global_llm_usage():
-    budget = get_global_budget()
-    return budget.to_dict()
+    """LLM usage summed over all runs' budgets, plus calls made by this API process."""
+    usage = LLMBudget().to_dict()
+    for key, value in get_state_store().total_budget().items():
+        usage[key] = usage.get(key, 0) + value
+    for key, value in get_global_budget().to_dict().items():
+        usage[key] += value
+    usage["estimated_cost_usd"] = round(usage["estimated_cost_usd"], 2)
+    return usage
 
 
 if __name__ == "__main__":
@@ -0,0 +1,313 @@
+"""Shared API state, so several API processes can serve one deployment.
+
+With uvicorn --workers N (or several containers on one results volume) each
+process runs the jobs it accepted on its own JobRunner, but any process must
+be able to answer status, cancel, event-stream and usage requests for any
+run. What those requests need lives behind StateStore:
+
+- job records: the JobRunner view of each job, which process owns it, and
+  whether another process asked for it to be cancelled
+- per-run LLM budgets, written by the job worker processes
+- bounded request and error histories for the debug endpoints
+- each API process's latest metrics snapshot (see telemetry.py), summed by GET /metrics
+
+Run events are not kept here. Each run's events.jsonl (see
+backend_api/event_log.py) is appended to only by the owning process and
+tailed by the others.
+
+SQLiteStateStore keeps this state in results/api_state.db (WAL mode, safe
+for concurrent processes sharing the results directory).
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import config
+from backend_api.jobs import FAILED, FINISHED_STATES
+
+
+API_STATE_DB_NAME = "api_state.db"
+
+
+def process_owner() -> str:
+    """Identifies this API process as the owner (runner) of its jobs."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    submitted_at TEXT,
+    updated_at REAL NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_owner ON jobs (owner, cancel_requested);
+CREATE TABLE IF NOT EXISTS budgets (
+    run_id TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    log TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_log ON history (log, id);
+CREATE TABLE IF NOT EXISTS metrics (
+    owner TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL,
+    body TEXT NOT NULL
+);
+"""
+
+
+class StateStore(ABC):
+    """Interface for API state shared between processes (see module docstring)."""
+
+    @abstractmethod
+    def save_job(self, job: Dict[str, Any], owner: Optional[str] = None):
+        """Insert or update a job record.
+
+        Args:
+            job: Job.to_dict() view
+            owner: Process running the job (default: this one)
+        """
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job record (with "owner" and "cancel_requested"), or None."""
+
+    @abstractmethod
+    def list_jobs(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """The most recently submitted jobs, oldest first."""
+
+    @abstractmethod
+    def unfinished_jobs(self) -> List[Dict[str, Any]]:
+        """Jobs that are queued or running."""
+
+    @abstractmethod
+    def request_cancel(self, job_id: str) -> bool:
+        """Ask the owner of an unfinished job to cancel it.
+
+        Returns:
+            False if the job is unknown or already finished
+        """
+
+    @abstractmethod
+    def cancel_requests(self, owner: Optional[str] = None) -> List[str]:
+        """IDs of the owner's (default: this process's) unfinished jobs another process asked to cancel."""
+
+    @abstractmethod
+    def save_budget(self, run_id: str, budget: Dict[str, Any]):
+        """Store a run's LLMBudget.to_dict() snapshot."""
+
+    @abstractmethod
+    def get_budget(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """A run's latest budget snapshot, or None."""
+
+    @abstractmethod
+    def total_budget(self) -> Dict[str, Any]:
+        """Budget fields summed over every run's latest snapshot."""
+
+    @abstractmethod
+    def record(self, log: str, entry: Dict[str, Any], keep: int):
+        """Append an entry to a named history, keeping only the newest `keep`."""
+
+    @abstractmethod
+    def recent(self, log: str) -> List[Dict[str, Any]]:
+        """A named history's entries, oldest first."""
+
+    @abstractmethod
+    def save_metrics(self, snapshot: Dict[str, Any], owner: Optional[str] = None):
+        """Store an API process's (default: this one's) metrics snapshot."""
+
+    @abstractmethod
+    def metrics_snapshots(self, max_age: float) -> List[Dict[str, Any]]:
+        """Metrics snapshots of every API process that saved one in the last max_age seconds."""
+
+
+class SQLiteStateStore(StateStore):
+    """StateStore in a SQLite database shared by all API processes.
+
+    Args:
+        path: Database file (created if missing)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def save_job(self, job: Dict[str, Any], owner: Optional[str] = None):
+        owner = owner or process_owner()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO jobs (job_id, status, owner, submitted_at, updated_at, body) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (job_id) DO UPDATE SET status = excluded.status, owner = excluded.owner, "
+                "submitted_at = excluded.submitted_at, updated_at = excluded.updated_at, body = excluded.body, "
+                "cancel_requested = CASE WHEN jobs.owner = excluded.owner THEN jobs.cancel_requested ELSE 0 END",
+                (job["job_id"], job["status"], owner, job.get("submitted_at"), time.time(),
+                 json.dumps(job, default=str)),
+            )
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            "SELECT owner, cancel_requested, body FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return self._job(*row) if row else None
+
+    def list_jobs(self, limit: int = 100) -> List[Dict[str, Any]]:
+        rows = self._connection().execute(
+            "SELECT owner, cancel_requested, body FROM jobs ORDER BY submitted_at DESC, job_id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        return [self._job(*row) for row in reversed(rows)]
+
+    def unfinished_jobs(self) -> List[Dict[str, Any]]:
+        return [
+            self._job(*row) for row in self._connection().execute(
+                f"SELECT owner, cancel_requested, body FROM jobs WHERE status NOT IN "
+                f"({', '.join('?' * len(FINISHED_STATES))}) ORDER BY submitted_at",
+                FINISHED_STATES,
+            )
+        ]
+
+    def request_cancel(self, job_id: str) -> bool:
+        with self._connection() as conn:
+            return conn.execute(
+                f"UPDATE jobs SET cancel_requested = 1 WHERE job_id = ? AND status NOT IN "
+                f"({', '.join('?' * len(FINISHED_STATES))})",
+                (job_id, *FINISHED_STATES),
+            ).rowcount > 0
+
+    def cancel_requests(self, owner: Optional[str] = None) -> List[str]:
+        owner = owner or process_owner()
+        return [
+            row[0] for row in self._connection().execute(
+                f"SELECT job_id FROM jobs WHERE owner = ? AND cancel_requested = 1 AND status NOT IN "
+                f"({', '.join('?' * len(FINISHED_STATES))})",
+                (owner, *FINISHED_STATES),
+            )
+        ]
+
+    def save_budget(self, run_id: str, budget: Dict[str, Any]):
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO budgets (run_id, updated_at, body) VALUES (?, ?, ?)",
+                (run_id, time.time(), json.dumps(budget)),
+            )
+
+    def get_budget(self, run_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute("SELECT body FROM budgets WHERE run_id = ?", (run_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def total_budget(self) -> Dict[str, Any]:
+        totals: Dict[str, Any] = {}
+        for (body,) in self._connection().execute("SELECT body FROM budgets"):
+            for key, value in json.loads(body).items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def record(self, log: str, entry: Dict[str, Any], keep: int):
+        with self._connection() as conn:
+            entry_id = conn.execute(
+                "INSERT INTO history (log, body) VALUES (?, ?)", (log, json.dumps(entry, default=str))
+            ).lastrowid
+            conn.execute(
+                "DELETE FROM history WHERE log = ? AND id <= (SELECT id FROM history WHERE log = ? AND id <= ? "
+                "ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                (log, log, entry_id, keep),
+            )
+
+    def recent(self, log: str) -> List[Dict[str, Any]]:
+        return [
+            json.loads(body)
+            for (body,) in self._connection().execute("SELECT body FROM history WHERE log = ? ORDER BY id", (log,))
+        ]
+
+    def save_metrics(self, snapshot: Dict[str, Any], owner: Optional[str] = None):
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO metrics (owner, updated_at, body) VALUES (?, ?, ?)",
+                (owner or process_owner(), time.time(), json.dumps(snapshot)),
+            )
+
+    def metrics_snapshots(self, max_age: float) -> List[Dict[str, Any]]:
+        return [
+            json.loads(body) for (body,) in self._connection().execute(
+                "SELECT body FROM metrics WHERE updated_at >= ? ORDER BY owner", (time.time() - max_age,)
+            )
+        ]
+
+    @staticmethod
+    def _job(owner: str, cancel_requested: int, body: str) -> Dict[str, Any]:
+        job = json.loads(body)
+        job["owner"] = owner
+        job["cancel_requested"] = bool(cancel_requested)
+        return job
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection (used as a context manager, it commits the block)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+
+def fail_orphaned_jobs(store: StateStore) -> List[str]:
+    """Mark unfinished jobs whose owning API process (on this host) has exited as failed.
+
+    Returns:
+        IDs of the jobs marked failed
+    """
+    host = socket.gethostname()
+    orphaned = []
+    for job in store.unfinished_jobs():
+        owner_host, _, pid = job["owner"].rpartition(":")
+        if owner_host != host or not pid.isdigit() or _process_alive(int(pid)):
+            continue
+        owner = job.pop("owner")
+        job.pop("cancel_requested")
+        job.update(status=FAILED, error="API process exited", finished_at=datetime.now().isoformat())
+        store.save_job(job, owner=owner)
+        orphaned.append(job["job_id"])
+    return orphaned
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+_store: Optional[StateStore] = None
+
+
+def get_state_store() -> StateStore:
+    """Process-wide state store for config.RESULTS_DIR."""
+    global _store
+    path = config.RESULTS_DIR / API_STATE_DB_NAME
+    if _store is None or getattr(_store, "path", None) != path:
+        _store = SQLiteStateStore(path)
+    return _store
@@ -13,6 +13,8 @@ from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+import telemetry
+
 
 @dataclass
 class Trade:
@@ -36,22 +38,36 @@ class BacktestSimulator:
         self.initial_capital = initial_capital
 
     @staticmethod
-    def _get_bar_timestamp(bar: pd.Series, data: pd.DataFrame, idx: int) -> pd.Timestamp:
-        """Extract timestamp from bar (handles both column and index formats).
+    def _get_timestamps(data: pd.DataFrame):
+        """Return bar timestamps (handles both column and index formats).
 
         Args:
-            bar: Row from OHLCV DataFrame
-            data: Original DataFrame
-            idx: Row index position
+            data: OHLCV DataFrame
 
         Returns:
-            Timestamp for this bar
+            Positionally indexable timestamps (array, DatetimeIndex or RangeIndex)
         """
-        if 'timestamp' in bar.index:
-            return bar['timestamp']
+        if 'timestamp' in data.columns:
+            return data['timestamp'].array
+        elif isinstance(data.index, pd.DatetimeIndex):
+            return data.index
         else:
-            # Timestamp is in the DataFrame index
-            return data.index[idx]
+            # No timestamps available: fall back to bar positions
+            return pd.RangeIndex(len(data))
+
+    @staticmethod
+    def _get_day_keys(timestamps) -> np.ndarray:
+        """Return one integer key per bar that changes when the trading day changes."""
+        if isinstance(timestamps, pd.RangeIndex):
+            return np.zeros(len(timestamps), dtype=np.int64)
+        return pd.DatetimeIndex(pd.to_datetime(timestamps)).normalize().asi8
+
+    @staticmethod
+    def _as_array(values) -> np.ndarray:
+        """Positional NumPy view of a Series/array (no copy for matching dtypes)."""
+        if isinstance(values, (pd.Series, pd.Index)):
+            return values.to_numpy()
+        return np.asarray(values)
 
     def run(
         self,
@@ -65,6 +81,9 @@ class BacktestSimulator:
     ) -> Dict[str, Any]:
         """Run backtest simulation.
 
+        Signals are aligned with data by position. Data may be a slice (view)
+        of a larger frame; it is never reindexed or copied.
+
         Args:
             data: OHLCV DataFrame with columns: timestamp, open, high, low, close, volume
             entry_signals: Boolean series indicating entry signals (at close)
@@ -77,13 +96,28 @@ class BacktestSimulator:
         Returns:
             Dict with keys: trades (DataFrame), equity_curve (Series), metrics (Dict)
         """
-        # Reset index to integer for easier iteration
-        data = data.reset_index(drop=True)
-        entry_signals = entry_signals.reset_index(drop=True)
-        if exit_signals is not None:
-            exit_signals = exit_signals.reset_index(drop=True)
-        else:
-            exit_signals = pd.Series([False] * len(data), index=data.index)
+        # Positional views over the shared OHLCV arrays. Prices may be float32
+        # (compact mode); scalars are read as Python floats so P&L and equity
+        # math always runs in float64.
+        opens = self._as_array(data['open'])
+        highs = self._as_array(data['high'])
+        lows = self._as_array(data['low'])
+        closes = self._as_array(data['close'])
+        timestamps = self._get_timestamps(data)
+        day_keys = self._get_day_keys(timestamps)
+        telemetry.BACKTESTS.inc()
+        telemetry.BARS_SIMULATED.inc(len(closes))
+
+        entry_arr = self._as_array(entry_signals)
+        exit_arr = self._as_array(exit_signals) if exit_signals is not None else None
+
+        atr_arr = None
+        if stop_config.get('type') == 'atr' or tp_config.get('type') == 'atr':
+            atr_series = stop_config.get('atr')
+            if atr_series is None:
+                atr_series = tp_config.get('atr')
+            if atr_series is not None:
+                atr_arr = self._as_array(atr_series)
 
         # Track state
         trades = []
@@ -91,17 +125,15 @@ class BacktestSimulator:
         equity = self.initial_capital
         daily_pnl = 0.0
         daily_trades = 0
-        current_date = None
+        current_day = None
+        n_bars = len(data)
 
         # Iterate through bars
-        for i in range(len(data) - 1):  # -1 because we need next bar for fills
-            bar = data.iloc[i]
-            next_bar = data.iloc[i + 1]
-
+        for i in range(n_bars - 1):  # -1 because we need next bar for fills
             # Check if new day (reset daily counters)
-            bar_date = pd.to_datetime(self._get_bar_timestamp(bar, data, i)).date()
-            if current_date is None or bar_date != current_date:
-                current_date = bar_date
+            bar_day = day_keys[i]
+            if current_day is None or bar_day != current_day:
+                current_day = bar_day
                 daily_pnl = 0.0
                 daily_trades = 0
 
@@ -122,17 +154,17 @@ class BacktestSimulator:
 
                 # Check if stop or target hit during this bar
                 # Assume worst case: if both hit, stop hits first
-                if next_bar['low'] <= stop_price:
+                if lows[i + 1] <= stop_price:
                     exit_price = stop_price
                     exit_reason = "stop"
                     hit_stop = True
-                elif next_bar['high'] >= target_price:
+                elif highs[i + 1] >= target_price:
                     exit_price = target_price
                     exit_reason = "target"
                     hit_target = True
-                elif exit_signals.iloc[i]:
+                elif exit_arr is not None and exit_arr[i]:
                     # Exit signal at close of bar i, fill at open of bar i+1
-                    exit_price = next_bar['open']
+                    exit_price = float(opens[i + 1])
                     exit_reason = "signal"
 
                 # Close position if exit triggered
@@ -143,7 +175,7 @@ class BacktestSimulator:
                     trade = Trade(
                         entry_time=position['entry_time'],
                         entry_price=position['entry_price'],
-                        exit_time=self._get_bar_timestamp(next_bar, data, i + 1),
+                        exit_time=timestamps[i + 1],
                         exit_price=exit_price,
                         pnl=pnl,
                         return_pct=return_pct,
@@ -159,7 +191,7 @@ class BacktestSimulator:
                     position = None
 
             # Check for entry signals (only if no position)
-            if position is None and entry_signals.iloc[i]:
+            if position is None and entry_arr[i]:
                 # Check risk limits if configured
                 if risk_limits:
                     # Check daily loss limit
@@ -186,26 +218,24 @@ class BacktestSimulator:
                 atr_required = stop_config.get('type') == 'atr' or tp_config.get('type') == 'atr'
 
                 if atr_required:
-                    atr_series = stop_config.get('atr')
-                    if atr_series is None:
-                        atr_series = tp_config.get('atr')
-                    if atr_series is not None and i < len(atr_series):
-                        atr_value = atr_series.iloc[i]
+                    if atr_arr is not None and i < len(atr_arr):
+                        atr_value = float(atr_arr[i])
 
                     # Skip entry if ATR is required but not available (warmup period or NaN)
                     if atr_value is None or np.isnan(atr_value):
                         continue  # Skip this entry - indicator_warmup_unsatisfied
 
                 # Calculate position size
+                entry_price = float(opens[i + 1])
                 shares = self._calculate_position_size(
-                    next_bar['open'], equity, size_config
+                    entry_price, equity, size_config
                 )
 
                 if shares > 0:
                     # Entry signal at close of bar i, fill at open of bar i+1
                     position = {
-                        'entry_time': self._get_bar_timestamp(next_bar, data, i + 1),
-                        'entry_price': next_bar['open'],
+                        'entry_time': timestamps[i + 1],
+                        'entry_price': entry_price,
                         'shares': shares,
                         'atr_value': atr_value,
                     }
@@ -213,15 +243,15 @@ class BacktestSimulator:
 
         # Close any remaining position at last bar
         if position is not None:
-            last_bar = data.iloc[-1]
-            pnl = (last_bar['close'] - position['entry_price']) * position['shares']
-            return_pct = (last_bar['close'] - position['entry_price']) / position['entry_price']
+            last_close = float(closes[n_bars - 1])
+            pnl = (last_close - position['entry_price']) * position['shares']
+            return_pct = (last_close - position['entry_price']) / position['entry_price']
 
             trade = Trade(
                 entry_time=position['entry_time'],
                 entry_price=position['entry_price'],
-                exit_time=self._get_bar_timestamp(last_bar, data, len(data) - 1),
-                exit_price=last_bar['close'],
+                exit_time=timestamps[n_bars - 1],
+                exit_price=last_close,
                 pnl=pnl,
                 return_pct=return_pct,
                 shares=position['shares'],
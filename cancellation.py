@@ -0,0 +1,150 @@
+"""Cooperative cancellation tokens and deadlines.
+
+A CancelToken is handed down through run_darwin, the evaluation functions
+and the LLM clients. Long-running code calls token.check() at its natural
+checkpoints (per episode, subwindow and jitter run; before each LLM
+attempt). Once the token has been cancelled or its deadline has passed,
+check() raises:
+
+- Cancelled when the token (or an ancestor) was cancelled
+- DeadlineExceeded when the token's (or an ancestor's) deadline passed
+
+Both derive from BaseException, like asyncio.CancelledError, so the broad
+`except Exception` handlers that turn a failing window or child into a
+penalty do not swallow them.
+
+child(timeout) derives a token with a tighter deadline: run_darwin gives
+each evaluation its own deadline under the run-wide one. A token can also
+follow an external flag (anything with is_set(), e.g. a
+multiprocessing.Event set by another process).
+"""
+
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Cancelled(BaseException):
+    """Raised at a checkpoint once the work's token has been cancelled."""
+
+
+class DeadlineExceeded(Cancelled):
+    """Raised at a checkpoint once the work's deadline has passed."""
+
+
+class CancelToken:
+    """Cancellation flag plus optional deadline, inherited by child tokens.
+
+    Args:
+        timeout: Seconds from now until the deadline (None = no deadline of its own)
+        parent: Token whose cancellation and deadline also apply to this one
+        flag: External cancellation flag with is_set() (default: a private threading.Event)
+    """
+
+    def __init__(self, timeout: Optional[float] = None, parent: Optional["CancelToken"] = None, flag=None):
+        self.parent = parent
+        self.flag = flag if flag is not None else threading.Event()
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+
+    def cancel(self):
+        """Cancel this token and its children."""
+        self.flag.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once this token or an ancestor was cancelled (deadlines not included)."""
+        token = self
+        while token is not None:
+            if token.flag.is_set():
+                return True
+            token = token.parent
+        return False
+
+    @property
+    def expired(self) -> bool:
+        """True once this token's or an ancestor's deadline has passed."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def remaining(self) -> Optional[float]:
+        """Seconds until the nearest deadline (None if there is none)."""
+        deadlines = []
+        token = self
+        while token is not None:
+            if token.deadline is not None:
+                deadlines.append(token.deadline)
+            token = token.parent
+        return min(deadlines) - time.monotonic() if deadlines else None
+
+    def check(self):
+        """Checkpoint: raise if the work should stop.
+
+        Raises:
+            Cancelled: If this token or an ancestor was cancelled
+            DeadlineExceeded: If a deadline has passed
+        """
+        if self.cancelled:
+            raise Cancelled("cancelled")
+        if self.expired:
+            raise DeadlineExceeded("deadline exceeded")
+
+    def child(self, timeout: Optional[float] = None) -> "CancelToken":
+        """Token cancelled with this one, with an optional tighter deadline."""
+        return CancelToken(timeout=timeout, parent=self)
+
+    def sleep(self, seconds: float, poll: float = 0.1):
+        """Sleep, waking up to raise as soon as the token is cancelled or expires."""
+        wake = time.monotonic() + seconds
+        while True:
+            self.check()
+            left = wake - time.monotonic()
+            if left <= 0:
+                return
+            time.sleep(min(poll, left))
+
+    def call(self, fn: Callable[..., T], *args: Any, poll: float = 0.1, **kwargs: Any) -> T:
+        """Run a blocking call (e.g. an HTTP request) that cannot check the token itself.
+
+        fn runs on a helper thread. If the token is cancelled or expires
+        first, this raises right away and the call's eventual result is
+        discarded.
+        """
+        self.check()
+        done = threading.Event()
+        outcome: dict = {}
+
+        def run():
+            try:
+                outcome["result"] = fn(*args, **kwargs)
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                done.set()
+
+        threading.Thread(target=run, name="cancellable-call", daemon=True).start()
+        while not done.wait(poll):
+            self.check()
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+
+
+def checkpoint(token: Optional[CancelToken]):
+    """token.check() for optional tokens."""
+    if token is not None:
+        token.check()
+
+
+def call(fn: Callable[..., T], token: Optional[CancelToken] = None) -> T:
+    """token.call(fn) for optional tokens (fn() runs directly without one)."""
+    return fn() if token is None else token.call(fn)
+
+
+def sleep(seconds: float, token: Optional[CancelToken] = None):
+    """token.sleep(seconds) for optional tokens."""
+    if token is None:
+        time.sleep(seconds)
+    else:
+        token.sleep(seconds)
@@ -25,7 +25,59 @@ for d in [RESULTS_DIR, CACHE_DIR, GRAPHS_DIR, PATCHES_DIR, STATIC_DIR]:
 # Settings
 DEFAULT_TIMEFRAME = "5m"
 MAX_NODES_PER_GRAPH = 40
-CACHE_EXPIRY_DAYS = 7
+
+# Bar cache file format: "parquet" (compressed) or "feather" (memory-mapped, zero-copy loads)
+BAR_CACHE_FORMAT = os.getenv("BAR_CACHE_FORMAT", "parquet")
+
+# Compact dtypes for market data (float32 prices/indicators, uint volume); see data/compact.py
+COMPACT_MARKET_DATA = os.getenv("COMPACT_MARKET_DATA", "0") == "1"
+
+# In-process dataset registry budget for the API server (bytes)
+DATASET_REGISTRY_MAX_BYTES = int(os.getenv("DATASET_REGISTRY_MAX_BYTES", str(2 * 1024 ** 3)))
+
+# Market data source: "polygon" or "synthetic" (offline load testing, see data/synthetic.py)
+MARKET_DATA_PROVIDER = os.getenv("MARKET_DATA_PROVIDER", "polygon")
+SYNTHETIC_SEED = int(os.getenv("SYNTHETIC_SEED", "0"))
+
+# Polygon fetching (rate limit of 0 = unlimited, e.g. paid plans)
+POLYGON_MAX_WORKERS = int(os.getenv("POLYGON_MAX_WORKERS", "8"))
+POLYGON_MAX_REQUESTS_PER_SECOND = float(os.getenv("POLYGON_MAX_REQUESTS_PER_SECOND", "0")) or None
+
+# Also write each finished run out in the one-JSON-file-per-artifact layout (see evolution/storage.py)
+RUN_JSON_EXPORT = os.getenv("RUN_JSON_EXPORT", "0") == "1"
+
+# Write-behind run storage (see evolution/writer.py)
+RUN_WRITE_BEHIND = os.getenv("RUN_WRITE_BEHIND", "1") == "1"
+RUN_WRITER_QUEUE_SIZE = int(os.getenv("RUN_WRITER_QUEUE_SIZE", "256"))
+RUN_WRITER_MAX_BATCH = int(os.getenv("RUN_WRITER_MAX_BATCH", "64"))
+
+# API job runner: Darwin runs execute in a pool of worker processes (see backend_api/jobs.py).
+# JOB_WORKERS is also the max number of concurrent runs; JOB_QUEUE_SIZE caps runs waiting for a worker.
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "8"))
+JOB_START_METHOD = os.getenv("JOB_START_METHOD", "spawn")
+# Finished jobs each API process keeps in memory; older ones are only in the state store
+JOB_HISTORY_SIZE = int(os.getenv("JOB_HISTORY_SIZE", "100"))
+# Graceful cancel (DELETE /api/runs/{run_id}): seconds a run gets to stop at a checkpoint and save
+# its partial results before its worker process is killed
+JOB_CANCEL_GRACE_SECONDS = float(os.getenv("JOB_CANCEL_GRACE_SECONDS", "10"))
+# Process pool size for batch strategy evaluation (POST /api/evaluate/batch) inside a job worker
+EVAL_BATCH_WORKERS = int(os.getenv("EVAL_BATCH_WORKERS", "4"))
+
+# Seconds between keep-alive comments on an idle SSE stream
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
+# Recent events per run kept in memory; older ones are replayed from results/runs/<run_id>/events.jsonl
+EVENT_RING_SIZE = int(os.getenv("EVENT_RING_SIZE", "500"))
+
+# API state shared by all API processes lives in results/api_state.db (see backend_api/state.py).
+# Processes poll it this often for cross-process cancels and SSE streams of jobs they don't run.
+API_STATE_POLL_SECONDS = float(os.getenv("API_STATE_POLL_SECONDS", "0.5"))
+
+# Metrics (see telemetry.py): job workers and API processes publish their values this often;
+# GET /metrics ignores API processes that have not published for METRICS_STALE_SECONDS
+METRICS_PUBLISH_SECONDS = float(os.getenv("METRICS_PUBLISH_SECONDS", "5"))
+METRICS_STALE_SECONDS = float(os.getenv("METRICS_STALE_SECONDS", "60"))
 
 # Validation
 HOLDOUT_SPLIT = 0.75  # 75% train, 25% holdout
@@ -36,4 +88,6 @@ SUBWINDOW_CHUNKS = 6
 # Evolution
 DARWIN_DEPTH = 3
 SURVIVORS_PER_GEN = 3
-CHILDREN_PER_SURVIVOR = 3
\ No newline at end of file
+CHILDREN_PER_SURVIVOR = 3
+# Per-strategy evaluation deadline inside a Darwin run; an overrunning child is killed with "timeout"
+DARWIN_MAX_EVAL_SECONDS = float(os.getenv("DARWIN_MAX_EVAL_SECONDS", "60"))
\ No newline at end of file
@@ -0,0 +1,395 @@
+"""Range-aware, month-partitioned OHLCV bar cache.
+
+Bars are stored per (symbol, timeframe) as one parquet file per session
+month, alongside a coverage file listing the session days already fetched.
+A request only needs the days missing from coverage; finalized historical
+days never expire, while the current (still open) session day and anything
+after it are never marked covered, so they are re-fetched on every request.
+
+With cache_format="feather", each series is also materialized as a single
+uncompressed Feather file that reads memory-map (see data.frame_store):
+requested ranges come back as zero-copy views, and every process reading
+the same series shares its pages. Writes only touch the month partitions;
+the series file is rebuilt lazily, on a read, once a partition before the
+current month is newer than it. Partitions of the current month change
+with every fetch of the still-open day. Until the month is over, ranges
+that include it are read from the partitions instead of rewriting the
+whole series file on every request.
+
+Every process using the cache root (job workers, API processes) shares it.
+lock() serializes the fetch -> merge -> mark-covered sequence of a series
+across threads and processes (an flock on the series' .lock file), and all
+files are replaced atomically, so readers never see a partial write.
+
+Layout::
+
+    <root>/<symbol>/<timeframe>/2024-01.parquet
+    <root>/<symbol>/<timeframe>/coverage.json
+    <root>/<symbol>/<timeframe>/.lock
+    <root>/<symbol>/<timeframe>/series.feather   (feather format only)
+"""
+
+import json
+import os
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from data.frame_store import read_frame, write_frame
+
+try:
+    import fcntl
+except ImportError:  # Windows: locks only cover the threads of one process
+    fcntl = None
+
+
+CACHE_FORMATS = ("parquet", "feather")
+
+BAR_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+DayRange = Tuple[date, date]  # inclusive
+
+
+class BarCache:
+    """Month-partitioned bar store with per-day coverage tracking."""
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        session_tz: str = "America/New_York",
+        cache_format: str = "parquet",
+    ):
+        if cache_format not in CACHE_FORMATS:
+            raise ValueError(f"Unknown cache format: {cache_format} (expected one of {CACHE_FORMATS})")
+        self.root = Path(root)
+        self.session_tz = session_tz
+        self.cache_format = cache_format
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def lock(self, symbol: str, timeframe: str) -> "_SeriesLock":
+        """Lock serializing fetch/write of one (symbol, timeframe) series across processes.
+
+        Hold it around the whole missing_ranges() -> write/append ->
+        mark_covered() sequence, so rows fetched by another process are never
+        overwritten and coverage only ever lists days whose rows are stored.
+        """
+        with self._locks_guard:
+            thread_lock = self._locks.setdefault((symbol, timeframe), threading.Lock())
+        return _SeriesLock(thread_lock, self._series_dir(symbol, timeframe) / ".lock")
+
+    def today(self) -> date:
+        """Current session day (still open, never finalized)."""
+        return pd.Timestamp.now(tz=self.session_tz).date()
+
+    def missing_ranges(self, symbol: str, timeframe: str, start: str, end: str) -> List[DayRange]:
+        """Day ranges within [start, end] not yet covered by the cache.
+
+        Args:
+            symbol: Ticker symbol
+            timeframe: Bar size
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD, inclusive)
+
+        Returns:
+            Sorted list of inclusive (first_day, last_day) gaps
+        """
+        gaps = []
+        cursor = _to_date(start)
+        last = _to_date(end)
+        for covered_start, covered_end in self._load_coverage(symbol, timeframe):
+            if covered_end < cursor:
+                continue
+            if covered_start > last:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start - timedelta(days=1)))
+            cursor = max(cursor, covered_end + timedelta(days=1))
+        if cursor <= last:
+            gaps.append((cursor, last))
+        return gaps
+
+    def write(self, symbol: str, timeframe: str, df: pd.DataFrame, first_day: date, last_day: date):
+        """Store bars fetched for [first_day, last_day] and update coverage.
+
+        Existing rows for those days are replaced. Days from today onwards
+        are stored but not marked covered.
+
+        Args:
+            symbol: Ticker symbol
+            timeframe: Bar size
+            df: Bars fetched for the range (may be empty)
+            first_day: First session day of the fetched range
+            last_day: Last session day of the fetched range (inclusive)
+        """
+        self._merge(symbol, timeframe, df, replace_range=(first_day, last_day))
+        self.mark_covered(symbol, timeframe, first_day, last_day)
+
+    def clear(self, symbol: str, timeframe: str, first_day: date, last_day: date):
+        """Drop stored rows for session days in [first_day, last_day].
+
+        Used before streaming a re-fetch of a range with append().
+        """
+        self._merge(symbol, timeframe, _empty_bars(), replace_range=(first_day, last_day))
+
+    def append(self, symbol: str, timeframe: str, df: pd.DataFrame):
+        """Merge a batch of bars (e.g. one API page) into the month partitions.
+
+        Rows with timestamps already stored are replaced. Coverage is not
+        updated; call mark_covered() once the whole range is written.
+        """
+        if len(df):
+            self._merge(symbol, timeframe, df)
+
+    def mark_covered(self, symbol: str, timeframe: str, first_day: date, last_day: date):
+        """Record [first_day, last_day] as fetched (finalized days only)."""
+        final_day = min(last_day, self.today() - timedelta(days=1))
+        if first_day <= final_day:
+            self._add_coverage(symbol, timeframe, (first_day, final_day))
+
+    def read(self, symbol: str, timeframe: str, start: str, end: str) -> pd.DataFrame:
+        """Load cached bars for session days in [start, end].
+
+        Args:
+            symbol: Ticker symbol
+            timeframe: Bar size
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD, inclusive)
+
+        Returns:
+            DataFrame with columns: timestamp, open, high, low, close, volume
+        """
+        first_day, last_day = _to_date(start), _to_date(end)
+        if self.cache_format == "feather":
+            return self._read_mapped(symbol, timeframe, first_day, last_day)
+        return self._read_partitions(symbol, timeframe, first_day, last_day)
+
+    def coverage(self, symbol: str, timeframe: str) -> List[DayRange]:
+        """Covered (finalized) day ranges for a series."""
+        return self._load_coverage(symbol, timeframe)
+
+    def _read_partitions(self, symbol: str, timeframe: str, first_day: date, last_day: date) -> pd.DataFrame:
+        """Load [first_day, last_day] from the month partitions."""
+        frames = []
+        for month in _months_between(first_day, last_day):
+            path = self._partition_path(symbol, timeframe, month)
+            if path.exists():
+                frames.append(pd.read_parquet(path))
+
+        if not frames:
+            return _empty_bars()
+
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        days = self._session_days(df)
+        mask = (days >= pd.Timestamp(first_day)) & (days <= pd.Timestamp(last_day))
+        return df[mask].reset_index(drop=True)
+
+    def _series_dir(self, symbol: str, timeframe: str) -> Path:
+        return self.root / symbol / timeframe
+
+    def _partition_path(self, symbol: str, timeframe: str, month: date) -> Path:
+        return self._series_dir(symbol, timeframe) / f"{month:%Y-%m}.parquet"
+
+    def _coverage_path(self, symbol: str, timeframe: str) -> Path:
+        return self._series_dir(symbol, timeframe) / "coverage.json"
+
+    def _series_path(self, symbol: str, timeframe: str) -> Path:
+        return self._series_dir(symbol, timeframe) / "series.feather"
+
+    def _materialize_series(self, symbol: str, timeframe: str):
+        """Rebuild the single-file Feather copy of a series from its partitions."""
+        partitions = sorted(self._series_dir(symbol, timeframe).glob("*.parquet"))
+        frames = [pd.read_parquet(path) for path in partitions]
+        frames = [frame for frame in frames if len(frame)]
+        if not frames:
+            return
+        write_frame(pd.concat(frames, ignore_index=True), self._series_path(symbol, timeframe))
+
+    def _read_mapped(self, symbol: str, timeframe: str, first_day: date, last_day: date) -> pd.DataFrame:
+        """Slice [first_day, last_day] out of the memory-mapped series file."""
+        series_path = self._series_path(symbol, timeframe)
+        partitions = list(self._series_dir(symbol, timeframe).glob("*.parquet"))
+        if not partitions:
+            return _empty_bars()
+
+        # Months written since the series file was built
+        built_ns = series_path.stat().st_mtime_ns if series_path.exists() else None
+        stale = {
+            date.fromisoformat(f"{path.stem}-01")
+            for path in partitions
+            if built_ns is None or path.stat().st_mtime_ns > built_ns
+        }
+        current_month = self.today().replace(day=1)
+        if built_ns is None or any(month < current_month for month in stale):
+            self._materialize_series(symbol, timeframe)
+            stale = set()
+        if not series_path.exists():
+            return _empty_bars()
+        if stale.intersection(_months_between(first_day, last_day)):
+            # Only the open month changed: read it from the partitions
+            return self._read_partitions(symbol, timeframe, first_day, last_day)
+
+        series = read_frame(series_path)
+        timestamps = series['timestamp'].array
+        lo, hi = np.searchsorted(timestamps.asi8, [
+            self._day_start_ns(first_day),
+            self._day_start_ns(last_day + timedelta(days=1)),
+        ])
+
+        # Positional slices of the mapped columns: views, no copy
+        columns = {
+            name: (timestamps if name == 'timestamp' else series[name].to_numpy())[lo:hi]
+            for name in series.columns
+        }
+        return pd.DataFrame(columns, copy=False)
+
+    def _day_start_ns(self, day: date) -> int:
+        """UTC epoch nanoseconds of session-local midnight starting day."""
+        return pd.Timestamp(day).tz_localize(self.session_tz).value
+
+    def _session_days(self, df: pd.DataFrame) -> pd.Series:
+        """Session-local calendar day (tz-naive midnight) of each bar."""
+        if len(df) == 0:
+            return pd.Series([], dtype='datetime64[ns]')
+        ts = pd.to_datetime(df['timestamp'], utc=True)
+        return ts.dt.tz_convert(self.session_tz).dt.tz_localize(None).dt.normalize()
+
+    def _merge(
+        self,
+        symbol: str,
+        timeframe: str,
+        df: pd.DataFrame,
+        replace_range: Optional[DayRange] = None,
+    ):
+        """Merge df into its month partitions.
+
+        With replace_range, every stored row for those days is dropped first;
+        otherwise only stored rows sharing a timestamp with df are replaced.
+        """
+        self._series_dir(symbol, timeframe).mkdir(parents=True, exist_ok=True)
+
+        df = df[BAR_COLUMNS] if len(df) else _empty_bars()
+        days = self._session_days(df)
+
+        if replace_range is not None:
+            first_day, last_day = replace_range
+        elif len(df):
+            first_day, last_day = days.iloc[0].date(), days.iloc[-1].date()
+        else:
+            return
+
+        for month in _months_between(first_day, last_day):
+            month_start = pd.Timestamp(max(first_day, month))
+            month_end = pd.Timestamp(min(last_day, _month_end(month)))
+            new_rows = df[(days >= month_start) & (days <= month_end)]
+
+            path = self._partition_path(symbol, timeframe, month)
+            if path.exists():
+                existing = pd.read_parquet(path)
+                if replace_range is not None:
+                    existing_days = self._session_days(existing)
+                    keep = (existing_days < month_start) | (existing_days > month_end)
+                else:
+                    keep = ~existing['timestamp'].isin(new_rows['timestamp'])
+                merged = pd.concat([existing[keep], new_rows], ignore_index=True) if len(new_rows) else existing[keep]
+            elif len(new_rows):
+                merged = new_rows
+            else:
+                continue
+
+            if len(merged) == 0:
+                path.unlink()
+                continue
+
+            merged = merged.sort_values('timestamp', kind='stable').reset_index(drop=True)
+            _atomic_write_parquet(merged, path)
+
+    def _load_coverage(self, symbol: str, timeframe: str) -> List[DayRange]:
+        path = self._coverage_path(symbol, timeframe)
+        if not path.exists():
+            return []
+        intervals = json.loads(path.read_text()).get('intervals', [])
+        return [(_to_date(a), _to_date(b)) for a, b in intervals]
+
+    def _add_coverage(self, symbol: str, timeframe: str, interval: DayRange):
+        merged: List[DayRange] = []
+        for start, end in sorted(self._load_coverage(symbol, timeframe) + [interval]):
+            if merged and start <= merged[-1][1] + timedelta(days=1):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+
+        path = self._coverage_path(symbol, timeframe)
+        tmp_path = _tmp_path(path)
+        tmp_path.write_text(json.dumps(
+            {'intervals': [[a.isoformat(), b.isoformat()] for a, b in merged]}, indent=2
+        ))
+        tmp_path.replace(path)
+
+
+class _SeriesLock:
+    """Thread lock plus an exclusive flock on the series' lock file."""
+
+    def __init__(self, thread_lock: threading.Lock, path: Path):
+        self._thread_lock = thread_lock
+        self._path = path
+        self._file = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if fcntl is None:
+            return self
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._path, "a")
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        except BaseException:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._thread_lock.release()
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._file is not None:
+            self._file.close()  # releases the flock
+            self._file = None
+        self._thread_lock.release()
+
+
+def _empty_bars() -> pd.DataFrame:
+    return pd.DataFrame(columns=BAR_COLUMNS)
+
+
+def _to_date(value: Union[str, date]) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def _months_between(first_day: date, last_day: date) -> List[date]:
+    """First day of every month overlapping [first_day, last_day]."""
+    months = []
+    month = first_day.replace(day=1)
+    while month <= last_day:
+        months.append(month)
+        month = (month + timedelta(days=32)).replace(day=1)
+    return months
+
+
+def _month_end(month: date) -> date:
+    return (month + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+
+
+def _tmp_path(path: Path) -> Path:
+    """Temp file next to path, unique per process and thread."""
+    return path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _atomic_write_parquet(df: pd.DataFrame, path: Path):
+    tmp_path = _tmp_path(path)
+    df.to_parquet(tmp_path, index=False)
+    tmp_path.replace(path)
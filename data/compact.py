@@ -0,0 +1,68 @@
+"""Compact dtype mode for market data and derived series.
+
+Opt-in memory saver for long histories: OHLC prices (and every indicator
+GraphExecutor derives from them) are stored as float32, volume as unsigned
+integers. Timestamps stay datetime64[ns], which is already int64 epoch-ns.
+Compacting a frame roughly halves its footprint.
+
+Tolerance: float32 keeps ~7 significant digits (relative rounding error
+<= COMPACT_PRICE_RTOL), so equity prices below $100k round-trip to the
+cent. Indicators computed on compact data agree with float64 ones to about
+COMPACT_INDICATOR_RTOL. The simulator does all P&L and equity arithmetic in
+float64, so trades only differ if a signal comparison lands within that
+tolerance of its threshold. Fitness is expected to match within
+COMPACT_FITNESS_ATOL (see tests/test_compact_dtypes.py).
+"""
+
+import numpy as np
+import pandas as pd
+
+
+PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+PRICE_DTYPE = np.float32
+
+COMPACT_PRICE_RTOL = 6e-8  # half a float32 ulp
+COMPACT_INDICATOR_RTOL = 1e-5
+COMPACT_FITNESS_ATOL = 1e-4
+
+
+def compact_bars(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a compact-dtype copy of an OHLCV frame.
+
+    Prices become float32. Volume becomes uint32 (uint64 if it does not
+    fit) when it is whole and non-negative, otherwise float32.
+
+    Args:
+        df: OHLCV DataFrame (timestamp column or DatetimeIndex)
+
+    Returns:
+        DataFrame with the same layout and compact dtypes
+    """
+    dtypes = {col: PRICE_DTYPE for col in PRICE_COLUMNS if col in df.columns}
+    if 'volume' in df.columns:
+        dtypes['volume'] = volume_dtype(df['volume'])
+    return df.astype(dtypes)
+
+
+def volume_dtype(volume: pd.Series):
+    """Smallest lossless unsigned integer dtype for volume (float32 fallback)."""
+    values = volume.to_numpy()
+    if len(values) == 0:
+        return np.uint32
+    if not np.issubdtype(values.dtype, np.number) or np.isnan(values.astype(np.float64)).any():
+        return PRICE_DTYPE
+    if values.min() < 0 or not np.array_equal(values, np.floor(values)):
+        return PRICE_DTYPE
+    return np.uint32 if values.max() <= np.iinfo(np.uint32).max else np.uint64
+
+
+def is_compact(data: pd.DataFrame) -> bool:
+    """True if the frame's prices are stored in compact (float32) dtype."""
+    return 'close' in data.columns and data['close'].dtype == PRICE_DTYPE
+
+
+def compact_series(value):
+    """Downcast a float64 Series to float32 (other values pass through)."""
+    if isinstance(value, pd.Series) and value.dtype == np.float64:
+        return value.astype(PRICE_DTYPE)
+    return value
@@ -0,0 +1,112 @@
+"""Memory-mapped OHLCV frame store (uncompressed Arrow IPC / Feather v2).
+
+Frames written here can be opened by many processes at once: numeric and
+timestamp columns come back as read-only NumPy views over the mapped file,
+so every reader shares the same physical pages instead of decoding its own
+copy of the data.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+
+# Schema metadata key recording whether the frame had a timestamp index
+TIMESTAMP_INDEX_KEY = b"darwin_timestamp_index"
+
+
+def write_frame(df: pd.DataFrame, path: Union[str, Path]) -> Path:
+    """Write an OHLCV frame as a single-chunk, uncompressed Feather file.
+
+    Timestamp-indexed frames (Phase 3 format) are stored with the index as a
+    ``timestamp`` column and restored as an index by read_frame().
+
+    Args:
+        df: OHLCV DataFrame (timestamp column or DatetimeIndex)
+        path: Destination file path
+
+    Returns:
+        Path to written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    timestamp_index = isinstance(df.index, pd.DatetimeIndex)
+    if timestamp_index:
+        table_df = df.rename_axis("timestamp").reset_index()
+    else:
+        table_df = df.reset_index(drop=True)
+
+    table = pa.Table.from_pandas(table_df, preserve_index=False).combine_chunks()
+    metadata = dict(table.schema.metadata or {})
+    metadata[TIMESTAMP_INDEX_KEY] = b"1" if timestamp_index else b"0"
+    table = table.replace_schema_metadata(metadata)
+
+    # Atomic write so concurrent readers never map a partial file
+    tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.{threading.get_ident()}.tmp")
+    feather.write_feather(
+        table, tmp_path, compression="uncompressed", chunksize=max(table.num_rows, 1)
+    )
+    tmp_path.replace(path)
+
+    return path
+
+
+def read_frame(path: Union[str, Path], memory_map: bool = True) -> pd.DataFrame:
+    """Load a frame written by write_frame().
+
+    With memory_map=True, numeric and timestamp columns are read-only views
+    over the mapped file (no copy). Columns that cannot be viewed directly
+    (nulls, booleans, strings, multiple chunks) are converted normally.
+
+    Args:
+        path: File path
+        memory_map: Map the file instead of reading it into memory
+
+    Returns:
+        DataFrame in the same layout it was written with
+    """
+    table = feather.read_table(path, memory_map=memory_map)
+    metadata = table.schema.metadata or {}
+    timestamp_index = metadata.get(TIMESTAMP_INDEX_KEY) == b"1"
+
+    columns = {name: _column_view(table.column(name)) for name in table.column_names}
+
+    if timestamp_index and "timestamp" in columns:
+        index = pd.DatetimeIndex(columns.pop("timestamp"), name="timestamp")
+        return pd.DataFrame(columns, index=index, copy=False)
+
+    return pd.DataFrame(columns, copy=False)
+
+
+def _column_view(column: pa.ChunkedArray):
+    """Return a zero-copy NumPy/pandas view of an Arrow column when possible."""
+    if column.num_chunks != 1 or column.null_count > 0:
+        return column.to_pandas()
+
+    chunk = column.chunk(0)
+
+    if pa.types.is_timestamp(chunk.type):
+        unit = chunk.type.unit
+        values = np.frombuffer(
+            chunk.buffers()[1],
+            dtype=f"M8[{unit}]",
+            count=len(chunk),
+            offset=chunk.offset * 8,
+        )
+        if chunk.type.tz is not None:
+            return pd.arrays.DatetimeArray(
+                values.view("i8"), dtype=pd.DatetimeTZDtype(unit=unit, tz=chunk.type.tz)
+            )
+        return values
+
+    if pa.types.is_integer(chunk.type) or pa.types.is_floating(chunk.type):
+        return chunk.to_numpy(zero_copy_only=True)
+
+    return column.to_pandas()
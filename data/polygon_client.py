@@ -1,47 +1,139 @@
 import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from datetime import datetime, timedelta
-import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
 import json
-from typing import Dict, List
-from config import POLYGON_API_KEY, CACHE_DIR, CACHE_EXPIRY_DAYS
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+import telemetry
+from data.bar_cache import BAR_COLUMNS, BarCache
+from data.compact import compact_bars
+from config import (
+    POLYGON_API_KEY,
+    CACHE_DIR,
+    POLYGON_MAX_WORKERS,
+    POLYGON_MAX_REQUESTS_PER_SECOND,
+    BAR_CACHE_FORMAT,
+    COMPACT_MARKET_DATA,
+)
+
+
+# Responses worth retrying: rate limited or transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _decode_page(results: List[Dict]) -> pd.DataFrame:
+    """Decode one page of Polygon aggregate dicts into typed columns.
+
+    Timestamps are int64 epoch ms (-> UTC datetime), OHLCV float64.
+    """
+    n = len(results)
+    columns = {'timestamp': np.fromiter((r['t'] for r in results), dtype=np.int64, count=n)}
+    for key, name in (('o', 'open'), ('h', 'high'), ('l', 'low'), ('c', 'close'), ('v', 'volume')):
+        columns[name] = np.fromiter((r[key] for r in results), dtype=np.float64, count=n)
+    columns['timestamp'] = pd.to_datetime(columns['timestamp'], unit='ms', utc=True)
+    return pd.DataFrame(columns, copy=False)
+
+
+class RateLimiter:
+    """Thread-safe minimum-interval limiter (max_per_second=None disables)."""
+
+    def __init__(self, max_per_second: Optional[float] = None):
+        self.interval = 1.0 / max_per_second if max_per_second else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self):
+        """Block until the next request slot is available."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
 
 
 class PolygonClient:
     BASE_URL = "https://api.polygon.io/v2/aggs/ticker"
     
-    def __init__(self, api_key: str = POLYGON_API_KEY):
+    def __init__(
+        self,
+        api_key: str = POLYGON_API_KEY,
+        base_url: str = BASE_URL,
+        cache_dir: Optional[Path] = None,
+        cache_format: str = BAR_CACHE_FORMAT,
+        compact: bool = COMPACT_MARKET_DATA,
+        max_workers: int = POLYGON_MAX_WORKERS,
+        max_requests_per_second: Optional[float] = POLYGON_MAX_REQUESTS_PER_SECOND,
+        max_retries: int = 5,
+        backoff_seconds: float = 0.5,
+    ):
         if not api_key:
             raise ValueError("POLYGON_API_KEY not set")
         self.api_key = api_key
-        self.cache_dir = CACHE_DIR
-        
-    def _get_cache_path(self, symbol: str, timeframe: str, start: str, end: str) -> Path:
-        """Generate cache file path based on request params."""
-        cache_key = f"{symbol}_{timeframe}_{start}_{end}"
-        hash_key = hashlib.md5(cache_key.encode()).hexdigest()
-        return self.cache_dir / f"{hash_key}.parquet"
-    
-    def _is_cache_valid(self, cache_path: Path) -> bool:
-        """Check if cache file exists and is not expired."""
-        if not cache_path.exists():
-            return False
+        self.base_url = base_url.rstrip('/')
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else CACHE_DIR
+        self.bar_cache = BarCache(self.cache_dir / "bars", cache_format=cache_format)
+        self.compact = compact
+        self.max_workers = max_workers
+        self.max_requests_per_second = max_requests_per_second
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+
+        # One keep-alive connection pool shared by all fetch threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+        self._rate_limiters_lock = threading.Lock()
+
+    def _rate_limiter(self, url: str) -> RateLimiter:
+        """Per-host rate limiter."""
+        host = urlsplit(url).netloc
+        with self._rate_limiters_lock:
+            if host not in self._rate_limiters:
+                self._rate_limiters[host] = RateLimiter(self.max_requests_per_second)
+            return self._rate_limiters[host]
+
+    def _get_json(self, url: str, params: Dict) -> Dict:
+        """GET a Polygon page with rate limiting and retry/backoff on 429/5xx."""
+        limiter = self._rate_limiter(url)
+        for attempt in range(self.max_retries + 1):
+            limiter.acquire()
+            try:
+                response = self.session.get(url, params=params, timeout=30)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self.backoff_seconds * 2 ** attempt)
+                continue
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                retry_after = response.headers.get("Retry-After", "")
+                delay = float(retry_after) if retry_after.isdigit() else self.backoff_seconds * 2 ** attempt
+                time.sleep(delay)
+                continue
+
+            response.raise_for_status()
+            return response.json()
         
-        mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        age = datetime.now() - mtime
-        return age < timedelta(days=CACHE_EXPIRY_DAYS)
-    
-    def _load_from_cache(self, cache_path: Path) -> pd.DataFrame:
-        """Load DataFrame from cache."""
-        return pd.read_parquet(cache_path)
-    
-    def _save_to_cache(self, df: pd.DataFrame, cache_path: Path):
-        """Save DataFrame to cache."""
-        df.to_parquet(cache_path, index=False)
-    
-    def _fetch_from_polygon(self, symbol: str, timeframe: str, start: str, end: str) -> pd.DataFrame:
-        """Fetch bars from Polygon API."""
+    def _fetch_pages(self, symbol: str, timeframe: str, start: str, end: str) -> Iterator[pd.DataFrame]:
+        """Fetch bars from Polygon API one page at a time.
+
+        Each page's results are decoded straight into typed columns, so only
+        one page of raw result dicts is alive at any time.
+
+        Yields:
+            DataFrame per non-empty page (timestamp, open, high, low, close, volume)
+        """
         # Convert timeframe to Polygon format
         # "5m" -> multiplier=5, timespan="minute"
         # "1h" -> multiplier=1, timespan="hour"
@@ -59,7 +151,7 @@ class PolygonClient:
         else:
             raise ValueError(f"Invalid timeframe: {timeframe}")
         
-        url = f"{self.BASE_URL}/{symbol}/range/{multiplier}/{timespan}/{start}/{end}"
+        url = f"{self.base_url}/{symbol}/range/{multiplier}/{timespan}/{start}/{end}"
         params = {
             "apiKey": self.api_key,
             "adjusted": "true",
@@ -67,21 +159,18 @@ class PolygonClient:
             "limit": 50000
         }
         
-        all_results = []
-        
         while True:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(url, params)
             
             if data.get("status") != "OK":
                 raise ValueError(f"Polygon API error: {data.get('error', 'Unknown error')}")
             
-            results = data.get("results", [])
+            results = data.pop("results", None)
             if not results:
                 break
-                
-            all_results.extend(results)
+
+            yield _decode_page(results)
+            del results
             
             # Check for pagination
             next_url = data.get("next_url")
@@ -90,29 +179,7 @@ class PolygonClient:
             
             url = next_url
             params = {"apiKey": self.api_key}  # next_url already has other params
-        
-        if not all_results:
-            return pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(all_results)
-        df = df.rename(columns={
-            't': 'timestamp',
-            'o': 'open',
-            'h': 'high',
-            'l': 'low',
-            'c': 'close',
-            'v': 'volume'
-        })
-        
-        # Convert timestamp from ms to datetime (UTC)
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True)
-        
-        # Select and order columns
-        df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-        
-        return df
-    
+
     def get_bars(self, symbol: str, timeframe: str, start: str, end: str) -> pd.DataFrame:
         """
         Get OHLCV bars for a single symbol.
@@ -125,20 +192,73 @@ class PolygonClient:
             
         Returns:
             DataFrame with columns: timestamp, open, high, low, close, volume
+            (compact dtypes if the client was created with compact=True)
         """
-        cache_path = self._get_cache_path(symbol, timeframe, start, end)
-        
-        if self._is_cache_valid(cache_path):
-            print(f"Loading {symbol} {timeframe} from cache...")
-            return self._load_from_cache(cache_path)
-        
-        print(f"Fetching {symbol} {timeframe} from Polygon...")
-        df = self._fetch_from_polygon(symbol, timeframe, start, end)
-        
-        if not df.empty:
-            self._save_to_cache(df, cache_path)
-        
-        return df
+        with self.bar_cache.lock(symbol, timeframe):
+            missing = self.bar_cache.missing_ranges(symbol, timeframe, start, end)
+
+            telemetry.CACHE_REQUESTS.labels("bars", "miss" if missing else "hit").inc()
+            if not missing:
+                print(f"Loading {symbol} {timeframe} from cache...")
+            for first_day, last_day in missing:
+                print(f"Fetching {symbol} {timeframe} {first_day}..{last_day} from Polygon...")
+                # Pages go straight to the month partitions; the range only
+                # counts as covered once every page has been written
+                self.bar_cache.clear(symbol, timeframe, first_day, last_day)
+                for page in self._fetch_pages(
+                    symbol, timeframe, first_day.isoformat(), last_day.isoformat()
+                ):
+                    self.bar_cache.append(symbol, timeframe, page)
+                self.bar_cache.mark_covered(symbol, timeframe, first_day, last_day)
+
+            df = self.bar_cache.read(symbol, timeframe, start, end)
+
+        return compact_bars(df) if self.compact else df
+
+    def get_bars_many(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        start: str,
+        end: str,
+        on_symbol: Optional[Callable[[str, Optional[pd.DataFrame], Optional[Exception]], None]] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get OHLCV bars for many symbols concurrently.
+
+        Symbols are fetched on up to max_workers threads sharing this client's
+        pooled session; each symbol follows its own pagination.
+
+        Args:
+            symbols: List of ticker symbols
+            timeframe: Bar size (e.g., "5m", "1h", "1d")
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD)
+            on_symbol: Optional callback(symbol, df, error) as each symbol finishes
+
+        Returns:
+            Dictionary mapping symbol -> DataFrame for symbols that succeeded,
+            in the order requested
+        """
+        results: Dict[str, pd.DataFrame] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(symbols)))) as pool:
+            futures = {
+                pool.submit(self.get_bars, symbol, timeframe, start, end): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    if on_symbol is not None:
+                        on_symbol(symbol, None, e)
+                    continue
+                results[symbol] = df
+                if on_symbol is not None:
+                    on_symbol(symbol, df, None)
+
+        return {symbol: results[symbol] for symbol in symbols if symbol in results}
 
 
 def get_bars(symbols: List[str], timeframe: str, start: str, end: str) -> Dict[str, pd.DataFrame]:
@@ -155,13 +275,12 @@ def get_bars(symbols: List[str], timeframe: str, start: str, end: str) -> Dict[s
         Dictionary mapping symbol -> DataFrame
     """
     client = PolygonClient()
-    result = {}
-    
-    for symbol in symbols:
-        try:
-            result[symbol] = client.get_bars(symbol, timeframe, start, end)
-        except Exception as e:
-            print(f"Error fetching {symbol}: {e}")
-            result[symbol] = pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-    
-    return result
\ No newline at end of file
+
+    def report_error(symbol, df, error):
+        if error is not None:
+            print(f"Error fetching {symbol}: {error}")
+
+    fetched = client.get_bars_many(symbols, timeframe, start, end, on_symbol=report_error)
+
+    empty = pd.DataFrame(columns=BAR_COLUMNS)
+    return {symbol: fetched.get(symbol, empty.copy()) for symbol in symbols}
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""Process-wide registry of shared, immutable market datasets.
+
+Concurrent runs asking for the same (symbol, timeframe, start, end) window
+get the same MarketFrame instead of each re-reading the cache and building
+its own DataFrame. Frames are evicted least-recently-used once the resident
+size exceeds a byte budget; evicted frames stay valid for runs still
+holding them.
+"""
+
+import mmap
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import telemetry
+
+
+DatasetKey = Tuple[str, str, str, str]  # (symbol, timeframe, start, end)
+
+
+@dataclass(frozen=True)
+class MarketFrame:
+    """Immutable OHLCV dataset shared between runs.
+
+    The numeric columns of df are read-only arrays; evaluation code slices
+    and reads them but must never write to them.
+    """
+    symbol: str
+    timeframe: str
+    start: str
+    end: str
+    df: pd.DataFrame = field(repr=False)
+    nbytes: int
+
+    @property
+    def key(self) -> DatasetKey:
+        return (self.symbol, self.timeframe, self.start, self.end)
+
+
+def freeze_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a frame whose numeric columns are read-only NumPy arrays.
+
+    Args:
+        df: OHLCV DataFrame
+
+    Returns:
+        DataFrame sharing one read-only array per numeric column. Columns
+        that are already read-only or memory-mapped (e.g. from the Feather
+        bar cache) are kept as read-only views, without a copy
+    """
+    columns = {}
+    for name in df.columns:
+        column = df[name]
+        if column.dtype.kind in "fiub":
+            values = column.to_numpy()
+            if values.flags.writeable and not _is_mapped(values):
+                values = values.copy()  # the caller may still write to its own array
+            else:
+                values = values.view()
+            values.flags.writeable = False
+            columns[name] = values
+        else:
+            columns[name] = column.array
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def _is_mapped(values: np.ndarray) -> bool:
+    """True if the array's memory is a memory-mapped file."""
+    base = values
+    while base is not None:
+        if isinstance(base, (np.memmap, mmap.mmap)):
+            return True
+        base = getattr(base, "base", None)
+    return False
+
+
+class DatasetRegistry:
+    """LRU cache of MarketFrames under a byte budget.
+
+    Args:
+        loader: Callable(symbol, timeframe, start, end) -> DataFrame
+        max_bytes: Resident size budget (the most recent frame is always kept)
+    """
+
+    def __init__(self, loader: Callable[[str, str, str, str], pd.DataFrame], max_bytes: int):
+        self.loader = loader
+        self.max_bytes = max_bytes
+        self._frames: "OrderedDict[DatasetKey, MarketFrame]" = OrderedDict()
+        self._loaded_at: Dict[DatasetKey, float] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[DatasetKey, threading.Lock] = {}
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, symbol: str, timeframe: str, start: str, end: str) -> MarketFrame:
+        """Return the shared MarketFrame for a window, loading it on a miss.
+
+        Concurrent requests for the same window wait for a single load.
+        """
+        key = (symbol, timeframe, start, end)
+
+        with self._lock:
+            frame = self._lookup(key)
+            if frame is not None:
+                return frame
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                frame = self._lookup(key)
+                if frame is not None:
+                    return frame
+                self.misses += 1
+                telemetry.CACHE_REQUESTS.labels("dataset", "miss").inc()
+
+            try:
+                df = freeze_frame(self.loader(symbol, timeframe, start, end))
+                frame = MarketFrame(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    start=start,
+                    end=end,
+                    df=df,
+                    nbytes=int(df.memory_usage(index=True, deep=True).sum()),
+                )
+
+                with self._lock:
+                    self._frames[key] = frame
+                    self._loaded_at[key] = time.time()
+                    self.resident_bytes += frame.nbytes
+                    self._evict()
+            finally:
+                # Also after a failed load: waiters retry it, and the entry is not leaked
+                with self._lock:
+                    self._key_locks.pop(key, None)
+
+        return frame
+
+    def get_many(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        start: str,
+        end: str,
+        max_workers: int = 8,
+        on_symbol: Optional[Callable[[str, Optional[MarketFrame], Optional[Exception]], None]] = None,
+    ) -> Dict[str, MarketFrame]:
+        """Get frames for many symbols, loading misses concurrently.
+
+        Args:
+            symbols: Ticker symbols
+            timeframe: Bar size
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD)
+            max_workers: Concurrent loads
+            on_symbol: Optional callback(symbol, frame, error) as each symbol finishes
+
+        Returns:
+            Dict mapping symbol -> MarketFrame for symbols that loaded, in
+            the order requested
+        """
+        frames: Dict[str, MarketFrame] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as pool:
+            futures = {
+                pool.submit(self.get, symbol, timeframe, start, end): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    frame = future.result()
+                except Exception as e:
+                    if on_symbol is not None:
+                        on_symbol(symbol, None, e)
+                    continue
+                frames[symbol] = frame
+                if on_symbol is not None:
+                    on_symbol(symbol, frame, None)
+
+        return {symbol: frames[symbol] for symbol in symbols if symbol in frames}
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, resident bytes and per-dataset sizes."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "resident_bytes": self.resident_bytes,
+                "max_bytes": self.max_bytes,
+                "datasets": [
+                    {
+                        "symbol": frame.symbol,
+                        "timeframe": frame.timeframe,
+                        "start": frame.start,
+                        "end": frame.end,
+                        "bars": len(frame.df),
+                        "bytes": frame.nbytes,
+                        "loaded_at": self._loaded_at[key],
+                    }
+                    # Most recently used first
+                    for key, frame in reversed(self._frames.items())
+                ],
+            }
+
+    def clear(self):
+        """Drop every resident frame."""
+        with self._lock:
+            self._frames.clear()
+            self._loaded_at.clear()
+            self.resident_bytes = 0
+
+    def _lookup(self, key: DatasetKey) -> Optional[MarketFrame]:
+        """Return a resident frame and mark it used (caller holds _lock)."""
+        frame = self._frames.get(key)
+        if frame is not None:
+            self._frames.move_to_end(key)
+            self.hits += 1
+            telemetry.CACHE_REQUESTS.labels("dataset", "hit").inc()
+        return frame
+
+    def _evict(self):
+        """Drop least-recently-used frames over budget (caller holds _lock)."""
+        while self.resident_bytes > self.max_bytes and len(self._frames) > 1:
+            key, frame = self._frames.popitem(last=False)
+            self._loaded_at.pop(key, None)
+            self.resident_bytes -= frame.nbytes
+            self.evictions += 1
@@ -0,0 +1,209 @@
+"""Local timeframe resampling of cached OHLCV bars.
+
+Builds coarser bars (10m/15m/30m/1h/1d, ...) from a finer base timeframe
+(5m by default) so timeframe sweeps need no extra downloads. Intraday bins
+are anchored to the session open in the session timezone, and bars are
+labelled by their start time like Polygon aggregates.
+"""
+
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+import telemetry
+
+
+OHLCV_AGG = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum',
+}
+
+MINUTES_PER_UNIT = {'m': 1, 'h': 60, 'd': 1440}
+
+
+def timeframe_minutes(timeframe: str) -> int:
+    """Convert a timeframe string ("5m", "1h", "1d") to minutes.
+
+    Args:
+        timeframe: Timeframe string
+
+    Returns:
+        Bar length in minutes
+    """
+    unit = timeframe[-1:]
+    if unit not in MINUTES_PER_UNIT or not timeframe[:-1].isdigit():
+        raise ValueError(f"Invalid timeframe: {timeframe}")
+    return int(timeframe[:-1]) * MINUTES_PER_UNIT[unit]
+
+
+def resample_bars(
+    df: pd.DataFrame,
+    target_timeframe: str,
+    base_timeframe: str = "5m",
+    session_tz: str = "America/New_York",
+    session_open: str = "09:30",
+) -> pd.DataFrame:
+    """Aggregate OHLCV bars to a coarser timeframe.
+
+    open=first, high=max, low=min, close=last, volume=sum. Bins with no base
+    bars are dropped. Intraday bins are aligned to session_open (so 1h bars
+    run 09:30-10:30, ...); daily bars group by session-local calendar date.
+
+    Args:
+        df: OHLCV DataFrame (timestamp column or DatetimeIndex)
+        target_timeframe: Timeframe to build (e.g. "15m", "1h", "1d")
+        base_timeframe: Timeframe of df
+        session_tz: Exchange timezone used for alignment
+        session_open: Session open time (HH:MM, session_tz)
+
+    Returns:
+        Resampled DataFrame in the same layout (column or index) as df
+    """
+    base_minutes = timeframe_minutes(base_timeframe)
+    target_minutes = timeframe_minutes(target_timeframe)
+
+    if target_minutes < base_minutes or target_minutes % base_minutes != 0:
+        raise ValueError(
+            f"Cannot build {target_timeframe} bars from {base_timeframe} bars "
+            f"(target must be a whole multiple of the base timeframe)"
+        )
+
+    timestamp_column = 'timestamp' in df.columns
+    bars = df.set_index('timestamp') if timestamp_column else df
+    if len(bars) == 0:
+        return df.iloc[0:0]
+
+    if target_minutes == base_minutes:
+        return df
+
+    index = pd.DatetimeIndex(bars.index)
+    source_tz = index.tz
+    local_index = (index if source_tz is not None else index.tz_localize('UTC')).tz_convert(session_tz)
+    local = bars[list(OHLCV_AGG)].set_axis(local_index, axis=0)
+
+    if target_minutes >= MINUTES_PER_UNIT['d']:
+        rule = f"{target_minutes // MINUTES_PER_UNIT['d']}D"
+        offset = None
+    else:
+        hours, minutes = (int(part) for part in session_open.split(':'))
+        rule = f"{target_minutes}min"
+        offset = pd.Timedelta(minutes=(hours * 60 + minutes) % target_minutes)
+
+    resampled = (
+        local.resample(rule, origin='start_day', offset=offset, label='left', closed='left')
+        .agg(OHLCV_AGG)
+        .dropna(subset=['open'])
+    )
+
+    # Back to the source timezone convention
+    resampled.index = resampled.index.tz_convert('UTC')
+    if source_tz is None:
+        resampled.index = resampled.index.tz_localize(None)
+    elif str(source_tz) != 'UTC':
+        resampled.index = resampled.index.tz_convert(source_tz)
+    resampled.index.name = 'timestamp'
+
+    if timestamp_column:
+        return resampled.reset_index()
+    return resampled
+
+
+class BarResampler:
+    """Memoized resampler keyed by (symbol, base timeframe, target timeframe).
+
+    Entries are also keyed by a content hash of the base frame, so a
+    refreshed or revised base series never returns stale bars. With cache_dir set, resampled
+    frames are persisted as parquet and reused across processes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_entries: int = 64,
+        session_tz: str = "America/New_York",
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_entries = max_entries
+        self.session_tz = session_tz
+        self._memo: "OrderedDict[Tuple, pd.DataFrame]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        symbol: str,
+        df: pd.DataFrame,
+        target_timeframe: str,
+        base_timeframe: str = "5m",
+    ) -> pd.DataFrame:
+        """Return df resampled to target_timeframe, memoized per symbol.
+
+        Args:
+            symbol: Symbol the bars belong to
+            df: Base-timeframe OHLCV DataFrame
+            target_timeframe: Timeframe to build
+            base_timeframe: Timeframe of df
+
+        Returns:
+            Resampled DataFrame
+        """
+        if timeframe_minutes(target_timeframe) == timeframe_minutes(base_timeframe):
+            return df
+
+        key = (symbol, base_timeframe, target_timeframe, _frame_fingerprint(df))
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            self.hits += 1
+            telemetry.CACHE_REQUESTS.labels("resample", "hit").inc()
+            return self._memo[key]
+
+        self.misses += 1
+        telemetry.CACHE_REQUESTS.labels("resample", "miss").inc()
+        cache_path = self._cache_path(key)
+        if cache_path is not None and cache_path.exists():
+            resampled = pd.read_parquet(cache_path)
+            # Index-format frames round-trip their DatetimeIndex through parquet;
+            # only restore it from a column if it came back as one
+            if 'timestamp' not in df.columns and 'timestamp' in resampled.columns:
+                resampled = resampled.set_index('timestamp')
+        else:
+            resampled = resample_bars(
+                df, target_timeframe, base_timeframe=base_timeframe, session_tz=self.session_tz
+            )
+            if cache_path is not None:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                resampled.to_parquet(cache_path, index='timestamp' not in resampled.columns)
+
+        self._memo[key] = resampled
+        while len(self._memo) > self.max_entries:
+            self._memo.popitem(last=False)
+        return resampled
+
+    def clear(self):
+        """Drop all memoized frames (parquet cache is kept)."""
+        self._memo.clear()
+
+    def _cache_path(self, key: Tuple) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        symbol, base_timeframe, target_timeframe, fingerprint = key
+        # Hashed: symbols may not be valid file names
+        digest = hashlib.md5(f"{symbol}\0{fingerprint}".encode()).hexdigest()
+        return self.cache_dir / f"{base_timeframe}_to_{target_timeframe}_{digest}.parquet"
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a bar series (timestamps and OHLCV values)."""
+    timestamps = pd.DatetimeIndex(df['timestamp'] if 'timestamp' in df.columns else df.index)
+    digest = hashlib.blake2b(str(timestamps.tz).encode(), digest_size=16)
+    digest.update(np.ascontiguousarray(timestamps.asi8))
+    for column in OHLCV_AGG:
+        digest.update(np.ascontiguousarray(df[column].to_numpy(dtype='float64')))
+    return digest.hexdigest()
@@ -0,0 +1,484 @@
+"""Deterministic synthetic OHLCV provider for offline load testing.
+
+SyntheticClient has the same get_bars / get_bars_many interface as
+PolygonClient, so the executor, simulator, episode sampler and full Darwin
+runs can be exercised at production data sizes without network access.
+
+The price process has two levels:
+
+- Daily: a Markov regime chain (bull / bear / sideways / crisis, each with
+  its own drift and volatility), GARCH(1,1) volatility clustering on top of
+  the regime volatility, overnight gaps with occasional jumps, and a weak
+  pull of the log price back to the symbol's anchor price so decades-long
+  series stay in a realistic range.
+- Intraday: each session's open-to-close move is spread over the bars with
+  a Brownian bridge under a U-shaped volatility profile (busy open and
+  close, quiet midday). Volume follows the same profile and the regime
+  volatility.
+
+Everything is a pure function of (seed, symbol, session day, timeframe):
+the daily path is generated sequentially from EPOCH and every session's
+intraday noise comes from its own seeded generator. A day's bars are
+therefore identical whatever window or chunk size they are requested
+with, and series of any length (tens of millions of bars) are built one
+chunk of sessions at a time. Different timeframes of one symbol share the
+daily opens and closes but not their intraday paths.
+
+Sessions are weekdays (no exchange holidays); bars are labelled by their
+start time in UTC like Polygon aggregates, daily bars at session-local
+midnight.
+"""
+
+import math
+import threading
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from data.bar_cache import BAR_COLUMNS
+from data.compact import PRICE_DTYPE
+from data.resample import MINUTES_PER_UNIT, timeframe_minutes
+
+
+# First session day of every synthetic series
+EPOCH = date(1970, 1, 1)
+
+# Sessions generated per chunk (bounds peak working memory)
+DEFAULT_CHUNK_DAYS = 250
+
+# Daily path is extended in blocks of this many sessions
+_DAILY_BLOCK = 2520
+
+
+@dataclass(frozen=True)
+class Regime:
+    """Market regime of the daily process.
+
+    Attributes:
+        name: Regime label
+        drift: Mean open-to-close log return per session
+        volatility: Open-to-close log return volatility per session
+        persistence: Probability of staying in the regime the next session
+    """
+    name: str
+    drift: float
+    volatility: float
+    persistence: float
+
+
+DEFAULT_REGIMES: Tuple[Regime, ...] = (
+    Regime("bull", drift=0.0006, volatility=0.010, persistence=0.985),
+    Regime("bear", drift=-0.0008, volatility=0.018, persistence=0.970),
+    Regime("sideways", drift=0.0, volatility=0.008, persistence=0.980),
+    Regime("crisis", drift=-0.0020, volatility=0.035, persistence=0.900),
+)
+
+
+@dataclass
+class _DailyPath:
+    """Per-session state of one symbol from EPOCH onwards."""
+    regime: np.ndarray      # int8 index into regimes
+    sigma: np.ndarray       # effective open-to-close volatility
+    log_open: np.ndarray
+    log_close: np.ndarray
+
+
+class SyntheticClient:
+    """Seedable regime-switching OHLCV generator with the PolygonClient interface.
+
+    Args:
+        seed: Master seed (same seed + symbol -> same bars)
+        regimes: Regimes of the daily Markov chain (first one is the start state)
+        session_tz: Exchange timezone
+        session_open: Session open (HH:MM, session_tz)
+        session_close: Session close (HH:MM, session_tz)
+        daily_volume: Typical shares traded per session
+        garch: (alpha, beta) of the GARCH(1,1) volatility multiplier
+        gap_volatility: Overnight gap volatility as a fraction of session volatility
+        jump_probability: Chance per session of an overnight jump
+        jump_volatility: Log-size volatility of overnight jumps
+        compact: Return compact dtypes (float32 prices, uint32 volume)
+        chunk_days: Sessions generated per chunk
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        regimes: Tuple[Regime, ...] = DEFAULT_REGIMES,
+        session_tz: str = "America/New_York",
+        session_open: str = "09:30",
+        session_close: str = "16:00",
+        daily_volume: float = 2_000_000,
+        garch: Tuple[float, float] = (0.08, 0.90),
+        gap_volatility: float = 0.25,
+        jump_probability: float = 0.02,
+        jump_volatility: float = 0.04,
+        compact: bool = False,
+        chunk_days: int = DEFAULT_CHUNK_DAYS,
+    ):
+        alpha, beta = garch
+        if alpha < 0 or beta < 0 or alpha + beta >= 1:
+            raise ValueError(f"GARCH parameters must satisfy alpha, beta >= 0 and alpha + beta < 1 (got {garch})")
+
+        self.seed = seed
+        self.regimes = tuple(regimes)
+        self.session_tz = session_tz
+        self.session_open = session_open
+        self.session_close = session_close
+        self.daily_volume = daily_volume
+        self.garch = (alpha, beta)
+        self.gap_volatility = gap_volatility
+        self.jump_probability = jump_probability
+        self.jump_volatility = jump_volatility
+        self.compact = compact
+        self.chunk_days = chunk_days
+
+        self._open_minutes = _clock_minutes(session_open)
+        self._session_minutes = _clock_minutes(session_close) - self._open_minutes
+        if self._session_minutes <= 0:
+            raise ValueError(f"Session close {session_close} must be after open {session_open}")
+
+        self._daily: Dict[str, _DailyPath] = {}
+        self._lock = threading.Lock()
+
+    def get_bars(self, symbol: str, timeframe: str, start: str, end: str) -> pd.DataFrame:
+        """
+        Get OHLCV bars for a single symbol.
+
+        Args:
+            symbol: Ticker symbol (e.g., "AAPL")
+            timeframe: Bar size (e.g., "5m", "1h", "1d")
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD)
+
+        Returns:
+            DataFrame with columns: timestamp, open, high, low, close, volume
+            (compact dtypes if the client was created with compact=True)
+        """
+        days = self._session_days(start, end)
+        bars_per_day = len(self._bar_offsets(timeframe)[0])
+        total = len(days) * bars_per_day
+
+        price_dtype = PRICE_DTYPE if self.compact else np.float64
+        columns = {'timestamp': np.empty(total, dtype=np.int64)}
+        for name in BAR_COLUMNS[1:]:
+            columns[name] = np.empty(total, dtype=price_dtype)
+        if self.compact:
+            columns['volume'] = np.empty(total, dtype=np.uint32)
+
+        # Chunks are written straight into the preallocated columns
+        position = 0
+        for chunk in self._iter_chunk_arrays(symbol, timeframe, days):
+            size = len(chunk['timestamp'])
+            for name, values in chunk.items():
+                columns[name][position:position + size] = values
+            position += size
+
+        return _bars_frame(columns)
+
+    def iter_bars(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: str,
+        end: str,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield the bars for [start, end] one chunk of sessions at a time.
+
+        For series too large to hold in memory at once; concatenating the
+        chunks gives exactly get_bars(symbol, timeframe, start, end).
+        """
+        days = self._session_days(start, end)
+        for chunk in self._iter_chunk_arrays(symbol, timeframe, days):
+            if self.compact:
+                chunk = {
+                    name: values if name == 'timestamp' else values.astype(
+                        np.uint32 if name == 'volume' else PRICE_DTYPE
+                    )
+                    for name, values in chunk.items()
+                }
+            yield _bars_frame(chunk)
+
+    def generate(self, symbol: str, timeframe: str, n_bars: int, start: str = "2000-01-03") -> pd.DataFrame:
+        """Get exactly n_bars bars starting at the first session on or after start.
+
+        Args:
+            symbol: Ticker symbol
+            timeframe: Bar size
+            n_bars: Number of bars
+            start: First date (YYYY-MM-DD)
+
+        Returns:
+            OHLCV DataFrame with n_bars rows (may extend past today)
+        """
+        bars_per_day = len(self._bar_offsets(timeframe)[0])
+        first = pd.Timestamp(start)
+        sessions = max(1, math.ceil(n_bars / bars_per_day))
+        last = (first + pd.offsets.BDay(0)) + pd.offsets.BDay(sessions - 1)
+        return self.get_bars(symbol, timeframe, start, f"{last:%Y-%m-%d}").iloc[:n_bars]
+
+    def get_bars_many(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        start: str,
+        end: str,
+        on_symbol: Optional[Callable[[str, Optional[pd.DataFrame], Optional[Exception]], None]] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get OHLCV bars for many symbols.
+
+        Generation is CPU-bound, so symbols are built one after another.
+
+        Args:
+            symbols: List of ticker symbols
+            timeframe: Bar size (e.g., "5m", "1h", "1d")
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD)
+            on_symbol: Optional callback(symbol, df, error) as each symbol finishes
+
+        Returns:
+            Dictionary mapping symbol -> DataFrame for symbols that succeeded,
+            in the order requested
+        """
+        results: Dict[str, pd.DataFrame] = {}
+        for symbol in symbols:
+            try:
+                df = self.get_bars(symbol, timeframe, start, end)
+            except Exception as e:
+                if on_symbol is not None:
+                    on_symbol(symbol, None, e)
+                continue
+            results[symbol] = df
+            if on_symbol is not None:
+                on_symbol(symbol, df, None)
+        return results
+
+    def regime_labels(self, symbol: str, start: str, end: str) -> pd.Series:
+        """Ground-truth regime name of every session in [start, end].
+
+        Args:
+            symbol: Ticker symbol
+            start: Start date (YYYY-MM-DD)
+            end: End date (YYYY-MM-DD)
+
+        Returns:
+            Series of regime names indexed by session date
+        """
+        days = self._session_days(start, end)
+        if len(days) == 0:
+            return pd.Series([], dtype=object, name='regime')
+        ordinals = _ordinals(days)
+        daily = self._daily_path(symbol, int(ordinals[-1]) + 1)
+        names = np.array([regime.name for regime in self.regimes], dtype=object)
+        return pd.Series(names[daily.regime[ordinals]], index=days, name='regime')
+
+    def _session_days(self, start: str, end: str) -> pd.DatetimeIndex:
+        days = pd.bdate_range(start, end)
+        if len(days) and days[0].date() < EPOCH:
+            raise ValueError(f"Synthetic data starts at {EPOCH} (requested {start})")
+        return days
+
+    def _bar_offsets(self, timeframe: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Bar start offsets from the session open and bar durations (minutes)."""
+        minutes = timeframe_minutes(timeframe)
+        if minutes >= MINUTES_PER_UNIT['d']:
+            if minutes != MINUTES_PER_UNIT['d']:
+                raise ValueError(f"Unsupported synthetic timeframe: {timeframe} (daily bars are 1d)")
+            return np.zeros(1, dtype=np.int64), np.array([self._session_minutes], dtype=np.int64)
+
+        offsets = np.arange(0, self._session_minutes, minutes, dtype=np.int64)
+        durations = np.minimum(minutes, self._session_minutes - offsets)
+        return offsets, durations
+
+    def _daily_path(self, symbol: str, n_days: int) -> _DailyPath:
+        """Daily regime/volatility/price path covering the first n_days sessions.
+
+        Generated sequentially from EPOCH; each random stream is drawn in one
+        call, so a longer path always starts with the shorter one.
+        """
+        with self._lock:
+            path = self._daily.get(symbol)
+            if path is not None and len(path.log_close) >= n_days:
+                return path
+
+            n = _DAILY_BLOCK * math.ceil(n_days / _DAILY_BLOCK)
+            streams = np.random.SeedSequence([self.seed, _symbol_key(symbol)]).spawn(5)
+            regime_rng, shock_rng, gap_rng, jump_rng, jump_size_rng = (
+                np.random.default_rng(stream) for stream in streams
+            )
+            regime_draws = regime_rng.random((n, 2))
+            shocks = shock_rng.standard_normal(n)
+            gap_shocks = gap_rng.standard_normal(n)
+            jumps = np.where(
+                jump_rng.random(n) < self.jump_probability,
+                self.jump_volatility * jump_size_rng.standard_normal(n),
+                0.0,
+            )
+
+            drifts = np.array([regime.drift for regime in self.regimes])
+            volatilities = np.array([regime.volatility for regime in self.regimes])
+            persistence = np.array([regime.persistence for regime in self.regimes])
+            n_regimes = len(self.regimes)
+            alpha, beta = self.garch
+            omega = 1.0 - alpha - beta
+            anchor = math.log(_anchor_price(symbol))
+            reversion = 1.0 / _DAILY_BLOCK
+
+            regime = np.empty(n, dtype=np.int8)
+            sigma = np.empty(n)
+            log_open = np.empty(n)
+            log_close = np.empty(n)
+
+            state, variance, last_close = 0, 1.0, anchor
+            for t in range(n):
+                switch, pick = regime_draws[t]
+                if n_regimes > 1 and switch > persistence[state]:
+                    other = int(pick * (n_regimes - 1))
+                    state = other if other < state else other + 1
+
+                vol = volatilities[state] * math.sqrt(variance)
+                gap = self.gap_volatility * vol * gap_shocks[t] + jumps[t]
+                drift = drifts[state] - reversion * (last_close - anchor)
+
+                regime[t] = state
+                sigma[t] = vol
+                log_open[t] = last_close + gap
+                log_close[t] = log_open[t] + drift + vol * shocks[t]
+                last_close = log_close[t]
+                variance = omega + (alpha * shocks[t] ** 2 + beta) * variance
+
+            path = _DailyPath(regime=regime, sigma=sigma, log_open=log_open, log_close=log_close)
+            self._daily[symbol] = path
+            return path
+
+    def _iter_chunk_arrays(
+        self,
+        symbol: str,
+        timeframe: str,
+        days: pd.DatetimeIndex,
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """Generate float64 bar columns for days, chunk_days sessions at a time."""
+        if len(days) == 0:
+            return
+
+        offsets, durations = self._bar_offsets(timeframe)
+        daily_bars = len(offsets) == 1 and durations[0] == self._session_minutes
+        n_bars = len(offsets)
+
+        # U-shaped intraday variance profile, normalized to one session
+        midpoints = (offsets + durations / 2) / self._session_minutes
+        variance = durations * (1.0 + 3.0 * (2.0 * midpoints - 1.0) ** 2)
+        variance = variance / variance.sum()
+        scale = np.sqrt(variance)
+        bridge = np.cumsum(variance)
+        volume_share = variance
+
+        ordinals = _ordinals(days)
+        daily = self._daily_path(symbol, int(ordinals[-1]) + 1)
+        reference_sigma = float(np.mean([regime.volatility for regime in self.regimes]))
+        symbol_key = _symbol_key(symbol)
+        timeframe_key = timeframe_minutes(timeframe)
+
+        if daily_bars:
+            local_starts = days
+        else:
+            local_starts = days + pd.Timedelta(minutes=self._open_minutes)
+        session_starts = local_starts.tz_localize(self.session_tz).tz_convert('UTC').asi8
+        offsets_ns = offsets * 60_000_000_000
+
+        for lo in range(0, len(days), self.chunk_days):
+            chunk_ordinals = ordinals[lo:lo + self.chunk_days]
+            n_days = len(chunk_ordinals)
+
+            # Per-session generators: a day's bars never depend on the chunking
+            shocks = np.empty((n_days, n_bars, 4))
+            for i, ordinal in enumerate(chunk_ordinals):
+                rng = np.random.default_rng([self.seed, symbol_key, int(ordinal), timeframe_key])
+                shocks[i] = rng.standard_normal((n_bars, 4))
+
+            sigma = daily.sigma[chunk_ordinals][:, None]
+            day_open = daily.log_open[chunk_ordinals][:, None]
+            day_move = daily.log_close[chunk_ordinals][:, None] - day_open
+
+            # Brownian bridge from the session open to the session close
+            walk = np.cumsum(sigma * scale * shocks[:, :, 0], axis=1)
+            walk -= bridge * (walk[:, -1:] - day_move)
+            log_close = day_open + walk
+            log_open = np.concatenate([day_open, log_close[:, :-1]], axis=1)
+
+            wick = 0.5 * sigma * scale
+            close = np.exp(log_close)
+            open_ = np.exp(log_open)
+            high = np.maximum(open_, close) * np.exp(np.abs(shocks[:, :, 1]) * wick)
+            low = np.minimum(open_, close) * np.exp(-np.abs(shocks[:, :, 2]) * wick)
+
+            activity = self.daily_volume * (sigma / reference_sigma) ** 0.8
+            volume = np.rint(activity * volume_share * np.exp(0.35 * shocks[:, :, 3] - 0.06125))
+
+            timestamps = session_starts[lo:lo + n_days][:, None] + offsets_ns
+            yield {
+                'timestamp': timestamps.ravel(),
+                'open': open_.ravel(),
+                'high': high.ravel(),
+                'low': low.ravel(),
+                'close': close.ravel(),
+                'volume': volume.ravel(),
+            }
+
+
+def get_bars(
+    symbols: List[str],
+    timeframe: str,
+    start: str,
+    end: str,
+    seed: int = 0,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Get synthetic OHLCV bars for multiple symbols.
+
+    Args:
+        symbols: List of ticker symbols
+        timeframe: Bar size (e.g., "5m", "1h", "1d")
+        start: Start date (YYYY-MM-DD)
+        end: End date (YYYY-MM-DD)
+        seed: Master seed
+
+    Returns:
+        Dictionary mapping symbol -> DataFrame
+    """
+    return SyntheticClient(seed=seed).get_bars_many(symbols, timeframe, start, end)
+
+
+def _bars_frame(columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Wrap generated columns (int64 epoch-ns timestamps) without copying."""
+    ordered = {name: columns[name] for name in BAR_COLUMNS}
+    ordered['timestamp'] = pd.arrays.DatetimeArray(
+        ordered['timestamp'].view('M8[ns]'), dtype=pd.DatetimeTZDtype(unit='ns', tz='UTC')
+    )
+    return pd.DataFrame(ordered, copy=False)
+
+
+def _ordinals(days: pd.DatetimeIndex) -> np.ndarray:
+    """Session index of each day counted from EPOCH."""
+    return np.busday_count(EPOCH, days.values.astype('M8[D]'))
+
+
+def _symbol_key(symbol: str) -> int:
+    """Stable (process-independent) integer key of a symbol."""
+    return zlib.crc32(symbol.encode())
+
+
+def _anchor_price(symbol: str) -> float:
+    """Long-run price level of a symbol (between $10 and $500)."""
+    return 10.0 + (_symbol_key(symbol) % 4900) / 10.0
+
+
+def _clock_minutes(clock: str) -> int:
+    hours, minutes = (int(part) for part in clock.split(':'))
+    return hours * 60 + minutes
+
@@ -163,9 +163,7 @@ Risk limits: Max 5 trades per day, max 2% daily loss
 
     print(f"\n  Run directory: {summary.run_dir}")
     print(f"    - run_config.json")
-    print(f"    - graphs/*.json ({summary.total_evaluations} graphs)")
-    print(f"    - evals/*.json ({summary.total_evaluations} evaluations)")
-    print(f"    - lineage.jsonl (parent→child relationships)")
+    print(f"    - run.db ({summary.total_evaluations} graphs + evaluations, patches, lineage)")
     print(f"    - summary.json (top strategies, kill stats)")
 
     print_section("DEMO COMPLETE")
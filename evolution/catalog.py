@@ -0,0 +1,221 @@
+"""Indexed catalog of Darwin runs.
+
+One row per run in results/catalog.db, written by RunStorage.save_summary,
+so listing runs never walks results/runs/ or parses summary files. Pages
+are returned newest first using keyset (cursor) pagination over the
+(timestamp, run_id) index: a page costs the same however many runs exist.
+"""
+
+import base64
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import config
+
+
+CATALOG_DB_NAME = "catalog.db"
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    status TEXT NOT NULL,
+    best_fitness REAL,
+    total_evaluations INTEGER,
+    summary TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_time ON runs (timestamp DESC, run_id DESC);
+CREATE INDEX IF NOT EXISTS runs_by_status ON runs (status, timestamp DESC, run_id DESC);
+CREATE INDEX IF NOT EXISTS runs_by_fitness ON runs (best_fitness);
+"""
+
+
+class InvalidCursor(ValueError):
+    """Raised for a malformed pagination cursor."""
+
+
+class RunCatalog:
+    """SQLite index of run summaries.
+
+    Args:
+        db_path: Catalog database (default: <RESULTS_DIR>/catalog.db)
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path is not None else config.RESULTS_DIR / CATALOG_DB_NAME
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def upsert(self, run_id: str, summary: Dict[str, Any]):
+        """Insert or replace the catalog row for a run.
+
+        Args:
+            run_id: Run identifier
+            summary: Run summary (as written to summary.json)
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs (run_id, timestamp, status, best_fitness, total_evaluations, summary) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                _row(run_id, summary),
+            )
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Catalogued summary for a run, or None."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT summary FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        min_fitness: Optional[float] = None,
+        max_fitness: Optional[float] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """One page of runs, newest first.
+
+        Args:
+            limit: Page size (capped at MAX_PAGE_SIZE)
+            cursor: next_cursor from the previous page
+            status: Only runs with this status ("completed", "failed_compile", ...)
+            min_fitness: Only runs with best_fitness >= min_fitness
+            max_fitness: Only runs with best_fitness <= max_fitness
+            fields: Summary keys to return (default: the whole summary)
+
+        Returns:
+            {"runs": [{"run_id", "summary"}, ...], "next_cursor": str or None}
+
+        Raises:
+            InvalidCursor: If cursor cannot be decoded
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        clauses, params = [], []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if min_fitness is not None:
+            clauses.append("best_fitness >= ?")
+            params.append(min_fitness)
+        if max_fitness is not None:
+            clauses.append("best_fitness <= ?")
+            params.append(max_fitness)
+        if cursor is not None:
+            clauses.append("(timestamp, run_id) < (?, ?)")
+            params.extend(_decode_cursor(cursor))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT run_id, timestamp, summary FROM runs {where} "
+                f"ORDER BY timestamp DESC, run_id DESC LIMIT ?",
+                params + [limit + 1],
+            ).fetchall()
+
+        next_cursor = _encode_cursor(rows[limit - 1][1], rows[limit - 1][0]) if len(rows) > limit else None
+        runs = []
+        for run_id, _, summary in rows[:limit]:
+            summary = json.loads(summary)
+            if fields:
+                summary = {key: summary[key] for key in fields if key in summary}
+            runs.append({"run_id": run_id, "summary": summary})
+        return {"runs": runs, "next_cursor": next_cursor}
+
+    def backfill(self, runs_dir: Path) -> int:
+        """Catalog run directories that have a summary.json but no catalog row.
+
+        Picks up runs written before the catalog existed (or copied in by
+        hand). Only directories missing from the catalog are read.
+
+        Args:
+            runs_dir: Directory of run directories
+
+        Returns:
+            Number of runs added
+        """
+        runs_dir = Path(runs_dir)
+        if not runs_dir.exists():
+            return 0
+
+        with self._connect() as conn:
+            known = {row[0] for row in conn.execute("SELECT run_id FROM runs")}
+
+        rows = []
+        for run_dir in runs_dir.iterdir():
+            summary_file = run_dir / "summary.json"
+            if run_dir.name in known or not summary_file.exists():
+                continue
+            try:
+                summary = json.loads(summary_file.read_text())
+            except (OSError, json.JSONDecodeError):
+                continue
+            summary.setdefault("timestamp", datetime.fromtimestamp(summary_file.stat().st_mtime).isoformat())
+            rows.append(_row(run_dir.name, summary))
+
+        if rows:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO runs (run_id, timestamp, status, best_fitness, total_evaluations, summary) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        return len(rows)
+
+    def _connect(self) -> "_Transaction":
+        return _Transaction(sqlite3.connect(str(self.db_path), timeout=30))
+
+
+class _Transaction:
+    """Connection context: commit (or roll back) and close on exit."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self._conn
+
+    def __exit__(self, exc_type, *exc_info):
+        try:
+            if exc_type is None:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+        finally:
+            self._conn.close()
+        return False
+
+
+def _row(run_id: str, summary: Dict[str, Any]) -> Tuple:
+    best_fitness = summary.get("best_fitness")
+    if best_fitness is None and summary.get("top_strategies"):
+        best_fitness = max(s.get("fitness", float("-inf")) for s in summary["top_strategies"])
+    return (
+        run_id,
+        summary.get("timestamp") or datetime.now().isoformat(),
+        summary.get("status") or "completed",
+        best_fitness if isinstance(best_fitness, (int, float)) else None,
+        summary.get("total_evaluations"),
+        json.dumps(summary, default=str),
+    )
+
+
+def _encode_cursor(timestamp: str, run_id: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([timestamp, run_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        timestamp, run_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise InvalidCursor(f"Invalid cursor: {cursor}")
+    return str(timestamp), str(run_id)
@@ -1,14 +1,16 @@
 """Darwin evolution engine - multi-generation strategy evolution."""
 
 import pandas as pd
-from typing import Optional, List, Dict, Any
+from typing import Callable, Optional, List, Dict, Any
 from dataclasses import dataclass
 
+from cancellation import CancelToken, Cancelled, DeadlineExceeded
 from graph.schema import StrategyGraph, UniverseSpec, TimeConfig
 from validation.evaluation import (
     evaluate_strategy,
     evaluate_strategy_phase3,
     apply_schedule_override,
+    timeout_result,
     Phase3Config,
     Phase3ScheduleConfig,
     StrategyEvaluationResult,
@@ -17,7 +19,8 @@ from llm import compile_nl_to_graph, propose_child_patches, create_results_summa
 from evolution.patches import apply_patch
 from evolution.population import prune_top_k, kill_stats_by_label, get_generation_stats
 from evolution.storage import RunStorage
-from research.integration import save_research_artifacts
+from evolution.writer import RunWriter
+import config
 
 
 @dataclass
@@ -52,6 +55,10 @@ def run_darwin(
     run_id: Optional[str] = None,
     phase3_config: Optional[Phase3Config] = None,
     max_runtime_seconds: float = 300.0,  # Hard cap: 5 minutes
+    staged_evaluation: bool = False,
+    on_generation: Optional[Callable[[Dict[str, Any]], None]] = None,
+    token: Optional[CancelToken] = None,
+    max_eval_seconds: float = config.DARWIN_MAX_EVAL_SECONDS,
 ) -> RunSummary:
     """Run Darwin evolution on a strategy.
 
@@ -72,377 +79,470 @@ def run_darwin(
         initial_capital: Starting capital for backtests
         run_id: Optional run identifier
         phase3_config: Optional Phase 3 configuration
+        staged_evaluation: Skip stability/jitter stages for children already
+            killed by holdout/train rules (non-Phase 3 evaluation only)
+        on_generation: Optional progress callback, called after each
+            generation with its stats, the run's evals_completed so far
+            and the run-wide best_fitness
+        token: Cancellation token for the whole run (e.g. a job's cancel flag)
+        max_eval_seconds: Deadline for each strategy evaluation; a child
+            that overruns it is killed with the "timeout" label (a child cut
+            off by max_runtime_seconds is dropped without a kill record)
 
     Returns:
         RunSummary with results
 
     Raises:
         ValueError: If neither nl_text nor seed_graph provided
+        Cancelled: If the token is cancelled; results evaluated so far are
+            saved with summary status "cancelled" first
     """
-    # Initialize storage
+    # Initialize storage (per-child writes go through the write-behind writer)
     storage = RunStorage(run_id=run_id)
+    writer = RunWriter(storage)
+    try:
+        # Save run config
+        config_dict = {
+            'universe': universe.model_dump(),
+            'time_config': time_config.model_dump(),
+            'nl_text': nl_text,
+            'depth': depth,
+            'branching': branching,
+            'survivors_per_layer': survivors_per_layer,
+            'min_survivors_floor': min_survivors_floor,
+            'max_total_evals': max_total_evals,
+            'compile_provider': compile_provider,
+            'compile_model': compile_model,
+            'mutate_provider': mutate_provider,
+            'mutate_model': mutate_model,
+            'rescue_mode': rescue_mode,
+            'staged_evaluation': staged_evaluation,
+        }
+        # Include Phase 3 config for reproducibility
+        if phase3_config:
+            from dataclasses import asdict
+            p3_dict = asdict(phase3_config)
+            # Serialize schedule sub-config
+            if phase3_config.schedule:
+                p3_dict['schedule'] = phase3_config.schedule.to_dict()
+            # sampling_mode_schedule already serializes as list[str] via asdict
+            config_dict['phase3_config'] = p3_dict
+        storage.save_config(config_dict)
+
+        import time as _time
+        _t_run_start = _time.monotonic()
+        # LLM calls and evaluations check this token, so the hard timeout also stops them mid-way
+        run_token = CancelToken(timeout=max_runtime_seconds, parent=token)
+        print(f"\n⏱️  Hard timeout: {max_runtime_seconds:.0f}s ({max_runtime_seconds/60:.1f} min)")
+
+        def _timed_out():
+            if run_token.expired:
+                elapsed = _time.monotonic() - _t_run_start
+                print(f"\n🛑 HARD TIMEOUT after {elapsed:.1f}s — saving results and exiting")
+                return True
+            return False
+
+        # Compile or use seed graph
+        if nl_text:
+            adam = None
+            # Try primary compile provider, fall back to openai if it fails
+            for _provider, _model in [
+                (compile_provider, compile_model),
+                ("openai", "gpt-4o-mini"),  # fallback
+            ]:
+                print(f"\n🤖 Compiling NL strategy using {_provider}/{_model}...")
+                _t_compile = _time.monotonic()
+                try:
+                    adam = compile_nl_to_graph(
+                        nl_text=nl_text,
+                        universe=universe,
+                        time_config=time_config,
+                        provider=_provider,
+                        model=_model,
+                        run_id=run_id,
+                        token=run_token,
+                    )
+                    print(f"✓ Adam compiled: {adam.graph_id} ({_time.monotonic() - _t_compile:.1f}s)")
+                    break
+                except DeadlineExceeded:
+                    print(f"❌ Compilation timed out with {_provider}/{_model} ({_time.monotonic() - _t_compile:.1f}s)")
+                    break
+                except Cancelled:
+                    _save_cancelled(storage, writer, [], [])
+                    raise
+                except Exception as e:
+                    print(f"❌ Compilation failed with {_provider}/{_model} ({_time.monotonic() - _t_compile:.1f}s): {e}")
+                    continue
+
+            if adam is None:
+                error_summary = {
+                    "status": "failed_compile",
+                    "error": "All compile providers failed",
+                    "total_evaluations": 0,
+                    "best_fitness": None,
+                    "best_strategy": None,
+                    "top_strategies": [],
+                    "kill_stats": {},
+                    "generation_stats": [],
+                }
+                storage.save_summary(
+                    top_strategies=[],
+                    kill_stats={},
+                    generation_stats=[],
+                    total_evals=0,
+                    extra=error_summary,
+                )
+                writer.close()
+                storage.close()
+                raise ValueError("Compilation failed: all providers failed")
+        elif seed_graph:
+            adam = seed_graph
+            print(f"\n📈 Using seed graph: {adam.graph_id}")
+        else:
+            raise ValueError("Must provide either nl_text or seed_graph")
 
-    # Save run config
-    config_dict = {
-        'universe': universe.model_dump(),
-        'time_config': time_config.model_dump(),
-        'nl_text': nl_text,
-        'depth': depth,
-        'branching': branching,
-        'survivors_per_layer': survivors_per_layer,
-        'min_survivors_floor': min_survivors_floor,
-        'max_total_evals': max_total_evals,
-        'compile_provider': compile_provider,
-        'compile_model': compile_model,
-        'mutate_provider': mutate_provider,
-        'mutate_model': mutate_model,
-        'rescue_mode': rescue_mode,
-    }
-    # Include Phase 3 config for reproducibility
-    if phase3_config:
-        from dataclasses import asdict
-        p3_dict = asdict(phase3_config)
-        # Serialize schedule sub-config
-        if phase3_config.schedule:
-            p3_dict['schedule'] = phase3_config.schedule.to_dict()
-        # sampling_mode_schedule already serializes as list[str] via asdict
-        config_dict['phase3_config'] = p3_dict
-    storage.save_config(config_dict)
-
-    import time as _time
-    _t_run_start = _time.monotonic()
-    print(f"\n⏱️  Hard timeout: {max_runtime_seconds:.0f}s ({max_runtime_seconds/60:.1f} min)")
-
-    def _timed_out():
-        elapsed = _time.monotonic() - _t_run_start
-        if elapsed >= max_runtime_seconds:
-            print(f"\n🛑 HARD TIMEOUT after {elapsed:.1f}s — saving results and exiting")
-            return True
-        return False
-
-    # Compile or use seed graph
-    if nl_text:
-        adam = None
-        # Try primary compile provider, fall back to openai if it fails
-        for _provider, _model in [
-            (compile_provider, compile_model),
-            ("openai", "gpt-4o-mini"),  # fallback
-        ]:
-            print(f"\n🤖 Compiling NL strategy using {_provider}/{_model}...")
-            _t_compile = _time.monotonic()
+        writer.save_graph(adam)
+
+        phase3_active = bool(phase3_config and phase3_config.enabled and phase3_config.mode == "episodes")
+
+        # Resolve schedule: use explicit schedule, or default when Phase 3 active
+        schedule = None
+        if phase3_config and phase3_config.schedule:
+            schedule = phase3_config.schedule
+        elif phase3_active:
+            # Sensible default schedule when Phase 3 is on but no schedule provided
+            schedule = Phase3ScheduleConfig()
+
+        def _evaluate_target(graph, generation=0):
+            # Raises Cancelled on an explicit cancel and DeadlineExceeded once
+            # the run's own limit has passed. A graph that overruns only its
+            # evaluation deadline is killed with "timeout" instead.
             try:
-                adam = compile_nl_to_graph(
-                    nl_text=nl_text,
-                    universe=universe,
-                    time_config=time_config,
-                    provider=_provider,
-                    model=_model,
-                    run_id=run_id,
-                )
-                print(f"✓ Adam compiled: {adam.graph_id} ({_time.monotonic() - _t_compile:.1f}s)")
-                break
-            except Exception as e:
-                print(f"❌ Compilation failed with {_provider}/{_model} ({_time.monotonic() - _t_compile:.1f}s): {e}")
-                continue
-
-        if adam is None:
-            error_summary = {
-                "status": "failed_compile",
-                "error": "All compile providers failed",
-                "total_evaluations": 0,
-                "best_fitness": None,
-                "best_strategy": None,
-                "top_strategies": [],
-                "kill_stats": {},
-                "generation_stats": [],
-            }
-            storage.save_summary(
-                top_strategies=[],
-                kill_stats={},
-                generation_stats=[],
-                total_evals=0,
-                extra=error_summary,
-            )
-            raise ValueError("Compilation failed: all providers failed")
-    elif seed_graph:
-        adam = seed_graph
-        print(f"\n📈 Using seed graph: {adam.graph_id}")
-    else:
-        raise ValueError("Must provide either nl_text or seed_graph")
-
-    storage.save_graph(adam)
-
-    phase3_active = bool(phase3_config and phase3_config.enabled and phase3_config.mode == "episodes")
-
-    # Resolve schedule: use explicit schedule, or default when Phase 3 active
-    schedule = None
-    if phase3_config and phase3_config.schedule:
-        schedule = phase3_config.schedule
-    elif phase3_active:
-        # Sensible default schedule when Phase 3 is on but no schedule provided
-        schedule = Phase3ScheduleConfig()
-
-    def _evaluate_target(graph, generation=0):
+                if phase3_active:
+                    result = evaluate_strategy_phase3(
+                        strategy=graph,
+                        data=data,
+                        initial_capital=initial_capital,
+                        phase3_config=phase3_config,
+                        generation=generation,
+                        token=run_token.child(max_eval_seconds),
+                    )
+                else:
+                    result = evaluate_strategy(
+                        graph, data, initial_capital=initial_capital, staged=staged_evaluation,
+                        token=run_token.child(max_eval_seconds),
+                    )
+            except DeadlineExceeded:
+                if run_token.expired:
+                    raise
+                print(f"    ⏱️  Evaluation of {graph.graph_id} timed out")
+                return timeout_result(graph, max_eval_seconds)
+            # Apply schedule override (grace period, etc.)
+            if schedule:
+                result = apply_schedule_override(result, schedule, generation)
+            return result
+
+        # Evaluate Adam (generation 0)
+        print(f"\n🔬 Evaluating Adam...")
+        _t_eval_adam = _time.monotonic()
+        try:
+            adam_result = _evaluate_target(adam, generation=0)
+        except DeadlineExceeded:
+            adam_result = timeout_result(adam, max_runtime_seconds, run_limit=True)
+        except Cancelled:
+            _save_cancelled(storage, writer, [], [])
+            raise
+        print(f"  Adam eval took {_time.monotonic() - _t_eval_adam:.1f}s")
+        writer.save_evaluation(adam_result)
         if phase3_active:
-            result = evaluate_strategy_phase3(
-                strategy=graph,
-                data=data,
-                initial_capital=initial_capital,
+            # Generate Blue Memo + Red Verdict
+            writer.save_research_artifacts(
+                evaluation_result=adam_result,
                 phase3_config=phase3_config,
-                generation=generation,
-            )
-        else:
-            result = evaluate_strategy(graph, data, initial_capital=initial_capital)
-        # Apply schedule override (grace period, etc.)
-        if schedule:
-            result = apply_schedule_override(result, schedule, generation)
-        return result
-
-    # Evaluate Adam (generation 0)
-    print(f"\n🔬 Evaluating Adam...")
-    _t_eval_adam = _time.monotonic()
-    adam_result = _evaluate_target(adam, generation=0)
-    print(f"  Adam eval took {_time.monotonic() - _t_eval_adam:.1f}s")
-    storage.save_evaluation(adam_result)
-    if phase3_active:
-        storage.save_phase3_report(adam_result)
-        # Generate Blue Memo + Red Verdict
-        save_research_artifacts(
-            run_id=run_id,
-            evaluation_result=adam_result,
-            phase3_config=phase3_config,
-            parent_graph_id=None,
-            generation=0,
-            patch=None,
-        )
-
-    print(f"✓ Adam: {adam_result.decision.upper()} (fitness={adam_result.fitness:.3f})")
-
-    # Track all evaluations and generations
-    all_evaluations = [adam_result]
-    generation_stats_list = []
-
-    # Store graph mapping for parent lookup
-    graph_map = {adam.graph_id: adam}
-
-    # Check if Adam survived (or can mutate via grace period)
-    if not adam_result.is_survivor() and not adam_result.can_mutate():
-        print(f"⚠️  Adam was KILLED: {', '.join(adam_result.kill_reason)}")
-        if not rescue_mode:
-            print("❌ Rescue mode disabled - cannot evolve killed strategies")
-            # Return early with just Adam
-            return _build_summary(
-                storage, all_evaluations, generation_stats_list, adam_result
+                parent_graph_id=None,
+                generation=0,
+                patch=None,
             )
-        else:
-            print("🔧 Rescue mode enabled - attempting mutations anyway...")
-    elif adam_result.decision == "mutate_only":
-        print(f"⚠️  Adam was KILLED but in grace period - allowing mutations"
-              f" (labels: {', '.join(adam_result.kill_reason)})")
-
-    # Current generation (starts with Adam)
-    current_gen = [adam_result]
-
-    # Evolution loop
-    for gen in range(depth):
-        _t_gen_start = _time.monotonic()
-        _elapsed_total = _t_gen_start - _t_run_start
-        print(f"\n{'='*80}")
-        print(f"GENERATION {gen+1}/{depth}  [elapsed: {_elapsed_total:.1f}s / {max_runtime_seconds:.0f}s]")
-        print(f"{'='*80}")
-
-        if _timed_out():
-            break
-
-        # Select parents: survivors + mutate_only (grace period) strategies
-        mutable = [r for r in current_gen if r.can_mutate()]
-        mutable_ranked = sorted(mutable, key=lambda r: r.fitness, reverse=True)
-        parents = mutable_ranked[:survivors_per_layer]
-
-        # SURVIVOR FLOOR: If no survivors, force-select top N by fitness (even if killed)
-        survivor_floor_triggered = False
-        rescue_from_best_dead_triggered = False
-
-        if not parents and current_gen:
-            # Try survivor floor first (if configured)
-            if min_survivors_floor > 0:
-                print(f"⚠️  No natural survivors - applying survivor floor (min={min_survivors_floor})")
-                survivor_floor_triggered = True
-
-                # Sort by fitness (stable sort by fitness then graph_id for determinism)
-                sorted_gen = sorted(
-                    current_gen,
-                    key=lambda x: (x.fitness, x.graph_id),
-                    reverse=True
-                )
 
-                # Take top min_survivors_floor
-                parents = sorted_gen[:min_survivors_floor]
-
-                # Mark these with survivor override flag
-                for p in parents:
-                    if not hasattr(p, '_survivors_override'):
-                        p._survivors_override = True
-
-                print(f"🔧 Survivor floor: selected top {len(parents)} by fitness:")
-                for i, p in enumerate(parents, 1):
-                    print(f"  {i}. {p.graph_id:40s} fitness={p.fitness:.3f} (FORCED)")
-
-            # If still no parents and rescue mode enabled, rescue from best dead
-            elif rescue_mode:
-                print(f"⚠️  No natural survivors - applying rescue-from-best-dead (rescue_mode=True)")
-                rescue_from_best_dead_triggered = True
-
-                # Select top 2 by Phase 3 fitness for mutation
-                N_RESCUE = 2
-                sorted_gen = sorted(
-                    current_gen,
-                    key=lambda x: (x.fitness, x.graph_id),
-                    reverse=True
-                )
+        print(f"✓ Adam: {adam_result.decision.upper()} (fitness={adam_result.fitness:.3f})")
+
+        # Track all evaluations and generations
+        all_evaluations = [adam_result]
+        generation_stats_list = []
 
-                parents = sorted_gen[:N_RESCUE]
+        # Store graph mapping for parent lookup
+        graph_map = {adam.graph_id: adam}
 
-                # Mark with rescue flag
-                for p in parents:
-                    if not hasattr(p, '_rescue_from_dead'):
-                        p._rescue_from_dead = True
+        # Check if Adam survived (or can mutate via grace period)
+        if not adam_result.is_survivor() and not adam_result.can_mutate():
+            print(f"⚠️  Adam was KILLED: {', '.join(adam_result.kill_reason)}")
+            if not rescue_mode:
+                print("❌ Rescue mode disabled - cannot evolve killed strategies")
+                # Return early with just Adam
+                writer.close()
+                return _build_summary(
+                    storage, all_evaluations, generation_stats_list, adam_result
+                )
+            else:
+                print("🔧 Rescue mode enabled - attempting mutations anyway...")
+        elif adam_result.decision == "mutate_only":
+            print(f"⚠️  Adam was KILLED but in grace period - allowing mutations"
+                  f" (labels: {', '.join(adam_result.kill_reason)})")
+
+        # Current generation (starts with Adam)
+        current_gen = [adam_result]
+
+        # Evolution loop
+        for gen in range(depth):
+            _t_gen_start = _time.monotonic()
+            _elapsed_total = _t_gen_start - _t_run_start
+            print(f"\n{'='*80}")
+            print(f"GENERATION {gen+1}/{depth}  [elapsed: {_elapsed_total:.1f}s / {max_runtime_seconds:.0f}s]")
+            print(f"{'='*80}")
 
-                print(f"🔧 Rescue-from-best-dead: selected top {len(parents)} by fitness:")
-                for i, p in enumerate(parents, 1):
-                    print(f"  {i}. {p.graph_id:40s} fitness={p.fitness:.3f} (RESCUED)")
+            if _timed_out():
+                break
 
-        if not parents:
-            print("❌ No survivors to mutate - evolution terminated")
-            break
+            # Select parents: survivors + mutate_only (grace period) strategies
+            mutable = [r for r in current_gen if r.can_mutate()]
+            mutable_ranked = sorted(mutable, key=lambda r: r.fitness, reverse=True)
+            parents = mutable_ranked[:survivors_per_layer]
+
+            # SURVIVOR FLOOR: If no survivors, force-select top N by fitness (even if killed)
+            survivor_floor_triggered = False
+            rescue_from_best_dead_triggered = False
+
+            if not parents and current_gen:
+                # Try survivor floor first (if configured)
+                if min_survivors_floor > 0:
+                    print(f"⚠️  No natural survivors - applying survivor floor (min={min_survivors_floor})")
+                    survivor_floor_triggered = True
+
+                    # Sort by fitness (stable sort by fitness then graph_id for determinism)
+                    sorted_gen = sorted(
+                        current_gen,
+                        key=lambda x: (x.fitness, x.graph_id),
+                        reverse=True
+                    )
 
-        print(f"\n📊 Selected {len(parents)} parents:")
-        for i, p in enumerate(parents, 1):
-            print(f"  {i}. {p.graph_id:40s} fitness={p.fitness:.3f}")
+                    # Take top min_survivors_floor
+                    parents = sorted_gen[:min_survivors_floor]
+
+                    # Mark these with survivor override flag
+                    for p in parents:
+                        if not hasattr(p, '_survivors_override'):
+                            p._survivors_override = True
+
+                    print(f"🔧 Survivor floor: selected top {len(parents)} by fitness:")
+                    for i, p in enumerate(parents, 1):
+                        print(f"  {i}. {p.graph_id:40s} fitness={p.fitness:.3f} (FORCED)")
+
+                # If still no parents and rescue mode enabled, rescue from best dead
+                elif rescue_mode:
+                    print(f"⚠️  No natural survivors - applying rescue-from-best-dead (rescue_mode=True)")
+                    rescue_from_best_dead_triggered = True
+
+                    # Select top 2 by Phase 3 fitness for mutation
+                    N_RESCUE = 2
+                    sorted_gen = sorted(
+                        current_gen,
+                        key=lambda x: (x.fitness, x.graph_id),
+                        reverse=True
+                    )
 
-        # Generate children for each parent
-        next_gen = []
+                    parents = sorted_gen[:N_RESCUE]
 
-        for parent_idx, parent_result in enumerate(parents, 1):
-            # Check eval budget and timeout
-            if len(all_evaluations) >= max_total_evals:
-                print(f"\n⚠️  Hit max_total_evals ({max_total_evals}) - stopping")
-                break
-            if _timed_out():
-                break
+                    # Mark with rescue flag
+                    for p in parents:
+                        if not hasattr(p, '_rescue_from_dead'):
+                            p._rescue_from_dead = True
 
-            print(f"\n[Parent {parent_idx}/{len(parents)}] {parent_result.graph_id}")
+                    print(f"🔧 Rescue-from-best-dead: selected top {len(parents)} by fitness:")
+                    for i, p in enumerate(parents, 1):
+                        print(f"  {i}. {p.graph_id:40s} fitness={p.fitness:.3f} (RESCUED)")
 
-            # Get parent graph from map
-            parent_graph = graph_map.get(parent_result.graph_id)
-            if not parent_graph:
-                print(f"  ❌ Parent graph not found in map - skipping")
-                continue
+            if not parents:
+                print("❌ No survivors to mutate - evolution terminated")
+                break
 
-            # Create results summary
-            results_summary = create_results_summary(parent_result)
+            print(f"\n📊 Selected {len(parents)} parents:")
+            for i, p in enumerate(parents, 1):
+                print(f"  {i}. {p.graph_id:40s} fitness={p.fitness:.3f}")
 
-            # Propose child patches
-            print(f"  🤖 Generating {branching} mutations using {mutate_provider}/{mutate_model}...")
-            _t_mutate = _time.monotonic()
-            try:
-                patches = propose_child_patches(
-                    parent_graph=parent_graph,
-                    results_summary=results_summary,
-                    num_children=branching,
-                    provider=mutate_provider,
-                    model=mutate_model,
-                    run_id=run_id,
-                )
-                print(f"  ✓ Mutations generated in {_time.monotonic() - _t_mutate:.1f}s")
-            except Exception as e:
-                print(f"  ❌ Mutation generation failed ({_time.monotonic() - _t_mutate:.1f}s): {e}")
-                continue
+            # Generate children for each parent
+            next_gen = []
 
-            # Apply patches and evaluate children
-            for patch_idx, patch in enumerate(patches, 1):
+            for parent_idx, parent_result in enumerate(parents, 1):
                 # Check eval budget and timeout
                 if len(all_evaluations) >= max_total_evals:
+                    print(f"\n⚠️  Hit max_total_evals ({max_total_evals}) - stopping")
                     break
                 if _timed_out():
                     break
 
-                print(f"  [{patch_idx}/{len(patches)}] Applying patch {patch.patch_id}...")
+                print(f"\n[Parent {parent_idx}/{len(parents)}] {parent_result.graph_id}")
 
+                # Get parent graph from map
+                parent_graph = graph_map.get(parent_result.graph_id)
+                if not parent_graph:
+                    print(f"  ❌ Parent graph not found in map - skipping")
+                    continue
+
+                # Create results summary
+                results_summary = create_results_summary(parent_result)
+
+                # Propose child patches
+                print(f"  🤖 Generating {branching} mutations using {mutate_provider}/{mutate_model}...")
+                _t_mutate = _time.monotonic()
                 try:
-                    # Apply patch
-                    child = apply_patch(parent_graph, patch)
-                    graph_map[child.graph_id] = child  # Store for future parent lookup
-                    storage.save_graph(child)
-                    storage.save_patch(patch)
-
-                    # Evaluate child (pass generation index for schedule)
-                    _t_child_eval = _time.monotonic()
-                    child_result = _evaluate_target(child, generation=gen)
-                    print(f"    Child eval took {_time.monotonic() - _t_child_eval:.1f}s")
-                    storage.save_evaluation(child_result)
-                    if phase3_active:
-                        storage.save_phase3_report(child_result)
-                        # Generate Blue Memo + Red Verdict
-                        save_research_artifacts(
-                            run_id=run_id,
-                            evaluation_result=child_result,
-                            phase3_config=phase3_config,
-                            parent_graph_id=parent_result.graph_id,
-                            generation=gen,
-                            patch=patch,
-                        )
-                    all_evaluations.append(child_result)
-
-                    # Log lineage
-                    storage.append_lineage(
-                        parent_id=parent_result.graph_id,
-                        child_id=child_result.graph_id,
-                        patch_id=patch.patch_id,
-                        depth=gen + 1,
-                        fitness=child_result.fitness,
+                    patches = propose_child_patches(
+                        parent_graph=parent_graph,
+                        results_summary=results_summary,
+                        num_children=branching,
+                        provider=mutate_provider,
+                        model=mutate_model,
+                        run_id=run_id,
+                        token=run_token,
                     )
+                    print(f"  ✓ Mutations generated in {_time.monotonic() - _t_mutate:.1f}s")
+                except DeadlineExceeded:
+                    print(f"  ❌ Mutation generation timed out ({_time.monotonic() - _t_mutate:.1f}s)")
+                    continue
+                except Cancelled:
+                    _save_cancelled(storage, writer, all_evaluations, generation_stats_list)
+                    raise
+                except Exception as e:
+                    print(f"  ❌ Mutation generation failed ({_time.monotonic() - _t_mutate:.1f}s): {e}")
+                    continue
+
+                # Apply patches and evaluate children
+                for patch_idx, patch in enumerate(patches, 1):
+                    # Check eval budget and timeout
+                    if len(all_evaluations) >= max_total_evals:
+                        break
+                    if _timed_out():
+                        break
+
+                    print(f"  [{patch_idx}/{len(patches)}] Applying patch {patch.patch_id}...")
+
+                    try:
+                        # Apply patch
+                        child = apply_patch(parent_graph, patch)
+                        graph_map[child.graph_id] = child  # Store for future parent lookup
+                        writer.save_graph(child)
+                        writer.save_patch(patch)
+
+                        # Evaluate child (pass generation index for schedule)
+                        _t_child_eval = _time.monotonic()
+                        try:
+                            child_result = _evaluate_target(child, generation=gen)
+                        except DeadlineExceeded:
+                            # Run limit hit mid-evaluation: no verdict, nothing recorded
+                            break
+                        except Cancelled:
+                            _save_cancelled(storage, writer, all_evaluations, generation_stats_list)
+                            raise
+                        print(f"    Child eval took {_time.monotonic() - _t_child_eval:.1f}s")
+                        writer.save_evaluation(child_result)
+                        writer.append_lineage(
+                            parent_id=parent_result.graph_id,
+                            child_id=child_result.graph_id,
+                            patch_id=patch.patch_id,
+                            depth=gen + 1,
+                            fitness=child_result.fitness,
+                        )
+                        if phase3_active:
+                            # Generate Blue Memo + Red Verdict
+                            writer.save_research_artifacts(
+                                evaluation_result=child_result,
+                                phase3_config=phase3_config,
+                                parent_graph_id=parent_result.graph_id,
+                                generation=gen,
+                                patch=patch,
+                            )
+                        all_evaluations.append(child_result)
+
+                        # Add to next generation
+                        next_gen.append(child_result)
+
+                        status = "✓" if child_result.is_survivor() else "✗"
+                        print(f"    {status} {child_result.decision.upper()} (fitness={child_result.fitness:.3f})")
+
+                    except Exception as e:
+                        print(f"    ❌ Failed: {e}")
+
+            # Generation stats
+            gen_stats = get_generation_stats(next_gen)
+            gen_stats['generation'] = gen + 1
+            gen_stats['survivor_floor_triggered'] = survivor_floor_triggered
+            gen_stats['rescue_from_best_dead_triggered'] = rescue_from_best_dead_triggered
+            generation_stats_list.append(gen_stats)
+
+            _gen_elapsed = _time.monotonic() - _t_gen_start
+            _total_elapsed = _time.monotonic() - _t_run_start
+            print(f"\n📊 Generation {gen+1} Summary ({_gen_elapsed:.1f}s, total {_total_elapsed:.1f}s/{max_runtime_seconds:.0f}s):")
+            print(f"  Evaluated: {gen_stats['total']}")
+            print(f"  Survivors: {gen_stats['survivors']} ({gen_stats['survivor_rate']:.1%})")
+            if survivor_floor_triggered:
+                print(f"  Survivor Floor: TRIGGERED")
+            if rescue_from_best_dead_triggered:
+                print(f"  Rescue-from-Best-Dead: TRIGGERED")
+            print(f"  Best:      {gen_stats['best_fitness']:.3f}")
+            print(f"  Mean:      {gen_stats['mean_fitness']:.3f}")
+            if phase3_active and next_gen:
+                median_fitness = sorted([r.fitness for r in next_gen])[len(next_gen)//2]
+                print(f"  Median:    {median_fitness:.3f}")
+
+            # Generation boundary: everything evaluated so far is on disk
+            writer.flush()
+
+            if on_generation is not None:
+                on_generation({
+                    **gen_stats,
+                    'depth': depth,
+                    'evals_completed': len(all_evaluations),
+                    'best_fitness': max(r.fitness for r in all_evaluations),
+                })
+
+            # Move to next generation
+            current_gen = next_gen
+
+            if not current_gen:
+                print("\n❌ No children produced - evolution terminated")
+                break
 
-                    # Add to next generation
-                    next_gen.append(child_result)
+        # Build final summary (after every queued write has landed, also on hard timeout)
+        writer.close()
+        return _build_summary(storage, all_evaluations, generation_stats_list, adam_result)
+    finally:
+        # Every exit path, including errors: stop the writer thread and close run.db
+        writer.close()
+        storage.close()
 
-                    status = "✓" if child_result.is_survivor() else "✗"
-                    print(f"    {status} {child_result.decision.upper()} (fitness={child_result.fitness:.3f})")
 
-                except Exception as e:
-                    print(f"    ❌ Failed: {e}")
-
-        # Generation stats
-        gen_stats = get_generation_stats(next_gen)
-        gen_stats['generation'] = gen + 1
-        gen_stats['survivor_floor_triggered'] = survivor_floor_triggered
-        gen_stats['rescue_from_best_dead_triggered'] = rescue_from_best_dead_triggered
-        generation_stats_list.append(gen_stats)
-
-        _gen_elapsed = _time.monotonic() - _t_gen_start
-        _total_elapsed = _time.monotonic() - _t_run_start
-        print(f"\n📊 Generation {gen+1} Summary ({_gen_elapsed:.1f}s, total {_total_elapsed:.1f}s/{max_runtime_seconds:.0f}s):")
-        print(f"  Evaluated: {gen_stats['total']}")
-        print(f"  Survivors: {gen_stats['survivors']} ({gen_stats['survivor_rate']:.1%})")
-        if survivor_floor_triggered:
-            print(f"  Survivor Floor: TRIGGERED")
-        if rescue_from_best_dead_triggered:
-            print(f"  Rescue-from-Best-Dead: TRIGGERED")
-        print(f"  Best:      {gen_stats['best_fitness']:.3f}")
-        print(f"  Mean:      {gen_stats['mean_fitness']:.3f}")
-        if phase3_active and next_gen:
-            median_fitness = sorted([r.fitness for r in next_gen])[len(next_gen)//2]
-            print(f"  Median:    {median_fitness:.3f}")
-
-        # Move to next generation
-        current_gen = next_gen
-
-        if not current_gen:
-            print("\n❌ No children produced - evolution terminated")
-            break
-
-    # Build final summary
-    return _build_summary(storage, all_evaluations, generation_stats_list, adam_result)
+def _save_cancelled(
+    storage: RunStorage,
+    writer: RunWriter,
+    all_evaluations: List[StrategyEvaluationResult],
+    generation_stats: List[Dict[str, Any]],
+):
+    """Flush queued writes and save the summary of a cancelled run."""
+    from evolution.population import rank_by_fitness
+
+    print("\n🛑 Run cancelled — saving results and exiting")
+    writer.close()
+    top_strategies = rank_by_fitness(all_evaluations)[:10]
+    storage.save_summary(
+        top_strategies=top_strategies,
+        kill_stats=kill_stats_by_label(all_evaluations),
+        generation_stats=generation_stats,
+        total_evals=len(all_evaluations),
+        extra={
+            "status": "cancelled",
+            "best_fitness": top_strategies[0].fitness if top_strategies else None,
+        },
+    )
+    storage.close()
 
 
 def _build_summary(
@@ -470,6 +570,10 @@ def _build_summary(
         extra={"best_fitness": best_strategy.fitness if best_strategy else None},
     )
 
+    if config.RUN_JSON_EXPORT:
+        storage.export_json()
+    storage.close()
+
     print(f"\n💾 Results saved to: {storage.run_dir}")
 
     return RunSummary(
@@ -0,0 +1,144 @@
+"""Playback view of a Darwin run (the frontend's useEvolutionPlayback format).
+
+A run's playback document is built from one entry per evaluated strategy.
+RunStorage materializes each entry (playback_entry) as the strategy's
+evaluation lands, so serving /playback only needs the stored entries;
+assemble_playback() groups them into generations, lineage, champion and
+stats.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional
+
+
+def playback_entry(graph: Dict[str, Any], evaluation: Dict[str, Any]) -> Dict[str, Any]:
+    """Playback entry for one strategy.
+
+    Args:
+        graph: Stored StrategyGraph dict
+        evaluation: Stored evaluation dict ({} if not evaluated)
+
+    Returns:
+        {"id", "graph", "results", "state"} with state "alive" or "dead"
+    """
+    graph = dict(graph)
+
+    # Determine state from eval decision
+    decision = evaluation.get("decision", "survive")
+    state = "dead" if decision == "kill" else "alive"
+
+    # Build results in mock-compatible format
+    val_report = evaluation.get("validation_report", {})
+    fitness = evaluation.get("fitness", val_report.get("fitness", 0))
+    holdout = val_report.get("holdout_metrics", {})
+    penalties = val_report.get("penalties", {})
+    failures = val_report.get("failure_labels", [])
+
+    results = {
+        "phase3": {
+            "aggregated_fitness": fitness,
+            "median_fitness": fitness,
+            "penalties": penalties,
+            "regime_coverage": {
+                "unique_regimes": 1,
+                "years_covered": 0.33,
+                "per_regime_fitness": {},
+            },
+            "episodes": [
+                {
+                    "label": "full_period",
+                    "start_ts": graph.get("time", {}).get("date_range", {}).get("start", "2024-10-01"),
+                    "fitness": fitness,
+                    "tags": {
+                        "trend": "bull" if holdout.get("return_pct", 0) > 0 else "bear",
+                        "vol_bucket": "medium",
+                        "chop_bucket": "medium",
+                        "drawdown_state": "normal",
+                    },
+                    "difficulty": 0.5,
+                    "debug_stats": {
+                        "return_pct": holdout.get("return_pct", 0),
+                        "sharpe": holdout.get("sharpe", 0),
+                        "max_dd_pct": holdout.get("max_dd_pct", 0),
+                        "trades": holdout.get("trades", 0),
+                        "win_rate": holdout.get("win_rate", 0),
+                    },
+                }
+            ],
+        },
+        "red_verdict": {
+            "verdict": "SURVIVE" if decision == "survive" else "KILL",
+            "failures": failures,
+            "next_action": "breed" if decision == "survive" else "discard",
+        },
+        "fitness": fitness,
+    }
+
+    # Ensure graph has metadata.generation
+    metadata = dict(graph.get("metadata") or {})
+    metadata.setdefault("generation", 0)
+    graph["metadata"] = metadata
+
+    return {
+        "id": graph.get("graph_id"),
+        "graph": graph,
+        "results": results,
+        "state": state,
+    }
+
+
+def assemble_playback(
+    run_id: str,
+    entries: List[Dict[str, Any]],
+    summary: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Build the playback document from per-strategy entries.
+
+    Entries are not modified (the champion is returned as an "elite" copy).
+
+    Args:
+        run_id: Run identifier
+        entries: playback_entry() dicts
+        summary: Run summary (for stats.best_fitness), if written
+
+    Returns:
+        {"run_id", "generations", "lineage", "champion", "stats"}
+    """
+    strategies = sorted(entries, key=lambda s: (-s["results"].get("fitness", 0), s["id"]))
+
+    # Mark top strategy as elite
+    if strategies:
+        strategies[0] = copy.copy(strategies[0])
+        strategies[0]["state"] = "elite"
+
+    # Build generations array (group by metadata.generation)
+    gen_map = {}
+    for s in strategies:
+        gen = s["graph"].get("metadata", {}).get("generation", 0)
+        gen_map.setdefault(gen, []).append(s)
+
+    max_gen = max(gen_map.keys()) if gen_map else 0
+    generations = [gen_map.get(g, []) for g in range(max_gen + 1)]
+
+    # Build lineage
+    lineage = {"roots": [], "edges": []}
+    for s in strategies:
+        parent = s["graph"].get("metadata", {}).get("parent_graph")
+        if parent:
+            lineage["edges"].append({"parent": parent, "child": s["id"]})
+        else:
+            lineage["roots"].append(s["id"])
+
+    survivors = sum(1 for s in strategies if s["state"] in ("alive", "elite"))
+    return {
+        "run_id": run_id,
+        "generations": generations,
+        "lineage": lineage,
+        "champion": strategies[0] if strategies else None,
+        "stats": {
+            "total_strategies": len(strategies),
+            "total_survivors": survivors,
+            "survival_rate": survivors / max(len(strategies), 1),
+            "best_fitness": (summary or {}).get("best_fitness", 0),
+        },
+    }
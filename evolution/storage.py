@@ -1,16 +1,124 @@
-"""Storage and persistence for Darwin evolution runs."""
+"""Storage and persistence for Darwin evolution runs.
+
+Each run directory holds a single SQLite database (run.db) with one table
+per artifact type (graphs, patches, evaluations, phase3_reports, episodes,
+lineage) next to run_config.json and summary.json. Writes are grouped into
+transactions with RunStorage.batch(); readers (RunReader) answer playback
+and lineage requests with single queries.
+
+Phase 3 data is stored once: episodes are rows of their own, and an
+evaluation's validation_report["phase3"] is reassembled from the
+phase3_reports and episodes tables when loaded.
+
+The playback table holds each strategy's playback entry (see
+evolution/playback.py), rewritten whenever its graph or evaluation is saved.
+Its seq column increases with every write, so readers can fetch only the
+entries that changed since a previous seq.
+
+The lineage_nodes table indexes the lineage graph: one row per strategy
+with its generation and its evaluation's fitness/decision, kept current by
+save_graph, save_evaluation and append_lineage. Together with the lineage
+table (the edges) it answers lineage graph requests without rebuilding the
+graph.
+
+The original one-JSON-file-per-artifact layout is available through
+export_run_json(), and RunReader still reads run directories written in
+that layout.
+"""
 
 import json
+import sqlite3
+import threading
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 from graph.schema import StrategyGraph
 from validation.evaluation import StrategyEvaluationResult
 from evolution.patches import PatchSet
+from evolution.catalog import RunCatalog
+from evolution.playback import playback_entry
 import config
 
 
+RUN_DB_NAME = "run.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS graphs (
+    graph_id TEXT PRIMARY KEY,
+    name TEXT,
+    generation INTEGER,
+    parent_graph_id TEXT,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS patches (
+    patch_id TEXT PRIMARY KEY,
+    parent_graph_id TEXT,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS evaluations (
+    graph_id TEXT PRIMARY KEY,
+    strategy_name TEXT,
+    fitness REAL,
+    decision TEXT,
+    kill_reason TEXT,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS phase3_reports (
+    graph_id TEXT PRIMARY KEY,
+    strategy_name TEXT,
+    fitness REAL,
+    decision TEXT,
+    kill_reason TEXT,
+    timestamp TEXT,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS episodes (
+    graph_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    label TEXT,
+    start_ts TEXT,
+    end_ts TEXT,
+    fitness REAL,
+    decision TEXT,
+    body TEXT NOT NULL,
+    PRIMARY KEY (graph_id, idx)
+);
+CREATE TABLE IF NOT EXISTS lineage (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    parent_id TEXT,
+    child_id TEXT,
+    patch_id TEXT,
+    depth INTEGER,
+    fitness REAL,
+    timestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS lineage_parent ON lineage (parent_id);
+CREATE INDEX IF NOT EXISTS lineage_child ON lineage (child_id);
+CREATE TABLE IF NOT EXISTS playback (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    graph_id TEXT NOT NULL UNIQUE,
+    fitness REAL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS playback_fitness ON playback (fitness);
+CREATE TABLE IF NOT EXISTS lineage_nodes (
+    graph_id TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL DEFAULT 0,
+    is_child INTEGER NOT NULL DEFAULT 0,
+    fitness REAL,
+    decision TEXT
+);
+"""
+
+
+def _dumps(value: Any) -> str:
+    """Compact JSON for table bodies."""
+    return json.dumps(value, separators=(',', ':'), default=str)
+
+
 class RunStorage:
     """Manages storage for a Darwin evolution run."""
 
@@ -25,16 +133,65 @@ class RunStorage:
 
         self.run_id = run_id
         self.run_dir = config.RESULTS_DIR / "runs" / run_id
-
-        # Create directories
         self.run_dir.mkdir(parents=True, exist_ok=True)
-        (self.run_dir / "graphs").mkdir(exist_ok=True)
-        (self.run_dir / "patches").mkdir(exist_ok=True)
-        (self.run_dir / "evals").mkdir(exist_ok=True)
-        (self.run_dir / "phase3_reports").mkdir(exist_ok=True)
+        self.db_path = self.run_dir / RUN_DB_NAME
 
-        # Lineage tracking
-        self.lineage_file = self.run_dir / "lineage.jsonl"
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+
+        # Runs stored before playback entries were materialized
+        if self._conn.execute("SELECT 1 FROM graphs").fetchone() and \
+                not self._conn.execute("SELECT 1 FROM playback").fetchone():
+            with self.batch():
+                for (graph_id,) in self._conn.execute("SELECT graph_id FROM graphs").fetchall():
+                    self._materialize_playback(graph_id)
+
+        # ... and before the lineage graph was indexed
+        if (self._conn.execute("SELECT 1 FROM graphs").fetchone()
+                or self._conn.execute("SELECT 1 FROM lineage").fetchone()) and \
+                not self._conn.execute("SELECT 1 FROM lineage_nodes").fetchone():
+            with self.batch():
+                for (graph_id,) in self._conn.execute("SELECT graph_id FROM graphs").fetchall():
+                    self._add_lineage_node(graph_id)
+                for parent_id, child_id in self._conn.execute(
+                    "SELECT parent_id, child_id FROM lineage ORDER BY seq"
+                ).fetchall():
+                    self._index_lineage_edge(parent_id, child_id)
+
+    @contextmanager
+    def batch(self) -> Iterator["RunStorage"]:
+        """Group saves into one transaction (nested batches join the outer one).
+
+        Example:
+            with storage.batch():
+                storage.save_evaluation(result)
+                storage.append_lineage(...)
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                if self._batch_depth == 1:
+                    self._conn.rollback()
+                raise
+            else:
+                if self._batch_depth == 1:
+                    self._conn.commit()
+            finally:
+                self._batch_depth -= 1
+
+    def close(self):
+        """Commit and close the run database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
 
     def save_config(self, config_dict: Dict[str, Any]):
         """Save run configuration.
@@ -52,9 +209,21 @@ class RunStorage:
         Args:
             graph: StrategyGraph to save
         """
-        graph_path = self.run_dir / "graphs" / f"{graph.graph_id}.json"
-        with open(graph_path, 'w') as f:
-            f.write(graph.model_dump_json(indent=2))
+        metadata = graph.metadata or {}
+        with self.batch():
+            self._conn.execute(
+                "INSERT OR REPLACE INTO graphs (graph_id, name, generation, parent_graph_id, body) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    graph.graph_id,
+                    graph.name,
+                    metadata.get("generation"),
+                    metadata.get("parent_graph"),
+                    graph.model_dump_json(),
+                ),
+            )
+            self._materialize_playback(graph.graph_id)
+            self._add_lineage_node(graph.graph_id)
 
     def save_patch(self, patch: PatchSet):
         """Save patch set.
@@ -62,44 +231,93 @@ class RunStorage:
         Args:
             patch: PatchSet to save
         """
-        patch_path = self.run_dir / "patches" / f"{patch.patch_id}.json"
-        with open(patch_path, 'w') as f:
-            f.write(patch.model_dump_json(indent=2))
+        with self.batch():
+            self._conn.execute(
+                "INSERT OR REPLACE INTO patches (patch_id, parent_graph_id, body) VALUES (?, ?, ?)",
+                (patch.patch_id, patch.parent_graph_id, patch.model_dump_json()),
+            )
 
     def save_evaluation(self, result: StrategyEvaluationResult):
         """Save evaluation result.
 
+        Any Phase 3 section of the validation report is stored in the
+        phase3_reports/episodes tables rather than in the evaluation row.
+
         Args:
             result: StrategyEvaluationResult to save
         """
-        eval_path = self.run_dir / "evals" / f"{result.graph_id}.json"
-        with open(eval_path, 'w') as f:
-            json.dump(result.to_dict(), f, indent=2)
+        data = result.to_dict()
+        report = dict(data.get("validation_report") or {})
+        report.pop("phase3", None)
+        data["validation_report"] = report
+
+        with self.batch():
+            self._conn.execute(
+                "INSERT OR REPLACE INTO evaluations "
+                "(graph_id, strategy_name, fitness, decision, kill_reason, body) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    result.graph_id,
+                    result.strategy_name,
+                    result.fitness,
+                    result.decision,
+                    _dumps(result.kill_reason),
+                    _dumps(data),
+                ),
+            )
+            self.save_phase3_report(result)
+            self._materialize_playback(result.graph_id)
+            self._conn.execute(
+                "UPDATE lineage_nodes SET fitness = ?, decision = ? WHERE graph_id = ?",
+                (result.fitness, result.decision, result.graph_id),
+            )
 
     def save_phase3_report(self, result: StrategyEvaluationResult):
         """Save Phase 3 report for a graph (if present in validation_report).
 
-        Extracts the 'phase3' sub-dict from the evaluation result and writes
-        it to ``phase3_reports/<graph_id>.json``.  No-ops if the result does
-        not contain Phase 3 data.
+        Stores the 'phase3' sub-dict of the evaluation result, with one
+        episodes row per episode. No-ops if the result does not contain
+        Phase 3 data.
         """
         phase3_data = result.validation_report.get("phase3")
         if not phase3_data:
             return
 
-        report = {
-            "graph_id": result.graph_id,
-            "strategy_name": result.strategy_name,
-            "fitness": result.fitness,
-            "decision": result.decision,
-            "kill_reason": result.kill_reason,
-            "timestamp": result.validation_report.get("timestamp"),
-            "phase3": phase3_data,
-        }
+        episodes = phase3_data.get("episodes") or []
+        body = {key: value for key, value in phase3_data.items() if key != "episodes"}
 
-        report_path = self.run_dir / "phase3_reports" / f"{result.graph_id}.json"
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        with self.batch():
+            self._conn.execute(
+                "INSERT OR REPLACE INTO phase3_reports "
+                "(graph_id, strategy_name, fitness, decision, kill_reason, timestamp, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    result.graph_id,
+                    result.strategy_name,
+                    result.fitness,
+                    result.decision,
+                    _dumps(result.kill_reason),
+                    result.validation_report.get("timestamp"),
+                    _dumps(body),
+                ),
+            )
+            self._conn.execute("DELETE FROM episodes WHERE graph_id = ?", (result.graph_id,))
+            self._conn.executemany(
+                "INSERT INTO episodes (graph_id, idx, label, start_ts, end_ts, fitness, decision, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        result.graph_id,
+                        idx,
+                        episode.get("label"),
+                        episode.get("start_ts"),
+                        episode.get("end_ts"),
+                        episode.get("fitness"),
+                        episode.get("decision"),
+                        _dumps(episode),
+                    )
+                    for idx, episode in enumerate(episodes)
+                ],
+            )
 
     def append_lineage(
         self,
@@ -118,17 +336,85 @@ class RunStorage:
             depth: Generation depth
             fitness: Child fitness
         """
-        entry = {
-            'parent_id': parent_id,
-            'child_id': child_id,
-            'patch_id': patch_id,
-            'depth': depth,
-            'fitness': round(fitness, 4),
-            'timestamp': datetime.now().isoformat(),
-        }
+        with self.batch():
+            self._conn.execute(
+                "INSERT INTO lineage (parent_id, child_id, patch_id, depth, fitness, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (parent_id, child_id, patch_id, depth, round(fitness, 4), datetime.now().isoformat()),
+            )
+            self._index_lineage_edge(parent_id, child_id)
 
-        with open(self.lineage_file, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
+    def _add_lineage_node(self, graph_id: str):
+        """Add a strategy to the lineage index (a root at generation 0 until it gets a parent)."""
+        self._conn.execute(
+            "INSERT OR IGNORE INTO lineage_nodes (graph_id, fitness, decision) "
+            "SELECT ?, fitness, decision FROM (SELECT NULL) LEFT JOIN evaluations ON graph_id = ?",
+            (graph_id, graph_id),
+        )
+
+    def _index_lineage_edge(self, parent_id: Optional[str], child_id: Optional[str]):
+        """Update the lineage index for a new lineage entry."""
+        for graph_id in (parent_id, child_id):
+            if graph_id:
+                self._add_lineage_node(graph_id)
+        if not (parent_id and child_id):
+            return
+        self._conn.execute("UPDATE lineage_nodes SET is_child = 1 WHERE graph_id = ?", (child_id,))
+
+        # A child's generation is max(its latest logged depth, smallest parent
+        # generation + 1), as in _scan_lineage_graph. Parents are normally
+        # logged before their children, so the new edge rarely has
+        # descendants to update. When lineage arrives out of order, the
+        # child's descendants are recomputed in topological order, so every
+        # node sees its parents' final generations.
+        descendants = {child_id: []}
+        pending = [child_id]
+        while pending:
+            graph_id = pending.pop()
+            for (grandchild_id,) in self._conn.execute(
+                "SELECT child_id FROM lineage WHERE parent_id = ? AND child_id IS NOT NULL", (graph_id,)
+            ):
+                descendants[graph_id].append(grandchild_id)
+                if grandchild_id not in descendants:
+                    descendants[grandchild_id] = []
+                    pending.append(grandchild_id)
+
+        indegree = dict.fromkeys(descendants, 0)
+        for grandchildren in descendants.values():
+            for grandchild_id in grandchildren:
+                indegree[grandchild_id] += 1
+        ready = [graph_id for graph_id, count in indegree.items() if count == 0]
+        while ready:  # nodes on a (malformed) lineage cycle are never ready and keep their generation
+            graph_id = ready.pop()
+            generation = self._conn.execute(
+                "SELECT MAX(COALESCE((SELECT depth FROM lineage WHERE child_id = ?1 AND depth IS NOT NULL "
+                "ORDER BY seq DESC LIMIT 1), MIN(n.generation) + 1), MIN(n.generation) + 1) "
+                "FROM lineage l JOIN lineage_nodes n ON n.graph_id = l.parent_id WHERE l.child_id = ?1",
+                (graph_id,),
+            ).fetchone()[0]
+            self._conn.execute(
+                "UPDATE lineage_nodes SET generation = ? WHERE graph_id = ? AND generation != ?",
+                (generation, graph_id, generation),
+            )
+            for grandchild_id in descendants[graph_id]:
+                indegree[grandchild_id] -= 1
+                if indegree[grandchild_id] == 0:
+                    ready.append(grandchild_id)
+
+    def _materialize_playback(self, graph_id: str):
+        """Rewrite a strategy's playback entry from its stored graph and evaluation."""
+        row = self._conn.execute(
+            "SELECT g.body, e.body FROM graphs g LEFT JOIN evaluations e ON e.graph_id = g.graph_id "
+            "WHERE g.graph_id = ?",
+            (graph_id,),
+        ).fetchone()
+        if row is None:
+            return  # evaluated before its graph was saved; save_graph materializes it
+        entry = playback_entry(json.loads(row[0]), json.loads(row[1]) if row[1] else {})
+        self._conn.execute(
+            "INSERT OR REPLACE INTO playback (graph_id, fitness, body) VALUES (?, ?, ?)",
+            (graph_id, entry["results"].get("fitness"), _dumps(entry)),
+        )
 
     def save_summary(
         self,
@@ -138,7 +424,7 @@ class RunStorage:
         total_evals: int,
         extra: Optional[Dict[str, Any]] = None,
     ):
-        """Save run summary.
+        """Save run summary and index it in the run catalog.
 
         Args:
             top_strategies: Top N strategies by fitness
@@ -173,4 +459,390 @@ class RunStorage:
         with open(summary_path, 'w') as f:
             json.dump(summary, f, indent=2)
 
+        RunCatalog().upsert(self.run_id, summary)
+
         return summary_path
+
+    def export_json(self, dest_dir: Optional[Path] = None) -> Path:
+        """Export this run in the one-JSON-file-per-artifact layout.
+
+        Args:
+            dest_dir: Target directory (default: the run directory)
+
+        Returns:
+            Directory written to
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+        return export_run_json(self.run_dir, dest_dir)
+
+
+class RunReader:
+    """Read-side access to a stored run (SQLite or legacy JSON layout).
+
+    Args:
+        run_dir: Run directory
+    """
+
+    def __init__(self, run_dir: Path):
+        self.run_dir = Path(run_dir)
+        self.db_path = self.run_dir / RUN_DB_NAME
+
+    @property
+    def is_legacy(self) -> bool:
+        """True for run directories written in the JSON-file layout."""
+        return not self.db_path.exists()
+
+    def graph_ids(self) -> List[str]:
+        """IDs of all stored graphs, sorted."""
+        if self.is_legacy:
+            return sorted(path.stem for path in self._legacy_dir("graphs").glob("*.json"))
+        with self._connect() as conn:
+            return [row[0] for row in conn.execute("SELECT graph_id FROM graphs ORDER BY graph_id")]
+
+    def load_graph(self, graph_id: str) -> Optional[Dict[str, Any]]:
+        """Stored graph as a dict, or None."""
+        if self.is_legacy:
+            return self._load_legacy("graphs", graph_id)
+        with self._connect() as conn:
+            row = conn.execute("SELECT body FROM graphs WHERE graph_id = ?", (graph_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def load_patch(self, patch_id: str) -> Optional[Dict[str, Any]]:
+        """Stored patch set as a dict, or None."""
+        if self.is_legacy:
+            return self._load_legacy("patches", patch_id)
+        with self._connect() as conn:
+            row = conn.execute("SELECT body FROM patches WHERE patch_id = ?", (patch_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def load_evaluation(self, graph_id: str) -> Optional[Dict[str, Any]]:
+        """Stored evaluation (StrategyEvaluationResult.to_dict() form), or None."""
+        if self.is_legacy:
+            return self._load_legacy("evals", graph_id)
+        with self._connect() as conn:
+            row = conn.execute("SELECT body FROM evaluations WHERE graph_id = ?", (graph_id,)).fetchone()
+            if row is None:
+                return None
+            evaluation = json.loads(row[0])
+            phase3 = self._phase3(conn, graph_id)
+        if phase3 is not None:
+            evaluation["validation_report"]["phase3"] = phase3
+        return evaluation
+
+    def load_phase3_report(self, graph_id: str) -> Optional[Dict[str, Any]]:
+        """Stored Phase 3 report, or None."""
+        if self.is_legacy:
+            return self._load_legacy("phase3_reports", graph_id)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT graph_id, strategy_name, fitness, decision, kill_reason, timestamp "
+                "FROM phase3_reports WHERE graph_id = ?",
+                (graph_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            return {
+                "graph_id": row[0],
+                "strategy_name": row[1],
+                "fitness": row[2],
+                "decision": row[3],
+                "kill_reason": json.loads(row[4]),
+                "timestamp": row[5],
+                "phase3": self._phase3(conn, graph_id),
+            }
+
+    def graphs_with_evaluations(self) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Every graph with its evaluation ({} if none), sorted by graph ID.
+
+        Evaluations omit the Phase 3 section (see load_evaluation).
+        """
+        if self.is_legacy:
+            return [
+                (self._load_legacy("graphs", graph_id), self._load_legacy("evals", graph_id) or {})
+                for graph_id in self.graph_ids()
+            ]
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT g.body, e.body FROM graphs g "
+                "LEFT JOIN evaluations e ON e.graph_id = g.graph_id ORDER BY g.graph_id"
+            ).fetchall()
+        return [(json.loads(graph), json.loads(evaluation) if evaluation else {}) for graph, evaluation in rows]
+
+    def evaluation_metadata(self) -> Dict[str, Dict[str, Any]]:
+        """graph_id -> {fitness, decision, graph_id} for every evaluation."""
+        if self.is_legacy:
+            metadata = {}
+            for path in self._legacy_dir("evals").glob("*.json"):
+                try:
+                    data = json.loads(path.read_text())
+                except Exception:
+                    continue
+                metadata[path.stem] = {
+                    "fitness": data.get("fitness"),
+                    "decision": data.get("decision"),
+                    "graph_id": path.stem,
+                }
+            return metadata
+        with self._connect() as conn:
+            return {
+                graph_id: {"fitness": fitness, "decision": decision, "graph_id": graph_id}
+                for graph_id, fitness, decision in conn.execute(
+                    "SELECT graph_id, fitness, decision FROM evaluations"
+                )
+            }
+
+    def lineage(self) -> List[Dict[str, Any]]:
+        """Lineage entries in insertion order."""
+        if self.is_legacy:
+            return self._legacy_lineage()
+        with self._connect() as conn:
+            return [
+                {
+                    "parent_id": parent_id,
+                    "child_id": child_id,
+                    "patch_id": patch_id,
+                    "depth": depth,
+                    "fitness": fitness,
+                    "timestamp": timestamp,
+                }
+                for parent_id, child_id, patch_id, depth, fitness, timestamp in conn.execute(
+                    "SELECT parent_id, child_id, patch_id, depth, fitness, timestamp FROM lineage ORDER BY seq"
+                )
+            ]
+
+    def lineage_graph(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Lineage graph: {"nodes": [{id, label, fitness, decision, generation}], "edges": [...]}.
+
+        Served from the lineage index; runs without one (legacy layout, or
+        run.db files from before it) are scanned instead.
+        """
+        if not self._has_table("lineage_nodes"):
+            return self._scan_lineage_graph()
+        with self._connect() as conn:
+            nodes = [
+                {"id": graph_id, "label": graph_id, "fitness": fitness, "decision": decision, "generation": generation}
+                for graph_id, generation, fitness, decision in conn.execute(
+                    "SELECT graph_id, generation, fitness, decision FROM lineage_nodes ORDER BY graph_id"
+                )
+            ]
+            edges = [
+                {"source": parent_id, "target": child_id, "generation": generation}
+                for parent_id, child_id, generation in conn.execute(
+                    "SELECT l.parent_id, l.child_id, n.generation FROM lineage l "
+                    "JOIN lineage_nodes n ON n.graph_id = l.child_id "
+                    "WHERE l.parent_id IS NOT NULL ORDER BY l.seq"
+                )
+            ]
+        return {"nodes": nodes, "edges": edges}
+
+    def _scan_lineage_graph(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Build the lineage graph from all lineage entries, graphs and evaluations."""
+        graph_ids = set(self.graph_ids())
+        children = set()
+        adjacency = defaultdict(list)
+        child_gen = {}
+
+        for entry in self.lineage():
+            parent_id = entry.get("parent_id")
+            child_id = entry.get("child_id")
+            depth = entry.get("depth")
+            if parent_id:
+                graph_ids.add(parent_id)
+            if child_id:
+                graph_ids.add(child_id)
+                children.add(child_id)
+            if parent_id and child_id:
+                adjacency[parent_id].append(child_id)
+                if isinstance(depth, int):
+                    child_gen[child_id] = depth
+
+        generation_map = {root_id: 0 for root_id in graph_ids - children}
+        queue = deque(generation_map)
+        queued = set(queue)
+        while queue:
+            node = queue.popleft()
+            queued.discard(node)
+            base_gen = generation_map.get(node, 0)
+            for child in adjacency.get(node, []):
+                child_generation = max(child_gen.get(child, base_gen + 1), base_gen + 1)
+                if child not in generation_map or child_generation < generation_map[child]:
+                    generation_map[child] = child_generation
+                if child not in queued:
+                    queue.append(child)
+                    queued.add(child)
+
+        eval_metadata = self.evaluation_metadata()
+        nodes = []
+        for graph_id in sorted(graph_ids):
+            metadata = eval_metadata.get(graph_id, {})
+            nodes.append({
+                "id": graph_id,
+                "label": graph_id,
+                "fitness": metadata.get("fitness"),
+                "decision": metadata.get("decision"),
+                "generation": generation_map.get(graph_id, 0),
+            })
+        edges = [
+            {"source": parent_id, "target": target, "generation": generation_map.get(target)}
+            for parent_id, targets in adjacency.items()
+            for target in targets
+        ]
+        return {"nodes": nodes, "edges": edges}
+
+    def playback_entries(self, after: int = 0) -> List[Tuple[int, Dict[str, Any]]]:
+        """(seq, playback entry) pairs written after seq `after`, oldest first.
+
+        Runs without materialized entries (legacy layout, or run.db files
+        from before the playback table) get entries built on the fly,
+        numbered 1..n in graph ID order.
+        """
+        if self._has_playback():
+            with self._connect() as conn:
+                return [
+                    (seq, json.loads(body))
+                    for seq, body in conn.execute(
+                        "SELECT seq, body FROM playback WHERE seq > ? ORDER BY seq", (after,)
+                    )
+                ]
+        entries = [playback_entry(graph, evaluation) for graph, evaluation in self.graphs_with_evaluations()]
+        return [(seq, entry) for seq, entry in enumerate(entries, 1) if seq > after]
+
+    def playback_version(self) -> int:
+        """Latest playback seq (changes whenever any playback entry does)."""
+        if self._has_playback():
+            with self._connect() as conn:
+                return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM playback").fetchone()[0]
+        return len(self.graph_ids())
+
+    def champion_id(self) -> Optional[str]:
+        """Graph ID of the highest-fitness playback entry."""
+        if self._has_playback():
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT graph_id FROM playback ORDER BY fitness DESC, graph_id LIMIT 1"
+                ).fetchone()
+            return row[0] if row else None
+        entries = [entry for _, entry in self.playback_entries()]
+        if not entries:
+            return None
+        return min(entries, key=lambda e: (-e["results"].get("fitness", 0), e["id"]))["id"]
+
+    def _has_playback(self) -> bool:
+        return self._has_table("playback")
+
+    def _has_table(self, name: str) -> bool:
+        if self.is_legacy:
+            return False
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+            ).fetchone() is not None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Read-only connection (closed when the with-block exits)."""
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        return _ClosingConnection(conn)
+
+    def _phase3(self, conn: sqlite3.Connection, graph_id: str) -> Optional[Dict[str, Any]]:
+        row = conn.execute("SELECT body FROM phase3_reports WHERE graph_id = ?", (graph_id,)).fetchone()
+        if row is None:
+            return None
+        phase3 = json.loads(row[0])
+        phase3["episodes"] = [
+            json.loads(body)
+            for (body,) in conn.execute(
+                "SELECT body FROM episodes WHERE graph_id = ? ORDER BY idx", (graph_id,)
+            )
+        ]
+        return phase3
+
+    def _legacy_dir(self, kind: str) -> Path:
+        return self.run_dir / kind
+
+    def _load_legacy(self, kind: str, artifact_id: str) -> Optional[Dict[str, Any]]:
+        path = self._legacy_dir(kind) / f"{artifact_id}.json"
+        if not path.exists():
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def _legacy_lineage(self) -> List[Dict[str, Any]]:
+        lineage_path = self.run_dir / "lineage.jsonl"
+        if not lineage_path.exists():
+            return []
+
+        entries = []
+        with open(lineage_path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return entries
+
+
+class _ClosingConnection:
+    """sqlite3 connection wrapper whose with-block closes the connection."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self._conn
+
+    def __exit__(self, *exc_info):
+        self._conn.close()
+        return False
+
+
+def export_run_json(run_dir: Path, dest_dir: Optional[Path] = None) -> Path:
+    """Write a stored run out in the one-JSON-file-per-artifact layout.
+
+    Produces graphs/, patches/, evals/ and phase3_reports/ (one indented
+    JSON file per artifact) plus lineage.jsonl, as earlier versions of
+    RunStorage wrote them.
+
+    Args:
+        run_dir: Run directory containing run.db
+        dest_dir: Target directory (default: run_dir)
+
+    Returns:
+        Directory written to
+    """
+    reader = RunReader(run_dir)
+    if reader.is_legacy:
+        raise FileNotFoundError(f"No {RUN_DB_NAME} in {run_dir}")
+
+    dest_dir = Path(dest_dir) if dest_dir is not None else Path(run_dir)
+    for kind in ("graphs", "patches", "evals", "phase3_reports"):
+        (dest_dir / kind).mkdir(parents=True, exist_ok=True)
+
+    with reader._connect() as conn:
+        graph_ids = [row[0] for row in conn.execute("SELECT graph_id FROM graphs")]
+        patch_ids = [row[0] for row in conn.execute("SELECT patch_id FROM patches")]
+        eval_ids = [row[0] for row in conn.execute("SELECT graph_id FROM evaluations")]
+        report_ids = [row[0] for row in conn.execute("SELECT graph_id FROM phase3_reports")]
+
+    for graph_id in graph_ids:
+        graph = StrategyGraph.model_validate(reader.load_graph(graph_id))
+        (dest_dir / "graphs" / f"{graph_id}.json").write_text(graph.model_dump_json(indent=2))
+    for patch_id in patch_ids:
+        patch = PatchSet.model_validate(reader.load_patch(patch_id))
+        (dest_dir / "patches" / f"{patch_id}.json").write_text(patch.model_dump_json(indent=2))
+    for graph_id in eval_ids:
+        with open(dest_dir / "evals" / f"{graph_id}.json", 'w') as f:
+            json.dump(reader.load_evaluation(graph_id), f, indent=2)
+    for graph_id in report_ids:
+        with open(dest_dir / "phase3_reports" / f"{graph_id}.json", 'w') as f:
+            json.dump(reader.load_phase3_report(graph_id), f, indent=2, default=str)
+
+    with open(dest_dir / "lineage.jsonl", 'w') as f:
+        for entry in reader.lineage():
+            f.write(json.dumps(entry) + '\n')
+
+    return dest_dir
@@ -0,0 +1,192 @@
+"""Write-behind persistence for Darwin runs.
+
+RunWriter takes the storage calls run_darwin makes for every child (graph,
+patch, evaluation, lineage, research artifacts) off the evaluation path:
+calls are queued and a background thread writes them, committing everything
+that has queued up since its last write in one RunStorage.batch()
+transaction. The queue is bounded, so a slow disk eventually applies
+backpressure instead of buffering without limit.
+
+flush() blocks until every queued write is durable; run_darwin flushes at
+generation boundaries and closes the writer before building the summary.
+Queued writes are also flushed at interpreter exit.
+
+Objects handed to the writer are serialized when written, so they must not
+be mutated afterwards.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from evolution.storage import RunStorage
+from research.integration import save_research_artifacts
+import config
+import telemetry
+
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+WriteOp = Tuple[Callable[..., Any], tuple, dict]
+
+
+class RunWriter:
+    """Queue RunStorage writes and apply them in batches on a background thread.
+
+    Args:
+        storage: RunStorage to write to
+        max_pending: Queue capacity (enqueueing blocks while full)
+        max_batch: Most writes committed per transaction
+        write_behind: False applies every write immediately on the caller's thread
+    """
+
+    def __init__(
+        self,
+        storage: RunStorage,
+        max_pending: int = config.RUN_WRITER_QUEUE_SIZE,
+        max_batch: int = config.RUN_WRITER_MAX_BATCH,
+        write_behind: bool = config.RUN_WRITE_BEHIND,
+    ):
+        self.storage = storage
+        self.max_batch = max_batch
+        self.write_behind = write_behind
+        self.errors: List[Exception] = []
+        self.writes = 0
+        self.batches = 0
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        if write_behind:
+            self._thread = threading.Thread(
+                target=self._run, name=f"run-writer-{storage.run_id}", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.close)
+
+    def save_graph(self, graph):
+        """Queue RunStorage.save_graph(graph)."""
+        self.submit(self.storage.save_graph, graph)
+
+    def save_patch(self, patch):
+        """Queue RunStorage.save_patch(patch)."""
+        self.submit(self.storage.save_patch, patch)
+
+    def save_evaluation(self, result):
+        """Queue RunStorage.save_evaluation(result) (includes any Phase 3 report)."""
+        self.submit(self.storage.save_evaluation, result)
+
+    def append_lineage(self, parent_id: str, child_id: str, patch_id: str, depth: int, fitness: float):
+        """Queue RunStorage.append_lineage(...)."""
+        self.submit(self.storage.append_lineage, parent_id, child_id, patch_id, depth, fitness)
+
+    def save_research_artifacts(self, **kwargs):
+        """Queue research.integration.save_research_artifacts(run_id=..., **kwargs)."""
+        self.submit(save_research_artifacts, run_id=self.storage.run_id, **kwargs)
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs):
+        """Queue an arbitrary write (run on the writer thread, inside a batch)."""
+        if self._closed:
+            raise RuntimeError(f"RunWriter for {self.storage.run_id} is closed")
+        if not self.write_behind:
+            self._write_batch([(fn, args, kwargs)])
+            return
+
+        with self._idle:
+            self._pending += 1
+        telemetry.STORAGE_QUEUE_DEPTH.inc()
+        self._queue.put((fn, args, kwargs))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued write has been committed.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def close(self):
+        """Flush outstanding writes and stop the writer thread (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            atexit.unregister(self.close)
+        if self.errors:
+            logger.warning(f"[{self.storage.run_id}] {len(self.errors)} storage write(s) failed")
+
+    def _run(self):
+        while True:
+            op = self._queue.get()
+            if op is _STOP:
+                return
+
+            batch = [op]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    op = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if op is _STOP:
+                    stop = True
+                    break
+                batch.append(op)
+
+            self._write_batch(batch)
+            telemetry.STORAGE_QUEUE_DEPTH.dec(len(batch))
+            with self._idle:
+                self._pending -= len(batch)
+                self._idle.notify_all()
+            if stop:
+                return
+
+    def _write_batch(self, batch: List[WriteOp]):
+        """Commit a batch in one transaction; on failure, retry writes one by one."""
+        try:
+            started = time.perf_counter()
+            with self.storage.batch():
+                for fn, args, kwargs in batch:
+                    fn(*args, **kwargs)
+            telemetry.STORAGE_WRITE_SECONDS.observe(time.perf_counter() - started)
+            telemetry.STORAGE_WRITES.inc(len(batch))
+            self.writes += len(batch)
+            self.batches += 1
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                self._record_error(batch[0], e)
+                return
+
+        # Isolate the failing write so the rest of the batch still lands
+        for op in batch:
+            fn, args, kwargs = op
+            try:
+                started = time.perf_counter()
+                with self.storage.batch():
+                    fn(*args, **kwargs)
+                telemetry.STORAGE_WRITE_SECONDS.observe(time.perf_counter() - started)
+                telemetry.STORAGE_WRITES.inc()
+                self.writes += 1
+                self.batches += 1
+            except Exception as e:
+                self._record_error(op, e)
+
+    def _record_error(self, op: WriteOp, error: Exception):
+        fn = op[0]
+        logger.error(f"[{self.storage.run_id}] Storage write {getattr(fn, '__name__', fn)} failed: {error}")
+        self.errors.append(error)
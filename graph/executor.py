@@ -5,9 +5,11 @@ Executes StrategyGraph nodes in topological order with strict no-lookahead guara
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Tuple, List
+from typing import Dict, Any, Tuple, List, Optional
 from collections import defaultdict, deque
 
+import telemetry
+from data.compact import compact_series, is_compact
 from graph.schema import StrategyGraph, Node
 from graph.gene_pool import get_registry, NodeType
 
@@ -20,8 +22,14 @@ class GraphExecutionError(Exception):
 class GraphExecutor:
     """Executes strategy graphs deterministically on OHLCV data."""
 
-    def __init__(self):
+    def __init__(self, compact: Optional[bool] = None):
+        """
+        Args:
+            compact: Store price and indicator series as float32 (see
+                data.compact). None = follow the input data's dtype.
+        """
         self.registry = get_registry()
+        self.compact = compact
 
     def execute(self, graph: StrategyGraph, data: pd.DataFrame) -> Dict[Tuple[str, str], Any]:
         """Execute a strategy graph on OHLCV data.
@@ -42,12 +50,18 @@ class GraphExecutor:
         # Topologically sort nodes
         sorted_nodes = self._topological_sort(graph)
 
+        compact = self.compact if self.compact is not None else is_compact(data)
+
         # Execute nodes in order
+        telemetry.GRAPH_EXECUTIONS.inc()
         context = {}
         for node in sorted_nodes:
+            telemetry.NODE_EVALUATIONS.labels(node.type).inc()
             try:
                 node_outputs = self._execute_node(node, context, data)
                 for output_key, output_value in node_outputs.items():
+                    if compact:
+                        output_value = compact_series(output_value)
                     context[(node.id, output_key)] = output_value
             except Exception as e:
                 raise GraphExecutionError(
@@ -7,6 +7,7 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
 import config
+import telemetry
 
 
 # Create cache directory
@@ -101,12 +102,14 @@ def get_cached_response(
                 cached = json.load(f)
             _current_budget.cache_hits += 1
             _global_budget.cache_hits += 1
+            telemetry.CACHE_REQUESTS.labels("llm", "hit").inc()
             return cached.get('response')
         except Exception:
             return None
 
     _current_budget.cache_misses += 1
     _global_budget.cache_misses += 1
+    telemetry.CACHE_REQUESTS.labels("llm", "miss").inc()
     return None
 
 
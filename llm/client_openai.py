@@ -7,7 +7,10 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 
 import openai
+import cancellation
 import config
+import telemetry
+from cancellation import CancelToken
 from llm.cache import get_cached_response, save_cached_response, record_api_call
 from llm.transcripts import record_transcript
 
@@ -26,6 +29,7 @@ def complete_json(
     max_retries: int = 3,
     use_cache: bool = True,
     transcript_meta: Optional[Dict[str, Any]] = None,
+    token: Optional[CancelToken] = None,
 ) -> Dict[str, Any]:
     """Complete JSON using OpenAI API with caching.
 
@@ -37,6 +41,8 @@ def complete_json(
         max_tokens: Maximum tokens to generate
         max_retries: Max retry attempts for transient errors
         use_cache: Enable response caching (default True)
+        token: Cancellation token: checked before each attempt, and a
+            cancelled or expired token abandons an in-flight request
 
     Returns:
         Parsed JSON dict
@@ -44,6 +50,7 @@ def complete_json(
     Raises:
         openai.APIError: API errors
         json.JSONDecodeError: Invalid JSON response
+        Cancelled: If the token is cancelled or its deadline passes
     """
     if not config.OPENAI_API_KEY:
         raise ValueError("OPENAI_API_KEY not set in environment")
@@ -83,17 +90,21 @@ def complete_json(
         {"role": "user", "content": user_prompt}
     ]
 
+    stage = (transcript_meta or {}).get("stage") or "unknown"
+
     # Retry loop for transient errors
     last_error = None
     for attempt in range(max_retries):
+        cancellation.checkpoint(token)
         try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                response_format={"type": "json_object"},  # Force JSON mode
-            )
+            with telemetry.LLM_CALL_SECONDS.labels("openai", stage).time():
+                response = cancellation.call(lambda: client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    response_format={"type": "json_object"},  # Force JSON mode
+                ), token)
 
             raw_response = response.choices[0].message.content
 
@@ -113,6 +124,7 @@ def complete_json(
             tokens_used = response.usage.total_tokens if hasattr(response, 'usage') else 0
             cost_estimate = tokens_used * 0.00001  # Rough estimate for GPT-4o
             record_api_call("openai", tokens=tokens_used, cost=cost_estimate)
+            telemetry.LLM_TOKENS.labels("openai", stage).inc(tokens_used)
 
             _record(transcript_meta, parsed=parsed, raw_text=raw_response)
 
@@ -125,7 +137,7 @@ def complete_json(
             # Transient errors - retry
             last_error = e
             if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
+                cancellation.sleep(2 ** attempt, token)  # Exponential backoff
                 continue
             else:
                 raise
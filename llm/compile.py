@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional
 
 import config
+from cancellation import CancelToken
 
 from graph.schema import StrategyGraph, UniverseSpec, TimeConfig, Node
 from graph.gene_pool import NodeType
@@ -28,6 +29,7 @@ def compile_nl_to_graph(
     model: Optional[str] = None,
     temperature: float = 0.7,
     run_id: Optional[str] = None,
+    token: Optional[CancelToken] = None,
 ) -> StrategyGraph:
     """Compile natural language to StrategyGraph.
 
@@ -41,12 +43,14 @@ def compile_nl_to_graph(
         allowed_nodes: List of allowed node types (default: all from registry)
         provider: "openai" or "anthropic"
         temperature: LLM temperature
+        token: Cancellation token passed to every LLM call
 
     Returns:
         Validated StrategyGraph with locked universe/time_config
 
     Raises:
         ValidationError: If LLM output is invalid
+        Cancelled: If the token is cancelled or expires
     """
     registry = get_registry()
 
@@ -69,6 +73,7 @@ def compile_nl_to_graph(
             temperature=temperature,
             max_tokens=4000,
             transcript_meta=transcript_meta,
+            token=token,
         )
         if model:
             kwargs["model"] = model
@@ -80,6 +85,7 @@ def compile_nl_to_graph(
             temperature=temperature,
             max_tokens=4000,
             transcript_meta=transcript_meta,
+            token=token,
         )
         if model:
             kwargs["model"] = model
@@ -88,7 +94,7 @@ def compile_nl_to_graph(
         raise ValueError(f"Unknown provider: {provider}")
 
     # Validate and parse
-    strategy = validate_strategy_graph(llm_output, provider)
+    strategy = validate_strategy_graph(llm_output, provider, token=token)
 
     _normalize_node_types(strategy)
     _normalize_numeric_inputs(strategy)
@@ -109,6 +115,7 @@ def compile_nl_to_graph(
             temperature=temperature,
             run_id=run_id,
             attempt=1,
+            token=token,
         )
 
     # CRITICAL: Verify universe and time_config were not modified
@@ -242,6 +249,7 @@ def _attempt_structure_repair(
     temperature: float,
     run_id: Optional[str],
     attempt: int = 1,
+    token: Optional[CancelToken] = None,
 ) -> StrategyGraph:
     """Try once to repair structural issues discovered after parsing."""
     system_prompt = "You output StrategyGraph JSON only."
@@ -272,6 +280,7 @@ Do not change universe, time_config, or date_range."""
             temperature=0.0,
             max_tokens=4000,
             transcript_meta=transcript_meta,
+            token=token,
         )
     elif provider == "anthropic":
         repaired_json = client_anthropic.complete_json(
@@ -280,11 +289,12 @@ Do not change universe, time_config, or date_range."""
             temperature=0.0,
             max_tokens=4000,
             transcript_meta=transcript_meta,
+            token=token,
         )
     else:
         raise ValueError(f"Unknown provider: {provider}")
 
-    repaired_strategy = validate_strategy_graph(repaired_json, provider)
+    repaired_strategy = validate_strategy_graph(repaired_json, provider, token=token)
     _normalize_node_types(repaired_strategy)
     _normalize_numeric_inputs(repaired_strategy)
     _normalize_comparison_operators(repaired_strategy)
@@ -1,9 +1,10 @@
 """JSON validation and repair for LLM outputs."""
 
 import json
-from typing import Dict, Any, TypeVar, Type
+from typing import Dict, Any, Optional, TypeVar, Type
 from pydantic import BaseModel, ValidationError
 
+from cancellation import CancelToken
 from llm import client_openai, client_anthropic
 
 
@@ -15,6 +16,7 @@ def validate_and_repair(
     model_class: Type[T],
     provider: str = "openai",
     max_repair_attempts: int = 1,
+    token: Optional[CancelToken] = None,
 ) -> T:
     """Validate LLM JSON output against Pydantic model with optional repair.
 
@@ -23,6 +25,7 @@ def validate_and_repair(
         model_class: Pydantic model class to validate against
         provider: "openai" or "anthropic" for repair attempts
         max_repair_attempts: Max repair attempts (default 1)
+        token: Cancellation token for the repair call
 
     Returns:
         Validated Pydantic model instance
@@ -39,7 +42,7 @@ def validate_and_repair(
             raise
 
         # Try one repair
-        repaired = _attempt_repair(llm_output, model_class, e, provider)
+        repaired = _attempt_repair(llm_output, model_class, e, provider, token)
 
         # Validate repaired JSON
         try:
@@ -56,6 +59,7 @@ def _attempt_repair(
     model_class: Type[BaseModel],
     error: ValidationError,
     provider: str,
+    token: Optional[CancelToken] = None,
 ) -> Dict[str, Any]:
     """Attempt to repair invalid JSON with LLM.
 
@@ -64,6 +68,7 @@ def _attempt_repair(
         model_class: Target Pydantic model
         error: ValidationError from initial validation
         provider: "openai" or "anthropic"
+        token: Cancellation token for the LLM call
 
     Returns:
         Repaired JSON dict (not validated)
@@ -94,6 +99,7 @@ Output the corrected JSON only."""
             user_prompt=user_prompt,
             temperature=0.0,  # Deterministic repair
             max_tokens=4000,
+            token=token,
         )
     elif provider == "anthropic":
         repaired = client_anthropic.complete_json(
@@ -101,6 +107,7 @@ Output the corrected JSON only."""
             user_prompt=user_prompt,
             temperature=0.0,
             max_tokens=4000,
+            token=token,
         )
     else:
         raise ValueError(f"Unknown provider: {provider}")
@@ -108,12 +115,17 @@ Output the corrected JSON only."""
     return repaired
 
 
-def validate_strategy_graph(llm_output: Dict[str, Any], provider: str = "openai"):
+def validate_strategy_graph(
+    llm_output: Dict[str, Any],
+    provider: str = "openai",
+    token: Optional[CancelToken] = None,
+):
     """Validate and repair StrategyGraph JSON.
 
     Args:
         llm_output: JSON dict from LLM
         provider: "openai" or "anthropic"
+        token: Cancellation token for a repair call
 
     Returns:
         Validated StrategyGraph instance
@@ -123,7 +135,7 @@ def validate_strategy_graph(llm_output: Dict[str, Any], provider: str = "openai"
     """
     from graph.schema import StrategyGraph
 
-    return validate_and_repair(llm_output, StrategyGraph, provider)
+    return validate_and_repair(llm_output, StrategyGraph, provider, token=token)
 
 
 def validate_patch_set(llm_output: Dict[str, Any], provider: str = "openai"):
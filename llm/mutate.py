@@ -7,6 +7,7 @@ import json
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+from cancellation import CancelToken
 from graph.schema import StrategyGraph
 from graph.gene_pool import get_registry
 from evolution.patches import PatchSet
@@ -23,6 +24,7 @@ def propose_child_patches(
     model: Optional[str] = None,
     temperature: float = 0.8,
     run_id: Optional[str] = None,
+    token: Optional[CancelToken] = None,
 ) -> List[PatchSet]:
     """Propose mutation patches to create child strategies.
 
@@ -36,12 +38,14 @@ def propose_child_patches(
         num_children: Number of child patches to generate (default 3)
         provider: "openai" or "anthropic"
         temperature: LLM temperature
+        token: Cancellation token passed to the LLM call
 
     Returns:
         List of PatchSet objects (one per child)
 
     Raises:
         ValidationError: If LLM output is invalid
+        Cancelled: If the token is cancelled or expires
     """
     registry = get_registry()
 
@@ -75,6 +79,7 @@ def propose_child_patches(
             temperature=temperature,
             max_tokens=4000,
             transcript_meta=transcript_meta,
+            token=token,
         )
         if model:
             kwargs["model"] = model
@@ -86,6 +91,7 @@ def propose_child_patches(
             temperature=temperature,
             max_tokens=4000,
             transcript_meta=transcript_meta,
+            token=token,
         )
         if model:
             kwargs["model"] = model
@@ -3,7 +3,7 @@
 
 Verifies:
   - Phase 3 evaluation runs inside Darwin (seed_graph, no LLM compile)
-  - Phase3Report JSON artifacts are created under results/runs/<run_id>/phase3_reports/
+  - Phase3 reports are stored in results/runs/<run_id>/run.db
   - Schedule config is serialised to run_config.json
   - Curriculum sampling_mode_schedule is respected
 
@@ -168,44 +168,37 @@ def main():
             else:
                 print(f"  run_config.json: MISSING")
 
-            # Check phase3_reports directory
+            # Check Phase 3 reports in the run store
             checks_total += 1
-            p3_dir = run_dir / "phase3_reports"
-            if p3_dir.exists():
-                reports = list(p3_dir.glob("*.json"))
-                print(f"  phase3_reports/: {len(reports)} report(s)")
-                if len(reports) >= 1:
-                    # Validate content of first report
-                    with open(reports[0]) as f:
-                        report = json.load(f)
-                    has_phase3 = "phase3" in report
-                    has_episodes = "episodes" in report.get("phase3", {})
-                    has_explanation = "explanation" in report.get("phase3", {})
-                    print(f"    First report: phase3={has_phase3}, episodes={has_episodes}, "
-                          f"explanation={has_explanation}")
-                    if has_phase3 and has_episodes:
-                        checks_passed += 1
-                        print(f"    PASS")
-                    else:
-                        print(f"    FAIL")
-                else:
-                    print(f"    FAIL (no reports)")
-            else:
-                print(f"  phase3_reports/: MISSING")
-
-            # Check evals directory
-            checks_total += 1
-            evals_dir = run_dir / "evals"
-            if evals_dir.exists():
-                evals = list(evals_dir.glob("*.json"))
-                print(f"  evals/: {len(evals)} eval(s)")
-                if len(evals) >= 1:
+            from evolution.storage import RunReader
+            reader = RunReader(run_dir)
+            eval_ids = sorted(reader.evaluation_metadata())
+            reports = [r for r in (reader.load_phase3_report(gid) for gid in eval_ids) if r]
+            print(f"  phase3 reports: {len(reports)} report(s)")
+            if len(reports) >= 1:
+                # Validate content of first report
+                report = reports[0]
+                has_phase3 = "phase3" in report
+                has_episodes = "episodes" in report.get("phase3", {})
+                has_explanation = "explanation" in report.get("phase3", {})
+                print(f"    First report: phase3={has_phase3}, episodes={has_episodes}, "
+                      f"explanation={has_explanation}")
+                if has_phase3 and has_episodes:
                     checks_passed += 1
                     print(f"    PASS")
                 else:
                     print(f"    FAIL")
             else:
-                print(f"  evals/: MISSING")
+                print(f"    FAIL (no reports)")
+
+            # Check evaluations
+            checks_total += 1
+            print(f"  evals: {len(eval_ids)} eval(s)")
+            if len(eval_ids) >= 1:
+                checks_passed += 1
+                print(f"    PASS")
+            else:
+                print(f"    FAIL")
 
             # Check blue_memos directory
             checks_total += 1
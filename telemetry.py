@@ -0,0 +1,355 @@
+"""In-process metrics registry (telemetry) with Prometheus text exposition.
+
+The engine's hot paths (graph execution, backtests, evaluation stages, LLM
+calls, caches, run storage) record into the module-level metrics declared
+at the bottom of this file:
+
+    GRAPH_EXECUTIONS.inc()
+    NODE_EVALUATIONS.labels(node.type).inc()
+    with EVALUATION_STAGE_SECONDS.labels("holdout").time():
+        ...
+
+Recording takes no lock: every thread updates its own shard of values (one
+dict update per call) and snapshot() sums the shards. Shards of exited
+threads are folded together when a snapshot is taken.
+
+Each process has its own registry. Processes that work on behalf of another
+hand their values back to it:
+
+- process pool tasks submitted through collecting() return their metrics
+  with their result; merge_result() adds them to the caller's registry
+- JobRunner workers push snapshots over their JobChannel (see
+  backend_api/jobs.py)
+- API processes publish theirs to the shared state store, and GET /metrics
+  serves the sum (see backend_api/main.py)
+
+Snapshots are JSON-friendly: {metric name: [[label values, value], ...]},
+where a histogram's value is its per-bucket counts followed by the sum of
+observations.
+"""
+
+import bisect
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+Labels = Tuple[str, ...]
+Snapshot = Dict[str, List[list]]
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds: 1ms .. 2min, wide enough for both a single backtest and an LLM call
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class _Shard:
+    """Values recorded by one thread: (metric name, labels) -> number or histogram list."""
+
+    __slots__ = ("thread", "values")
+
+    def __init__(self, thread: Optional[threading.Thread]):
+        self.thread = thread
+        self.values: Dict[Tuple[str, Labels], Any] = {}
+
+
+_metrics: Dict[str, "_Metric"] = {}
+_shards: List[_Shard] = []
+_retired = _Shard(None)  # exited threads' values and values merged from other processes
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _values() -> Dict[Tuple[str, Labels], Any]:
+    """This thread's shard (registered on first use)."""
+    try:
+        return _local.shard.values
+    except AttributeError:
+        shard = _Shard(threading.current_thread())
+        with _lock:
+            _shards.append(shard)
+        _local.shard = shard
+        return shard.values
+
+
+class _Series:
+    """One labelled series of a metric (what the hot path records into)."""
+
+    __slots__ = ("metric", "key")
+
+    def __init__(self, metric: "_Metric", labels: Labels):
+        self.metric = metric
+        self.key = (metric.name, labels)
+
+    def inc(self, amount: float = 1):
+        """Add to a counter or gauge."""
+        values = _values()
+        values[self.key] = values.get(self.key, 0) + amount
+
+    def dec(self, amount: float = 1):
+        """Subtract from a gauge."""
+        self.inc(-amount)
+
+    def observe(self, value: float):
+        """Record a histogram observation."""
+        values = _values()
+        counts = values.get(self.key)
+        if counts is None:
+            counts = values[self.key] = [0] * (len(self.metric.buckets) + 1) + [0.0]
+        counts[bisect.bisect_left(self.metric.buckets, value)] += 1
+        counts[-1] += value
+
+    def time(self) -> "_Timer":
+        """Context manager observing its duration in seconds."""
+        return _Timer(self)
+
+
+class _Timer:
+    __slots__ = ("series", "started")
+
+    def __init__(self, series: _Series):
+        self.series = series
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.series.observe(time.perf_counter() - self.started)
+        return False
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (), buckets: Sequence[float] = ()):
+        if name in _metrics:
+            raise ValueError(f"Metric {name} is already registered")
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Labels, _Series] = {}
+        self._unlabelled = _Series(self, ())
+        _metrics[name] = self
+
+    def labels(self, *values: Any) -> _Series:
+        """The series for these label values (in declaration order)."""
+        series = self._series.get(values)
+        if series is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"{self.name} expects labels {self.label_names}, got {values}")
+            series = self._series[values] = _Series(self, tuple(str(v) for v in values))
+        return series
+
+
+class Counter(_Metric):
+    """Monotonic count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1):
+        self._unlabelled.inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that goes up and down (recorded as increments, so every thread can move it)."""
+
+    kind = "gauge"
+
+    def inc(self, amount: float = 1):
+        self._unlabelled.inc(amount)
+
+    def dec(self, amount: float = 1):
+        self._unlabelled.inc(-amount)
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels, sorted(buckets))
+
+    def observe(self, value: float):
+        self._unlabelled.observe(value)
+
+    def time(self) -> _Timer:
+        return self._unlabelled.time()
+
+
+def _add(values: Dict[Tuple[str, Labels], Any], key: Tuple[str, Labels], value: Any):
+    current = values.get(key)
+    if current is None:
+        values[key] = list(value) if isinstance(value, list) else value
+    elif isinstance(current, list):
+        for i, v in enumerate(value):
+            current[i] += v
+    else:
+        values[key] = current + value
+
+
+def _to_snapshot(values: Dict[Tuple[str, Labels], Any]) -> Snapshot:
+    snapshot: Snapshot = {}
+    for (name, labels), value in values.items():
+        snapshot.setdefault(name, []).append([list(labels), value])
+    return snapshot
+
+
+def _from_snapshot(snapshot: Snapshot) -> Dict[Tuple[str, Labels], Any]:
+    values: Dict[Tuple[str, Labels], Any] = {}
+    for name, samples in snapshot.items():
+        for labels, value in samples:
+            _add(values, (name, tuple(labels)), value)
+    return values
+
+
+def snapshot() -> Snapshot:
+    """Everything recorded in this process (plus merged values) so far."""
+    totals: Dict[Tuple[str, Labels], Any] = {}
+    with _lock:
+        for shard in [s for s in _shards if not s.thread.is_alive()]:
+            _shards.remove(shard)
+            for key, value in shard.values.items():
+                _add(_retired.values, key, value)
+        for shard in [_retired, *_shards]:
+            # dict.copy() is atomic under the GIL; the owning thread may keep recording
+            for key, value in shard.values.copy().items():
+                _add(totals, key, value)
+    return _to_snapshot(totals)
+
+
+def merge(other: Snapshot):
+    """Add another process's values to this registry."""
+    with _lock:
+        for key, value in _from_snapshot(other).items():
+            _add(_retired.values, key, value)
+
+
+def combine(snapshots: Iterable[Snapshot]) -> Snapshot:
+    """Sum several snapshots."""
+    values: Dict[Tuple[str, Labels], Any] = {}
+    for other in snapshots:
+        for key, value in _from_snapshot(other).items():
+            _add(values, key, value)
+    return _to_snapshot(values)
+
+
+def without_gauges(values: Snapshot) -> Snapshot:
+    """A snapshot minus its gauge series.
+
+    Counters and histograms of a process that has exited still add to the
+    totals; its gauges describe state that went away with it.
+    """
+    return {
+        name: samples for name, samples in values.items()
+        if name not in _metrics or _metrics[name].kind != "gauge"
+    }
+
+
+def reset():
+    """Forget every recorded value (declared metrics are kept)."""
+    global _local
+    with _lock:
+        _shards.clear()
+        _retired.values.clear()
+        _local = threading.local()
+
+
+def collecting(fn: Callable[..., Any], *args, **kwargs) -> Tuple[Any, Snapshot]:
+    """Process pool task wrapper: run fn and return (result, metrics it recorded).
+
+    Submit as executor.submit(telemetry.collecting, fn, *args) and unwrap the
+    future's result with merge_result().
+    """
+    reset()
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        recorded = snapshot()
+        reset()
+    return result, recorded
+
+
+def merge_result(wrapped: Tuple[Any, Snapshot]) -> Any:
+    """Merge the metrics of a collecting() task into this process and return its result."""
+    result, recorded = wrapped
+    merge(recorded)
+    return result
+
+
+def _reset_after_fork():
+    # Another parent thread may have held the lock at fork time: replace it, don't take it
+    global _lock, _local
+    _lock = threading.Lock()
+    _local = threading.local()
+    _shards.clear()
+    _retired.values.clear()
+
+
+# Forked children (process pools) start from an empty registry, not a copy of the parent's
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def render(values: Snapshot) -> str:
+    """Prometheus text exposition (format 0.0.4) of a snapshot."""
+    lines: List[str] = []
+    for metric in _metrics.values():
+        samples = sorted((tuple(labels), value) for labels, value in values.get(metric.name, []))
+        if not samples and not metric.label_names:
+            samples = [((), [0] * (len(metric.buckets) + 2) if metric.kind == "histogram" else 0)]
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for labels, value in samples:
+            pairs = list(zip(metric.label_names, labels))
+            if metric.kind != "histogram":
+                lines.append(f"{metric.name}{_format_labels(pairs)} {_format_value(value)}")
+                continue
+            cumulative = 0
+            for bound, count in zip([*metric.buckets, float("inf")], value[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                lines.append(f"{metric.name}_bucket{_format_labels(pairs + [('le', le)])} {cumulative}")
+            lines.append(f"{metric.name}_sum{_format_labels(pairs)} {_format_value(value[-1])}")
+            lines.append(f"{metric.name}_count{_format_labels(pairs)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def _format_labels(pairs: List[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    escaped = (
+        f'{name}="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# ===== Engine metrics =====
+
+GRAPH_EXECUTIONS = Counter("darwin_graph_executions_total", "Strategy graph executions")
+NODE_EVALUATIONS = Counter("darwin_node_evaluations_total", "Graph node evaluations", labels=("node_type",))
+BACKTESTS = Counter("darwin_backtests_total", "Backtest simulations")
+BARS_SIMULATED = Counter("darwin_bars_simulated_total", "Bars stepped through by the backtest simulator")
+EVALUATION_STAGE_SECONDS = Histogram(
+    "darwin_evaluation_stage_seconds",
+    "Evaluation latency by stage (holdout, train, stability, jitter, episode)",
+    labels=("stage",),
+)
+LLM_CALL_SECONDS = Histogram(
+    "darwin_llm_call_seconds", "LLM API call latency (cache misses only)", labels=("provider", "stage")
+)
+LLM_TOKENS = Counter("darwin_llm_tokens_total", "LLM tokens used", labels=("provider", "stage"))
+CACHE_REQUESTS = Counter(
+    "darwin_cache_requests_total", "Cache lookups by cache (llm, dataset, resample, bars) and result (hit, miss)",
+    labels=("cache", "result"),
+)
+STORAGE_WRITE_SECONDS = Histogram("darwin_storage_write_seconds", "Run storage batch commit latency")
+STORAGE_WRITES = Counter("darwin_storage_writes_total", "Run storage writes committed")
+STORAGE_QUEUE_DEPTH = Gauge("darwin_storage_queue_depth", "Run storage writes queued but not yet committed")
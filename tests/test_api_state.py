@@ -0,0 +1,165 @@
+"""Tests for the API state store shared by API processes."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import multiprocessing
+import socket
+import subprocess
+import threading
+import time
+
+import pytest
+
+import config
+from backend_api.event_log import EVENT_LOG_NAME, RunEventLog
+from backend_api.jobs import CANCELLED, COMPLETED, FAILED, RUNNING, Job
+from backend_api.state import SQLiteStateStore, fail_orphaned_jobs, process_owner
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SQLiteStateStore(tmp_path / "api_state.db")
+
+
+def record_entries(path, worker, count):
+    store = SQLiteStateStore(path)
+    for i in range(count):
+        store.record("requests", {"worker": worker, "i": i}, keep=1000)
+        store.save_budget(f"run_{worker}", {"total_calls": i + 1, "estimated_cost_usd": 0.5})
+
+
+def test_jobs_and_cancel_requests(store):
+    job = Job(job_id="a", target="x:y", kwargs={}, status=RUNNING).to_dict()
+    store.save_job(job, owner="other:1")
+    store.save_job(Job(job_id="b", target="x:y", kwargs={}).to_dict())
+
+    assert store.get_job("a")["owner"] == "other:1"
+    assert [j["job_id"] for j in store.list_jobs()] == ["a", "b"]
+    assert store.get_job("missing") is None
+
+    assert store.request_cancel("a")
+    assert store.cancel_requests(owner="other:1") == ["a"]
+    assert store.cancel_requests() == []
+
+    store.save_job({**job, "status": CANCELLED}, owner="other:1")
+    assert store.cancel_requests(owner="other:1") == []
+    assert not store.request_cancel("a")
+
+
+def test_histories_are_bounded_and_budgets_summed(store):
+    for i in range(10):
+        store.record("errors", {"i": i}, keep=3)
+    store.record("requests", {"i": 0}, keep=3)
+    assert [entry["i"] for entry in store.recent("errors")] == [7, 8, 9]
+    assert len(store.recent("requests")) == 1
+
+    store.save_budget("r1", {"total_calls": 2, "estimated_cost_usd": 0.25, "note": "x"})
+    store.save_budget("r2", {"total_calls": 3, "estimated_cost_usd": 0.5})
+    store.save_budget("r2", {"total_calls": 4, "estimated_cost_usd": 0.5})
+    assert store.get_budget("r2")["total_calls"] == 4
+    assert store.total_budget() == {"total_calls": 6, "estimated_cost_usd": 0.75}
+
+
+def test_concurrent_processes_share_the_store(tmp_path):
+    path = tmp_path / "api_state.db"
+    SQLiteStateStore(path)
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=record_entries, args=(path, worker, 50)) for worker in range(2)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+        assert process.exitcode == 0
+
+    store = SQLiteStateStore(path)
+    assert len(store.recent("requests")) == 100
+    assert store.total_budget()["total_calls"] == 100
+
+
+def test_jobs_of_exited_processes_are_failed(store):
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    host = socket.gethostname()
+    store.save_job(Job(job_id="orphan", target="x:y", kwargs={}, status=RUNNING).to_dict(),
+                   owner=f"{host}:{exited.pid}")
+    store.save_job(Job(job_id="mine", target="x:y", kwargs={}, status=RUNNING).to_dict())
+    store.save_job(Job(job_id="remote", target="x:y", kwargs={}, status=RUNNING).to_dict(), owner="elsewhere:1")
+
+    assert fail_orphaned_jobs(store) == ["orphan"]
+    assert store.get_job("orphan")["status"] == FAILED
+    assert store.get_job("mine")["status"] == RUNNING
+
+
+def test_api_serves_jobs_owned_by_another_process(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import backend_api.main as main
+
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    monkeypatch.setattr(config, "API_STATE_POLL_SECONDS", 0.05)
+    store = main.get_state_store()
+    client = TestClient(main.app)
+
+    # Another API process runs this job and writes its event log
+    job = Job(job_id="remote_run", target="x:y", kwargs={}, status=RUNNING)
+    store.save_job(job.to_dict(), owner="other-host:1")
+    log = RunEventLog(tmp_path / "runs" / "remote_run" / EVENT_LOG_NAME)
+    log.append({"type": "log", "message": "first"})
+
+    assert client.get("/api/jobs/remote_run").json()["owner"] == "other-host:1"
+    assert client.post("/api/jobs/remote_run/cancel").json()["cancel_requested"] is True
+
+    def finish_remotely():
+        time.sleep(0.3)
+        log.append({"type": "log", "message": "second"})
+        job.status, job.result = COMPLETED, {"best_fitness": 1.0, "total_evaluations": 2}
+        store.save_job(job.to_dict(), owner="other-host:1")
+
+    finisher = threading.Thread(target=finish_remotely)
+    finisher.start()
+    body = client.get("/api/run/remote_run/events").text
+    finisher.join()
+
+    events = [json.loads(line[len("data: "):]) for line in body.splitlines() if line.startswith("data: ")]
+    assert [e["message"] for e in events if e["type"] == "log"] == ["first", "second"]
+    assert events[-1]["type"] == "run_finished"
+    assert events[-1]["best_fitness"] == 1.0
+    assert main._job_view(store.get_job("remote_run"))["status"] == COMPLETED
+    assert main._job_view(store.get_job("remote_run"))["owner"] != process_owner()
+
+
+def test_request_history_is_written_off_the_event_loop(tmp_path, monkeypatch):
+    import asyncio
+    from fastapi.testclient import TestClient
+    import backend_api.main as main
+
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    monkeypatch.setattr(config, "API_STATE_POLL_SECONDS", 0.05)
+    store = main.get_state_store()
+    main._pending_history.clear()  # entries left by earlier tests' clients
+    writes = []
+    record = store.record
+
+    def checked_record(log, entry, keep):
+        try:
+            asyncio.get_running_loop()
+            writes.append((log, "event loop"))
+        except RuntimeError:
+            writes.append((log, "thread"))
+        record(log, entry, keep)
+
+    monkeypatch.setattr(store, "record", checked_record)
+
+    with TestClient(main.app) as client:
+        assert client.get("/api/nope").status_code == 404
+        deadline = time.monotonic() + 10
+        while len(writes) < 2:
+            assert time.monotonic() < deadline, "history was not written"
+            time.sleep(0.02)
+
+        assert sorted(writes) == [("errors", "thread"), ("requests", "thread")]
+        assert client.get("/api/debug/errors").json()["errors"][-1]["path"] == "/api/nope"
@@ -0,0 +1,84 @@
+"""Tests for the bulk artifact endpoint."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import gzip
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import config
+from backend_api import artifacts
+from tests.test_run_storage import write_small_run
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    from backend_api.main import app
+    return TestClient(app)
+
+
+def read_ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_bulk_fetch_projects_fields_and_compresses(client):
+    _, adam = write_small_run("bulk_run")
+
+    response = client.post(
+        "/api/runs/bulk_run/artifacts",
+        json={"kinds": ["graph", "eval", "phase3", "memo"], "fields": ["eval.fitness", "graph.metadata.parent_graph"]},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith(artifacts.NDJSON_MEDIA_TYPE)
+
+    records = {record["graph_id"]: record for record in read_ndjson(response)}
+    assert set(records) == {adam.graph_id, "child_0", "child_1"}
+    assert records["child_1"]["eval"] == {"fitness": -0.2}
+    assert records["child_0"]["graph"] == {"metadata": {"parent_graph": adam.graph_id}}
+    assert len(records["child_0"]["phase3"]["phase3"]["episodes"]) == 3
+    assert records["child_0"]["memo"] is None
+
+
+def test_bulk_fetch_selected_graphs_uncompressed(client):
+    write_small_run("bulk_plain")
+
+    response = client.post(
+        "/api/runs/bulk_plain/artifacts",
+        json={"graph_ids": ["child_0", "missing"], "kinds": ["eval"]},
+        headers={"Accept-Encoding": "identity"},
+    )
+    assert "content-encoding" not in response.headers
+    records = read_ndjson(response)
+    assert [record["graph_id"] for record in records] == ["child_0", "missing"]
+    assert records[0]["eval"]["decision"] == "survive"
+    assert records[1]["eval"] is None
+
+
+def test_bulk_fetch_rejects_bad_requests(client, monkeypatch):
+    write_small_run("bulk_bad")
+    url = "/api/runs/bulk_bad/artifacts"
+
+    assert client.post(url, json={"kinds": ["bogus"]}).status_code == 400
+    assert client.post(url, json={"fields": ["fitness"]}).status_code == 400
+    assert client.post("/api/runs/missing/artifacts", json={}).status_code == 404
+    for graph_id in ("../../../etc/x", "..", "memos\\x"):
+        assert client.post(url, json={"graph_ids": [graph_id], "kinds": ["graph", "memo"]}).status_code == 400
+
+    monkeypatch.setattr(artifacts, "msgpack", None)
+    assert client.post(url, json={"format": "msgpack"}).status_code == 501
+
+
+def test_ndjson_chunks_form_one_gzip_stream():
+    records = [{"graph_id": f"g{i}", "eval": {"fitness": i / 10}} for i in range(500)]
+    body = b"".join(artifacts.ndjson_chunks(iter(records)))
+    plain = b"".join(artifacts.ndjson_chunks(iter(records), compress=False))
+
+    assert gzip.decompress(body) == plain
+    assert len(body) < len(plain) / 4
@@ -0,0 +1,191 @@
+"""Tests for the range-aware, month-partitioned bar cache."""
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+
+from data.bar_cache import BarCache
+from data.polygon_client import PolygonClient
+
+
+def make_day_bars(first_day, last_day):
+    """Hourly regular-session bars (UTC timestamps) for each business day."""
+    stamps = []
+    for day in pd.bdate_range(first_day, last_day):
+        local = pd.date_range(f"{day.date()} 09:30", periods=7, freq="1h", tz="America/New_York")
+        stamps.append(local.tz_convert("UTC"))
+    if not stamps:
+        return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
+    ts = stamps[0].append(stamps[1:])
+    close = 100.0 + np.arange(len(ts)) * 0.1
+    return pd.DataFrame({
+        "timestamp": ts, "open": close, "high": close + 0.5,
+        "low": close - 0.5, "close": close, "volume": 1000.0,
+    })
+
+
+class RecordingClient(PolygonClient):
+    """PolygonClient whose network fetch is replaced by synthetic bar pages."""
+
+    def __init__(self, cache_dir, page_size=500):
+        super().__init__(api_key="test-key", cache_dir=cache_dir)
+        self.fetches = []
+        self.page_size = page_size
+        self.rows_on_disk_per_page = []
+
+    def _fetch_pages(self, symbol, timeframe, start, end):
+        self.fetches.append((start, end))
+        bars = make_day_bars(start, end)
+        for offset in range(0, len(bars), self.page_size):
+            # Previous pages must already be in the partitions
+            self.rows_on_disk_per_page.append(len(self.bar_cache.read(symbol, timeframe, start, end)))
+            yield bars.iloc[offset:offset + self.page_size]
+
+
+def test_missing_ranges_and_coverage_merge(tmp_path):
+    cache = BarCache(tmp_path)
+    cache.write("AAPL", "1h", make_day_bars("2024-01-01", "2024-01-31"), date(2024, 1, 1), date(2024, 1, 31))
+    cache.write("AAPL", "1h", make_day_bars("2024-03-01", "2024-03-31"), date(2024, 3, 1), date(2024, 3, 31))
+
+    assert cache.missing_ranges("AAPL", "1h", "2024-01-10", "2024-01-20") == []
+    assert cache.missing_ranges("AAPL", "1h", "2024-01-15", "2024-04-10") == [
+        (date(2024, 2, 1), date(2024, 2, 29)),
+        (date(2024, 4, 1), date(2024, 4, 10)),
+    ]
+
+    cache.write("AAPL", "1h", make_day_bars("2024-02-01", "2024-02-29"), date(2024, 2, 1), date(2024, 2, 29))
+    assert cache.coverage("AAPL", "1h") == [(date(2024, 1, 1), date(2024, 3, 31))]
+    assert sorted(p.name for p in (tmp_path / "AAPL" / "1h").glob("*.parquet")) == [
+        "2024-01.parquet", "2024-02.parquet", "2024-03.parquet",
+    ]
+
+
+def test_overlapping_requests_fetch_only_gaps(tmp_path):
+    client = RecordingClient(tmp_path)
+
+    full = client.get_bars("AAPL", "1h", "2024-01-01", "2024-12-31")
+    sub = client.get_bars("AAPL", "1h", "2024-01-01", "2024-06-30")
+    extended = client.get_bars("AAPL", "1h", "2024-06-01", "2025-01-31")
+
+    assert client.fetches == [("2024-01-01", "2024-12-31"), ("2025-01-01", "2025-01-31")]
+    expected = make_day_bars("2024-01-01", "2024-06-28")
+    pd.testing.assert_frame_equal(sub[["timestamp", "volume"]], expected[["timestamp", "volume"]])
+    assert len(full) == len(make_day_bars("2024-01-01", "2024-12-31"))
+    assert extended["timestamp"].min() == make_day_bars("2024-06-03", "2024-06-03")["timestamp"].min()
+    assert extended["timestamp"].is_monotonic_increasing
+
+
+def test_open_day_is_never_finalized(tmp_path):
+    client = RecordingClient(tmp_path)
+    today = client.bar_cache.today()
+    start = (pd.Timestamp(today) - pd.Timedelta(days=10)).date().isoformat()
+
+    client.get_bars("AAPL", "1h", start, today.isoformat())
+    client.get_bars("AAPL", "1h", start, today.isoformat())
+
+    # Historical days come from disk; the trailing open day is re-fetched
+    assert client.fetches[1] == (today.isoformat(), today.isoformat())
+    assert client.bar_cache.coverage("AAPL", "1h")[-1][1] < today
+
+
+def test_pages_stream_into_partitions(tmp_path):
+    client = RecordingClient(tmp_path, page_size=100)
+    df = client.get_bars("AAPL", "1h", "2024-01-01", "2024-03-31")
+
+    n_pages = -(-len(df) // 100)
+    assert client.rows_on_disk_per_page == [100 * i for i in range(n_pages)]
+    assert df["timestamp"].is_unique and df["timestamp"].is_monotonic_increasing
+
+
+def test_refetch_replaces_rows_without_duplicates(tmp_path):
+    cache = BarCache(tmp_path)
+    bars = make_day_bars("2024-05-01", "2024-05-31")
+    cache.write("MSFT", "1h", bars, date(2024, 5, 1), date(2024, 5, 31))
+    cache.write("MSFT", "1h", make_day_bars("2024-05-10", "2024-05-20"), date(2024, 5, 10), date(2024, 5, 20))
+
+    result = cache.read("MSFT", "1h", "2024-05-01", "2024-05-31")
+    assert len(result) == len(bars)
+    assert result["timestamp"].is_unique
+
+
+def test_feather_format_matches_parquet_with_zero_copy_views(tmp_path):
+    parquet = BarCache(tmp_path / "parquet")
+    feather = BarCache(tmp_path / "feather", cache_format="feather")
+    for cache in (parquet, feather):
+        cache.write("AAPL", "1h", make_day_bars("2024-01-01", "2024-03-31"), date(2024, 1, 1), date(2024, 3, 31))
+
+    expected = parquet.read("AAPL", "1h", "2024-01-15", "2024-02-20")
+    mapped = feather.read("AAPL", "1h", "2024-01-15", "2024-02-20")
+
+    pd.testing.assert_frame_equal(mapped, expected)
+    close = mapped["close"].to_numpy()
+    assert not close.flags.writeable  # view over the mapped series file
+    assert mapped["timestamp"].dt.tz is not None
+
+
+def test_feather_series_refreshes_after_parquet_writes(tmp_path):
+    feather = BarCache(tmp_path, cache_format="feather")
+    feather.write("AAPL", "1h", make_day_bars("2024-01-01", "2024-01-31"), date(2024, 1, 1), date(2024, 1, 31))
+
+    # Another process using the parquet format extends the same series
+    BarCache(tmp_path).write("AAPL", "1h", make_day_bars("2024-02-01", "2024-02-29"), date(2024, 2, 1), date(2024, 2, 29))
+
+    result = feather.read("AAPL", "1h", "2024-01-01", "2024-02-29")
+    assert len(result) == len(make_day_bars("2024-01-01", "2024-02-29"))
+
+
+def test_feather_series_is_not_rewritten_for_open_month_fetches(tmp_path, monkeypatch):
+    feather = BarCache(tmp_path, cache_format="feather")
+    monkeypatch.setattr(feather, "today", lambda: date(2024, 3, 15))
+    feather.write("AAPL", "1h", make_day_bars("2024-01-01", "2024-02-29"), date(2024, 1, 1), date(2024, 2, 29))
+    assert not feather._series_path("AAPL", "1h").exists()  # built on the first read
+    feather.read("AAPL", "1h", "2024-01-01", "2024-02-29")
+    built_ns = feather._series_path("AAPL", "1h").stat().st_mtime_ns
+
+    # Fetches of the open month update its partition only
+    for _ in range(3):
+        feather.write("AAPL", "1h", make_day_bars("2024-03-01", "2024-03-15"), date(2024, 3, 1), date(2024, 3, 15))
+        history = feather.read("AAPL", "1h", "2024-01-01", "2024-02-29")
+        recent = feather.read("AAPL", "1h", "2024-02-20", "2024-03-15")
+    assert feather._series_path("AAPL", "1h").stat().st_mtime_ns == built_ns
+    assert not history["close"].to_numpy().flags.writeable  # still mapped
+    assert list(recent["timestamp"]) == list(make_day_bars("2024-02-20", "2024-03-15")["timestamp"])
+
+    # Once the month is over, the next read folds it into the series file
+    monkeypatch.setattr(feather, "today", lambda: date(2024, 4, 2))
+    assert len(feather.read("AAPL", "1h", "2024-01-01", "2024-03-31")) == len(make_day_bars("2024-01-01", "2024-03-15"))
+    assert feather._series_path("AAPL", "1h").stat().st_mtime_ns > built_ns
+
+
+def fill_days(root, days):
+    """Fetch-and-cover each day under the series lock, as get_bars does."""
+    cache = BarCache(root)
+    for day in days:
+        with cache.lock("AAPL", "1h"):
+            for first_day, last_day in cache.missing_ranges("AAPL", "1h", day.isoformat(), day.isoformat()):
+                cache.append("AAPL", "1h", make_day_bars(first_day, last_day))
+                cache.mark_covered("AAPL", "1h", first_day, last_day)
+
+
+def test_processes_sharing_a_series_do_not_lose_rows(tmp_path):
+    days = [date(2024, 1, 1) + timedelta(days=i) for i in range(31)]
+    context = multiprocessing.get_context("spawn")
+    # Interleaved days of the same month partition
+    processes = [context.Process(target=fill_days, args=(tmp_path, days[i::3])) for i in range(3)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(120)
+        assert process.exitcode == 0
+
+    cache = BarCache(tmp_path)
+    assert cache.coverage("AAPL", "1h") == [(date(2024, 1, 1), date(2024, 1, 31))]
+    result = cache.read("AAPL", "1h", "2024-01-01", "2024-01-31")
+    assert list(result["timestamp"]) == list(make_day_bars("2024-01-01", "2024-01-31")["timestamp"])
+    assert not list(tmp_path.rglob("*.tmp"))
@@ -0,0 +1,229 @@
+"""Tests for cancellation tokens, evaluation deadlines and graceful run cancel."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import time
+
+import pytest
+
+import config
+from backend_api.jobs import CANCELLED, RUNNING, JobRunner
+from cancellation import CancelToken, Cancelled, DeadlineExceeded
+from evolution.patches import PatchOp, PatchSet
+from graph.schema import UniverseSpec, TimeConfig, DateRange
+from validation.evaluation import evaluate_strategy
+from tests.test_survivor_floor import make_simple_trading_strategy, make_test_data
+
+
+# Job targets (imported by module path in the worker processes)
+
+def cooperative_job(channel):
+    channel.emit("log", {"message": "started"})
+    channel.token.sleep(60)
+    return "not cancelled"
+
+
+def stubborn_job(channel):
+    channel.emit("log", {"message": "started"})
+    time.sleep(60)
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def runner():
+    events = []
+    runner = JobRunner(max_workers=1, max_queued=1, on_event=lambda job, event: events.append((job.job_id, event)))
+    runner.events = events
+    yield runner
+    runner.shutdown(timeout=1)
+
+
+def wait_for(predicate, timeout=20):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.02)
+
+
+def run_darwin_on_seed(**kwargs):
+    from evolution.darwin import run_darwin
+
+    return run_darwin(
+        data=make_test_data(n_bars=200),
+        universe=UniverseSpec(type="explicit", symbols=["TEST"]),
+        time_config=TimeConfig(timeframe="1D", date_range=DateRange(start="2024-01-01", end="2024-12-31")),
+        seed_graph=make_simple_trading_strategy(),
+        **kwargs,
+    )
+
+
+def test_token_cancel_and_deadlines():
+    parent = CancelToken()
+    child = parent.child(timeout=0.05)
+    assert parent.remaining() is None
+    child.check()
+
+    time.sleep(0.06)
+    with pytest.raises(DeadlineExceeded):
+        child.check()
+    parent.check()  # a child's deadline does not apply to its parent
+
+    parent.cancel()
+    assert child.cancelled
+    with pytest.raises(Cancelled) as raised:
+        parent.child().check()
+    assert not isinstance(raised.value, DeadlineExceeded)
+
+    # BaseException: not swallowed by `except Exception` penalty handlers
+    with pytest.raises(Cancelled):
+        try:
+            parent.check()
+        except Exception:
+            pass
+
+
+def test_blocking_calls_are_abandoned():
+    token = CancelToken(timeout=0.2)
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        token.call(time.sleep, 5)
+    with pytest.raises(DeadlineExceeded):
+        token.sleep(5)
+    assert time.monotonic() - started < 2
+
+    assert CancelToken().call(lambda x: x * 2, 21) == 42
+    with pytest.raises(ValueError):
+        CancelToken().call(int, "not a number")
+
+
+def test_validation_stops_at_checkpoint():
+    token = CancelToken()
+    token.cancel()
+    with pytest.raises(Cancelled):
+        evaluate_strategy(make_simple_trading_strategy(), make_test_data(n_bars=200), token=token)
+
+
+def test_slow_child_is_killed_with_timeout(results_dir):
+    summary = run_darwin_on_seed(depth=1, run_id="eval_deadline", max_eval_seconds=0.0)
+
+    assert summary.total_evaluations == 1
+    assert summary.best_strategy.decision == "kill"
+    assert summary.best_strategy.kill_reason[0] == "timeout"
+    assert summary.kill_stats["timeout"] == 1
+
+
+def test_run_limit_is_not_recorded_as_an_evaluation_timeout(results_dir, monkeypatch):
+    import evolution.darwin as darwin
+
+    summary = run_darwin_on_seed(depth=1, run_id="run_deadline_adam", max_runtime_seconds=0.0)
+    assert summary.best_strategy.kill_reason[0] == "run_timeout"
+    assert "timeout" not in summary.kill_stats
+
+    evaluated = []
+
+    def child_outlives_run(graph, data, token=None, **kwargs):
+        evaluated.append(graph.graph_id)
+        if len(evaluated) > 1:
+            token.sleep(60)  # until the run's limit passes
+        return evaluate_strategy(graph, data, token=token, **kwargs)
+
+    monkeypatch.setattr(darwin, "evaluate_strategy", child_outlives_run)
+    monkeypatch.setattr(darwin, "propose_child_patches", lambda parent_graph, **kwargs: [
+        PatchSet(
+            patch_id=f"{parent_graph.graph_id}_p0",
+            parent_graph_id=parent_graph.graph_id,
+            description="widen target",
+            ops=[PatchOp(op_type="modify_param", node_id="tp_fixed", param_name="points", param_value=5.0)],
+        )
+    ])
+
+    summary = run_darwin_on_seed(
+        depth=2, rescue_mode=True, run_id="run_deadline_child", max_runtime_seconds=2.0, max_eval_seconds=60.0
+    )
+    assert len(evaluated) == 2
+    assert summary.total_evaluations == 1  # the cut-off child leaves no kill record
+    assert "timeout" not in summary.kill_stats
+
+
+def test_cancelled_run_saves_partial_results(results_dir, monkeypatch):
+    import evolution.darwin as darwin
+
+    token = CancelToken()
+
+    def cancel_while_mutating(parent_graph, results_summary, num_children, **kwargs):
+        token.cancel()
+        return [
+            PatchSet(
+                patch_id=f"{parent_graph.graph_id}_p{i}",
+                parent_graph_id=parent_graph.graph_id,
+                description="widen target",
+                ops=[PatchOp(op_type="modify_param", node_id="tp_fixed", param_name="points", param_value=5.0 + i)],
+            )
+            for i in range(num_children)
+        ]
+
+    monkeypatch.setattr(darwin, "propose_child_patches", cancel_while_mutating)
+
+    with pytest.raises(Cancelled):
+        run_darwin_on_seed(depth=2, branching=2, rescue_mode=True, run_id="cancelled_run", token=token)
+
+    summary = json.loads((results_dir / "runs" / "cancelled_run" / "summary.json").read_text())
+    assert summary["status"] == "cancelled"
+    assert summary["total_evaluations"] == 1  # Adam; the first child stopped at its first checkpoint
+
+
+def test_graceful_cancel_lets_job_stop(runner):
+    runner.submit("coop", "tests.test_cancellation:cooperative_job")
+    wait_for(lambda: any(event and event["message"] == "started" for _, event in runner.events))
+    pid = runner.stats()["workers"][0]["pid"]
+
+    assert runner.cancel("coop", grace=30).status == RUNNING
+    job = runner.wait("coop", timeout=10)
+    assert job.status == CANCELLED
+    assert runner.stats()["workers"][0]["pid"] == pid  # stopped by itself: worker kept
+
+    # The flag is cleared for the next job
+    runner.submit("next", "tests.test_job_runner:steps_job", value=1, steps=1)
+    assert runner.wait("next", timeout=30).result["pid"] == pid
+
+
+def test_job_ignoring_cancel_is_terminated_after_grace(runner):
+    runner.submit("stubborn", "tests.test_cancellation:stubborn_job")
+    wait_for(lambda: any(event and event["message"] == "started" for _, event in runner.events))
+    pid = runner.stats()["workers"][0]["pid"]
+
+    runner.cancel("stubborn", grace=0.3)
+    job = runner.wait("stubborn", timeout=10)
+    assert job.status == CANCELLED
+    assert "grace" in job.error
+    assert runner.stats()["workers"][0]["pid"] != pid
+
+
+def test_delete_run_endpoint(results_dir, monkeypatch):
+    from fastapi.testclient import TestClient
+    import backend_api.main as main
+
+    test_runner = JobRunner(max_workers=1, max_queued=0, on_event=main._on_job_update)
+    monkeypatch.setattr(main, "job_runner", test_runner)
+    client = TestClient(main.app)
+
+    try:
+        test_runner.submit("coop_run", "tests.test_cancellation:cooperative_job")
+        wait_for(lambda: any(
+            event.get("message") == "started" for _, event in main.running_jobs["coop_run"]["events"].since(0)
+        ))
+
+        body = client.delete("/api/runs/coop_run").json()
+        assert body["status"] == CANCELLED
+        wait_for(lambda: client.get("/api/jobs/coop_run").json()["status"] == CANCELLED)
+        assert client.delete("/api/runs/nope").status_code == 404
+    finally:
+        test_runner.shutdown(timeout=1)
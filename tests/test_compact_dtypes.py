@@ -0,0 +1,95 @@
+"""Parity tests for compact (float32 / uint volume) market data mode."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from data.compact import (
+    COMPACT_FITNESS_ATOL,
+    COMPACT_INDICATOR_RTOL,
+    compact_bars,
+    is_compact,
+)
+from graph.executor import GraphExecutor
+from graph.schema import Node
+from validation.evaluation import evaluate_strategy
+from validation.overfit_tests import run_backtest_on_data
+from tests.test_phase3_integration import (
+    make_simple_strategy,
+    make_test_data_with_timestamp_column,
+    make_test_data_with_timestamp_index,
+)
+
+
+def make_atr_strategy():
+    """SMA crossover with ATR-based stop/target (exercises float32 ATR)."""
+    strategy = make_simple_strategy()
+    nodes = [n for n in strategy.nodes if n.id not in ("stop_fixed", "tp_fixed")]
+    nodes += [
+        Node(id="atr", type="ATR", params={"period": 14},
+             inputs={"high": ("market", "high"), "low": ("market", "low"), "close": ("market", "close")}),
+        Node(id="stop_atr", type="StopLossATR", params={"mult": 1.5}, inputs={"atr": ("atr", "atr")}),
+        Node(id="tp_atr", type="TakeProfitATR", params={"mult": 3.0}, inputs={"atr": ("atr", "atr")}),
+    ]
+    for node in nodes:
+        if node.id == "bracket":
+            node.inputs["stop_config"] = ("stop_atr", "stop_config")
+            node.inputs["tp_config"] = ("tp_atr", "tp_config")
+    return strategy.model_copy(update={"nodes": nodes})
+
+
+def test_compact_bars_dtypes_and_size():
+    df = make_test_data_with_timestamp_column(n_bars=1000)
+    compact = compact_bars(df)
+
+    assert is_compact(compact) and not is_compact(df)
+    assert all(compact[col].dtype == np.float32 for col in ["open", "high", "low", "close"])
+    assert compact["volume"].dtype == np.uint32
+    assert compact["timestamp"].dtype == df["timestamp"].dtype
+    assert compact.memory_usage(index=False).sum() < 0.6 * df.memory_usage(index=False).sum()
+
+    fractional = df.assign(volume=df["volume"] + 0.5)
+    assert compact_bars(fractional)["volume"].dtype == np.float32
+
+
+def test_executor_keeps_indicators_compact():
+    df = make_test_data_with_timestamp_column(n_bars=300)
+    strategy = make_atr_strategy()
+
+    full = GraphExecutor().execute(strategy, df)
+    compact = GraphExecutor().execute(strategy, compact_bars(df))
+
+    for key in [("sma_fast", "sma"), ("sma_slow", "sma"), ("atr", "atr")]:
+        assert compact[key].dtype == np.float32
+        np.testing.assert_allclose(
+            compact[key].to_numpy(dtype=np.float64), full[key].to_numpy(),
+            rtol=COMPACT_INDICATOR_RTOL, equal_nan=True,
+        )
+    assert compact[("entry_compare", "result")].equals(full[("entry_compare", "result")])
+
+
+def test_trades_and_fitness_match_within_tolerance():
+    fixtures = [
+        make_test_data_with_timestamp_column(n_bars=500),
+        make_test_data_with_timestamp_index(n_bars=500),
+    ]
+    for strategy in (make_simple_strategy(), make_atr_strategy()):
+        for df in fixtures:
+            full = run_backtest_on_data(strategy, df)
+            compact = run_backtest_on_data(strategy, compact_bars(df))
+
+            assert full["metrics"]["trade_count"] > 0
+            for col in ["entry_time", "exit_time", "exit_reason", "shares"]:
+                assert compact["trades"][col].tolist() == full["trades"][col].tolist()
+            np.testing.assert_allclose(
+                compact["trades"]["pnl"].astype(float), full["trades"]["pnl"].astype(float),
+                rtol=1e-4, atol=1e-2,
+            )
+
+            full_eval = evaluate_strategy(strategy, df, n_jitter=0)
+            compact_eval = evaluate_strategy(strategy, compact_bars(df), n_jitter=0)
+            assert compact_eval.decision == full_eval.decision
+            assert abs(compact_eval.fitness - full_eval.fitness) <= COMPACT_FITNESS_ATOL
@@ -0,0 +1,119 @@
+"""Tests for the process-wide shared dataset registry."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.frame_store import read_frame, write_frame
+from data.registry import DatasetRegistry, freeze_frame
+from tests.test_phase3_integration import make_test_data_with_timestamp_column
+
+
+class CountingLoader:
+    def __init__(self, n_bars=200, delay=0.0):
+        self.n_bars = n_bars
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, symbol, timeframe, start, end):
+        with self.lock:
+            self.calls.append(symbol)
+        time.sleep(self.delay)
+        return make_test_data_with_timestamp_column(n_bars=self.n_bars)
+
+
+def test_same_window_is_shared_and_immutable():
+    loader = CountingLoader()
+    registry = DatasetRegistry(loader, max_bytes=10 ** 9)
+
+    first = registry.get("AAPL", "5m", "2024-01-01", "2024-06-30")
+    second = registry.get("AAPL", "5m", "2024-01-01", "2024-06-30")
+
+    assert first is second
+    assert loader.calls == ["AAPL"]
+    assert (registry.hits, registry.misses) == (1, 1)
+    with pytest.raises(ValueError):
+        first.df["close"].to_numpy()[0] = 0.0
+    pd.testing.assert_frame_equal(first.df, make_test_data_with_timestamp_column(n_bars=200))
+
+
+def test_lru_eviction_under_byte_budget():
+    loader = CountingLoader()
+    probe = DatasetRegistry(loader, max_bytes=10 ** 9).get("X", "5m", "a", "b")
+    registry = DatasetRegistry(loader, max_bytes=int(probe.nbytes * 2.5))
+
+    registry.get("A", "5m", "a", "b")
+    registry.get("B", "5m", "a", "b")
+    registry.get("A", "5m", "a", "b")  # A is now most recently used
+    registry.get("C", "5m", "a", "b")  # evicts B
+
+    stats = registry.stats()
+    assert [d["symbol"] for d in stats["datasets"]] == ["C", "A"]
+    assert stats["evictions"] == 1
+    assert stats["resident_bytes"] == 2 * probe.nbytes <= stats["max_bytes"]
+
+
+def test_concurrent_requests_load_once():
+    loader = CountingLoader(delay=0.1)
+    registry = DatasetRegistry(loader, max_bytes=10 ** 9)
+
+    frames = registry.get_many(["AAPL", "MSFT", "AAPL", "AAPL"], "5m", "s", "e")
+    threads = [
+        threading.Thread(target=registry.get, args=("MSFT", "5m", "s", "e"))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(loader.calls) == ["AAPL", "MSFT"]
+    assert list(frames) == ["AAPL", "MSFT"]
+    assert registry.stats()["misses"] == 2
+
+
+def test_get_many_reports_errors_per_symbol():
+    def loader(symbol, timeframe, start, end):
+        if symbol == "BAD":
+            raise RuntimeError("no data")
+        return make_test_data_with_timestamp_column(n_bars=50)
+
+    registry = DatasetRegistry(loader, max_bytes=10 ** 9)
+    errors = {}
+    frames = registry.get_many(
+        ["GOOD", "BAD"], "5m", "s", "e",
+        on_symbol=lambda symbol, frame, error: error and errors.setdefault(symbol, error),
+    )
+
+    assert list(frames) == ["GOOD"]
+    assert isinstance(errors["BAD"], RuntimeError)
+
+
+def test_freeze_keeps_mapped_columns_zero_copy(tmp_path):
+    source = make_test_data_with_timestamp_column(n_bars=100)
+    mapped = read_frame(write_frame(source, tmp_path / "bars.feather"))
+    frozen = freeze_frame(mapped)
+    assert np.shares_memory(frozen["close"].to_numpy(), mapped["close"].to_numpy())
+    assert not frozen["close"].to_numpy().flags.writeable
+
+    # Writable in-memory frames are copied: the caller keeps its own array
+    frozen = freeze_frame(source)
+    assert not np.shares_memory(frozen["close"].to_numpy(), source["close"].to_numpy())
+    assert not frozen["close"].to_numpy().flags.writeable
+
+
+def test_failed_load_releases_its_window_lock():
+    def loader(symbol, timeframe, start, end):
+        raise RuntimeError("no data")
+
+    registry = DatasetRegistry(loader, max_bytes=10 ** 9)
+    with pytest.raises(RuntimeError):
+        registry.get("BAD", "5m", "s", "e")
+    assert registry._key_locks == {}
@@ -0,0 +1,121 @@
+"""Tests for streaming batch evaluation (iter_evaluations and POST /api/evaluate/batch)."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import threading
+import time
+
+import pytest
+
+import config
+from backend_api.jobs import JobRunner
+from cancellation import CancelToken, Cancelled
+from validation.evaluation import evaluate_many, iter_evaluations
+from tests.test_phase3_integration import make_simple_strategy, make_test_data_with_timestamp_column
+
+FAST = {"k_windows": 2, "n_jitter": 2}
+
+
+def make_strategies(n):
+    strategies = []
+    for i in range(n):
+        strategy = make_simple_strategy()
+        strategy.graph_id = f"batch_{i}"
+        strategies.append(strategy)
+    return strategies
+
+
+def test_pool_results_match_serial_evaluation():
+    data = make_test_data_with_timestamp_column(n_bars=400)
+    strategies = make_strategies(3)
+
+    # No jitter: parameter jitter draws are unseeded
+    params = {**FAST, "n_jitter": 0}
+    yielded = list(iter_evaluations(strategies, data, n_workers=2, **params))
+    serial = {r.graph_id: r for r in evaluate_many(strategies, data, verbose=False, **params)}
+
+    assert sorted(index for index, _, _ in yielded) == [0, 1, 2]
+    for index, result, seconds in yielded:
+        assert result.graph_id == strategies[index].graph_id
+        assert result.fitness == serial[result.graph_id].fitness
+        assert result.decision == serial[result.graph_id].decision
+        assert seconds > 0
+
+
+def test_failed_strategy_is_yielded_as_kill():
+    data = make_test_data_with_timestamp_column(n_bars=400)
+    broken = make_simple_strategy()
+    broken.graph_id = "broken"
+    broken.nodes = [node for node in broken.nodes if node.id != "sma_fast"]
+
+    [(index, result, _)] = iter_evaluations([broken], data, **FAST)
+    assert index == 0
+    assert result.decision == "kill"
+    assert result.kill_reason[0] == "catastrophic_failure"
+
+
+def test_cancelled_token_stops_the_pool():
+    data = make_test_data_with_timestamp_column(n_bars=400)
+    token = CancelToken()
+    results = iter_evaluations(make_strategies(4), data, n_workers=2, token=token, **FAST)
+    next(results)
+    token.cancel()
+    with pytest.raises(Cancelled):
+        list(results)
+
+
+def test_cancel_stops_in_flight_pool_evaluations(monkeypatch):
+    import validation.evaluation as evaluation
+
+    def slow_evaluation(strategy, data, token=None, **params):
+        (token or CancelToken()).sleep(30)  # a long evaluation that checks its token
+
+    monkeypatch.setattr(evaluation, "evaluate_strategy", slow_evaluation)  # inherited by forked workers
+    data = make_test_data_with_timestamp_column(n_bars=100)
+    token = CancelToken()
+    threading.Timer(0.5, token.cancel).start()
+
+    started = time.monotonic()
+    with pytest.raises(Cancelled):
+        list(iter_evaluations(make_strategies(2), data, n_workers=2, token=token))
+    assert time.monotonic() - started < 10
+
+
+def test_batch_endpoint_streams_results(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import backend_api.main as main
+
+    # Read by the spawned job worker when it imports config
+    monkeypatch.setenv("MARKET_DATA_PROVIDER", "synthetic")
+    monkeypatch.setenv("EVAL_BATCH_WORKERS", "2")
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    test_runner = JobRunner(max_workers=1, max_queued=1, on_event=main._on_job_update)
+    monkeypatch.setattr(main, "job_runner", test_runner)
+    client = TestClient(main.app)
+
+    try:
+        request = {
+            "graphs": [strategy.model_dump(mode="json") for strategy in make_strategies(3)],
+            "data": {"symbol": "SPY", "timeframe": "5m", "start_date": "2024-01-02", "end_date": "2024-01-31"},
+            "evaluation": FAST,
+        }
+        response = client.post("/api/evaluate/batch", json=request)
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+
+        evaluations = [line for line in lines if line["type"] == "evaluation"]
+        assert sorted(line["index"] for line in evaluations) == [0, 1, 2]
+        assert all(line["seconds"] > 0 for line in evaluations)
+        assert {line["result"]["graph_id"] for line in evaluations} == {"batch_0", "batch_1", "batch_2"}
+
+        final = lines[-1]
+        assert final["type"] == "batch_finished"
+        assert final["evaluated"] == 3
+        assert client.get(f"/api/jobs/{final['batch_id']}").json()["status"] == "completed"
+
+        assert client.post("/api/evaluate/batch", json={**request, "graphs": []}).status_code == 400
+    finally:
+        test_runner.shutdown(timeout=1)
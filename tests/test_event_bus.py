@@ -0,0 +1,92 @@
+"""Tests for push-based run event delivery over SSE."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncio
+import json
+import threading
+import time
+
+import config
+from backend_api.events import EventBus
+from backend_api.jobs import COMPLETED, RUNNING, Job
+
+
+def test_publish_from_another_thread_wakes_subscriber():
+    bus = EventBus()
+
+    async def scenario():
+        with bus.subscribe("run") as subscription:
+            assert bus.subscriber_count("run") == 1
+            sent = time.monotonic()
+            threading.Thread(target=bus.publish, args=("run", {"type": "log"}, 0)).start()
+            seq, event = await subscription.get(timeout=5)
+            return seq, event, time.monotonic() - sent
+
+    seq, event, latency = asyncio.run(scenario())
+    assert (seq, event) == (0, {"type": "log"})
+    assert latency < 0.1
+    assert bus.subscriber_count() == 0
+
+
+def test_slow_subscriber_is_dropped():
+    bus = EventBus(max_queue=3)
+
+    async def scenario():
+        with bus.subscribe("run") as subscription:
+            for i in range(5):
+                bus.publish("run", {"i": i}, i)
+            await asyncio.sleep(0)
+            items = [await subscription.get(timeout=1) for _ in range(3)]
+            return items, subscription.dropped
+
+    items, dropped = asyncio.run(scenario())
+    assert dropped
+    assert items[:2] == [(1, {"i": 1}), (2, {"i": 2})]
+    assert items[2] is None
+
+
+def read_sse(body):
+    return [json.loads(line[len("data: "):]) for line in body.splitlines() if line.startswith("data: ")]
+
+
+def test_sse_stream_pushes_events_and_closes_when_finished(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import backend_api.main as main
+
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    monkeypatch.setattr(config, "SSE_HEARTBEAT_SECONDS", 0.05)
+    job = Job(job_id="sse_run", target="x:y", kwargs={}, status=RUNNING)
+    main._on_job_update(job, None)
+    main._on_job_update(job, {"type": "log", "message": "before connect"})
+
+    def drive():
+        while main.event_bus.subscriber_count("sse_run") == 0:
+            time.sleep(0.01)
+        time.sleep(0.2)  # idle: heartbeats only
+        for i in range(3):
+            main._on_job_update(job, {"type": "log", "message": f"live {i}"})
+        job.progress = {"evals_completed": 3}
+        main._on_job_update(job, None)
+        job.status, job.result = COMPLETED, {"best_fitness": 1.5, "total_evaluations": 3}
+        main._on_job_update(job, None)
+
+    driver = threading.Thread(target=drive)
+    driver.start()
+    started = time.monotonic()
+    response = TestClient(main.app).get("/api/run/sse_run/events")
+    elapsed = time.monotonic() - started
+    driver.join()
+
+    events = read_sse(response.text)
+    messages = [event["message"] for event in events if event["type"] == "log"]
+    assert messages == ["before connect", "live 0", "live 1", "live 2"]
+    statuses = [event for event in events if event["type"] == "status"]
+    assert [event["status"] for event in statuses] == [RUNNING, RUNNING, COMPLETED]
+    assert statuses[1]["progress"] == {"evals_completed": 3}
+    assert events[-1] == {**events[-1], "type": "run_finished", "best_fitness": 1.5}
+    assert ": keep-alive" in response.text
+    assert elapsed < 1.0
+    assert main.event_bus.subscriber_count("sse_run") == 0
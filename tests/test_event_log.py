@@ -0,0 +1,87 @@
+"""Tests for the persisted per-run event log and SSE resume."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+
+import config
+from backend_api.event_log import RunEventLog, parse_last_event_id
+from backend_api.jobs import COMPLETED, RUNNING, Job
+
+
+def test_ring_is_bounded_and_older_events_come_from_disk(tmp_path):
+    log = RunEventLog(tmp_path / "events.jsonl", ring_size=10)
+    ids = [log.append({"type": "log", "n": i}) for i in range(100)]
+
+    assert ids == list(range(1, 101))
+    assert len(log._ring) == 10
+    assert [event_id for event_id, _ in log.since(95)] == [96, 97, 98, 99, 100]
+    replayed = list(log.since(0))
+    assert [event["n"] for _, event in replayed] == list(range(100))
+    assert list(log.since(100)) == []
+
+
+def test_reopened_log_continues_numbering(tmp_path):
+    path = tmp_path / "events.jsonl"
+    log = RunEventLog(path, ring_size=5)
+    for i in range(7):
+        log.append({"n": i})
+    log.close()
+
+    reopened = RunEventLog(path, ring_size=5)
+    assert reopened.last_id == 7
+    assert [event["n"] for _, event in reopened.since(4)] == [4, 5, 6]
+    assert reopened.append({"n": 7}) == 8
+    assert len(path.read_text().splitlines()) == 8
+
+
+def test_parse_last_event_id():
+    assert parse_last_event_id("42") == 42
+    assert parse_last_event_id(None) == 0
+    assert parse_last_event_id("garbage") == 0
+
+
+def read_sse(body):
+    """(id, event) pairs from an SSE body (id is None for unlogged events)."""
+    messages = []
+    for block in body.split("\n\n"):
+        event_id, data = None, None
+        for line in block.splitlines():
+            if line.startswith("id: "):
+                event_id = int(line[len("id: "):])
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: "):])
+        if data is not None:
+            messages.append((event_id, data))
+    return messages
+
+
+def test_sse_resumes_from_last_event_id(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import backend_api.main as main
+
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    job = Job(job_id="resume_run", target="x:y", kwargs={}, status=RUNNING)
+    main._on_job_update(job, None)
+    for i in range(6):
+        main._on_job_update(job, {"type": "log", "message": f"event {i}"})
+    job.status, job.result = COMPLETED, {"best_fitness": 0.5, "total_evaluations": 6}
+    main._on_job_update(job, None)
+    client = TestClient(main.app)
+
+    full = read_sse(client.get("/api/run/resume_run/events").text)
+    assert [event_id for event_id, _ in full if event_id is not None] == [1, 2, 3, 4, 5, 6]
+
+    resumed = read_sse(client.get("/api/run/resume_run/events", headers={"Last-Event-ID": "4"}).text)
+    assert [(event_id, event["message"]) for event_id, event in resumed if event_id] == [(5, "event 4"), (6, "event 5")]
+    assert resumed[-1][1]["type"] == "run_finished"
+
+    # After a restart the run is no longer in memory; its log is replayed from
+    # disk and its final state comes from the state store
+    monkeypatch.delitem(main.running_jobs, "resume_run")
+    replayed = read_sse(client.get("/api/run/resume_run/events", params={"last_event_id": "1"}).text)
+    assert [event_id for event_id, _ in replayed if event_id is not None] == [2, 3, 4, 5, 6]
+    assert [event["type"] for _, event in replayed[-2:]] == ["status", "run_finished"]
+    assert client.get("/api/run/never_ran/events").status_code == 404
@@ -0,0 +1,193 @@
+"""Tests for the process-pool job runner behind the run API."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import config
+from backend_api.jobs import CANCELLED, COMPLETED, FAILED, QUEUED, RUNNING, JobRunner, QueueFull
+
+
+# Job targets (imported by module path in the worker processes)
+
+def steps_job(channel, value, steps=3):
+    for i in range(steps):
+        channel.progress(step=i + 1)
+        channel.emit("log", {"message": f"step {i}"})
+    channel.worker_info(last_value=value)
+    return {"value": value, "pid": os.getpid()}
+
+
+def failing_job(channel):
+    raise ValueError("boom")
+
+
+def sleeping_job(channel, seconds):
+    channel.emit("log", {"message": "sleeping"})
+    time.sleep(seconds)
+    return seconds
+
+
+def crashing_job(channel):
+    os._exit(3)
+
+
+def pool_job(channel):
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        channel.emit("log", {"message": "pool", "pid": pool.submit(os.getpid).result()})
+        pool.submit(time.sleep, 60).result()
+
+
+def process_alive(pid):
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except FileNotFoundError:
+        return False
+    return stat.rsplit(")", 1)[1].split()[0] != "Z"  # zombies have exited
+
+
+@pytest.fixture
+def runner():
+    events = []
+    runner = JobRunner(max_workers=1, max_queued=1, on_event=lambda job, event: events.append((job.job_id, event)))
+    runner.events = events
+    yield runner
+    runner.shutdown(timeout=1)
+
+
+def wait_for(predicate, timeout=20):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.02)
+
+
+def test_job_reports_events_progress_and_result(runner):
+    runner.submit("a", "tests.test_job_runner:steps_job", value=42)
+    job = runner.wait("a", timeout=30)
+
+    assert job.status == COMPLETED
+    assert job.result["value"] == 42
+    assert job.result["pid"] != os.getpid()
+    assert job.progress == {"step": 3}
+    messages = [event["message"] for job_id, event in runner.events if event is not None]
+    assert messages == ["step 0", "step 1", "step 2"]
+    assert runner.stats()["workers"][0]["last_value"] == 42
+
+
+def test_failed_job_leaves_worker_usable(runner):
+    runner.submit("bad", "tests.test_job_runner:failing_job")
+    assert runner.wait("bad", timeout=30).status == FAILED
+    assert runner.get("bad").error == "boom"
+
+    runner.submit("good", "tests.test_job_runner:steps_job", value=1, steps=1)
+    assert runner.wait("good", timeout=30).status == COMPLETED
+    assert runner.stats()["workers"][0]["jobs_run"] == 2
+
+
+def test_admission_control_and_cancellation(runner):
+    running = runner.submit("long", "tests.test_job_runner:sleeping_job", seconds=60)
+    queued = runner.submit("next", "tests.test_job_runner:steps_job", value=2)
+    assert running.status == RUNNING
+    assert queued.status == QUEUED
+    assert runner.queue_position("next") == 0
+
+    with pytest.raises(QueueFull):
+        runner.submit("overflow", "tests.test_job_runner:steps_job", value=3)
+
+    wait_for(lambda: any(event and event["message"] == "sleeping" for _, event in runner.events))
+    old_pid = runner.stats()["workers"][0]["pid"]
+    assert runner.cancel("long").status == CANCELLED
+
+    # The queued job runs on the replacement worker
+    assert runner.wait("next", timeout=30).status == COMPLETED
+    assert runner.get("next").result["pid"] != old_pid
+    assert runner.get("long").status == CANCELLED
+
+
+def test_cancel_queued_job(runner):
+    runner.submit("long", "tests.test_job_runner:sleeping_job", seconds=60)
+    runner.submit("waiting", "tests.test_job_runner:steps_job", value=1)
+    assert runner.cancel("waiting").status == CANCELLED
+    assert runner.queue_position("waiting") is None
+    runner.submit("again", "tests.test_job_runner:steps_job", value=1)  # the slot is free again
+
+
+def test_crashed_worker_fails_job_and_is_replaced(runner):
+    runner.submit("crash", "tests.test_job_runner:crashing_job")
+    job = runner.wait("crash", timeout=30)
+    assert job.status == FAILED
+    assert "exit code 3" in job.error
+
+    runner.submit("after", "tests.test_job_runner:steps_job", value=5, steps=1)
+    assert runner.wait("after", timeout=30).status == COMPLETED
+
+
+@pytest.mark.skipif(not Path("/proc").exists(), reason="needs /proc")
+def test_hard_cancel_stops_processes_started_by_the_job(runner):
+    runner.submit("pool", "tests.test_job_runner:pool_job")
+    wait_for(lambda: any(event and event["message"] == "pool" for _, event in runner.events))
+    [pool_pid] = [event["pid"] for _, event in runner.events if event and event["message"] == "pool"]
+    assert process_alive(pool_pid)
+
+    assert runner.cancel("pool").status == CANCELLED
+    wait_for(lambda: not process_alive(pool_pid), timeout=10)
+
+
+def test_only_recent_finished_jobs_are_kept():
+    runner = JobRunner(max_workers=1, max_queued=1, max_finished=2)
+    try:
+        for job_id in ("a", "b", "c"):
+            runner.submit(job_id, "tests.test_job_runner:steps_job", value=1, steps=1)
+            assert runner.wait(job_id, timeout=30).status == COMPLETED
+
+        assert [job.job_id for job in runner.jobs()] == ["b", "c"]
+        assert runner.get("a") is None
+
+        # A resubmitted job replaces its old record, which no longer counts
+        runner.submit("b", "tests.test_job_runner:steps_job", value=2, steps=1)
+        assert runner.wait("b", timeout=30).result["value"] == 2
+        assert sorted(job.job_id for job in runner.jobs()) == ["b", "c"]
+    finally:
+        runner.shutdown(timeout=1)
+
+
+def test_run_api_uses_job_runner(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import backend_api.main as main
+
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    test_runner = JobRunner(max_workers=1, max_queued=0, on_event=main._on_job_update)
+    monkeypatch.setattr(main, "job_runner", test_runner)
+    client = TestClient(app=main.app)
+
+    try:
+        test_runner.submit("blocker", "tests.test_job_runner:sleeping_job", seconds=60)
+        assert client.get("/api/health").json()["status"] == "ok"
+
+        request = {
+            "nl_text": "Buy when the fast SMA crosses above the slow SMA",
+            "universe_symbols": ["SPY"],
+            "timeframe": "1D",
+            "start_date": "2024-01-01",
+            "end_date": "2024-06-30",
+        }
+        assert client.post("/api/run", json=request).status_code == 503  # pool busy, no queue
+
+        assert client.get("/api/jobs/blocker").json()["status"] == RUNNING
+        assert client.post("/api/jobs/blocker/cancel").json()["status"] == CANCELLED
+        assert client.get("/api/jobs/nope").status_code == 404
+
+        jobs = client.get("/api/jobs").json()
+        assert [job["job_id"] for job in jobs["jobs"]] == ["blocker"]
+        assert jobs["pool"]["max_workers"] == 1
+        *_, (_, last_event) = main.running_jobs["blocker"]["events"].since(0)
+        assert last_event["type"] == "run_cancelled"
+    finally:
+        test_runner.shutdown(timeout=1)
@@ -258,13 +258,17 @@ class TestPhase3ReportStorage:
                 )
                 storage.save_phase3_report(result)
 
-                report_path = storage.run_dir / "phase3_reports" / "graph_abc.json"
-                assert report_path.exists()
-
-                with open(report_path) as f:
-                    loaded = json.load(f)
+                from evolution.storage import RunReader
+                loaded = RunReader(storage.run_dir).load_phase3_report("graph_abc")
+                assert loaded is not None
                 assert loaded["graph_id"] == "graph_abc"
                 assert loaded["phase3"]["aggregated_fitness"] == 0.5
+
+                # JSON-file layout is still available as an export
+                storage.export_json()
+                report_path = storage.run_dir / "phase3_reports" / "graph_abc.json"
+                with open(report_path) as f:
+                    assert json.load(f) == loaded
             finally:
                 cfg.RESULTS_DIR = original
 
@@ -288,8 +292,8 @@ class TestPhase3ReportStorage:
                 )
                 storage.save_phase3_report(result)
 
-                report_path = storage.run_dir / "phase3_reports" / "graph_xyz.json"
-                assert not report_path.exists()
+                from evolution.storage import RunReader
+                assert RunReader(storage.run_dir).load_phase3_report("graph_xyz") is None
             finally:
                 cfg.RESULTS_DIR = original
 
@@ -0,0 +1,111 @@
+"""Tests for the materialized playback document and its API."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+
+import config
+from evolution.playback import assemble_playback
+from evolution.storage import RunReader, RunStorage, export_run_json
+from tests.test_run_storage import make_result, write_small_run
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def client(results_dir):
+    from backend_api.main import app
+    return TestClient(app)
+
+
+def test_entries_are_materialized_as_evaluations_land(results_dir):
+    storage, adam = write_small_run("materialized")
+    reader = RunReader(storage.run_dir)
+
+    entries = {entry["id"]: entry for _, entry in reader.playback_entries()}
+    assert set(entries) == {adam.graph_id, "child_0", "child_1"}
+    assert entries["child_1"]["state"] == "dead"
+    assert entries["child_0"]["results"]["fitness"] == 0.6
+    assert entries["child_0"]["graph"]["metadata"]["parent_graph"] == adam.graph_id
+    assert reader.champion_id() == "child_0"
+
+    # Re-evaluating a strategy rewrites its entry under a new seq
+    version = reader.playback_version()
+    storage.save_evaluation(make_result("child_1", 0.9))
+    written = reader.playback_entries(after=version)
+    assert [entry["id"] for _, entry in written] == ["child_1"]
+    assert written[0][0] > version
+    assert reader.champion_id() == "child_1"
+
+
+def test_stored_entries_match_legacy_reconstruction(results_dir, tmp_path):
+    storage, _ = write_small_run("legacy_match")
+    reader = RunReader(storage.run_dir)
+    legacy = RunReader(export_run_json(storage.run_dir, tmp_path / "export"))
+
+    def document(r):
+        return assemble_playback("run", [entry for _, entry in r.playback_entries()])
+
+    assert document(legacy) == document(reader)
+    assert legacy.champion_id() == reader.champion_id()
+
+
+def test_existing_runs_are_backfilled(results_dir):
+    storage, _ = write_small_run("backfill")
+    storage.close()
+    conn = sqlite3.connect(storage.db_path)
+    with conn:
+        conn.execute("DELETE FROM playback")
+        conn.execute("DELETE FROM lineage_nodes")
+    conn.close()
+
+    reopened = RunStorage(run_id="backfill")
+    reader = RunReader(reopened.run_dir)
+    assert len(reader.playback_entries()) == 3
+    assert reader.lineage_graph() == reader._scan_lineage_graph()
+
+
+def test_playback_etag_and_delta(client):
+    storage, adam = write_small_run("etag_run")
+
+    response = client.get("/api/runs/etag_run/playback")
+    etag = response.headers["etag"]
+    assert response.json()["stats"]["total_strategies"] == 3
+    assert client.get("/api/runs/etag_run/playback", headers={"If-None-Match": etag}).status_code == 304
+
+    delta = client.get("/api/runs/etag_run/playback/delta").json()
+    assert len(delta["strategies"]) == 3
+    assert delta["champion_id"] == "child_0"
+    cursor = delta["cursor"]
+    assert client.get(f"/api/runs/etag_run/playback/delta?cursor={cursor}").json()["strategies"] == []
+
+    # A new evaluation changes the ETag and shows up in the next delta only
+    child = adam.model_copy(deep=True)
+    child.graph_id = "child_2"
+    child.metadata = {"generation": 2, "parent_graph": "child_0"}
+    storage.save_graph(child)
+    storage.save_evaluation(make_result("child_2", 1.5))
+
+    delta = client.get(f"/api/runs/etag_run/playback/delta?cursor={cursor}").json()
+    assert [entry["id"] for entry in delta["strategies"]] == ["child_2"]
+    assert delta["champion_id"] == "child_2"
+
+    response = client.get("/api/runs/etag_run/playback", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    playback = response.json()
+    assert playback["champion"]["id"] == "child_2"
+    assert playback["champion"]["state"] == "elite"
+    assert len(playback["generations"]) == 3
+    assert playback["stats"]["total_strategies"] == 4
+
+    assert client.get("/api/runs/missing/playback/delta").status_code == 404
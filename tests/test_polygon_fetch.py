@@ -0,0 +1,166 @@
+"""Tests for concurrent Polygon fetching against a local replay server."""
+
+import sys
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+import pytest
+
+from data.polygon_client import PolygonClient, RateLimiter
+
+FIXTURE = Path(__file__).parent / "fixtures" / "polygon_aggs_replay.json"
+POLYGON_ORIGIN = "https://api.polygon.io"
+
+
+class ReplayServer:
+    """Serves recorded Polygon responses keyed by path (+ cursor)."""
+
+    def __init__(self, responses, delay=0.0, fail_first=None):
+        self.responses = responses
+        self.delay = delay
+        self.fail_first = dict(fail_first or {})  # request key -> [status, ...]
+        self.requests = []
+        self.connections = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                replay._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.origin = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handle(self, handler):
+        url = urlsplit(handler.path)
+        query = dict(parse_qsl(url.query))
+        key = url.path + (f"?{urlencode({'cursor': query['cursor']})}" if "cursor" in query else "")
+
+        with self.lock:
+            self.requests.append(key)
+            self.connections.add(handler.client_address)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            failures = self.fail_first.get(key)
+            status = failures.pop(0) if failures else 200
+        try:
+            time.sleep(self.delay)
+            if status == 200 and key not in self.responses:
+                status = 404
+            if status == 200:
+                body = json.dumps(self.responses[key]).replace(POLYGON_ORIGIN, self.origin)
+            else:
+                body = json.dumps({"status": "ERROR", "error": f"status {status}"})
+            payload = body.encode()
+            handler.send_response(status)
+            handler.send_header("Content-Type", "application/json")
+            handler.send_header("Content-Length", str(len(payload)))
+            if status == 429:
+                handler.send_header("Retry-After", "0")
+            handler.end_headers()
+            handler.wfile.write(payload)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def responses():
+    return json.loads(FIXTURE.read_text())
+
+
+def make_client(server, tmp_path, **kwargs):
+    return PolygonClient(
+        api_key="test-key",
+        base_url=f"{server.origin}/v2/aggs/ticker",
+        cache_dir=tmp_path,
+        backoff_seconds=0.0,
+        **kwargs,
+    )
+
+
+def test_pagination_and_cache(responses, tmp_path):
+    with ReplayServer(responses) as server:
+        client = make_client(server, tmp_path)
+        df = client.get_bars("AAPL", "5m", "2024-01-02", "2024-01-02")
+        assert len(df) == 7  # 4 + 3 across two pages
+        assert df["timestamp"].is_monotonic_increasing
+        assert list(df.columns) == ["timestamp", "open", "high", "low", "close", "volume"]
+        assert len(server.requests) == 2
+
+        cached = client.get_bars("AAPL", "5m", "2024-01-02", "2024-01-02")
+        pd.testing.assert_frame_equal(cached, df)
+        assert len(server.requests) == 2
+
+
+def test_get_bars_many_runs_concurrently_on_pooled_session(responses, tmp_path):
+    symbols = ["AAPL", "MSFT", "NOPE", "MISSING"]
+    seen = {}
+    with ReplayServer(responses, delay=0.05) as server:
+        client = make_client(server, tmp_path, max_workers=4)
+        result = client.get_bars_many(
+            symbols, "5m", "2024-01-02", "2024-01-02",
+            on_symbol=lambda symbol, df, error: seen.setdefault(symbol, error),
+        )
+
+    assert list(result) == ["AAPL", "MSFT", "NOPE"]
+    assert len(result["AAPL"]) == 7 and len(result["MSFT"]) == 5 and result["NOPE"].empty
+    assert seen["MISSING"] is not None  # 404 surfaces per symbol
+    assert server.max_in_flight > 1
+    # Keep-alive pool: no more connections than worker threads
+    assert len(server.connections) <= 4
+
+
+def test_retries_on_429_and_5xx(responses, tmp_path):
+    key = "/v2/aggs/ticker/MSFT/range/5/minute/2024-01-02/2024-01-02"
+    with ReplayServer(responses, fail_first={key: [429, 503]}) as server:
+        client = make_client(server, tmp_path)
+        df = client.get_bars("MSFT", "5m", "2024-01-02", "2024-01-02")
+
+    assert len(df) == 5
+    assert server.requests == [key, key, key]
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(max_per_second=50)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+def test_pages_decode_to_typed_columns(responses, tmp_path):
+    with ReplayServer(responses) as server:
+        client = make_client(server, tmp_path)
+        pages = list(client._fetch_pages("AAPL", "5m", "2024-01-02", "2024-01-02"))
+
+    assert [len(page) for page in pages] == [4, 3]
+    page = pages[0]
+    assert str(page["timestamp"].dtype) == "datetime64[ns, UTC]"
+    assert all(page[col].dtype == "float64" for col in ["open", "high", "low", "close", "volume"])
+    first = responses["/v2/aggs/ticker/AAPL/range/5/minute/2024-01-02/2024-01-02"]["results"][0]
+    assert page["timestamp"].iloc[0] == pd.Timestamp(first["t"], unit="ms", tz="UTC")
+    assert page["close"].iloc[0] == first["c"]
@@ -0,0 +1,141 @@
+"""Tests for local timeframe resampling and the robust timeframe sweep."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.resample import BarResampler, resample_bars, timeframe_minutes
+from graph.schema import TimeframeSpec
+from validation.robust_eval import evaluate_strategy_robust
+from tests.test_phase3_integration import make_simple_strategy
+
+
+def make_session_bars(n_days=3, seed=0):
+    """Regular-session 5m bars (09:30-16:00 ET) stored with UTC timestamps."""
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range("2024-03-04", periods=n_days)
+    stamps = [
+        pd.date_range(f"{day.date()} 09:30", periods=78, freq="5min", tz="America/New_York")
+        for day in days
+    ]
+    ts = stamps[0].append(stamps[1:]).tz_convert("UTC")
+    close = 100.0 + np.cumsum(rng.normal(0, 0.2, len(ts)))
+    return pd.DataFrame({
+        "timestamp": ts,
+        "open": close + rng.normal(0, 0.05, len(ts)),
+        "high": close + 0.3,
+        "low": close - 0.3,
+        "close": close,
+        "volume": rng.integers(100, 1000, len(ts)).astype(float),
+    })
+
+
+def test_timeframe_minutes():
+    assert timeframe_minutes("5m") == 5
+    assert timeframe_minutes("1h") == 60
+    assert timeframe_minutes("1d") == 1440
+    with pytest.raises(ValueError):
+        timeframe_minutes("5x")
+
+
+def test_ohlcv_aggregation_semantics():
+    df = make_session_bars(n_days=1)
+    bars = resample_bars(df, "15m")
+
+    assert len(bars) == 26
+    first = df.iloc[:3]
+    assert bars["open"].iloc[0] == first["open"].iloc[0]
+    assert bars["high"].iloc[0] == first["high"].max()
+    assert bars["low"].iloc[0] == first["low"].min()
+    assert bars["close"].iloc[0] == first["close"].iloc[-1]
+    assert bars["volume"].iloc[0] == first["volume"].sum()
+    assert bars["volume"].sum() == df["volume"].sum()
+
+
+def test_hourly_bars_align_to_session_open():
+    df = make_session_bars(n_days=2)
+    bars = resample_bars(df, "1h")
+    local = pd.DatetimeIndex(bars["timestamp"]).tz_convert("America/New_York")
+
+    assert (local.minute == 30).all()
+    assert len(bars) == 14  # 6 full hours + 15:30-16:00 per day
+
+
+def test_daily_bars_one_per_session():
+    df = make_session_bars(n_days=3)
+    bars = resample_bars(df, "1d")
+
+    assert len(bars) == 3
+    assert bars["close"].tolist() == df.groupby(df.index // 78)["close"].last().tolist()
+
+
+def test_index_format_and_invalid_target():
+    df = make_session_bars(n_days=1).set_index("timestamp")
+    bars = resample_bars(df, "30m")
+    assert isinstance(bars.index, pd.DatetimeIndex)
+    assert len(bars) == 13
+
+    with pytest.raises(ValueError):
+        resample_bars(df, "7m")
+
+
+@pytest.mark.parametrize("index_format", [False, True], ids=["timestamp_column", "timestamp_index"])
+def test_resampler_memoizes_and_persists(tmp_path, index_format):
+    df = make_session_bars()
+    if index_format:
+        df = df.set_index("timestamp")  # Phase 3 layout
+    resampler = BarResampler(cache_dir=tmp_path)
+
+    first = resampler.get("AAPL", df, "1h")
+    second = resampler.get("AAPL", df, "1h")
+    assert first is second
+    assert (resampler.hits, resampler.misses) == (1, 1)
+
+    # Fresh instance reads the parquet written next to the base data
+    reloaded = BarResampler(cache_dir=tmp_path).get("AAPL", df, "1h")
+    pd.testing.assert_frame_equal(reloaded, first)
+
+
+def test_revised_bars_are_not_served_from_the_parquet_cache(tmp_path):
+    df = make_session_bars()
+    before = BarResampler(cache_dir=tmp_path).get("AAPL", df, "1h")
+
+    revised = df.copy()
+    revised.loc[100, "high"] += 5.0  # mid-series revision; ends unchanged
+    after = BarResampler(cache_dir=tmp_path).get("AAPL", revised, "1h")
+
+    pd.testing.assert_frame_equal(after, resample_bars(revised, "1h"))
+    assert after["high"].max() > before["high"].max()
+
+
+def test_cache_files_stay_in_cache_dir(tmp_path):
+    df = make_session_bars(n_days=1)
+    cache_dir = tmp_path / "cache"
+
+    for symbol in ("BTC/USD", "../ETH"):
+        BarResampler(cache_dir=cache_dir).get(symbol, df, "1h")
+
+    files = list(tmp_path.rglob("*.parquet"))
+    assert len(files) == 2
+    assert all(path.parent == cache_dir for path in files)
+
+
+def test_robust_timeframe_sweep():
+    strategy = make_simple_strategy()
+    strategy.time.timeframe = "5m"
+    data_dict = {"AAA": make_session_bars(n_days=20, seed=1), "BBB": make_session_bars(n_days=20, seed=2)}
+
+    result = evaluate_strategy_robust(
+        strategy, data_dict,
+        timeframes=TimeframeSpec(type="sweep", timeframes=["5m", "15m"]),
+        k_windows=3, n_jitter=0, resampler=BarResampler(),
+    )
+
+    assert set(result.per_symbol_fitness) == {"AAA", "BBB"}
+    assert set(result.per_timeframe_fitness) == {"5m", "15m"}
+    assert result.worst_timeframe in ("5m", "15m")
+    assert result.validation_report["multi_symbol"]["symbols_evaluated"] == 4
@@ -19,7 +19,7 @@ def test_robust_aggregate_penalties(monkeypatch):
     fitness_sequence = [0.5, -0.8, 0.2]
     call_idx = {"count": 0}
 
-    def fake_evaluate(strategy, data, initial_capital=100000.0):
+    def fake_evaluate(strategy, data, initial_capital=100000.0, **kwargs):
         idx = call_idx["count"]
         call_idx["count"] += 1
         return StrategyEvaluationResult(
@@ -0,0 +1,118 @@
+"""Tests for parallel multi-symbol robust evaluation and the frame store."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from data.frame_store import read_frame, write_frame
+from validation.robust_eval import evaluate_strategy_robust, write_symbol_store
+from tests.test_phase3_integration import (
+    make_simple_strategy,
+    make_test_data_with_timestamp_column,
+    make_test_data_with_timestamp_index,
+)
+
+
+def make_universe(n_symbols=3, n_bars=400):
+    dates = pd.date_range("2024-01-01", periods=n_bars, freq="1D")
+    universe = {}
+    for i in range(n_symbols):
+        rng = np.random.default_rng(100 + i)
+        close = 100.0 + np.cumsum(rng.normal(0, 0.5, n_bars))
+        universe[f"SYM{i}"] = pd.DataFrame({
+            "timestamp": dates,
+            "open": close * 0.999,
+            "high": close * 1.002,
+            "low": close * 0.998,
+            "close": close,
+            "volume": 1000,
+        })
+    return universe
+
+
+def test_frame_store_roundtrip_is_zero_copy(tmp_path):
+    df = make_test_data_with_timestamp_column(n_bars=1000)
+    path = write_frame(df, tmp_path / "bars.feather")
+
+    loaded = read_frame(path)
+
+    pd.testing.assert_frame_equal(loaded, df)
+    close = loaded["close"].to_numpy()
+    assert not close.flags.writeable  # view over the mapped file
+
+
+def test_frame_store_preserves_timestamp_index(tmp_path):
+    df = make_test_data_with_timestamp_index(n_bars=200)
+    loaded = read_frame(write_frame(df, tmp_path / "bars.feather"))
+
+    assert isinstance(loaded.index, pd.DatetimeIndex)
+    pd.testing.assert_frame_equal(loaded, df, check_names=False, check_freq=False)
+
+
+def test_parallel_matches_serial(tmp_path):
+    strategy = make_simple_strategy()
+    universe = make_universe()
+    kwargs = dict(k_windows=3, n_jitter=0, worst_symbol_threshold=-100.0)
+
+    serial = evaluate_strategy_robust(strategy, universe, **kwargs)
+    parallel = evaluate_strategy_robust(strategy, universe, n_workers=2, **kwargs)
+    from_store = evaluate_strategy_robust(
+        strategy, write_symbol_store(universe, tmp_path), n_workers=2, **kwargs
+    )
+
+    assert len(set(serial.per_symbol_fitness.values())) > 1
+    for result in (parallel, from_store):
+        assert result.per_symbol_fitness == serial.per_symbol_fitness
+        assert result.median_fitness == serial.median_fitness
+        assert result.decision == serial.decision
+        assert result.validation_report["multi_symbol"]["symbols_cancelled"] == []
+
+
+def test_worst_symbol_kill_cancels_remaining():
+    strategy = make_simple_strategy()
+    universe = make_universe(n_symbols=4)
+    seen = []
+
+    # Threshold above any reachable fitness: the first symbol triggers the kill
+    result = evaluate_strategy_robust(
+        strategy, universe, k_windows=3, n_jitter=0,
+        worst_symbol_threshold=100.0, cancel_on_symbol_kill=True,
+        on_symbol_result=lambda symbol, _: seen.append(symbol),
+    )
+
+    assert seen == ["SYM0"]
+    assert result.decision == "kill"
+    assert "failed_on_symbol" in result.kill_reason
+    assert result.validation_report["multi_symbol"]["symbols_cancelled"] == ["SYM1", "SYM2", "SYM3"]
+
+
+def test_serial_results_keep_trades():
+    strategy = make_simple_strategy()
+    results = {}
+
+    evaluate_strategy_robust(
+        strategy, make_universe(n_symbols=2), k_windows=3, n_jitter=0,
+        on_symbol_result=lambda symbol, result: results.__setitem__(symbol, result),
+    )
+
+    for result in results.values():
+        holdout = result["validation"]["holdout_results"]
+        assert "trades" in holdout and "equity_curve" in holdout
+
+
+def test_symbol_store_accepts_any_symbol(tmp_path):
+    universe = make_universe(n_symbols=2)
+    universe = {"BTC/USD": universe["SYM0"], "../ETH": universe["SYM1"]}
+
+    store = write_symbol_store(universe, tmp_path / "store")
+
+    assert all(path.parent == tmp_path / "store" for path in store.values())
+    pd.testing.assert_frame_equal(read_frame(store["BTC/USD"]), universe["BTC/USD"])
+    result = evaluate_strategy_robust(
+        make_simple_strategy(), universe, k_windows=3, n_jitter=0, n_workers=2,
+        worst_symbol_threshold=-100.0,
+    )
+    assert set(result.per_symbol_fitness) == {"BTC/USD", "../ETH"}
@@ -0,0 +1,108 @@
+"""Tests for the indexed run catalog behind /api/runs."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+
+import pytest
+
+import config
+from evolution.catalog import InvalidCursor, RunCatalog
+from evolution.storage import RunStorage
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    return tmp_path
+
+
+def make_summary(i, status=None):
+    summary = {
+        "run_id": f"run_{i:03d}",
+        "timestamp": f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}",
+        "total_evaluations": 10 + i,
+        "best_fitness": i / 100,
+        "top_strategies": [],
+    }
+    if status:
+        summary["status"] = status
+    return summary
+
+
+def test_cursor_pages_cover_every_run_newest_first(results_dir):
+    catalog = RunCatalog()
+    for i in range(25):
+        catalog.upsert(f"run_{i:03d}", make_summary(i))
+
+    seen, cursor = [], None
+    while True:
+        page = catalog.list(limit=10, cursor=cursor)
+        seen.extend(run["run_id"] for run in page["runs"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [f"run_{i:03d}" for i in reversed(range(25))]
+    with pytest.raises(InvalidCursor):
+        catalog.list(cursor="not-a-cursor")
+
+
+def test_filters_and_field_projection(results_dir):
+    catalog = RunCatalog()
+    for i in range(10):
+        catalog.upsert(f"run_{i:03d}", make_summary(i, status="failed_compile" if i % 3 == 0 else None))
+
+    failed = catalog.list(status="failed_compile")["runs"]
+    assert [run["run_id"] for run in failed] == ["run_009", "run_006", "run_003", "run_000"]
+
+    ranged = catalog.list(min_fitness=0.02, max_fitness=0.05, fields=["best_fitness"])["runs"]
+    assert [run["run_id"] for run in ranged] == ["run_005", "run_004", "run_003", "run_002"]
+    assert ranged[0]["summary"] == {"best_fitness": 0.05}
+
+
+def test_save_summary_updates_catalog_and_backfill_finds_legacy_runs(results_dir):
+    storage = RunStorage(run_id="stored")
+    storage.save_summary([], {}, [], total_evals=4, extra={"best_fitness": 0.7})
+    storage.close()
+
+    legacy_dir = results_dir / "runs" / "legacy"
+    legacy_dir.mkdir(parents=True)
+    (legacy_dir / "summary.json").write_text(json.dumps({
+        "run_id": "legacy", "total_evaluations": 2,
+        "top_strategies": [{"graph_id": "a", "fitness": 0.3}, {"graph_id": "b", "fitness": 0.9}],
+    }))
+
+    catalog = RunCatalog()
+    assert catalog.get("stored")["best_fitness"] == 0.7
+    assert catalog.backfill(results_dir / "runs") == 1
+    assert catalog.backfill(results_dir / "runs") == 0
+    assert [run["run_id"] for run in catalog.list(min_fitness=0.8)["runs"]] == ["legacy"]
+
+
+def test_list_runs_endpoint(results_dir):
+    from fastapi.testclient import TestClient
+    from backend_api.main import app
+
+    for i in range(3):
+        storage = RunStorage(run_id=f"api_run_{i}")
+        storage.save_summary([], {}, [], total_evals=i, extra={"best_fitness": i / 10})
+        storage.close()
+
+    client = TestClient(app)
+    first = client.get("/api/runs", params={"limit": 2, "fields": "best_fitness,total_evaluations"}).json()
+    assert len(first["runs"]) == 2
+    assert set(first["runs"][0]["summary"]) == {"best_fitness", "total_evaluations"}
+
+    listed, page = [], first
+    while True:
+        listed.extend(run["run_id"] for run in page["runs"])
+        if page["next_cursor"] is None:
+            break
+        page = client.get("/api/runs", params={"limit": 2, "cursor": page["next_cursor"]}).json()
+    assert {"api_run_0", "api_run_1", "api_run_2"} <= set(listed)
+    assert len(listed) == len(set(listed))
+
+    assert client.get("/api/runs", params={"cursor": "???"}).status_code == 400
@@ -0,0 +1,208 @@
+"""Tests for the consolidated per-run SQLite store and its JSON export."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import random
+
+import pytest
+
+import config
+from evolution.patches import PatchOp, PatchSet
+from evolution.storage import RunReader, RunStorage, export_run_json
+from validation.evaluation import StrategyEvaluationResult
+from tests.test_phase3_integration import make_simple_strategy
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    return tmp_path
+
+
+def make_result(graph_id, fitness, decision="survive", phase3=True):
+    report = {
+        "timestamp": "2024-01-01T00:00:00",
+        "train_metrics": {"return_pct": 0.05, "trades": 12},
+        "holdout_metrics": {"return_pct": 0.02, "trades": 4},
+        "jitter_results": [{"fitness": fitness - 0.01 * i} for i in range(10)],
+    }
+    if phase3:
+        report["phase3"] = {
+            "aggregated_fitness": fitness,
+            "median_fitness": fitness,
+            "explanation": {"reasons": []},
+            "episodes": [
+                {"label": f"ep_{i}", "start_ts": "2024-01-01T00:00:00", "end_ts": "2024-03-01T00:00:00",
+                 "fitness": fitness + i, "decision": "survive", "tags": {"trend": "bull"}}
+                for i in range(3)
+            ],
+        }
+    return StrategyEvaluationResult(
+        graph_id=graph_id,
+        strategy_name=f"Strategy {graph_id}",
+        validation_report=report,
+        fitness=fitness,
+        decision=decision,
+        kill_reason=[] if decision != "kill" else ["negative_fitness"],
+    )
+
+
+def write_small_run(run_id="store_run"):
+    """Adam plus two children with lineage, like run_darwin stores them."""
+    storage = RunStorage(run_id=run_id)
+    adam = make_simple_strategy()
+    storage.save_graph(adam)
+    storage.save_evaluation(make_result(adam.graph_id, 0.4))
+
+    for i, fitness in enumerate((0.6, -0.2)):
+        child = adam.model_copy(deep=True)
+        child.graph_id = f"child_{i}"
+        child.metadata = {"generation": 1, "parent_graph": adam.graph_id}
+        patch = PatchSet(
+            patch_id=f"patch_{i}",
+            parent_graph_id=adam.graph_id,
+            description="tweak",
+            ops=[PatchOp(op_type="modify_param", node_id="sma_fast", param_name="period", param_value=5 + i)],
+        )
+        with storage.batch():
+            storage.save_graph(child)
+            storage.save_patch(patch)
+        with storage.batch():
+            storage.save_evaluation(make_result(child.graph_id, fitness, "survive" if fitness > 0 else "kill"))
+            storage.append_lineage(adam.graph_id, child.graph_id, patch.patch_id, depth=1, fitness=fitness)
+
+    storage.save_summary([], {}, [], total_evals=3)
+    return storage, adam
+
+
+def test_run_directory_is_a_handful_of_files(results_dir):
+    storage, _ = write_small_run()
+    storage.close()
+
+    names = {path.name for path in storage.run_dir.iterdir()}
+    assert names <= {"run.db", "run.db-wal", "run.db-shm", "summary.json"}
+    assert not any(path.is_dir() for path in storage.run_dir.iterdir())
+
+
+def test_reader_round_trips_artifacts(results_dir):
+    storage, adam = write_small_run()
+    reader = RunReader(storage.run_dir)
+
+    assert reader.graph_ids() == sorted([adam.graph_id, "child_0", "child_1"])
+    assert reader.load_graph("child_0")["metadata"]["parent_graph"] == adam.graph_id
+    assert reader.load_patch("patch_1")["ops"][0]["param_value"] == 6
+
+    expected = make_result("child_1", -0.2, "kill").to_dict()
+    assert reader.load_evaluation("child_1") == expected
+    assert reader.load_phase3_report("child_1")["phase3"] == expected["validation_report"]["phase3"]
+    assert reader.load_evaluation("missing") is None
+
+    assert [e["child_id"] for e in reader.lineage()] == ["child_0", "child_1"]
+    assert reader.evaluation_metadata()["child_1"]["decision"] == "kill"
+
+    pairs = reader.graphs_with_evaluations()
+    assert [graph["graph_id"] for graph, _ in pairs] == reader.graph_ids()
+    assert all(evaluation["fitness"] is not None for _, evaluation in pairs)
+
+
+def test_batch_rolls_back_on_error(results_dir):
+    storage = RunStorage(run_id="rollback")
+    with pytest.raises(RuntimeError):
+        with storage.batch():
+            storage.save_evaluation(make_result("g1", 0.1))
+            storage.append_lineage("g0", "g1", "p1", depth=1, fitness=0.1)
+            raise RuntimeError("interrupted")
+
+    reader = RunReader(storage.run_dir)
+    assert reader.load_evaluation("g1") is None
+    assert reader.lineage() == []
+
+
+def test_lineage_index_matches_full_scan(results_dir):
+    storage, adam = write_small_run("lineage_index")
+    reader = RunReader(storage.run_dir)
+
+    # A rescue lineage logged out of order: the grandchild's edge lands
+    # before its parent is attached to the tree
+    storage.append_lineage("rescued", "rescued_child", "p_r2", depth=None, fitness=0.3)
+    assert {n["id"]: n["generation"] for n in reader.lineage_graph()["nodes"]}["rescued_child"] == 1
+    storage.append_lineage("child_0", "rescued", "p_r1", depth=2, fitness=0.1)
+    storage.save_evaluation(make_result("rescued", 0.1))
+
+    indexed = reader.lineage_graph()
+    generations = {node["id"]: node["generation"] for node in indexed["nodes"]}
+    assert generations == {adam.graph_id: 0, "child_0": 1, "child_1": 1, "rescued": 2, "rescued_child": 3}
+    assert {node["id"]: node["decision"] for node in indexed["nodes"]}["child_1"] == "kill"
+    assert indexed["nodes"] == reader._scan_lineage_graph()["nodes"]
+    assert sorted(indexed["edges"], key=lambda e: e["target"]) == \
+        sorted(reader._scan_lineage_graph()["edges"], key=lambda e: e["target"])
+
+
+def test_lineage_index_recomputes_descendants_in_order(results_dir):
+    storage = RunStorage(run_id="lineage_out_of_order")
+    reader = RunReader(storage.run_dir)
+    for parent_id, child_id, depth in [("C", "E", 1), ("C", "D", 1), ("E", "D", 2), ("R", "C", 4)]:
+        storage.append_lineage(parent_id, child_id, f"p_{child_id}", depth=depth, fitness=0.0)
+
+    generations = {node["id"]: node["generation"] for node in reader.lineage_graph()["nodes"]}
+    assert generations == {"R": 0, "C": 4, "E": 5, "D": 5}
+    assert reader.lineage_graph()["nodes"] == reader._scan_lineage_graph()["nodes"]
+
+    # Random DAG lineages logged in random order
+    rng = random.Random(7)
+    for trial in range(20):
+        storage = RunStorage(run_id=f"lineage_random_{trial}")
+        edges = [
+            (f"g{parent}", f"g{child}", rng.choice([None, 1, 2, 3, 5]))
+            for child in range(1, 12)
+            for parent in rng.sample(range(child), k=min(child, rng.randint(1, 3)))
+        ]
+        rng.shuffle(edges)
+        for parent_id, child_id, depth in edges:
+            storage.append_lineage(parent_id, child_id, f"p_{child_id}", depth=depth, fitness=0.0)
+        reader = RunReader(storage.run_dir)
+        assert reader.lineage_graph()["nodes"] == reader._scan_lineage_graph()["nodes"]
+
+
+def test_json_export_matches_legacy_layout(results_dir, tmp_path):
+    storage, adam = write_small_run()
+    reader = RunReader(storage.run_dir)
+    export_dir = export_run_json(storage.run_dir, tmp_path / "export")
+
+    assert json.loads((export_dir / "graphs" / "child_0.json").read_text()) == reader.load_graph("child_0")
+    assert (export_dir / "evals" / f"{adam.graph_id}.json").exists()
+    assert len(list((export_dir / "phase3_reports").glob("*.json"))) == 3
+    assert len((export_dir / "lineage.jsonl").read_text().splitlines()) == 2
+
+    # The legacy-layout reader sees the same run
+    legacy = RunReader(export_dir)
+    assert legacy.is_legacy
+    assert legacy.graph_ids() == reader.graph_ids()
+    assert legacy.load_evaluation("child_1") == reader.load_evaluation("child_1")
+    assert legacy.lineage() == reader.lineage()
+
+
+def test_api_reads_from_run_store(results_dir):
+    from fastapi.testclient import TestClient
+    from backend_api.main import app
+
+    storage, adam = write_small_run("api_store_run")
+    client = TestClient(app)
+
+    playback = client.get("/api/runs/api_store_run/playback").json()
+    assert playback["stats"]["total_strategies"] == 3
+    assert playback["champion"]["id"] == "child_0"
+    assert {"parent": adam.graph_id, "child": "child_1"} in playback["lineage"]["edges"]
+
+    graph = client.get("/api/runs/api_store_run/lineage_graph").json()
+    assert {node["id"] for node in graph["nodes"]} == {adam.graph_id, "child_0", "child_1"}
+    assert len(graph["edges"]) == 2
+
+    evaluation = client.get(f"/api/runs/api_store_run/evals/{adam.graph_id}").json()
+    assert len(evaluation["validation_report"]["phase3"]["episodes"]) == 3
+    assert client.get("/api/runs/api_store_run/phase3/child_0").json()["graph_id"] == "child_0"
+    assert client.get("/api/runs/api_store_run/graphs/nope").status_code == 404
+    assert len(client.get("/api/runs/api_store_run/lineage").json()["lineage"]) == 2
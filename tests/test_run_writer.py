@@ -0,0 +1,151 @@
+"""Tests for the write-behind run storage writer."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import threading
+
+import pytest
+
+import config
+from evolution.patches import PatchOp, PatchSet
+from evolution.storage import RunReader, RunStorage
+from evolution.writer import RunWriter
+from graph.schema import UniverseSpec, TimeConfig, DateRange
+from validation.evaluation import Phase3Config
+from tests.test_run_storage import make_result
+from tests.test_survivor_floor import make_simple_trading_strategy, make_test_data
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    return tmp_path
+
+
+def test_writes_are_batched_and_flushed(results_dir):
+    storage = RunStorage(run_id="writer_batches")
+    writer = RunWriter(storage, max_pending=100, max_batch=50)
+
+    gate = threading.Event()
+    writer.submit(gate.wait)  # Hold the writer so the next writes queue up
+    for i in range(20):
+        writer.save_evaluation(make_result(f"g{i}", 0.1 * i))
+        writer.append_lineage("g0", f"g{i}", f"p{i}", depth=1, fitness=0.1 * i)
+    gate.set()
+
+    assert writer.flush(timeout=10)
+    reader = RunReader(storage.run_dir)
+    assert len(reader.evaluation_metadata()) == 20
+    assert len(reader.lineage()) == 20
+    assert writer.writes == 41
+    assert writer.batches <= 3  # the held write, then the queued 40 in one or two batches
+    writer.close()
+
+
+def test_bounded_queue_applies_backpressure(results_dir):
+    writer = RunWriter(RunStorage(run_id="writer_backpressure"), max_pending=2, max_batch=1)
+    started, gate = threading.Event(), threading.Event()
+
+    def hold():
+        started.set()
+        gate.wait()
+
+    writer.submit(hold)
+    assert started.wait(timeout=5)  # the writer is busy and the queue is empty
+
+    writer.submit(lambda: None)
+    writer.submit(lambda: None)
+    blocked = threading.Thread(target=writer.submit, args=(lambda: None,))
+    blocked.start()
+    blocked.join(timeout=0.3)
+    assert blocked.is_alive()  # queue full: the caller waits for the writer
+
+    gate.set()
+    blocked.join(timeout=5)
+    assert not blocked.is_alive()
+    writer.close()
+    assert writer.writes == 4
+
+
+def test_failed_write_does_not_drop_the_batch(results_dir):
+    storage = RunStorage(run_id="writer_errors")
+    writer = RunWriter(storage, max_batch=10)
+    gate = threading.Event()
+    writer.submit(gate.wait)
+
+    def broken():
+        raise OSError("disk full")
+
+    writer.save_evaluation(make_result("a", 0.1))
+    writer.submit(broken)
+    writer.save_evaluation(make_result("b", 0.2))
+    gate.set()
+    writer.close()
+
+    assert len(writer.errors) == 1
+    assert set(RunReader(storage.run_dir).evaluation_metadata()) == {"a", "b"}
+    with pytest.raises(RuntimeError):
+        writer.save_evaluation(make_result("c", 0.3))
+
+
+def test_darwin_run_is_durable_when_it_returns(results_dir, monkeypatch):
+    def fake_patches(parent_graph, results_summary, num_children, **kwargs):
+        return [
+            PatchSet(
+                patch_id=f"{parent_graph.graph_id}_p{i}",
+                parent_graph_id=parent_graph.graph_id,
+                description="widen target",
+                ops=[PatchOp(op_type="modify_param", node_id="tp_fixed", param_name="points", param_value=5.0 + i)],
+            )
+            for i in range(num_children)
+        ]
+
+    import evolution.darwin as darwin
+    monkeypatch.setattr(darwin, "propose_child_patches", fake_patches)
+
+    summary = darwin.run_darwin(
+        data=make_test_data(n_bars=200),
+        universe=UniverseSpec(type="explicit", symbols=["TEST"]),
+        time_config=TimeConfig(timeframe="1D", date_range=DateRange(start="2024-01-01", end="2024-12-31")),
+        seed_graph=make_simple_trading_strategy(),
+        depth=2,
+        branching=2,
+        survivors_per_layer=2,
+        max_total_evals=7,
+        rescue_mode=True,
+        run_id="writer_darwin",
+        phase3_config=Phase3Config(
+            enabled=True, mode="episodes", n_episodes=2, min_months=1, max_months=1,
+            min_bars=20, seed=42, sampling_mode="random", abort_on_all_episode_failures=False,
+        ),
+    )
+
+    reader = RunReader(Path(summary.run_dir))
+    assert summary.total_evaluations > 1
+    assert len(reader.evaluation_metadata()) == summary.total_evaluations
+    assert len(reader.lineage()) == summary.total_evaluations - 1
+    assert all(reader.load_phase3_report(graph_id) for graph_id in reader.graph_ids())
+    assert len(list((Path(summary.run_dir) / "red_verdicts").glob("*.json"))) == summary.total_evaluations
+
+
+def test_darwin_run_closes_writer_when_it_fails(results_dir, monkeypatch):
+    import evolution.darwin as darwin
+
+    def broken_evaluation(*args, **kwargs):
+        raise RuntimeError("evaluation crashed")
+
+    monkeypatch.setattr(darwin, "evaluate_strategy", broken_evaluation)
+    with pytest.raises(RuntimeError):
+        darwin.run_darwin(
+            data=make_test_data(n_bars=200),
+            universe=UniverseSpec(type="explicit", symbols=["TEST"]),
+            time_config=TimeConfig(timeframe="1D", date_range=DateRange(start="2024-01-01", end="2024-12-31")),
+            seed_graph=make_simple_trading_strategy(),
+            run_id="writer_failed_run",
+        )
+
+    assert not [t for t in threading.enumerate() if t.name == "run-writer-writer_failed_run"]
+    # The graph saved before the failure is on disk
+    assert RunReader(results_dir / "runs" / "writer_failed_run").graph_ids()
@@ -0,0 +1,66 @@
+"""Tests for reusing evaluation execution context in the no-trade autopsy."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from graph.executor import GraphExecutor
+from validation.evaluation import evaluate_strategy
+from validation.robust_fitness import evaluate_strategy_on_episodes
+from tests.test_phase3_integration import (
+    make_simple_strategy,
+    make_test_data_with_timestamp_index,
+)
+
+
+def test_evaluate_strategy_returns_signal_summary():
+    data = make_test_data_with_timestamp_index(n_bars=300)
+    strategy = make_simple_strategy()
+
+    result = evaluate_strategy(strategy, data, return_signal_summary=True)
+
+    summary = result.signal_summary
+    assert summary is not None
+    assert summary["bars"] == len(data)
+    assert summary["signal_true_count"] > 0
+    # SMA(20) warmup produces NaNs in the train and holdout executions
+    assert summary["nan_counts"]["sma_slow.sma"] > 0
+    # Transient diagnostics stay out of serialized reports
+    assert "signal_summary" not in result.to_dict()
+
+
+def test_signal_summary_off_by_default():
+    data = make_test_data_with_timestamp_index(n_bars=300)
+    result = evaluate_strategy(make_simple_strategy(), data)
+    assert result.signal_summary is None
+
+
+def test_episode_autopsy_does_not_reexecute(monkeypatch):
+    data = make_test_data_with_timestamp_index(n_bars=365)
+    strategy = make_simple_strategy()
+
+    calls = {"count": 0}
+    original_execute = GraphExecutor.execute
+
+    def counting_execute(self, graph, df):
+        calls["count"] += 1
+        return original_execute(self, graph, df)
+
+    monkeypatch.setattr(GraphExecutor, "execute", counting_execute)
+
+    aggregate = evaluate_strategy_on_episodes(
+        strategy=strategy,
+        data=data,
+        n_episodes=2,
+        min_months=2,
+        max_months=2,
+        min_bars=20,
+        seed=7,
+        abort_on_all_failures=False,
+    )
+
+    # Per episode: train + holdout + 6 windows + (1 baseline + 10) jitter runs
+    assert calls["count"] == 2 * (2 + 6 + 11)
+    for ep in aggregate.episodes:
+        assert ep.debug_stats["bars_in_episode"] > 0
+        assert "close" in ep.debug_stats["feature_nan_pct"]
@@ -0,0 +1,65 @@
+"""Tests for cost-ordered early-exit (staged) validation."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from graph.executor import GraphExecutor
+from validation.evaluation import evaluate_strategy
+from tests.test_phase3_integration import (
+    make_simple_strategy,
+    make_test_data_with_timestamp_index,
+)
+
+
+def _count_executions(monkeypatch):
+    calls = {"count": 0}
+    original_execute = GraphExecutor.execute
+
+    def counting_execute(self, graph, df):
+        calls["count"] += 1
+        return original_execute(self, graph, df)
+
+    monkeypatch.setattr(GraphExecutor, "execute", counting_execute)
+    return calls
+
+
+def test_staged_skips_stages_after_holdout_kill(monkeypatch):
+    # Too few bars in holdout for SMA(20) crossovers -> no holdout trades
+    data = make_test_data_with_timestamp_index(n_bars=60)
+    calls = _count_executions(monkeypatch)
+
+    result = evaluate_strategy(make_simple_strategy(), data, staged=True)
+
+    assert calls["count"] == 1  # holdout only
+    assert result.decision == "kill"
+    assert "no_holdout_trades" in result.kill_reason
+    report = result.validation_report
+    assert report["skipped_stages"] == ["train", "stability", "fragility"]
+    assert report["stability"]["skipped"] is True
+    assert report["fragility"]["skipped"] is True
+
+
+def test_staged_matches_full_decision(monkeypatch):
+    data = make_test_data_with_timestamp_index(n_bars=300)
+    strategy = make_simple_strategy()
+
+    np.random.seed(0)
+    full = evaluate_strategy(strategy, data)
+    np.random.seed(0)
+    staged = evaluate_strategy(strategy, data, staged=True)
+
+    assert staged.decision == full.decision
+    # Skipped stages may hide further labels, but never invent new ones
+    staged_hard = set(staged.kill_reason) - {"negative_fitness"}
+    assert staged_hard <= set(full.kill_reason)
+    if not staged.validation_report.get("skipped_stages"):
+        assert staged.fitness == full.fitness
+
+
+def test_full_mode_reports_no_skipped_stages():
+    data = make_test_data_with_timestamp_index(n_bars=300)
+    result = evaluate_strategy(make_simple_strategy(), data)
+    assert "skipped_stages" not in result.validation_report
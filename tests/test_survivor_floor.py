@@ -6,6 +6,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pandas as pd
 import pytest
+
+import config
 from graph.schema import StrategyGraph, Node, UniverseSpec, TimeConfig, DateRange
 from validation.evaluation import Phase3Config, StrategyEvaluationResult
 from evolution.darwin import run_darwin
@@ -69,8 +71,9 @@ def make_test_data(n_bars=200):
     return df
 
 
-def test_survivor_floor_triggers_when_all_killed():
+def test_survivor_floor_triggers_when_all_killed(tmp_path, monkeypatch):
     """Test that survivor floor selects top N strategies even when all are killed."""
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
     data = make_test_data(n_bars=200)
     strategy = make_simple_trading_strategy()
 
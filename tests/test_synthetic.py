@@ -0,0 +1,96 @@
+"""Tests for the deterministic synthetic OHLCV provider."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.compact import is_compact
+from data.synthetic import SyntheticClient
+from validation.overfit_tests import run_backtest_on_data
+from tests.test_phase3_integration import make_simple_strategy
+
+
+def test_same_seed_same_bars_and_seeds_differ():
+    bars = SyntheticClient(seed=7).get_bars("AAPL", "5m", "2024-03-01", "2024-03-15")
+    again = SyntheticClient(seed=7).get_bars("AAPL", "5m", "2024-03-01", "2024-03-15")
+    other_seed = SyntheticClient(seed=8).get_bars("AAPL", "5m", "2024-03-01", "2024-03-15")
+    other_symbol = SyntheticClient(seed=7).get_bars("MSFT", "5m", "2024-03-01", "2024-03-15")
+
+    pd.testing.assert_frame_equal(bars, again)
+    assert not np.allclose(bars["close"], other_seed["close"])
+    assert not np.allclose(bars["close"], other_symbol["close"])
+
+
+def test_bars_independent_of_window_and_chunking():
+    full = SyntheticClient(seed=1).get_bars("SPY", "15m", "2024-01-01", "2024-06-28")
+    window = SyntheticClient(seed=1, chunk_days=4).get_bars("SPY", "15m", "2024-03-11", "2024-03-15")
+
+    mask = (full["timestamp"] >= window["timestamp"].iloc[0]) & (full["timestamp"] <= window["timestamp"].iloc[-1])
+    pd.testing.assert_frame_equal(full[mask].reset_index(drop=True), window)
+
+    chunks = list(SyntheticClient(seed=1, chunk_days=10).iter_bars("SPY", "15m", "2024-01-01", "2024-06-28"))
+    assert len(chunks) > 1
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), full)
+
+
+def test_session_structure_and_ohlc_invariants():
+    # Spans the March DST change: the session stays 09:30-16:00 local time
+    bars = SyntheticClient(seed=3).get_bars("QQQ", "5m", "2024-03-04", "2024-03-15")
+    local = bars["timestamp"].dt.tz_convert("America/New_York")
+
+    assert str(bars["timestamp"].dtype) == "datetime64[ns, UTC]"
+    assert len(bars) == 10 * 78
+    assert (local.dt.strftime("%H:%M").groupby(local.dt.date).first() == "09:30").all()
+    assert (local.dt.strftime("%H:%M").groupby(local.dt.date).last() == "15:55").all()
+    assert bars["timestamp"].is_monotonic_increasing
+
+    assert (bars["high"] >= bars[["open", "close"]].max(axis=1)).all()
+    assert (bars["low"] <= bars[["open", "close"]].min(axis=1)).all()
+    assert (bars["low"] > 0).all()
+    assert (bars["volume"] >= 0).all()
+    # Continuous within a session, gapped overnight
+    same_day = local.dt.date.values[1:] == local.dt.date.values[:-1]
+    np.testing.assert_array_equal(bars["open"].values[1:][same_day], bars["close"].values[:-1][same_day])
+
+
+def test_daily_bars_share_session_open_and_close():
+    client = SyntheticClient(seed=5)
+    intraday = client.get_bars("IWM", "1h", "2024-05-06", "2024-05-10")
+    daily = client.get_bars("IWM", "1d", "2024-05-06", "2024-05-10")
+    session = intraday.groupby(intraday["timestamp"].dt.tz_convert("America/New_York").dt.date)
+
+    assert len(daily) == 5
+    assert (session.size() == 7).all()  # 6 full hours + 15:30-16:00
+    np.testing.assert_allclose(daily["open"].values, session["open"].first().values)
+    np.testing.assert_allclose(daily["close"].values, session["close"].last().values)
+    assert (daily["timestamp"].dt.tz_convert("America/New_York").dt.hour == 0).all()
+
+
+def test_regimes_generate_and_compact():
+    client = SyntheticClient(seed=2)
+    labels = client.regime_labels("SPY", "2000-01-01", "2009-12-31")
+    assert set(labels.unique()) == {"bull", "bear", "sideways", "crisis"}
+
+    bars = client.generate("SPY", "1m", 5000, start="2024-01-06")
+    assert len(bars) == 5000
+    assert bars["timestamp"].dt.tz_convert("America/New_York").iloc[0] == pd.Timestamp(
+        "2024-01-08 09:30", tz="America/New_York"
+    )
+
+    compact = SyntheticClient(seed=2, compact=True).generate("SPY", "1m", 5000, start="2024-01-06")
+    assert is_compact(compact) and compact["volume"].dtype == np.uint32
+    np.testing.assert_allclose(compact["close"], bars["close"], rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        client.get_bars("SPY", "1d", "1960-01-01", "1960-12-31")
+
+
+def test_strategy_runs_on_synthetic_bars():
+    bars = SyntheticClient(seed=11).get_bars("AAPL", "5m", "2024-01-01", "2024-02-29")
+    result = run_backtest_on_data(make_simple_strategy(), bars)
+    assert result["metrics"]["trade_count"] > 0
+    assert len(result["equity_curve"]) == len(bars)
@@ -0,0 +1,160 @@
+"""Tests for the in-process telemetry registry and GET /metrics."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import multiprocessing
+import threading
+
+import pytest
+
+import config
+import telemetry
+from backend_api.jobs import COMPLETED, RUNNING, JobRunner
+from validation.evaluation import iter_evaluations
+from tests.test_cancellation import wait_for
+from tests.test_evaluate_batch import make_strategies
+from tests.test_phase3_integration import make_test_data_with_timestamp_column
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    telemetry.reset()
+    yield
+    telemetry.reset()
+
+
+def value(snapshot, name, labels=()):
+    return sum(v for l, v in snapshot.get(name, []) if tuple(l) == tuple(labels))
+
+
+def record_in_child(queue):
+    queue.put(telemetry.snapshot())
+
+
+def recording_job(channel, n):
+    for _ in range(n):
+        telemetry.BACKTESTS.inc()
+    return n
+
+
+def queueing_job(channel, n):
+    telemetry.BACKTESTS.inc(n)
+    telemetry.STORAGE_QUEUE_DEPTH.inc(n)  # writes still queued when the worker dies
+    return n
+
+
+def test_threads_record_into_one_registry():
+    def work():
+        for _ in range(1000):
+            telemetry.NODE_EVALUATIONS.labels("SMA").inc()
+            telemetry.EVALUATION_STAGE_SECONDS.labels("holdout").observe(0.02)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    telemetry.NODE_EVALUATIONS.labels("RSI").inc(2)
+
+    snapshot = telemetry.snapshot()
+    assert value(snapshot, "darwin_node_evaluations_total", ["SMA"]) == 4000
+    assert value(snapshot, "darwin_node_evaluations_total", ["RSI"]) == 2
+    [[_, histogram]] = snapshot["darwin_evaluation_stage_seconds"]
+    assert sum(histogram[:-1]) == 4000
+    assert histogram[-1] == pytest.approx(80.0)
+    # Exited threads' shards are folded, not lost
+    assert telemetry.snapshot() == snapshot
+
+
+def test_render_prometheus_text():
+    telemetry.STORAGE_WRITE_SECONDS.observe(0.003)
+    telemetry.STORAGE_WRITE_SECONDS.observe(7)
+    telemetry.CACHE_REQUESTS.labels("llm", "hit").inc()
+    telemetry.STORAGE_QUEUE_DEPTH.inc(3)
+    telemetry.STORAGE_QUEUE_DEPTH.dec(2)
+
+    text = telemetry.render(telemetry.combine([telemetry.snapshot(), {"darwin_backtests_total": [[[], 5]]}]))
+    lines = text.splitlines()
+    assert "# TYPE darwin_storage_write_seconds histogram" in lines
+    assert 'darwin_storage_write_seconds_bucket{le="0.001"} 0' in lines
+    assert 'darwin_storage_write_seconds_bucket{le="0.005"} 1' in lines
+    assert 'darwin_storage_write_seconds_bucket{le="10"} 2' in lines
+    assert 'darwin_storage_write_seconds_bucket{le="+Inf"} 2' in lines
+    assert "darwin_storage_write_seconds_count 2" in lines
+    assert 'darwin_cache_requests_total{cache="llm",result="hit"} 1' in lines
+    assert "darwin_storage_queue_depth 1" in lines
+    assert "darwin_backtests_total 5" in lines
+    assert "darwin_graph_executions_total 0" in lines
+
+
+def test_forked_children_start_empty():
+    telemetry.BACKTESTS.inc()
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    child = context.Process(target=record_in_child, args=(queue,))
+    child.start()
+    assert queue.get(timeout=30) == {}
+    child.join(30)
+
+
+def test_pool_workers_report_to_the_caller():
+    data = make_test_data_with_timestamp_column(n_bars=400)
+    results = list(iter_evaluations(make_strategies(3), data, n_workers=2, k_windows=2, n_jitter=0))
+
+    snapshot = telemetry.snapshot()
+    # 3 strategies x (holdout + train + 2 stability windows + jitter baseline), all run in the pool
+    assert len(results) == 3
+    assert value(snapshot, "darwin_graph_executions_total") == 15
+    assert value(snapshot, "darwin_backtests_total") == 15
+    assert value(snapshot, "darwin_bars_simulated_total") == 3 * (400 + 400 + 100)
+    stages = {labels[0]: sum(h[:-1]) for labels, h in snapshot["darwin_evaluation_stage_seconds"]}
+    assert stages == {"holdout": 3, "train": 3, "stability": 3, "jitter": 3}
+
+
+def test_job_workers_push_metrics_to_the_runner():
+    runner = JobRunner(max_workers=1, max_queued=1)
+    try:
+        runner.submit("a", "tests.test_telemetry:recording_job", n=3)
+        assert runner.wait("a", timeout=30).status == COMPLETED
+        runner.submit("b", "tests.test_telemetry:recording_job", n=4)
+        assert runner.wait("b", timeout=30).status == COMPLETED
+        assert value(runner.metrics(), "darwin_backtests_total") == 7
+    finally:
+        runner.shutdown(timeout=1)
+
+
+def test_replaced_workers_keep_counters_but_not_gauges():
+    runner = JobRunner(max_workers=1, max_queued=1)
+    try:
+        runner.submit("a", "tests.test_telemetry:queueing_job", n=3)
+        assert runner.wait("a", timeout=30).status == COMPLETED
+        assert value(runner.metrics(), "darwin_storage_queue_depth") == 3
+
+        runner.submit("b", "tests.test_cancellation:stubborn_job")
+        wait_for(lambda: runner.get("b").status == RUNNING)
+        runner.cancel("b")
+        runner.wait("b", timeout=30)
+
+        assert value(runner.metrics(), "darwin_backtests_total") == 3
+        assert value(runner.metrics(), "darwin_storage_queue_depth") == 0
+    finally:
+        runner.shutdown(timeout=1)
+
+
+def test_metrics_endpoint_sums_api_processes(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import backend_api.main as main
+
+    monkeypatch.setattr(config, "RESULTS_DIR", tmp_path)
+    client = TestClient(main.app)
+    telemetry.BACKTESTS.inc(2)
+    main.get_state_store().save_metrics({"darwin_backtests_total": [[[], 3]]}, owner="other-host:1")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "darwin_backtests_total 5" in response.text.splitlines()
+
+    assert main.get_state_store().metrics_snapshots(max_age=-1) == []
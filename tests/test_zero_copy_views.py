@@ -0,0 +1,84 @@
+"""Tests that validation windows share OHLCV memory with the source frame."""
+
+import sys
+import tracemalloc
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from backtest.simulator import BacktestSimulator
+from validation.overfit_tests import time_holdout_split, subwindow_bounds
+
+
+def make_large_data(n_bars=200_000):
+    dates = pd.date_range("2020-01-01", periods=n_bars, freq="5min")
+    rng = np.random.default_rng(0)
+    close = 100.0 + np.cumsum(rng.normal(0, 0.05, n_bars))
+    return pd.DataFrame({
+        "timestamp": dates,
+        "open": close,
+        "high": close + 0.05,
+        "low": close - 0.05,
+        "close": close,
+        "volume": 1000.0,
+    })
+
+
+def test_holdout_split_shares_memory():
+    data = make_large_data(10_000)
+    train, holdout = time_holdout_split(data, 0.75)
+    for col in ["open", "high", "low", "close", "volume"]:
+        assert np.shares_memory(train[col].to_numpy(), data[col].to_numpy())
+        assert np.shares_memory(holdout[col].to_numpy(), data[col].to_numpy())
+
+
+def test_subwindow_bounds_cover_data():
+    bounds = subwindow_bounds(103, 6)
+    assert bounds[0] == (0, 17)
+    assert bounds[-1] == (85, 103)
+    assert all(b[1] == nb[0] for b, nb in zip(bounds, bounds[1:]))
+
+
+def _peak_bytes_holding_windows(data, k):
+    tracemalloc.start()
+    train, holdout = time_holdout_split(data, 0.75)
+    windows = [data.iloc[start:end] for start, end in subwindow_bounds(len(data), k)]
+    views = [w["close"].to_numpy() for w in windows]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(views) == k and len(train) + len(holdout) == len(data)
+    return peak
+
+
+def test_window_allocation_is_flat_in_k():
+    data = make_large_data()
+    ohlcv_bytes = data[["open", "high", "low", "close", "volume"]].memory_usage(index=False).sum()
+
+    peak_small = _peak_bytes_holding_windows(data, 2)
+    peak_large = _peak_bytes_holding_windows(data, 24)
+
+    # Holding every window alive must not approach one copy of the dataset
+    assert peak_small < ohlcv_bytes * 0.02
+    assert peak_large < ohlcv_bytes * 0.02
+
+
+def test_simulator_accepts_sliced_views():
+    data = make_large_data(2_000)
+    window = data.iloc[500:1500]
+    signals = pd.Series(False, index=window.index)
+    signals.iloc[::50] = True
+
+    sim = BacktestSimulator()
+    kwargs = dict(
+        exit_signals=None,
+        stop_config={"type": "fixed", "points": 0.2},
+        tp_config={"type": "fixed", "points": 0.2},
+        size_config={"type": "fixed", "dollars": 10000.0},
+    )
+    on_view = sim.run(window, signals, **kwargs)
+    on_copy = sim.run(window.reset_index(drop=True), signals.reset_index(drop=True), **kwargs)
+
+    pd.testing.assert_frame_equal(on_view["trades"], on_copy["trades"])
+    assert on_view["metrics"]["trade_count"] > 0
@@ -12,6 +12,7 @@ from .evaluation import (
     StrategyEvaluationResult,
     evaluate_strategy,
     evaluate_many,
+    iter_evaluations,
     get_survivors,
     rank_by_fitness
 )
@@ -28,6 +29,7 @@ __all__ = [
     'StrategyEvaluationResult',
     'evaluate_strategy',
     'evaluate_many',
+    'iter_evaluations',
     'get_survivors',
     'rank_by_fitness',
 ]
@@ -3,10 +3,18 @@
 Canonical interface for evaluating strategies with deterministic kill/survive decisions.
 """
 
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
 import pandas as pd
-from typing import Dict, Any, List, Literal, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Iterator, List, Literal, Optional, Tuple, Union
+from dataclasses import dataclass, asdict, field
 
+import telemetry
+from cancellation import CancelToken, checkpoint
+from data.frame_store import read_frame, write_frame
 from graph.schema import StrategyGraph
 from validation.overfit_tests import run_full_validation
 from validation.fitness import score_validation
@@ -57,10 +65,14 @@ class StrategyEvaluationResult:
     fitness: float
     decision: DecisionType
     kill_reason: List[str]  # Empty if decision != "kill"
+    signal_summary: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    """Execution signal/NaN counts (only when requested). Not serialized."""
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        data = asdict(self)
+        data.pop("signal_summary", None)
+        return data
 
     def is_survivor(self) -> bool:
         """Check if strategy survived evaluation."""
@@ -194,10 +206,15 @@ def evaluate_strategy(
     n_jitter: int = 10,
     jitter_pct: float = 0.1,
     initial_capital: float = 100000.0,
+    return_signal_summary: bool = False,
+    staged: bool = False,
+    token: Optional[CancelToken] = None,
 ) -> StrategyEvaluationResult:
     """Evaluate a strategy and determine survival.
 
     Runs complete validation suite and applies deterministic kill/survive rules.
+    With staged=True, stability and jitter stages are skipped once a hard
+    kill rule has already fired on the holdout/train backtests.
 
     Args:
         strategy: StrategyGraph to evaluate
@@ -207,12 +224,17 @@ def evaluate_strategy(
         n_jitter: Number of parameter jitter runs
         jitter_pct: Parameter jitter percentage
         initial_capital: Starting capital
+        return_signal_summary: Attach signal/NaN counts from the train and
+            holdout executions to result.signal_summary
+        staged: Cost-ordered early-exit validation (see run_full_validation)
+        token: Cancellation token, checked between backtests
 
     Returns:
         StrategyEvaluationResult with decision and reasons
 
     Raises:
         Exception: If validation fails catastrophically
+        Cancelled: If the token is cancelled or its deadline passes
     """
     # Run full validation suite
     validation_results = run_full_validation(
@@ -223,6 +245,9 @@ def evaluate_strategy(
         n_jitter=n_jitter,
         jitter_pct=jitter_pct,
         initial_capital=initial_capital,
+        collect_signal_summary=return_signal_summary,
+        staged=staged,
+        token=token,
     )
 
     # Calculate fitness
@@ -250,6 +275,7 @@ def evaluate_strategy(
         fitness=fitness,
         decision=decision,
         kill_reason=kill_reason,
+        signal_summary=validation_results.get('signal_summary'),
     )
 
 
@@ -316,6 +342,7 @@ def evaluate_many(
     jitter_pct: float = 0.1,
     initial_capital: float = 100000.0,
     verbose: bool = True,
+    staged: bool = False,
 ) -> List[StrategyEvaluationResult]:
     """Evaluate multiple strategies in batch.
 
@@ -328,6 +355,7 @@ def evaluate_many(
         jitter_pct: Parameter jitter percentage
         initial_capital: Starting capital
         verbose: Print progress
+        staged: Cost-ordered early-exit validation
 
     Returns:
         List of StrategyEvaluationResults (one per strategy)
@@ -347,6 +375,7 @@ def evaluate_many(
                 n_jitter=n_jitter,
                 jitter_pct=jitter_pct,
                 initial_capital=initial_capital,
+                staged=staged,
             )
             results.append(result)
 
@@ -357,35 +386,168 @@ def evaluate_many(
             # Strategy failed catastrophically (e.g., execution error)
             if verbose:
                 print(f"KILL (error: {e})")
-
-            # Create kill result
-            result = StrategyEvaluationResult(
-                graph_id=strategy.graph_id,
-                strategy_name=strategy.name,
-                validation_report={},
-                fitness=-999.0,  # Sentinel value for catastrophic failure
-                decision="kill",
-                kill_reason=["catastrophic_failure", str(e)],
-            )
-            results.append(result)
+            results.append(_catastrophic_result(strategy, e))
 
     return results
 
 
+def iter_evaluations(
+    strategies: List[StrategyGraph],
+    data: pd.DataFrame,
+    n_workers: Optional[int] = None,
+    token: Optional[CancelToken] = None,
+    **params: Any,
+) -> Iterator[Tuple[int, StrategyEvaluationResult, float]]:
+    """Evaluate strategies, yielding each result as soon as it is ready.
+
+    With n_workers > 1, strategies are evaluated on a process pool; the bars
+    are written once to a memory-mapped frame store (see data.frame_store)
+    that every worker maps instead of receiving its own copy. Results then
+    arrive in completion order, not input order.
+
+    Args:
+        strategies: StrategyGraphs to evaluate
+        data: OHLCV DataFrame for backtesting
+        n_workers: Worker processes (None or 1 = evaluate serially in-process)
+        token: Cancellation token. Serial evaluations check it between
+            backtests. Pool workers follow its deadline and a shared stop
+            flag, set when the token is cancelled or the consumer stops
+            early, so in-flight evaluations stop at their next checkpoint
+            and queued strategies are dropped
+        **params: evaluate_strategy() keyword arguments (train_frac,
+            k_windows, n_jitter, jitter_pct, initial_capital, staged)
+
+    Yields:
+        (index into strategies, result, evaluation seconds). Strategies that
+        fail catastrophically are yielded as kill results, as in
+        evaluate_many().
+
+    Raises:
+        Cancelled: If the token is cancelled or its deadline passes
+    """
+    if n_workers is None or n_workers <= 1 or len(strategies) <= 1:
+        for index, strategy in enumerate(strategies):
+            yield _evaluate_indexed(index, strategy, data, {**params, "token": token})
+        return
+
+    remaining = token.remaining() if token is not None else None
+    deadline = time.time() + remaining if remaining is not None else None  # wall clock: crosses processes
+
+    with tempfile.TemporaryDirectory(prefix="evaluate_") as store_dir:
+        source = write_frame(data, Path(store_dir) / "bars.feather")
+        context = multiprocessing.get_context()
+        stop = context.Event()
+        executor = ProcessPoolExecutor(
+            max_workers=min(n_workers, len(strategies)),
+            mp_context=context,
+            initializer=_set_pool_stop_flag,
+            initargs=(stop,),
+        )
+        try:
+            pending = {
+                executor.submit(telemetry.collecting, _evaluate_in_pool, index, strategy, source, params, deadline)
+                for index, strategy in enumerate(strategies)
+            }
+            while pending:
+                done, pending = wait(pending, timeout=None if token is None else 0.1, return_when=FIRST_COMPLETED)
+                checkpoint(token)
+                for future in done:
+                    yield telemetry.merge_result(future.result())
+        finally:
+            # Also runs when the consumer stops early: queued strategies are
+            # dropped and running ones raise at their next checkpoint
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pool_stop_flag = None
+
+
+def _set_pool_stop_flag(flag):
+    """Process pool initializer: remember the batch's shared stop flag."""
+    global _pool_stop_flag
+    _pool_stop_flag = flag
+
+
+def _evaluate_in_pool(
+    index: int,
+    strategy: StrategyGraph,
+    source: Union[str, Path],
+    params: Dict[str, Any],
+    deadline: Optional[float],
+) -> Tuple[int, StrategyEvaluationResult, float]:
+    """Pool worker: _evaluate_indexed() under the batch's stop flag and deadline."""
+    timeout = deadline - time.time() if deadline is not None else None
+    token = CancelToken(timeout=timeout, flag=_pool_stop_flag)
+    return _evaluate_indexed(index, strategy, source, {**params, "token": token})
+
+
+def _evaluate_indexed(
+    index: int,
+    strategy: StrategyGraph,
+    source: Union[pd.DataFrame, str, Path],
+    params: Dict[str, Any],
+) -> Tuple[int, StrategyEvaluationResult, float]:
+    """Evaluate one strategy of a batch (process pool worker), timing it."""
+    data = source if isinstance(source, pd.DataFrame) else read_frame(source)
+    started = time.perf_counter()
+    try:
+        result = evaluate_strategy(strategy=strategy, data=data, **params)
+    except Exception as e:
+        result = _catastrophic_result(strategy, e)
+    return index, result, time.perf_counter() - started
+
+
+def timeout_result(
+    strategy: StrategyGraph, seconds: float, run_limit: bool = False
+) -> StrategyEvaluationResult:
+    """Kill result for a strategy whose evaluation overran its deadline.
+
+    With run_limit, the deadline that passed was the whole run's (seconds is
+    the run's limit) and the result is labelled "run_timeout" instead.
+    """
+    if run_limit:
+        kill_reason = ["run_timeout", f"run exceeded {seconds:g}s before evaluation finished"]
+    else:
+        kill_reason = ["timeout", f"evaluation exceeded {seconds:g}s"]
+    return StrategyEvaluationResult(
+        graph_id=strategy.graph_id,
+        strategy_name=strategy.name,
+        validation_report={},
+        fitness=-999.0,  # Same sentinel as a catastrophic failure: never selected
+        decision="kill",
+        kill_reason=kill_reason,
+    )
+
+
+def _catastrophic_result(strategy: StrategyGraph, error: Exception) -> StrategyEvaluationResult:
+    """Kill result for a strategy whose evaluation raised."""
+    return StrategyEvaluationResult(
+        graph_id=strategy.graph_id,
+        strategy_name=strategy.name,
+        validation_report={},
+        fitness=-999.0,  # Sentinel value for catastrophic failure
+        decision="kill",
+        kill_reason=["catastrophic_failure", str(error)],
+    )
+
+
 def evaluate_strategy_phase3(
     strategy: StrategyGraph,
     data: pd.DataFrame,
     initial_capital: float = 100000.0,
     phase3_config: Optional[Phase3Config] = None,
     generation: int = 0,
+    token: Optional[CancelToken] = None,
 ) -> StrategyEvaluationResult:
     """Phase 3 evaluation for episode-based robustness.
 
     Args:
         generation: Current generation index (used for curriculum sampling).
+        token: Cancellation token, checked per episode and between backtests
     """
     if not phase3_config or not phase3_config.enabled or phase3_config.mode != "episodes":
-        return evaluate_strategy(strategy, data, initial_capital=initial_capital)
+        return evaluate_strategy(strategy, data, initial_capital=initial_capital, token=token)
 
     # Resolve sampling mode for this generation (curriculum support)
     effective_sampling_mode = phase3_config.get_sampling_mode(generation)
@@ -403,6 +565,7 @@ def evaluate_strategy_phase3(
         min_trades_per_episode=phase3_config.min_trades_per_episode,
         regime_penalty_weight=phase3_config.regime_penalty_weight,
         abort_on_all_failures=phase3_config.abort_on_all_episode_failures,
+        token=token,
     )
 
     failure_labels: List[str] = []
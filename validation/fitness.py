@@ -71,13 +71,13 @@ def extract_penalties(validation_results: Dict[str, Any]) -> Dict[str, float]:
 
     # Stability penalties
     stability = validation_results.get('stability', {})
-    if stability:
+    if stability and not stability.get('skipped'):
         penalties['concentration'] = stability.get('concentration_penalty', 0.0)
         penalties['cliff'] = stability.get('cliff_penalty', 0.0)
 
     # Fragility penalties
     fragility = validation_results.get('fragility', {})
-    if fragility:
+    if fragility and not fragility.get('skipped'):
         penalties['sign_flip'] = fragility.get('sign_flip_penalty', 0.0)
         penalties['fragility'] = fragility.get('fragility_score', 0.0) * 0.5  # Scale down
 
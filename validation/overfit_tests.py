@@ -8,12 +8,15 @@ Implements brutal validation suite:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from copy import deepcopy
 
+import telemetry
+from cancellation import CancelToken, checkpoint
 from graph.schema import StrategyGraph, Node
 from graph.executor import GraphExecutor
 from backtest.simulator import run_backtest
+from validation.reporting import early_kill_labels
 
 
 def time_holdout_split(
@@ -21,6 +24,9 @@ def time_holdout_split(
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Split data into train and holdout sets chronologically.
 
+    Both halves are positional slices (views) of ``data``; no OHLCV values
+    are copied. Callers must treat them as read-only.
+
     Args:
         data: Full OHLCV DataFrame
         train_frac: Fraction of data for training (default 0.75 = 75%)
@@ -31,14 +37,38 @@ def time_holdout_split(
     split_idx = int(len(data) * train_frac)
 
     # Preserve index (especially timestamp index needed for Phase 3)
-    train_data = data.iloc[:split_idx].copy()
-    holdout_data = data.iloc[split_idx:].copy()
+    train_data = data.iloc[:split_idx]
+    holdout_data = data.iloc[split_idx:]
 
     return train_data, holdout_data
 
 
+def subwindow_bounds(n_bars: int, k: int) -> List[Tuple[int, int]]:
+    """Integer [start, end) ranges for K chronological subwindows.
+
+    The last window absorbs the remainder when n_bars is not divisible by k.
+
+    Args:
+        n_bars: Total number of bars
+        k: Number of windows
+
+    Returns:
+        List of (start_idx, end_idx) tuples
+    """
+    chunk_size = n_bars // k
+    bounds = []
+    for i in range(k):
+        start_idx = i * chunk_size
+        end_idx = start_idx + chunk_size if i < k - 1 else n_bars
+        bounds.append((start_idx, end_idx))
+    return bounds
+
+
 def run_backtest_on_data(
-    strategy: StrategyGraph, data: pd.DataFrame, initial_capital: float = 100000.0
+    strategy: StrategyGraph,
+    data: pd.DataFrame,
+    initial_capital: float = 100000.0,
+    return_context: bool = False,
 ) -> Dict[str, Any]:
     """Execute strategy and run backtest on given data.
 
@@ -46,9 +76,10 @@ def run_backtest_on_data(
         strategy: StrategyGraph to test
         data: OHLCV DataFrame
         initial_capital: Starting capital
+        return_context: Also return the graph execution context under 'context'
 
     Returns:
-        Results dict with trades, equity_curve, metrics
+        Results dict with trades, equity_curve, metrics (and context if requested)
     """
     executor = GraphExecutor()
     context = executor.execute(strategy, data)
@@ -59,11 +90,90 @@ def run_backtest_on_data(
 
     results = run_backtest(data=data, orders_config=orders_config, initial_capital=initial_capital)
 
+    if return_context:
+        results['context'] = context
+
     return results
 
 
+def summarize_execution(
+    strategy: StrategyGraph, context: Dict[Tuple[str, str], Any], data: pd.DataFrame
+) -> Dict[str, Any]:
+    """Summarize an execution context into raw signal and NaN counts.
+
+    Counts (not percentages) are returned so summaries from several
+    executions can be combined with merge_signal_summaries().
+
+    Args:
+        strategy: StrategyGraph that produced the context
+        context: Context dict from GraphExecutor.execute()
+        data: OHLCV DataFrame the strategy was executed on
+
+    Returns:
+        Dict with bars, signal_true_count, exit_true_count and nan_counts
+        (keyed by OHLCV column or "node_id.output_key")
+    """
+    summary = {
+        'bars': len(data),
+        'signal_true_count': 0,
+        'exit_true_count': 0,
+        'nan_counts': {},
+    }
+
+    orders_key = list(strategy.outputs.values())[0]
+    orders_config = context.get(orders_key) or {}
+
+    entry_signal = orders_config.get('entry_signal')
+    if entry_signal is not None and hasattr(entry_signal, 'sum'):
+        summary['signal_true_count'] = int(entry_signal.sum())
+
+    exit_signal = orders_config.get('exit_signal')
+    if exit_signal is not None and hasattr(exit_signal, 'sum'):
+        summary['exit_true_count'] = int(exit_signal.sum())
+
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        if col in data.columns:
+            summary['nan_counts'][col] = int(data[col].isna().sum())
+
+    for (node_id, output_key), value in context.items():
+        if isinstance(value, pd.Series) and len(value) == len(data):
+            n_nan = int(value.isna().sum())
+            if n_nan > 0:
+                summary['nan_counts'][f"{node_id}.{output_key}"] = n_nan
+
+    return summary
+
+
+def merge_signal_summaries(summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine execution summaries from disjoint data segments.
+
+    Args:
+        summaries: Outputs of summarize_execution()
+
+    Returns:
+        Single summary with all counts added together
+    """
+    merged = {
+        'bars': 0,
+        'signal_true_count': 0,
+        'exit_true_count': 0,
+        'nan_counts': {},
+    }
+    for summary in summaries:
+        merged['bars'] += summary['bars']
+        merged['signal_true_count'] += summary['signal_true_count']
+        merged['exit_true_count'] += summary['exit_true_count']
+        for key, count in summary['nan_counts'].items():
+            merged['nan_counts'][key] = merged['nan_counts'].get(key, 0) + count
+    return merged
+
+
 def subwindow_stability(
-    strategy: StrategyGraph, data: pd.DataFrame, k: int = 6, initial_capital: float = 100000.0
+    strategy: StrategyGraph,
+    data: pd.DataFrame,
+    k: int = 6,
+    initial_capital: float = 100000.0,
+    token: Optional[CancelToken] = None,
 ) -> Dict[str, Any]:
     """Test strategy stability across K chronological subwindows.
 
@@ -77,6 +187,7 @@ def subwindow_stability(
         data: Full OHLCV DataFrame
         k: Number of chunks to split data into (default 6)
         initial_capital: Starting capital per window
+        token: Cancellation token, checked before each window
 
     Returns:
         Dict with:
@@ -85,14 +196,12 @@ def subwindow_stability(
             - cliff_penalty: Score for performance degradation
             - consistency_score: 1 - (std / mean) of returns
     """
-    chunk_size = len(data) // k
     window_results = []
 
-    for i in range(k):
-        start_idx = i * chunk_size
-        end_idx = start_idx + chunk_size if i < k - 1 else len(data)
-
-        window_data = data.iloc[start_idx:end_idx].reset_index(drop=True)
+    for i, (start_idx, end_idx) in enumerate(subwindow_bounds(len(data), k)):
+        checkpoint(token)
+        # Positional view over the shared frame (no copy, timestamps preserved)
+        window_data = data.iloc[start_idx:end_idx]
 
         try:
             results = run_backtest_on_data(strategy, window_data, initial_capital)
@@ -159,7 +268,8 @@ def parameter_jitter(
     data: pd.DataFrame,
     n: int = 10,
     jitter: float = 0.1,
-    initial_capital: float = 100000.0
+    initial_capital: float = 100000.0,
+    token: Optional[CancelToken] = None,
 ) -> Dict[str, Any]:
     """Test strategy robustness to parameter perturbations.
 
@@ -172,6 +282,7 @@ def parameter_jitter(
         n: Number of jitter runs (default 10)
         jitter: Jitter fraction (default 0.1 = ±10%)
         initial_capital: Starting capital
+        token: Cancellation token, checked before each run
 
     Returns:
         Dict with:
@@ -182,6 +293,7 @@ def parameter_jitter(
             - fragility_score: Overall fragility metric
     """
     # Run baseline
+    checkpoint(token)
     try:
         baseline_results = run_backtest_on_data(strategy, data, initial_capital)
         baseline_return = baseline_results['metrics']['total_return']
@@ -199,6 +311,7 @@ def parameter_jitter(
     jittered_results = []
 
     for i in range(n):
+        checkpoint(token)
         # Create jittered copy of strategy
         jittered_strategy = _jitter_strategy_params(strategy, jitter)
 
@@ -288,10 +401,20 @@ def run_full_validation(
     k_windows: int = 6,
     n_jitter: int = 10,
     jitter_pct: float = 0.1,
-    initial_capital: float = 100000.0
+    initial_capital: float = 100000.0,
+    collect_signal_summary: bool = False,
+    staged: bool = False,
+    token: Optional[CancelToken] = None,
 ) -> Dict[str, Any]:
     """Run complete validation suite.
 
+    In staged mode the cheap, decisive stages run first (holdout, then
+    train). As soon as a hard kill label fires (see
+    reporting.early_kill_labels), the remaining stages are skipped and
+    listed under 'skipped_stages'. Skipped stages contribute no penalties,
+    so the fitness of an early-killed strategy is not comparable to a full
+    run; its kill decision is.
+
     Args:
         strategy: StrategyGraph to validate
         data: Full OHLCV DataFrame
@@ -300,28 +423,77 @@ def run_full_validation(
         n_jitter: Number of parameter jitter runs
         jitter_pct: Jitter percentage
         initial_capital: Starting capital
+        collect_signal_summary: Also summarize the train/holdout executions
+            under 'signal_summary' (reuses their contexts, no extra execution)
+        staged: Run stages in cost order and stop after a hard kill
+        token: Cancellation token, checked between backtests
 
     Returns:
         Dict with all validation results
+
+    Raises:
+        Cancelled: If the token is cancelled or its deadline passes
     """
     # Split data
     train_data, holdout_data = time_holdout_split(data, train_frac)
 
-    # Run on train set
-    train_results = run_backtest_on_data(strategy, train_data, initial_capital)
+    skipped_stages: List[str] = []
+    executed = []  # (results, data) pairs to summarize
 
-    # Run on holdout set
-    holdout_results = run_backtest_on_data(strategy, holdout_data, initial_capital)
+    # Run on holdout set (decides most kills on its own)
+    checkpoint(token)
+    with telemetry.EVALUATION_STAGE_SECONDS.labels("holdout").time():
+        holdout_results = run_backtest_on_data(
+            strategy, holdout_data, initial_capital, return_context=collect_signal_summary
+        )
+    executed.append((holdout_results, holdout_data))
 
-    # Subwindow stability (on full data)
-    stability = subwindow_stability(strategy, data, k_windows, initial_capital)
+    if staged and early_kill_labels({}, holdout_results['metrics']):
+        skipped_stages = ['train', 'stability', 'fragility']
+        train_results = {'metrics': {}, 'skipped': True}
+    else:
+        # Run on train set
+        checkpoint(token)
+        with telemetry.EVALUATION_STAGE_SECONDS.labels("train").time():
+            train_results = run_backtest_on_data(
+                strategy, train_data, initial_capital, return_context=collect_signal_summary
+            )
+        executed.insert(0, (train_results, train_data))
+
+        if staged and early_kill_labels(train_results['metrics'], holdout_results['metrics']):
+            skipped_stages = ['stability', 'fragility']
+
+    signal_summary: Optional[Dict[str, Any]] = None
+    if collect_signal_summary:
+        # Drop the contexts once summarized so they are not kept alive
+        signal_summary = merge_signal_summaries([
+            summarize_execution(strategy, results.pop('context'), segment)
+            for results, segment in executed
+        ])
+
+    if 'stability' in skipped_stages:
+        stability = {'skipped': True}
+        fragility = {'skipped': True}
+    else:
+        # Subwindow stability (on full data)
+        with telemetry.EVALUATION_STAGE_SECONDS.labels("stability").time():
+            stability = subwindow_stability(strategy, data, k_windows, initial_capital, token=token)
 
-    # Parameter jitter (on holdout data)
-    fragility = parameter_jitter(strategy, holdout_data, n_jitter, jitter_pct, initial_capital)
+        # Parameter jitter (on holdout data)
+        with telemetry.EVALUATION_STAGE_SECONDS.labels("jitter").time():
+            fragility = parameter_jitter(
+                strategy, holdout_data, n_jitter, jitter_pct, initial_capital, token=token
+            )
 
-    return {
+    validation_results = {
         'train_results': train_results,
         'holdout_results': holdout_results,
         'stability': stability,
         'fragility': fragility,
     }
+    if signal_summary is not None:
+        validation_results['signal_summary'] = signal_summary
+    if skipped_stages:
+        validation_results['skipped_stages'] = skipped_stages
+
+    return validation_results
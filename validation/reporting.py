@@ -11,6 +11,16 @@ from pathlib import Path
 import config
 
 
+# Hard kill labels that depend only on train/holdout backtests. Staged
+# validation uses these to skip the stability and jitter stages.
+EARLY_KILL_LABELS = (
+    "no_holdout_trades",
+    "too_few_holdout_trades",
+    "holdout_sign_flip",
+    "severe_holdout_degradation",
+)
+
+
 class ValidationReport:
     """Standardized validation report for LLM consumption."""
 
@@ -24,6 +34,7 @@ class ValidationReport:
         fragility: Dict[str, Any],
         penalties: Dict[str, float],
         fitness: float,
+        skipped_stages: List[str] = None,
     ):
         self.strategy_id = strategy_id
         self.strategy_name = strategy_name
@@ -33,6 +44,7 @@ class ValidationReport:
         self.fragility = fragility
         self.penalties = penalties
         self.fitness = fitness
+        self.skipped_stages = skipped_stages or []
         self.timestamp = datetime.now().isoformat()
 
     def get_failure_labels(self) -> List[str]:
@@ -116,6 +128,8 @@ class ValidationReport:
             'cliff_penalty': round(self.stability.get('cliff_penalty', 0.0), 3),
             'consistency_score': round(self.stability.get('consistency_score', 0.0), 3),
         }
+        if self.stability.get('skipped'):
+            stability_compact['skipped'] = True
 
         # Compact fragility metrics
         fragility_compact = {
@@ -123,8 +137,10 @@ class ValidationReport:
             'sign_flip_penalty': round(self.fragility.get('sign_flip_penalty', 0.0), 3),
             'fragility_score': round(self.fragility.get('fragility_score', 0.0), 3),
         }
+        if self.fragility.get('skipped'):
+            fragility_compact['skipped'] = True
 
-        return {
+        report = {
             'strategy_id': self.strategy_id,
             'strategy_name': self.strategy_name,
             'timestamp': self.timestamp,
@@ -136,6 +152,10 @@ class ValidationReport:
             'failure_labels': self.get_failure_labels(),
             'fitness': round(self.fitness, 3),
         }
+        if self.skipped_stages:
+            report['skipped_stages'] = list(self.skipped_stages)
+
+        return report
 
     def to_json(self, indent: int = 2) -> str:
         """Convert report to JSON string.
@@ -195,4 +215,32 @@ def create_validation_report(
         fragility=validation_results['fragility'],
         penalties=fitness_results['penalties'],
         fitness=fitness_results['fitness'],
+        skipped_stages=validation_results.get('skipped_stages'),
+    )
+
+
+def early_kill_labels(
+    train_metrics: Dict[str, Any], holdout_metrics: Dict[str, Any]
+) -> List[str]:
+    """Hard kill labels decidable from train/holdout metrics alone.
+
+    Pass empty train_metrics to check the holdout-only rules.
+
+    Args:
+        train_metrics: Train backtest metrics (may be empty)
+        holdout_metrics: Holdout backtest metrics
+
+    Returns:
+        Subset of EARLY_KILL_LABELS that fired
+    """
+    report = ValidationReport(
+        strategy_id="",
+        strategy_name="",
+        train_metrics=train_metrics,
+        holdout_metrics=holdout_metrics,
+        stability={},
+        fragility={},
+        penalties={},
+        fitness=0.0,
     )
+    return [l for l in report.get_failure_labels() if l in EARLY_KILL_LABELS]
@@ -3,18 +3,30 @@
 Prevents overfitting to single ticker or timeframe.
 """
 
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Optional, Union
 from dataclasses import dataclass
 
-from graph.schema import StrategyGraph
+import config
+import telemetry
+from data.frame_store import read_frame, write_frame
+from data.resample import BarResampler
+from graph.schema import StrategyGraph, TimeframeSpec
 from validation.overfit_tests import run_full_validation
 from validation.fitness import score_validation
 from validation.reporting import ValidationReport, create_validation_report
 from validation.evaluation import StrategyEvaluationResult
 
 
+# Memoizes resampled sweep frames across evaluations of the same universe and
+# persists them as parquet next to the cached base bars
+_DEFAULT_RESAMPLER = BarResampler(cache_dir=config.CACHE_DIR / "resampled")
+
+
 @dataclass
 class RobustEvaluationResult:
     """Result of robust multi-symbol/timeframe evaluation."""
@@ -45,64 +57,100 @@ class RobustEvaluationResult:
 
 def evaluate_strategy_robust(
     strategy: StrategyGraph,
-    data_dict: Dict[str, pd.DataFrame],  # symbol -> bars_df
-    timeframes: List[str] = None,  # If None, use strategy's timeframe
+    data_dict: Dict[str, Union[pd.DataFrame, str, Path]],  # symbol -> bars_df or frame store path
+    timeframes: Union[List[str], TimeframeSpec] = None,  # If None, use strategy's timeframe
     train_frac: float = 0.75,
     k_windows: int = 6,
     n_jitter: int = 10,
     jitter_pct: float = 0.1,
     initial_capital: float = 100000.0,
     worst_symbol_threshold: float = -0.5,
+    n_workers: Optional[int] = None,
+    cancel_on_symbol_kill: bool = False,
+    on_symbol_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    resampler: Optional[BarResampler] = None,
 ) -> RobustEvaluationResult:
     """Evaluate strategy across multiple symbols and optionally timeframes.
 
+    With n_workers > 1, symbols are evaluated on a process pool. Each worker
+    memory-maps only its own symbol's frame from a frame store (see
+    data.frame_store); DataFrame inputs are written to a temporary store
+    first, path inputs are used as-is.
+
+    With timeframes, data_dict holds bars at the strategy's timeframe and
+    each sweep timeframe is resampled locally from them (no re-fetch). Every
+    (symbol, timeframe) pair is evaluated as its own unit keyed
+    "SYMBOL@timeframe".
+
     Args:
         strategy: StrategyGraph to evaluate
-        data_dict: Dict mapping symbol -> OHLCV DataFrame
-        timeframes: Optional list of timeframes to test (must have data for each)
+        data_dict: Dict mapping symbol -> OHLCV DataFrame or frame store path
+        timeframes: Optional timeframes (or sweep TimeframeSpec) to test; each
+            must be a whole multiple of the strategy's timeframe
         train_frac: Train/holdout split
         k_windows: Subwindows for stability
         n_jitter: Parameter jitter runs
         jitter_pct: Jitter percentage
         initial_capital: Starting capital
         worst_symbol_threshold: Threshold for worst_symbol_penalty
+        n_workers: Worker processes (None or 1 = evaluate serially in-process)
+        cancel_on_symbol_kill: Stop evaluating remaining symbols as soon as
+            one symbol's fitness falls below worst_symbol_threshold (the
+            strategy is killed with failed_on_symbol either way)
+        on_symbol_result: Optional callback(symbol, symbol_result) invoked as
+            each symbol completes
+        resampler: BarResampler for sweep timeframes (defaults to a shared
+            in-memory one)
 
     Returns:
         RobustEvaluationResult with aggregated metrics
     """
-    # For Phase 6.5 MVP, keep it simple: evaluate on each symbol with strategy's timeframe
-    # Timeframe sweep would require re-fetching data for each timeframe
+    if not data_dict:
+        raise ValueError("data_dict must contain at least one symbol")
 
-    if timeframes is not None:
-        # TODO: Implement timeframe sweep
-        # Would need to fetch data for each timeframe and evaluate
-        raise NotImplementedError("Timeframe sweep not yet implemented")
+    if isinstance(timeframes, TimeframeSpec):
+        timeframes = timeframes.timeframes
 
-    # Evaluate on each symbol
-    symbol_results = {}
-
-    for symbol, data in data_dict.items():
-        print(f"  Evaluating on {symbol}...")
-
-        # Run full validation
-        validation_results = run_full_validation(
-            strategy=strategy,
-            data=data,
-            train_frac=train_frac,
-            k_windows=k_windows,
-            n_jitter=n_jitter,
-            jitter_pct=jitter_pct,
-            initial_capital=initial_capital,
+    # Evaluation units: symbol -> source, or "SYMBOL@tf" -> resampled bars
+    unit_timeframes = {}
+    if timeframes:
+        units = _build_sweep_units(
+            data_dict, timeframes, strategy.time.timeframe, resampler or _DEFAULT_RESAMPLER
         )
+        unit_timeframes = {unit: unit.rsplit('@', 1)[1] for unit in units}
+    else:
+        units = data_dict
+
+    params = {
+        'train_frac': train_frac,
+        'k_windows': k_windows,
+        'n_jitter': n_jitter,
+        'jitter_pct': jitter_pct,
+        'initial_capital': initial_capital,
+    }
 
-        # Calculate fitness
-        fitness_results = score_validation(validation_results)
+    def should_stop(symbol_result: Dict[str, Any]) -> bool:
+        return cancel_on_symbol_kill and symbol_result['fitness']['fitness'] < worst_symbol_threshold
 
-        symbol_results[symbol] = {
-            'validation': validation_results,
-            'fitness': fitness_results,
-            'holdout_score': fitness_results['holdout_score'],
-        }
+    # Evaluate on each symbol
+    if n_workers is not None and n_workers > 1 and len(units) > 1:
+        completed = _evaluate_symbols_parallel(
+            strategy, units, params, n_workers, should_stop, on_symbol_result
+        )
+    else:
+        completed = {}
+        for symbol, source in units.items():
+            print(f"  Evaluating on {symbol}...")
+            _, symbol_result = _evaluate_symbol(strategy, symbol, source, params)
+            completed[symbol] = symbol_result
+            if on_symbol_result is not None:
+                on_symbol_result(symbol, symbol_result)
+            if should_stop(symbol_result):
+                break
+
+    # Keep data_dict order so ties resolve the same way as a serial run
+    symbol_results = {s: completed[s] for s in units if s in completed}
+    symbols_cancelled = [s for s in units if s not in completed]
 
     # Aggregate results
     holdout_scores = np.array([r['holdout_score'] for r in symbol_results.values()])
@@ -113,9 +161,9 @@ def evaluate_strategy_robust(
     best_fitness = np.max(fitness_scores)
     fitness_dispersion = np.std(fitness_scores)
 
-    # Find worst symbol
+    # Find worst symbol (evaluation unit)
     worst_idx = np.argmin(fitness_scores)
-    worst_symbol = list(symbol_results.keys())[worst_idx]
+    worst_unit = list(symbol_results.keys())[worst_idx]
 
     # Calculate penalties
     penalties = {}
@@ -133,7 +181,7 @@ def evaluate_strategy_robust(
     aggregated_fitness = median_fitness - sum(penalties.values())
 
     # Decision logic (use worst_symbol's failure labels + aggregated penalties)
-    worst_symbol_result = symbol_results[worst_symbol]
+    worst_symbol_result = symbol_results[worst_unit]
     worst_report = create_validation_report(
         strategy_id=strategy.graph_id,
         strategy_name=strategy.name,
@@ -163,6 +211,21 @@ def evaluate_strategy_robust(
         fitness_results=median_result['fitness'],
     )
 
+    # Per-symbol / per-timeframe medians across sweep units
+    per_symbol_fitness = {s: r['fitness']['fitness'] for s, r in symbol_results.items()}
+    per_timeframe_fitness = {}
+    worst_symbol, worst_timeframe = worst_unit, ""
+    if unit_timeframes:
+        by_symbol: Dict[str, List[float]] = {}
+        by_timeframe: Dict[str, List[float]] = {}
+        for unit, fitness in per_symbol_fitness.items():
+            symbol, timeframe = unit.rsplit('@', 1)
+            by_symbol.setdefault(symbol, []).append(fitness)
+            by_timeframe.setdefault(timeframe, []).append(fitness)
+        per_symbol_fitness = {s: float(np.median(f)) for s, f in by_symbol.items()}
+        per_timeframe_fitness = {tf: float(np.median(f)) for tf, f in by_timeframe.items()}
+        worst_symbol, worst_timeframe = worst_unit.rsplit('@', 1)
+
     validation_report_dict = median_report.to_dict()
     validation_report_dict['multi_symbol'] = {
         'median_fitness': round(median_fitness, 3),
@@ -170,7 +233,14 @@ def evaluate_strategy_robust(
         'worst_symbol': worst_symbol,
         'dispersion': round(fitness_dispersion, 3),
         'penalties': {k: round(v, 3) for k, v in penalties.items()},
+        'symbols_evaluated': len(symbol_results),
+        'symbols_cancelled': symbols_cancelled,
     }
+    if unit_timeframes:
+        validation_report_dict['multi_symbol']['worst_timeframe'] = worst_timeframe
+        validation_report_dict['multi_symbol']['per_timeframe_fitness'] = {
+            tf: round(f, 3) for tf, f in per_timeframe_fitness.items()
+        }
 
     return RobustEvaluationResult(
         graph_id=strategy.graph_id,
@@ -179,16 +249,143 @@ def evaluate_strategy_robust(
         worst_fitness=worst_fitness,
         best_fitness=best_fitness,
         fitness_dispersion=fitness_dispersion,
-        per_symbol_fitness={s: r['fitness']['fitness'] for s, r in symbol_results.items()},
-        per_timeframe_fitness={},  # TODO: Implement timeframe sweep
+        per_symbol_fitness=per_symbol_fitness,
+        per_timeframe_fitness=per_timeframe_fitness,
         worst_symbol=worst_symbol,
-        worst_timeframe="",  # TODO
+        worst_timeframe=worst_timeframe,
         decision=decision,
         kill_reason=kill_reason,
         validation_report=validation_report_dict,
     )
 
 
+def write_symbol_store(
+    data_dict: Dict[str, pd.DataFrame], directory: Union[str, Path]
+) -> Dict[str, Path]:
+    """Write each symbol's bars to a memory-mappable frame store.
+
+    The returned mapping can be passed as data_dict to
+    evaluate_strategy_robust() so large universes are written once and
+    shared by every evaluation.
+
+    Args:
+        data_dict: Dict mapping symbol -> OHLCV DataFrame
+        directory: Store directory
+
+    Returns:
+        Dict mapping symbol -> frame file path
+    """
+    # Files are keyed by position: symbols may not be valid file names
+    directory = Path(directory)
+    return {
+        symbol: write_frame(df, directory / f"{i}.feather")
+        for i, (symbol, df) in enumerate(data_dict.items())
+    }
+
+
+def _build_sweep_units(
+    data_dict: Dict[str, Union[pd.DataFrame, str, Path]],
+    timeframes: List[str],
+    base_timeframe: str,
+    resampler: BarResampler,
+) -> Dict[str, pd.DataFrame]:
+    """Resample each symbol's base bars to every sweep timeframe.
+
+    Returns:
+        Dict mapping "SYMBOL@timeframe" -> bars (timeframe-major order)
+    """
+    frames = {
+        symbol: source if isinstance(source, pd.DataFrame) else read_frame(source)
+        for symbol, source in data_dict.items()
+    }
+    return {
+        f"{symbol}@{timeframe}": resampler.get(symbol, df, timeframe, base_timeframe=base_timeframe)
+        for timeframe in timeframes
+        for symbol, df in frames.items()
+    }
+
+
+def _evaluate_symbol(
+    strategy: StrategyGraph,
+    symbol: str,
+    source: Union[pd.DataFrame, str, Path],
+    params: Dict[str, Any],
+    metrics_only: bool = False,
+) -> tuple[str, Dict[str, Any]]:
+    """Run full validation and scoring for one symbol.
+
+    Args:
+        metrics_only: Drop trades and equity curves so only the metrics
+            needed for aggregation travel back from a pool worker
+    """
+    data = source if isinstance(source, pd.DataFrame) else read_frame(source)
+
+    validation_results = run_full_validation(strategy=strategy, data=data, **params)
+    fitness_results = score_validation(validation_results)
+
+    validation = validation_results
+    if metrics_only:
+        validation = {
+            'train_results': {'metrics': validation_results['train_results']['metrics']},
+            'holdout_results': {'metrics': validation_results['holdout_results']['metrics']},
+            'stability': validation_results['stability'],
+            'fragility': validation_results['fragility'],
+        }
+        if 'skipped_stages' in validation_results:
+            validation['skipped_stages'] = validation_results['skipped_stages']
+
+    return symbol, {
+        'validation': validation,
+        'fitness': fitness_results,
+        'holdout_score': fitness_results['holdout_score'],
+    }
+
+
+def _evaluate_symbols_parallel(
+    strategy: StrategyGraph,
+    data_dict: Dict[str, Union[pd.DataFrame, str, Path]],
+    params: Dict[str, Any],
+    n_workers: int,
+    should_stop: Callable[[Dict[str, Any]], bool],
+    on_symbol_result: Optional[Callable[[str, Dict[str, Any]], None]],
+) -> Dict[str, Dict[str, Any]]:
+    """Evaluate symbols on a process pool, streaming results as they finish.
+
+    Returns:
+        Dict of completed symbol results (pending symbols are cancelled once
+        should_stop() fires)
+    """
+    completed = {}
+
+    with tempfile.TemporaryDirectory(prefix="robust_eval_") as store_dir:
+        frames = {s: d for s, d in data_dict.items() if isinstance(d, pd.DataFrame)}
+        sources = {**data_dict, **write_symbol_store(frames, store_dir)}
+
+        executor = ProcessPoolExecutor(max_workers=min(n_workers, len(sources)))
+        try:
+            pending = {
+                executor.submit(
+                    telemetry.collecting, _evaluate_symbol, strategy, symbol, source, params, True
+                )
+                for symbol, source in sources.items()
+            }
+            stop = False
+            while pending and not stop:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    symbol, symbol_result = telemetry.merge_result(future.result())
+                    print(f"  Evaluated {symbol}")
+                    completed[symbol] = symbol_result
+                    if on_symbol_result is not None:
+                        on_symbol_result(symbol, symbol_result)
+                    stop = stop or should_stop(symbol_result)
+        finally:
+            # Drops queued symbols; in-flight workers finish and are discarded
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    return completed
+
+
 def _apply_robust_survival_gate(
     failure_labels: List[str], fitness: float
 ) -> tuple[str, List[str]]:
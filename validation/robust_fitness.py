@@ -4,6 +4,8 @@ from typing import Any, Dict, List, Optional, TYPE_CHECKING
 import traceback
 import pandas as pd
 
+import telemetry
+from cancellation import CancelToken, checkpoint
 from validation.episodes import EpisodeSampler, RegimeTagger, slice_episode, EpisodeSpec
 
 if TYPE_CHECKING:
@@ -17,19 +19,19 @@ LUCKY_SPIKE_THRESHOLD = 0.6  # best episode accounts for >60% of total positive
 LUCKY_SPIKE_PENALTY = 0.2
 
 
-def _collect_debug_stats(strategy: Any, episode_df: Any, result: Any) -> Dict[str, Any]:
+def _collect_debug_stats(episode_df: Any, result: Any) -> Dict[str, Any]:
     """Collect no-trade autopsy diagnostics.
 
+    Uses the signal summary computed during evaluation instead of
+    re-executing the strategy graph on the episode.
+
     Args:
-        strategy: Strategy graph
         episode_df: Episode data
-        result: Evaluation result
+        result: Evaluation result (None if evaluation failed)
 
     Returns:
         Dict with diagnostic counts
     """
-    from graph.executor import GraphExecutor
-
     debug_stats = {
         "bars_in_episode": len(episode_df),
         "bars_after_warmup": 0,
@@ -44,22 +46,18 @@ def _collect_debug_stats(strategy: Any, episode_df: Any, result: Any) -> Dict[st
     }
 
     try:
-        # Execute strategy to get signals
-        executor = GraphExecutor()
-        context = executor.execute(strategy, episode_df)
+        summary = getattr(result, "signal_summary", None)
 
-        # Get orders config
-        orders_key = list(strategy.outputs.values())[0]
-        orders_config = context.get(orders_key, {})
-
-        # Count signal trues
-        entry_signal = orders_config.get('entry_signal')
-        if entry_signal is not None and hasattr(entry_signal, '__len__'):
-            debug_stats["signal_true_count"] = int(entry_signal.sum()) if hasattr(entry_signal, 'sum') else 0
+        if summary is None:
+            # No execution to reuse (e.g. evaluation failed): raw OHLCV only
+            for col in ['open', 'high', 'low', 'close', 'volume']:
+                if col in episode_df.columns and len(episode_df) > 0:
+                    nan_pct = episode_df[col].isna().sum() / len(episode_df) * 100
+                    debug_stats["feature_nan_pct"][col] = round(nan_pct, 2)
+            return debug_stats
 
-        exit_signal = orders_config.get('exit_signal')
-        if exit_signal is not None and hasattr(exit_signal, '__len__'):
-            debug_stats["exits"] = int(exit_signal.sum()) if hasattr(exit_signal, 'sum') else 0
+        debug_stats["signal_true_count"] = summary["signal_true_count"]
+        debug_stats["exits"] = summary["exit_true_count"]
 
         # Extract trade count from result
         n_trades = 0
@@ -76,19 +74,12 @@ def _collect_debug_stats(strategy: Any, episode_df: Any, result: Any) -> Dict[st
 
         debug_stats["fills"] = n_trades
 
-        # Check for NaN percentages in key features
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            if col in episode_df.columns or (hasattr(episode_df, 'index') and col == episode_df.index.name):
-                if col in episode_df.columns:
-                    nan_pct = episode_df[col].isna().sum() / len(episode_df) * 100
-                    debug_stats["feature_nan_pct"][col] = round(nan_pct, 2)
-
-        # Try to extract computed features from context
-        for node_id, value in context.items():
-            if isinstance(value, pd.Series) and len(value) == len(episode_df):
-                nan_pct = value.isna().sum() / len(value) * 100
-                if nan_pct > 0:
-                    debug_stats["feature_nan_pct"][node_id] = round(nan_pct, 2)
+        # NaN percentages for OHLCV columns (always) and computed features (if any)
+        bars = summary["bars"]
+        if bars > 0:
+            for key, count in summary["nan_counts"].items():
+                if count > 0 or key in episode_df.columns:
+                    debug_stats["feature_nan_pct"][key] = round(count / bars * 100, 2)
 
     except Exception:
         # If debug stats collection fails, just return what we have
@@ -137,6 +128,7 @@ def evaluate_strategy_on_episodes(
     min_trades_per_episode: int = 3,
     regime_penalty_weight: float = 0.3,
     abort_on_all_failures: bool = True,
+    token: Optional[CancelToken] = None,
 ) -> RobustAggregateResult:
     # Import here to avoid circular dependency
     from validation.evaluation import evaluate_strategy
@@ -157,6 +149,7 @@ def evaluate_strategy_on_episodes(
     n_trades_list: List[int] = []
 
     for spec in episodes:
+        checkpoint(token)
         episode_df = slice_episode(data, spec.start_ts, spec.end_ts)
         history_df = data.loc[: spec.start_ts]
 
@@ -170,7 +163,14 @@ def evaluate_strategy_on_episodes(
         error_details = None
         debug_stats = None
         try:
-            result = evaluate_strategy(strategy, episode_df, initial_capital=initial_capital)
+            with telemetry.EVALUATION_STAGE_SECONDS.labels("episode").time():
+                result = evaluate_strategy(
+                    strategy,
+                    episode_df,
+                    initial_capital=initial_capital,
+                    return_signal_summary=True,
+                    token=token,
+                )
             fitness = result.fitness
             decision = result.decision
             kill_reason = result.kill_reason
@@ -182,8 +182,8 @@ def evaluate_strategy_on_episodes(
             elif "performance" in result.validation_report:
                 n_trades = result.validation_report.get("performance", {}).get("n_trades", 0)
 
-            # Collect debug stats for no-trade autopsy
-            debug_stats = _collect_debug_stats(strategy, episode_df, result)
+            # Collect debug stats for no-trade autopsy (reuses evaluation's execution)
+            debug_stats = _collect_debug_stats(episode_df, result)
 
         except Exception as e:
             # Capture failure details for debugging
@@ -200,7 +200,7 @@ def evaluate_strategy_on_episodes(
 
             # Still try to collect debug stats
             try:
-                debug_stats = _collect_debug_stats(strategy, episode_df, None)
+                debug_stats = _collect_debug_stats(episode_df, None)
             except:
                 pass
 